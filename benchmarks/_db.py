@@ -0,0 +1,28 @@
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from tortoise import Tortoise
+from src.database import Db
+from src.database.storage import StorageProfile, connection_config
+
+
+@asynccontextmanager
+async def bench_db(file_name: str = "bench.sqlite3", profile: StorageProfile | None = None):
+    """
+    在临时目录中创建独立的 sqlite 数据库，不触碰用户数据和 aerich 迁移
+
+    profile 为 None 时使用 tortoise 的默认连接参数
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, file_name)
+        connection = connection_config(db_path, profile) if profile else f"sqlite://{db_path}"
+        await Tortoise.init(config={
+            "connections": {"default": connection},
+            "apps": {"models": {"models": ["src.database.model"], "default_connection": "default"}},
+        })
+        await Tortoise.generate_schemas()
+        Db._conn = Tortoise.get_connection("default")
+        try:
+            yield Db._conn
+        finally:
+            await Tortoise.close_connections()
@@ -0,0 +1,183 @@
+"""
+哔哩哔哩弹幕数据包解码基准
+
+对比 bilibili_api 的 LiveDanmaku 解包（所有 cmd 都 json 解码）与 BiliLiveClient 的 CommandDecoder
+（只解码 DANMU_MSG 和 SUPER_CHAT_MESSAGE）的吞吐量，再用本地 WebSocket 替身服务推送同样的数据包，
+测量 BiliLiveClient 从收包到分发事件的端到端吞吐量。
+可用 --packets 指定录制的数据包文件（每个为 4 字节大端长度 + 原始 WebSocket 二进制消息），
+否则生成模拟数据包，--save 可把模拟数据包写成同样的格式。
+
+    python -m benchmarks.bilibili_packets --packets packets.bin
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import brotli
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from bilibili_api.live import LiveDanmaku
+from benchmarks.douyin_frames import load_frames, save_frames
+from src.bilibili import BiliLiveClient
+from src.bilibili.wire import OP_MESSAGE, PROTO_BROTLI, PROTO_JSON, CommandDecoder, pack
+from src.utils import async_worker
+
+CMDS = ["DANMU_MSG", "SUPER_CHAT_MESSAGE"]
+# (cmd, 权重)，按常见直播间的消息比例
+MIX = [
+    ("DANMU_MSG", 10),
+    ("INTERACT_WORD", 35),
+    ("SEND_GIFT", 15),
+    ("ONLINE_RANK_COUNT", 10),
+    ("WATCHED_CHANGE", 10),
+    ("LIKE_INFO_V3_CLICK", 10),
+    ("STOP_LIVE_ROOM_LIST", 5),
+    ("ENTRY_EFFECT", 4),
+    ("SUPER_CHAT_MESSAGE", 1),
+]
+
+
+def _user(rng: random.Random):
+    uid = rng.randint(1, 10**10)
+    return {
+        "uid": uid,
+        "base": {"name": f"user{uid}", "face": "https://i0.hdslb.com/bfs/face/" + "x" * 40 + ".jpg", "is_mystery": False},
+        "medal": {"name": "粉丝牌", "level": rng.randint(1, 30), "color_start": 398668, "color_end": 6850801,
+                  "guard_level": rng.choice([0, 0, 0, 3]), "ruid": 12345, "score": rng.randint(1, 10**5)},
+        "wealth": {"level": rng.randint(1, 40)},
+    }
+
+
+def build_body(cmd: str, rng: random.Random) -> bytes:
+    if cmd == "DANMU_MSG":
+        user = _user(rng)
+        body = {
+            "cmd": "DANMU_MSG:4:0:2:2:2:0",
+            "dm_v2": "x" * 200,
+            "info": [
+                [0, 1, 25, 16777215, int(time.time() * 1000), rng.getrandbits(31), 0, "abcd", 0, 0, 0, "", 0, "{}", "{}",
+                 {"mode": 0, "user": user, "extra": json.dumps({"content": "x", "emots": None})}, {"activity_identity": ""}],
+                f"点歌 song{rng.randint(0, 999)}",
+                [user["uid"], user["base"]["name"], 0, 0, 0, 10000, 1, ""],
+                [user["medal"]["level"], "粉丝牌", "主播", 12345, 398668, "", 0, 6850801, 398668, 6850801, 0, 1, 12345],
+                [rng.randint(1, 60), 0, 6406234, ">50000", 0],
+                ["", ""], 0, 0, None, {"ts": int(time.time()), "ct": "ABCDEF"}, 0, 0, None, None, 0, 105, [14], None,
+            ],
+        }
+    elif cmd == "SUPER_CHAT_MESSAGE":
+        user = _user(rng)
+        body = {"cmd": cmd, "data": {"uid": user["uid"], "message": f"点歌 song{rng.randint(0, 999)}", "price": 30,
+                                     "user_info": {"uname": user["base"]["name"]},
+                                     "medal_info": {"guard_level": 0, "medal_level": 10, "medal_name": "粉丝牌"}}}
+    elif cmd == "STOP_LIVE_ROOM_LIST":
+        body = {"cmd": cmd, "data": {"room_id_list": [rng.randint(1, 10**8) for _ in range(150)]}}
+    elif cmd == "INTERACT_WORD":
+        body = {"cmd": cmd, "data": {"dmscore": 12, "pb": "x" * rng.randint(200, 600)}}
+    else:
+        body = {"cmd": cmd, "data": {"user": _user(rng), "num": rng.randint(1, 99), "extra": "x" * rng.randint(50, 800)}}
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def build_packets(count: int, max_ops: int = 10):
+    rng = random.Random(0)
+    names = [cmd for cmd, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    packets = []
+    for _ in range(count):
+        cmds = rng.choices(names, weights, k=rng.randint(1, max_ops))
+        inner = b"".join(pack(build_body(cmd, rng), OP_MESSAGE, PROTO_JSON) for cmd in cmds)
+        packets.append(pack(brotli.compress(inner), OP_MESSAGE, PROTO_BROTLI))
+    return packets
+
+
+unpack = LiveDanmaku._LiveDanmaku__unpack
+
+
+def live_danmaku_path(packet: bytes):
+    events = 0
+    for info in unpack(packet):
+        data = info["data"]
+        if isinstance(data, dict) and data.get("cmd", "").split(":", 1)[0] in CMDS:
+            events += 1
+    return events
+
+
+decoder = CommandDecoder(CMDS)
+
+
+def selective_path(packet: bytes):
+    return len(decoder.decode(packet))
+
+
+def measure(path, packets: list[bytes]):
+    start = time.perf_counter()
+    events = sum(path(packet) for packet in packets)
+    return len(packets) / (time.perf_counter() - start), events
+
+
+class LocalClient(BiliLiveClient):
+    async def _prepare_reconnect(self):
+        self.room_real_id = 1
+
+    async def _send_verify(self):
+        pass
+
+
+async def end_to_end(packets: list[bytes], expected: int):
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        for packet in packets:
+            await ws.send_bytes(packet)
+        async for _ in ws:
+            pass
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/sub", handler)
+    server = TestServer(app)
+    await server.start_server()
+    client = LocalClient(room_display_id=1)
+    client.url = str(server.make_url("/sub"))
+    received = 0
+    done = asyncio.Event()
+
+    def on_event(event):
+        nonlocal received
+        received += 1
+        if received >= expected:
+            done.set()
+
+    for cmd in CMDS:
+        client.on(cmd)(on_event)
+    start = time.perf_counter()
+    await client.connect_async()
+    await asyncio.wait_for(done.wait(), 120)
+    elapsed = time.perf_counter() - start
+    await client.disconnect()
+    await server.close()
+    await async_worker.http.close()
+    return len(packets) / elapsed, received
+
+
+def main(packets_path: str | None, count: int, save: str | None):
+    packets = load_frames(packets_path) if packets_path else build_packets(count)
+    if save:
+        save_frames(save, packets)
+    print(f"packets: {len(packets)}, {sum(map(len, packets)) / len(packets):.0f} bytes/packet")
+    events = 0
+    for name, path in (("LiveDanmaku", live_danmaku_path), ("selective", selective_path)):
+        rate, events = measure(path, packets)
+        print(f"{name:>12}: {rate:9.0f} packets/s, {events} events")
+    rate, received = asyncio.run(end_to_end(packets, events))
+    print(f"{'end-to-end':>12}: {rate:9.0f} packets/s, {received} events via local WebSocket")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--packets", default=None)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--save", default=None)
+    args = parser.parse_args()
+    main(args.packets, args.count, args.save)
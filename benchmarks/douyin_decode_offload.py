@@ -0,0 +1,78 @@
+"""
+抖音解码卸载基准
+
+模拟礼物/点赞刷屏时的大帧，分别在事件循环中解码和交给线程池/进程池解码，
+同时用 LoopLagMonitor 记录事件循环延迟，对比卸载前后的延迟和吞吐量。
+
+    python -m benchmarks.douyin_decode_offload --count 300 --messages 200
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from benchmarks.douyin_frames import CHAT, build_frames
+from src.douyin.decode_stage import DecodeStage
+from src.douyin.wire import ResponseDecoder, decode_frame
+from src.utils.worker import LoopLagMonitor
+
+
+async def run(frames: list[bytes], mode: str):
+    decoder = ResponseDecoder([CHAT])
+    executor = None
+    decode = partial(decode_frame, decoder=decoder)
+    if mode == "thread":
+        executor = ThreadPoolExecutor(max_workers=2)
+    elif mode == "process":
+        executor = ProcessPoolExecutor(max_workers=2)
+        decode = partial(decode_frame, decoder=decoder, copy_payloads=True)
+
+    chats = 0
+    done = asyncio.Event()
+
+    async def handle(frame):
+        nonlocal chats
+        chats += len(frame.response.messages)
+        if frame.log_id == last_log_id:
+            done.set()
+
+    if executor:
+        # 预热进程池
+        await asyncio.get_running_loop().run_in_executor(executor, decode, frames[0])
+    last_log_id = decode(frames[-1]).log_id
+    monitor = LoopLagMonitor(interval=0.005, window=100000, warn_threshold=float("inf"))
+    monitor_task = asyncio.create_task(monitor.run())
+    stage = DecodeStage(decode, handle, executor, max_in_flight=8, inline_threshold=16 * 1024)
+    stage.start()
+    await asyncio.sleep(0.05)
+    monitor.reset()
+
+    start = time.perf_counter()
+    for frame in frames:
+        await stage.put(frame)
+        # 模拟 WebSocket 读取，让出事件循环
+        await asyncio.sleep(0)
+    await done.wait()
+    elapsed = time.perf_counter() - start
+
+    monitor_task.cancel()
+    await stage.stop()
+    if executor:
+        executor.shutdown()
+    return len(frames) / elapsed, chats, monitor.stats()
+
+
+def main(count: int, messages: int):
+    frames = build_frames(count, messages)
+    print(f"frames: {len(frames)}, {sum(map(len, frames)) / len(frames) / 1024:.0f} KB/frame")
+    for mode in ("inline", "thread", "process"):
+        rate, chats, lag = asyncio.run(run(frames, mode))
+        print(f"{mode:>8}: {rate:7.0f} frames/s, {chats} chats, loop lag mean {lag.mean:6.2f} ms, p99 {lag.p99:6.2f} ms, max {lag.max:6.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=300)
+    parser.add_argument("--messages", type=int, default=200)
+    args = parser.parse_args()
+    main(args.count, args.messages)
@@ -0,0 +1,138 @@
+"""
+抖音推送帧解码基准
+
+对比 betterproto2 完整解析（旧的 on_message）与 wire.ResponseDecoder 选择性解码的吞吐量和单帧峰值内存分配，
+两条路径都只把 WebcastChatMessage 解析为完整消息。
+可用 --frames 指定录制的帧文件（每帧为 4 字节大端长度 + 原始 WebSocket 二进制消息），
+否则生成模拟帧，--save 可把模拟帧写成同样的格式。
+
+    python -m benchmarks.douyin_frames --frames frames.bin
+"""
+import argparse
+import gzip
+import random
+import struct
+import time
+import tracemalloc
+from src.douyin import lib
+from src.douyin.wire import ResponseDecoder, decode_push_frame, gunzip
+
+CHAT = "WebcastChatMessage"
+OTHER_METHODS = [
+    "WebcastMemberMessage",
+    "WebcastLikeMessage",
+    "WebcastGiftMessage",
+    "WebcastRoomUserSeqMessage",
+    "WebcastSocialMessage",
+    "WebcastRoomStatsMessage",
+    "WebcastInRoomBannerMessage",
+]
+
+
+def build_frames(count: int, max_messages: int = 8):
+    rng = random.Random(0)
+    frames = []
+    for n in range(count):
+        messages = []
+        for i in range(rng.randint(1, max_messages)):
+            if rng.random() < 0.15:
+                chat = lib.WebcastImChatMessage(
+                    content=f"点歌 song{rng.randint(0, 999)}",
+                    user=lib.WebcastDataUser(id=rng.randint(1, 10**12), nickname=f"user{i}", sec_uid="x" * 60),
+                    event_time=n,
+                )
+                method, payload = CHAT, bytes(chat)
+            else:
+                method, payload = rng.choice(OTHER_METHODS), rng.randbytes(rng.randint(300, 3000))
+            messages.append(lib.WebcastImMessage(method=method, payload=payload, msg_id=rng.getrandbits(63), msg_type=1))
+        response = lib.WebcastImResponse(
+            messages=messages,
+            cursor=f"t-{n}_r-1_d-1_u-1_h-1",
+            fetch_interval=1000,
+            now=1700000000000 + n,
+            internal_ext="internal_src:dim|wss_push_room_id:7000000000000000000|" + "x" * 160,
+            route_params={"im_path": "/webcast/im/fetch/"},
+            heartbeat_duration=10000,
+            need_ack=rng.random() < 0.5,
+        )
+        frame = lib.WebcastImPushFrame(
+            seq_id=n,
+            log_id=rng.getrandbits(63),
+            payload_encoding="gzip",
+            payload_type="msg",
+            payload=gzip.compress(bytes(response)),
+        )
+        frames.append(bytes(frame))
+    return frames
+
+
+def load_frames(path: str):
+    frames = []
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 0
+    while pos < len(data):
+        (length,) = struct.unpack_from(">I", data, pos)
+        frames.append(data[pos + 4:pos + 4 + length])
+        pos += 4 + length
+    return frames
+
+
+def save_frames(path: str, frames: list[bytes]):
+    with open(path, "wb") as f:
+        for frame in frames:
+            f.write(struct.pack(">I", len(frame)))
+            f.write(frame)
+
+
+def betterproto_path(frame: bytes):
+    package = lib.WebcastImPushFrame().parse(frame)
+    response = lib.WebcastImResponse().parse(gzip.decompress(package.payload))
+    return [lib.WebcastImChatMessage().parse(msg.payload) for msg in response.messages if msg.method == CHAT]
+
+
+decoder = ResponseDecoder([CHAT])
+
+
+def selective_path(frame: bytes):
+    package = decode_push_frame(frame)
+    response = decoder.decode(gunzip(package.payload))
+    return [lib.WebcastImChatMessage().parse(payload) for _, payload in response.messages]
+
+
+def measure(path, frames: list[bytes]):
+    start = time.perf_counter()
+    chats = sum(len(path(frame)) for frame in frames)
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc 统计单帧处理期间的峰值内存分配（相对处理前）
+    sample = frames[:1000]
+    tracemalloc.start()
+    peak_total = 0
+    for frame in sample:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        path(frame)
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - base
+    tracemalloc.stop()
+    return len(frames) / elapsed, chats, peak_total / len(sample) / 1024
+
+
+def main(frames_path: str | None, count: int, save: str | None):
+    frames = load_frames(frames_path) if frames_path else build_frames(count)
+    if save:
+        save_frames(save, frames)
+    print(f"frames: {len(frames)}, {sum(map(len, frames)) / len(frames):.0f} bytes/frame")
+    for name, path in (("betterproto2", betterproto_path), ("selective", selective_path)):
+        rate, chats, peak_kb = measure(path, frames)
+        print(f"{name:>12}: {rate:9.0f} frames/s, {chats} chats, peak {peak_kb:6.1f} KB allocated/frame")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", default=None)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--save", default=None)
+    args = parser.parse_args()
+    main(args.frames, args.count, args.save)
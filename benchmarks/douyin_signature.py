@@ -0,0 +1,49 @@
+"""
+抖音签名基准
+
+对比每次重新编译 sign_v1.js（旧的 execute_js）、复用编译好的函数、以及相同 md5 参数在 sign_ttl 内命中缓存时的签名速度。
+
+    FLET_ASSETS_DIR=assets python -m benchmarks.douyin_signature --count 50
+"""
+import argparse
+import hashlib
+import os
+import time
+
+os.environ.setdefault("FLET_ASSETS_DIR", "assets")
+
+from quickjs import Function  # noqa: E402
+from src.douyin.signature import SignatureEngine, get_real_path, open_file  # noqa: E402
+
+
+def md5_params(count: int):
+    return [hashlib.md5(f"live_id=1,room_id={n}".encode()).hexdigest() for n in range(count)]
+
+
+def legacy_sign(md5_param: str):
+    return Function("get_sign", open_file(get_real_path("sign_v1.js")))(md5_param)
+
+
+def rate(func, params: list[str]):
+    start = time.perf_counter()
+    for param in params:
+        func(param)
+    return len(params) / (time.perf_counter() - start)
+
+
+def main(count: int):
+    params = md5_params(count)
+    engine = SignatureEngine()
+    engine.function("sign_v1.js", "get_sign")
+    print(f"compile per call : {rate(legacy_sign, params):9.1f} signatures/s")
+    print(f"compiled once    : {rate(lambda p: engine.call('sign_v1.js', 'get_sign', p), params):9.1f} signatures/s")
+    for param in params:
+        engine.sign(param)
+    print(f"memoized         : {rate(engine.sign, params * 100):9.1f} signatures/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+    main(args.count)
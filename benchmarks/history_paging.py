@@ -0,0 +1,74 @@
+"""
+点歌历史分页基准
+
+生成指定条数的点歌记录，对比 OFFSET 分页（每页都 count()）与游标分页（总数缓存）
+在第 1 页和深页的加载耗时。
+
+    python -m benchmarks.history_paging --rows 1000000 --page 5000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from src.database import Db
+from src.database.paging import encode_cursor
+from ._db import bench_db
+
+SEED_SQL = """
+    INSERT INTO songhistory (uid, uname, song_name, source, create_time)
+    WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+    SELECT n % 50000, 'user' || (n % 50000), 'song' || (n % 3000),
+           CASE n % 3 WHEN 0 THEN 'douyin' ELSE 'bilibili' END, ? - n * 30
+    FROM seq
+"""
+
+
+async def timed(make_call, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await make_call()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+async def main(rows: int, page: int, size: int, repeat: int):
+    async with bench_db("paging.sqlite3") as conn:
+        await conn.execute_query(SEED_SQL, [rows, int(time.time())])
+        await conn.execute_script("ANALYZE")
+
+        # 深页的游标取自上一页的最后一行，与界面逐页翻到这里时拿到的游标相同
+        _, boundary = await Db.get_song_history_page(page=page - 1, size=size)
+        cursor = encode_cursor(boundary[-1].create_time, boundary[-1].id)
+
+        async def cursor_page(c):
+            await Db.count_song_history()
+            return await Db.get_song_history_cursor(cursor=c, size=size)
+
+        results = {
+            "offset": (
+                await timed(lambda: Db.get_song_history_page(page=1, size=size), repeat),
+                await timed(lambda: Db.get_song_history_page(page=page, size=size), repeat),
+            ),
+            "cursor": (
+                await timed(lambda: cursor_page(None), repeat),
+                await timed(lambda: cursor_page(cursor), repeat),
+            ),
+        }
+        offset_rows = [row.id for row in (await Db.get_song_history_page(page=page, size=size))[1]]
+        cursor_rows = [row.id for row in (await Db.get_song_history_cursor(cursor=cursor, size=size)).rows]
+        assert offset_rows == cursor_rows, "cursor page differs from offset page"
+
+    print(f"rows: {rows}, page size: {size}")
+    for name, (first, deep) in results.items():
+        print(f"{name:>7}: page 1 {first:8.3f} ms  page {page} {deep:8.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page, args.size, args.repeat))
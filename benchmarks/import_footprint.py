@@ -0,0 +1,69 @@
+"""
+启动导入耗时与常驻内存基准
+
+每个场景在独立的子进程中执行，记录导入耗时和导入后的 RSS（取多次运行的中位数）：
+
+- main: 只导入 main.run_app 依赖的全部模块，相当于未配置抖音直播间时的启动
+- douyin: 在 main 的基础上加载抖音直播热路径用到的消息类型
+- full: 在 douyin 的基础上访问一个热路径以外的消息类型，加载完整 schema
+
+    python -m benchmarks.import_footprint --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "main": "import main",
+    "douyin": "import main\nfrom src.douyin import lib\nlib.WebcastImPushFrame, lib.WebcastImResponse, lib.WebcastImChatMessage",
+    "full": "import main\nfrom src.douyin import lib\nlib.WebcastImChatMessage, lib.WebcastImGiftMessage",
+}
+
+PROBE = """
+import json, time
+def rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / (1024 * 1024 if __import__("sys").platform == "darwin" else 1024)
+base = rss_mb()
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "rss": rss_mb(), "base": base}}))
+"""
+
+
+def run_scenario(code: str):
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(runs: int):
+    print(f"{'scenario':>8} | {'import ms':>9} | {'RSS MB':>7} | {'delta MB':>8}")
+    for name, code in SCENARIOS.items():
+        results = [run_scenario(code) for _ in range(runs)]
+        elapsed = statistics.median(item["elapsed"] for item in results)
+        rss = statistics.median(item["rss"] for item in results)
+        delta = statistics.median(item["rss"] - item["base"] for item in results)
+        print(f"{name:>8} | {elapsed * 1000:9.1f} | {rss:7.1f} | {delta:8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.runs)
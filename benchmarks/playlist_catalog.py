@@ -0,0 +1,46 @@
+"""
+歌单内存索引基准
+
+向临时数据库写入指定数量的歌曲，测量 PlaylistCatalog 全量加载耗时和单次匹配耗时。
+
+    python -m benchmarks.playlist_catalog --songs 50000
+"""
+import argparse
+import asyncio
+import random
+import time
+from src.database.catalog import PlaylistCatalog
+from ._db import bench_db
+
+
+async def main(songs: int, lookups: int):
+    async with bench_db() as conn:
+        rows = [
+            (f"歌曲 Song {i}", f"歌手{i % 300}", i % 7 == 0, 30 if i % 7 == 0 else 0, "国语", "流行", int(time.time()))
+            for i in range(songs)
+        ]
+        await conn.execute_many(
+            "INSERT INTO playlist (song_name, singer, is_sc, sc_price, language, tag, create_time) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+        catalog = PlaylistCatalog()
+        start = time.perf_counter()
+        await catalog.load(conn)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        queries = [f" 歌曲 ＳＯＮＧ{random.randrange(songs)} " if i % 2 else f"歌曲song {random.randrange(songs * 2)}" for i in range(lookups)]
+        start = time.perf_counter()
+        hits = sum(1 for q in queries if catalog.lookup(q))
+        lookup_us = (time.perf_counter() - start) / lookups * 1_000_000
+
+    print(f"load {songs} songs: {load_ms:.1f} ms")
+    print(f"lookup: {lookup_us:.2f} us/op ({hits}/{lookups} hits)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--songs", type=int, default=50000)
+    parser.add_argument("--lookups", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(main(args.songs, args.lookups))
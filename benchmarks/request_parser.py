@@ -0,0 +1,74 @@
+"""
+点歌指令解析基准
+
+对比旧的 startswith / replace 字符串逻辑与 RequestParser 的解析速度。
+可用 --corpus 指定录制的弹幕文件（每行一条弹幕），否则生成 100 万行的模拟语料。
+
+    python -m benchmarks.request_parser --corpus chat.txt --prefix 点歌
+"""
+import argparse
+import random
+import time
+from src.live.parser import CommandType, get_parser
+
+CHATTER = ["哈哈哈哈", "主播好", "[doge]", "来了来了", "好听！", "点歌的人好多", "晚上好", "666", "这首歌叫什么", "?"]
+SONGS = ["晴天", "稻香", "Hello", "小幸运", "起风了", "夜曲", "  孤勇者 ", "Ｌｏｖｅ Ｓｔｏｒｙ"]
+
+
+def build_corpus(lines: int, prefix: str):
+    rng = random.Random(0)
+    corpus = []
+    for _ in range(lines):
+        roll = rng.random()
+        if roll < 0.15:
+            corpus.append(f"{prefix} {rng.choice(SONGS)}")
+        elif roll < 0.17:
+            corpus.append("取消点歌")
+        elif roll < 0.2:
+            corpus.append(f"{prefix}{rng.choice(SONGS)}")
+        else:
+            corpus.append(rng.choice(CHATTER))
+    return corpus
+
+
+def legacy_parse(msg: str, prefix: str, modal_level: int, medal_level: int):
+    if msg.startswith("取消点歌"):
+        return CommandType.CANCEL, ""
+    if not msg.startswith(f"{prefix} "):
+        return CommandType.IGNORE, ""
+    if modal_level > 0 and medal_level < modal_level:
+        return CommandType.IGNORE, ""
+    return CommandType.REQUEST, msg.replace(prefix, "", 1).strip()
+
+
+def main(corpus_path: str | None, lines: int, prefix: str):
+    if corpus_path:
+        with open(corpus_path, "r", encoding="utf-8") as f:
+            corpus = [line.rstrip("\n") for line in f]
+    else:
+        corpus = build_corpus(lines, prefix)
+
+    start = time.perf_counter()
+    legacy = [legacy_parse(msg, prefix, 0, 3) for msg in corpus]
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parser = get_parser(prefix)
+    parsed = [parser.parse(msg, 3, 0) for msg in corpus]
+    parser_elapsed = time.perf_counter() - start
+
+    # 旧逻辑会接受空歌名，RequestParser 会忽略
+    mismatches = sum(1 for a, b in zip(legacy, parsed) if (a[0], a[1]) != (b.type, b.song_name) and a[1])
+    requests = sum(1 for item in parsed if item.type == CommandType.REQUEST)
+    print(f"corpus: {len(corpus)} lines, {requests} requests, {mismatches} mismatches")
+    print(f"legacy startswith: {len(corpus) / legacy_elapsed / 1e6:6.2f} M lines/s")
+    print(f"RequestParser    : {len(corpus) / parser_elapsed / 1e6:6.2f} M lines/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", default=None)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--prefix", default="点歌")
+    args = parser.parse_args()
+    main(args.corpus, args.lines, args.prefix)
@@ -0,0 +1,71 @@
+"""
+点歌记录写入基准
+
+以固定速率（默认 1000 次/秒）模拟点歌请求，对比逐条 INSERT 与写后日志批量提交的
+已接受请求吞吐量和接受延迟。
+
+    python -m benchmarks.song_history_journal --rate 1000 --seconds 3
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from src.database import Db
+from src.database.journal import SongHistoryJournal
+from ._db import bench_db
+
+
+async def run_load(rate: int, seconds: float):
+    total = int(rate * seconds)
+    interval = 1 / rate
+    latencies: list[float] = []
+
+    async def accept(i: int):
+        start = time.perf_counter()
+        await Db.add_song_history(uid=i % 500, uname=f"user{i % 500}", song_name=f"song{i}", source="bilibili", create_time=int(time.time()))
+        latencies.append(time.perf_counter() - start)
+
+    tasks = []
+    begin = time.perf_counter()
+    for i in range(total):
+        # 按到达时间调度，模拟弹幕事件分发
+        delay = begin + i * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(accept(i)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - begin
+    latencies.sort()
+    return {
+        "requests": total,
+        "accepted_per_sec": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main(rate: int, seconds: float, flush_interval: float, max_batch: int):
+    async with bench_db("direct.sqlite3"):
+        Db._journal = SongHistoryJournal()
+        before = await run_load(rate, seconds)
+
+    async with bench_db("journal.sqlite3") as conn:
+        Db._journal = SongHistoryJournal(flush_interval=flush_interval, max_batch=max_batch)
+        await Db._journal.start(conn)
+        after = await run_load(rate, seconds)
+        await Db._journal.stop()
+        _, rows = await conn.execute_query("SELECT COUNT(*) AS count FROM songhistory")
+        assert rows[0]["count"] == after["requests"], "journal lost rows"
+
+    for name, result in (("direct insert", before), ("write-behind", after)):
+        print(f"{name:>14}: {result['accepted_per_sec']:8.1f} req/s  p50 {result['p50_ms']:7.3f} ms  p99 {result['p99_ms']:7.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=3)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    parser.add_argument("--max-batch", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rate, args.seconds, args.flush_interval, args.max_batch))
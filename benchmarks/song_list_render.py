@@ -0,0 +1,98 @@
+"""
+首页点歌列表渲染基准
+
+模拟 Flet 会话的一次 page.update()：计算控件树差异并用 msgpack 编码补丁，
+对比整表重建（旧的 generate_list）与按 msg_id 增量插入/移除（SongList）的单次更新耗时和补丁大小。
+SongList 只渲染前 page_size 行，补丁大小和服务端比较的子控件数量都与队列长度无关，单次更新耗时保持不变。
+
+    python -m benchmarks.song_list_render --sizes 10 100 500 1000 2000
+"""
+import argparse
+import time
+import flet as ft
+import msgpack
+from flet.controls.base_control import BaseControl
+from flet.controls.object_patch import ObjectPatch
+from flet.messaging.protocol import configure_encode_object_for_msgpack
+from src.ui.controls import SongList
+from src.utils import DanmuInfo
+
+encode_object = configure_encode_object_for_msgpack(BaseControl)
+
+
+def make_item(msg_id: int):
+    return DanmuInfo(msg_id % 97, f"user{msg_id}", msg_id=msg_id, msg=f"song{msg_id}", send_time=msg_id, source="bilibili")
+
+
+def legacy_row(item: DanmuInfo):
+    """
+    旧的 generate_list 生成的一行
+    """
+    return ft.Column(
+        data={"title": item.uname, "subtitle": item.msg},
+        controls=[
+            ft.ListTile(
+                leading=ft.Icon(ft.Icons.ACCOUNT_CIRCLE),
+                title=item.uname,
+                subtitle=item.msg,
+                trailing=ft.Row(
+                    tight=True,
+                    controls=[
+                        ft.IconButton(icon=ft.Icons.COPY, data={"action": "copy", "msg": item.msg}),
+                        ft.IconButton(icon=ft.Icons.DELETE, data={"action": "delete", "msg_id": item.msg_id}),
+                    ],
+                ),
+            ),
+        ],
+    )
+
+
+def send_patch(control, prev):
+    """
+    与 Session.patch_control 相同：计算差异并编码，返回补丁字节数
+    """
+    patch, _, _ = ObjectPatch.from_diff(prev, control, control_cls=BaseControl)
+    return len(msgpack.packb(patch.to_message(), default=encode_object))
+
+
+def measure(size: int, rounds: int):
+    items = [make_item(i) for i in range(size, 0, -1)]
+    full = ft.ListView(controls=[legacy_row(item) for item in items])
+    keyed = SongList()
+    keyed.reset(items)
+    send_patch(full, None)
+    send_patch(keyed, None)
+
+    full_elapsed = keyed_elapsed = 0.0
+    full_bytes = keyed_bytes = 0
+    for n in range(rounds):
+        item = make_item(size + n + 1)
+        removed = items.pop()
+        items.insert(0, item)
+
+        start = time.perf_counter()
+        full.controls = [legacy_row(item) for item in items]
+        full_bytes += send_patch(full, full)
+        full_elapsed += time.perf_counter() - start
+
+        start = time.perf_counter()
+        keyed.insert(0, item)
+        keyed.remove(removed.msg_id)
+        keyed_bytes += send_patch(keyed, keyed)
+        keyed_elapsed += time.perf_counter() - start
+    return full_elapsed / rounds, full_bytes // rounds, keyed_elapsed / rounds, keyed_bytes // rounds
+
+
+def main(sizes: list[int], rounds: int):
+    print(f"{'size':>6} | {'rebuild ms':>10} {'bytes':>9} | {'keyed ms':>9} {'bytes':>6}")
+    for size in sizes:
+        full_ms, full_bytes, keyed_ms, keyed_bytes = measure(size, rounds)
+        print(f"{size:>6} | {full_ms * 1000:10.3f} {full_bytes:9d} | {keyed_ms * 1000:9.3f} {keyed_bytes:6d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 1000, 2000])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    main(args.sizes, args.rounds)
@@ -0,0 +1,57 @@
+"""
+统计页查询基准
+
+按每天 --per-day 条生成点歌记录（歌名和昵称取自有限的池子，越靠前越常见），对比直接统计 songhistory
+与读取 song_daily_stats 汇总表的查询耗时，并输出回填汇总表的耗时。
+
+    python -m benchmarks.statistic_rollup --rows 1000000 --per-day 3000
+"""
+import argparse
+import asyncio
+import time
+from src.database import Db
+from .history_paging import timed
+from ._db import bench_db
+
+# 两个均匀随机数相乘，小编号的歌和用户出现得更多
+SKEW = "(abs(random()) / 9223372036854775807.0) * (abs(random()) / 9223372036854775807.0)"
+SEED_SQL = f"""
+    INSERT INTO songhistory (uid, uname, song_name, source, create_time)
+    WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?),
+    picks AS (SELECT n, CAST(? * {SKEW} AS INT) AS song, CAST(? * {SKEW} AS INT) AS user FROM seq)
+    SELECT user, 'user' || user, 'song' || song, CASE n % 3 WHEN 0 THEN 'douyin' ELSE 'bilibili' END, ? - n * ?
+    FROM picks
+"""
+
+CASES = [("song", 7, None), ("user", 7, "douyin"), ("song", 30, None), ("user", 30, None)]
+
+
+async def main(rows: int, per_day: int, songs: int, users: int, repeat: int):
+    async with bench_db("statistic.sqlite3") as conn:
+        await conn.execute_query(SEED_SQL, [rows, songs, users, int(time.time()), 86400 / per_day])
+        start = time.perf_counter()
+        await Db._rollup.setup(conn)
+        backfill = time.perf_counter() - start
+        await conn.execute_script("ANALYZE")
+        _, stats = await conn.execute_query("SELECT COUNT(*) AS count FROM song_daily_stats")
+
+        results = []
+        for query_type, days, source in CASES:
+            raw = await timed(lambda: Db._raw_statisitic(query_type, days, source), repeat)
+            rollup = await timed(lambda: Db.get_statisitic(query_type, days, source), repeat)
+            results.append((f"{query_type} {days}d {source or 'all'}", raw, rollup))
+
+    print(f"rows: {rows}, {per_day} per day, rollup rows: {stats[0]['count']}, backfill {backfill:.2f} s")
+    for name, raw, rollup in results:
+        print(f"{name:>18}: raw {raw:8.2f} ms  rollup {rollup:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--per-day", type=int, default=3000)
+    parser.add_argument("--songs", type=int, default=500)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.per_day, args.songs, args.users, args.repeat))
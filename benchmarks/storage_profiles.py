@@ -0,0 +1,71 @@
+"""
+SQLite 存储配置档基准
+
+对每个配置档（以及 tortoise 默认参数）逐条提交点歌记录，同时在同一事件循环中持续翻页读取，
+输出每秒提交数和读取延迟。数据库带全文索引和按天汇总的触发器，与实际运行时一致。
+
+    python -m benchmarks.storage_profiles --seconds 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from src.database import Db
+from src.database.model import SongHistory
+from src.database.storage import PROFILES
+from .history_paging import SEED_SQL
+from ._db import bench_db
+
+
+async def run_profile(profile, seconds: float, rows: int, read_interval: float):
+    async with bench_db("storage.sqlite3", profile) as conn:
+        await conn.execute_query(SEED_SQL, [rows, int(time.time())])
+        await Db._search.setup(conn)
+        await Db._rollup.setup(conn)
+        Db._counts.clear()
+        stop = time.perf_counter() + seconds
+        inserts = 0
+        latencies: list[float] = []
+
+        async def writer():
+            nonlocal inserts
+            while time.perf_counter() < stop:
+                await SongHistory.create(uid=inserts % 500, uname=f"user{inserts % 500}", song_name=f"song{inserts}",
+                                         source="bilibili", create_time=int(time.time()))
+                inserts += 1
+
+        async def reader():
+            while time.perf_counter() < stop:
+                start = time.perf_counter()
+                await Db.count_song_history(source="bilibili")
+                await Db.get_song_history_cursor(source="bilibili", size=20)
+                latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(read_interval)
+
+        await asyncio.gather(writer(), reader())
+        Db._search.clear()
+    latencies.sort()
+    return {
+        "inserts_per_sec": inserts / seconds,
+        "read_p50_ms": statistics.median(latencies) * 1000,
+        "read_p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main(seconds: float, rows: int, read_interval: float):
+    results = [("tortoise default", await run_profile(None, seconds, rows, read_interval))]
+    for name, profile in PROFILES.items():
+        results.append((name, await run_profile(profile, seconds, rows, read_interval)))
+    print(f"seed rows: {rows}, {seconds:g} s per profile")
+    for name, result in results:
+        print(f"{name:>16}: {result['inserts_per_sec']:8.1f} inserts/s  "
+              f"read p50 {result['read_p50_ms']:7.3f} ms  p99 {result['read_p99_ms']:7.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--read-interval", type=float, default=0.01)
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.rows, args.read_interval))
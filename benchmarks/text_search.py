@@ -0,0 +1,70 @@
+"""
+点歌历史和歌单文本搜索基准
+
+生成点歌记录和歌单，对比 LIKE '%x%' 与 FTS5 trigram 全文索引的搜索耗时（统计总数 + 取第一页），
+并输出从原表重建全文索引的耗时。
+
+    python -m benchmarks.text_search --history 1000000 --playlist 100000
+"""
+import argparse
+import asyncio
+import time
+from src.database import Db
+from .history_paging import SEED_SQL, timed
+from ._db import bench_db
+
+PLAYLIST_SQL = """
+    INSERT INTO playlist (song_name, singer, is_sc, sc_price, language, tag, create_time)
+    WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+    SELECT '歌曲' || n || CASE n % 4 WHEN 0 THEN '晴天' WHEN 1 THEN '夜曲' WHEN 2 THEN 'Love Story' ELSE '稻香' END,
+           '歌手' || (n % 2000), n % 10 = 0, 30, CASE n % 3 WHEN 0 THEN '国语' WHEN 1 THEN '粤语' ELSE '英语' END,
+           '标签' || (n % 50), ? - n
+    FROM seq
+"""
+
+HISTORY_CASES = {
+    "uname user123": {"uname": "user123"},
+    "song song29": {"song_name": "song29"},
+    "uname ser12 + source": {"uname": "ser12", "source": "douyin"},
+}
+PLAYLIST_CASES = ["晴天", "歌手123", "Love", "粤语"]
+
+
+async def main(history: int, playlist: int, repeat: int):
+    async with bench_db("search.sqlite3") as conn:
+        now = int(time.time())
+        await conn.execute_query(SEED_SQL, [history, now])
+        await conn.execute_query(PLAYLIST_SQL, [playlist, now])
+        start = time.perf_counter()
+        await Db._search.setup(conn)
+        build = time.perf_counter() - start
+        assert Db._search.available, "sqlite without fts5 trigram"
+        await conn.execute_script("ANALYZE")
+
+        results = []
+        for name, filters in HISTORY_CASES.items():
+            like = await timed(lambda: Db.get_song_history_page(**filters, fulltext=False), repeat)
+            fts = await timed(lambda: Db.get_song_history_page(**filters), repeat)
+            total = (await Db.get_song_history_page(**filters))[0]
+            assert total == (await Db.get_song_history_page(**filters, fulltext=False))[0], name
+            results.append((f"history {name}", total, like, fts))
+        for keyword in PLAYLIST_CASES:
+            like = await timed(lambda: Db.get_playlist_page(keyword, fulltext=False), repeat)
+            fts = await timed(lambda: Db.get_playlist_page(keyword), repeat)
+            total = (await Db.get_playlist_page(keyword))[0]
+            assert total == (await Db.get_playlist_page(keyword, fulltext=False))[0], keyword
+            results.append((f"playlist {keyword}", total, like, fts))
+        Db._search.clear()
+
+    print(f"history rows: {history}, playlist rows: {playlist}, index build {build:.2f} s")
+    for name, total, like, fts in results:
+        print(f"{name:>28}: {total:7d} hits  LIKE {like:8.2f} ms  FTS5 {fts:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history", type=int, default=1_000_000)
+    parser.add_argument("--playlist", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.history, args.playlist, args.repeat))
@@ -7,7 +7,9 @@ import atexit
 # PyInstaller hook 变量
 datas = []
 binaries = []
-hiddenimports = []
+# src/douyin/lib 只在首次访问消息类型时通过 importlib 导入 _core / _schema，
+# PyInstaller 的静态分析发现不了，需要显式声明，否则打包后解码第一帧就会 ModuleNotFoundError
+hiddenimports = ["src.douyin.lib._core", "src.douyin.lib._schema"]
 
 
 # --- Logic for packaging Notificator.app on macOS ---
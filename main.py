@@ -1,7 +1,7 @@
 import os
 import sys
 import flet as ft
-from src.utils import logger, async_worker
+from src.utils import logger, async_worker, notification_dispatcher
 from src.ui.layout import main
 from src.manager import (
     start_websocket_server,
@@ -32,6 +32,8 @@ def run_app():
         stop_subscribe()
         stop_all_servers()
         async_worker.stop()
+        # 发送退出前仍在队列中的通知
+        notification_dispatcher.stop()
         logger.info("------ Application Stop ------")
         os._exit(0)
 
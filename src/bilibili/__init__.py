@@ -0,0 +1,3 @@
+from .client import BiliLiveClient
+
+__all__ = ["BiliLiveClient"]
@@ -0,0 +1,215 @@
+import asyncio
+import json
+from typing import Callable
+from bilibili_api import Credential
+from bilibili_api.live import LiveRoom
+from bilibili_api.utils.network import get_buvid
+from src.utils import logger, WebSocketClient, ReconnectPolicy
+from .wire import (
+    HEARTBEAT_PACKET,
+    OP_AUTH,
+    VERIFICATION_SUCCESSFUL,
+    VIEW,
+    CommandDecoder,
+    pack,
+)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
+    "Referer": "https://live.bilibili.com/",
+    "Origin": "https://live.bilibili.com",
+}
+HEARTBEAT_INTERVAL = 30
+# 不是 cmd 的控制事件，不影响解码订阅
+CONTROL_EVENTS = frozenset((VERIFICATION_SUCCESSFUL, VIEW))
+
+
+class BiliLiveClient(WebSocketClient):
+    """
+    基于 WebSocketClient 的哔哩哔哩直播弹幕客户端
+
+    事件名、事件数据和 get_status 的状态码与 bilibili_api.live.LiveDanmaku 一致，
+    只有订阅了的 cmd 才会 json 解码；房间号、弹幕服务器和 token 仍通过 bilibili_api 获取。
+    """
+
+    STATUS_INIT = 0
+    STATUS_CONNECTING = 1
+    STATUS_ESTABLISHED = 2
+    STATUS_CLOSING = 3
+    STATUS_CLOSED = 4
+    STATUS_ERROR = 5
+
+    def __init__(self, room_display_id: int, credential: Credential | None = None, max_retry: int = 5):
+        super().__init__()
+        self.room_display_id = room_display_id
+        self.credential = credential if credential is not None else Credential()
+        self.max_retries = max_retry
+        self.reconnect_policy = ReconnectPolicy()
+        self.room = LiveRoom(room_display_id=room_display_id, credential=self.credential)
+        self.room_real_id = None
+        self.headers = dict(HEADERS)
+        self._handlers: dict[str, list[Callable]] = {}
+        self._decoder = CommandDecoder(())
+        self._hosts: list[str] = []
+        self._token = ""
+        self._verified = False
+        self._closed = False
+        self._last_status = self.STATUS_INIT
+        self._heartbeat_task: asyncio.Task | None = None
+        # 持有异步处理函数的任务引用，避免执行中被回收
+        self._tasks: set[asyncio.Task] = set()
+
+    def on(self, event: str):
+        def decorator(func: Callable):
+            self.add_event_listener(event, func)
+            return func
+
+        return decorator
+
+    def add_event_listener(self, event: str, handler: Callable):
+        self._handlers.setdefault(event, []).append(handler)
+        self._update_cmds()
+
+    def remove_event_listener(self, event: str, handler: Callable):
+        handlers = self._handlers.get(event)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event]
+            self._update_cmds()
+            return True
+        return False
+
+    def _update_cmds(self):
+        self._decoder.set_cmds(self._handlers.keys() - CONTROL_EVENTS)
+
+    def dispatch(self, event: str, data):
+        for handler in self._handlers.get(event, ()):
+            result = handler(data)
+            if asyncio.iscoroutine(result):
+                task = asyncio.create_task(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Bilibili danmaku handler error: {task.exception()!r}")
+
+    @property
+    def status_code(self):
+        return self._status_code
+
+    @status_code.setter
+    def status_code(self, value: int):
+        self._status_code = value
+        self._notify_status()
+
+    def _notify_status(self):
+        """
+        on_status_change 收到的是 get_status() 的直播状态码（与 LiveDanmaku 一致），只在变化时回调
+        """
+        status = self.get_status()
+        if status == self._last_status:
+            return
+        self._last_status = status
+        if self.on_status_change:
+            self.on_status_change(status)
+
+    def get_status(self) -> int:
+        """
+        0 初始化，1 连接建立中，2 已连接，3 断开连接中，4 已断开，5 错误
+        """
+        if self._closed:
+            return self.STATUS_CLOSED
+        status = self.status_code
+        if status == 1:
+            return self.STATUS_ESTABLISHED if self._verified else self.STATUS_CONNECTING
+        if status == 3:
+            return self.STATUS_ERROR
+        if status == 0 and not self._is_running:
+            return self.STATUS_INIT
+        return self.STATUS_CONNECTING
+
+    async def connect_async(self):
+        """
+        获取弹幕服务器并连接，连接建立后返回，之后在后台接收消息
+        """
+        self._closed = False
+        await self._prepare_reconnect()
+        await self._start()
+
+    async def disconnect(self):
+        self._closed = True
+        self._notify_status()
+        self._stop_heartbeat()
+        await self.close()
+
+    async def _prepare_reconnect(self):
+        # token 有有效期，每次连接都重新获取，连续失败时轮换服务器
+        if self.room_real_id is None:
+            self.room_real_id = await self.room.get_room_id()
+        try:
+            conf = await self.room.get_danmu_info()
+        except Exception as e:
+            if not self._hosts:
+                raise
+            logger.warning(f"Failed to refresh Bilibili danmaku server info, reusing the previous token: {e}")
+        else:
+            self._token = conf["token"]
+            self._hosts = [f"wss://{host['host']}:{host['wss_port']}/sub" for host in conf["host_list"]]
+        self.url = self._hosts[self.reconnect_policy.attempt % len(self._hosts)]
+
+    async def connect(self):
+        self._verified = False
+        self._notify_status()
+        self._stop_heartbeat()
+        await super().connect()
+        if self.is_connected:
+            await self._send_verify()
+
+    async def _send_verify(self):
+        credential = self.credential
+        uid = int(credential.dedeuserid) if credential.has_dedeuserid() else 0
+        buvid = credential.buvid3 if credential.has_buvid3() else (await get_buvid())[0]
+        body = {
+            "uid": uid,
+            "roomid": self.room_real_id,
+            "protover": 3,
+            "platform": "web",
+            "type": 2,
+            "buvid": buvid,
+            "key": self._token,
+        }
+        await self.send(pack(json.dumps(body, separators=(",", ":")).encode(), OP_AUTH))
+
+    async def on_message(self, message):
+        if isinstance(message, str):
+            return
+        for cmd, data in self._decoder.decode(message):
+            if cmd == VERIFICATION_SUCCESSFUL:
+                if data.get("code") != 0:
+                    logger.error(f"Bilibili danmaku auth failed: {data}")
+                    continue
+                logger.info(f"Bilibili danmaku connected to room {self.room_real_id}")
+                self._verified = True
+                self._notify_status()
+                self._stop_heartbeat()
+                self._heartbeat_task = asyncio.create_task(self._heartbeat())
+                data = None
+            self.dispatch(cmd, {
+                "room_display_id": self.room_display_id,
+                "room_real_id": self.room_real_id,
+                "type": cmd,
+                "data": data,
+            })
+
+    async def _heartbeat(self):
+        while self.is_connected:
+            await self.send(HEARTBEAT_PACKET)
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    def _stop_heartbeat(self):
+        if self._heartbeat_task and not self._heartbeat_task.done():
+            self._heartbeat_task.cancel()
+        self._heartbeat_task = None
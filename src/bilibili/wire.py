@@ -0,0 +1,136 @@
+"""
+哔哩哔哩直播弹幕协议的数据包编解码
+
+每个数据包由 16 字节大端头部 (总长度, 头部长度, 协议版本, 操作码, sequence) 和正文组成，
+协议版本 2/3 的正文是 zlib/brotli 压缩后的多个数据包。
+
+CommandDecoder 解压并拆分数据包，先从 JSON 正文开头直接读取 cmd，
+只有订阅的 cmd 才会 json 解码，其余消息（INTERACT_WORD、ONLINE_RANK 等）直接跳过。
+"""
+import json
+import struct
+import zlib
+from typing import Any, Iterable, Iterator, NamedTuple
+import brotli
+
+HEADER = struct.Struct(">IHHII")
+HEADER_LENGTH = HEADER.size
+
+# 协议版本
+PROTO_JSON = 0
+PROTO_INT = 1
+PROTO_ZLIB = 2
+PROTO_BROTLI = 3
+
+# 操作码
+OP_HEARTBEAT = 2
+OP_HEARTBEAT_REPLY = 3
+OP_MESSAGE = 5
+OP_AUTH = 7
+OP_AUTH_REPLY = 8
+
+# 事件名与 bilibili_api.live.LiveDanmaku 一致
+VERIFICATION_SUCCESSFUL = "VERIFICATION_SUCCESSFUL"
+VIEW = "VIEW"
+
+_CMD_KEY = b'"cmd":"'
+# cmd 一般是正文的第一个字段，只在开头查找
+_CMD_SEARCH = 64
+
+
+class Packet(NamedTuple):
+    protover: int
+    op: int
+    body: memoryview
+
+
+class Event(NamedTuple):
+    # cmd 去掉 ":" 之后的后缀，例如 DANMU_MSG:4:0:2:2:2:0 -> DANMU_MSG
+    cmd: str
+    data: Any
+
+
+def pack(body: bytes, op: int, protover: int = PROTO_INT) -> bytes:
+    return HEADER.pack(HEADER_LENGTH + len(body), HEADER_LENGTH, protover, op, 1) + body
+
+
+# 心跳包内容固定
+HEARTBEAT_PACKET = pack(b"[object Object]", OP_HEARTBEAT)
+
+
+def iter_packets(data: bytes | memoryview) -> Iterator[Packet]:
+    """
+    拆分数据包，压缩的数据包解压后递归拆分
+    """
+    buf = memoryview(data)
+    offset = 0
+    end = len(buf)
+    while offset + HEADER_LENGTH <= end:
+        length, header_length, protover, op, _ = HEADER.unpack_from(buf, offset)
+        if op == OP_HEARTBEAT_REPLY and protover == PROTO_INT:
+            # 与 bilibili_api 一致，心跳回复不按长度字段拆分，剩余数据都是正文
+            yield Packet(protover, op, buf[offset + header_length:])
+            return
+        if length < header_length or offset + length > end:
+            raise ValueError("truncated packet")
+        body = buf[offset + header_length:offset + length]
+        offset += length
+        if protover == PROTO_BROTLI:
+            yield from iter_packets(brotli.decompress(body))
+        elif protover == PROTO_ZLIB:
+            yield from iter_packets(zlib.decompress(body))
+        else:
+            yield Packet(protover, op, body)
+    if offset != end:
+        raise ValueError("truncated packet")
+
+
+def read_cmd(body: memoryview) -> str | None:
+    """
+    不解码 JSON，直接读取正文开头的 cmd，读取失败返回 None
+    """
+    head = bytes(body[:_CMD_SEARCH])
+    start = head.find(_CMD_KEY)
+    if start < 0:
+        return None
+    start += len(_CMD_KEY)
+    stop = head.find(b'"', start)
+    if stop < 0:
+        return None
+    return head[start:stop].split(b":", 1)[0].decode("utf-8")
+
+
+class CommandDecoder:
+    """
+    cmds 为订阅的 cmd 名
+    """
+
+    def __init__(self, cmds: Iterable[str]):
+        self.set_cmds(cmds)
+
+    def set_cmds(self, cmds: Iterable[str]):
+        self.cmds = frozenset(cmds)
+
+    def decode(self, data: bytes) -> list[Event]:
+        events = []
+        cmds = self.cmds
+        for protover, op, body in iter_packets(data):
+            if op == OP_MESSAGE:
+                cmd = read_cmd(body)
+                if cmd is None:
+                    # 格式不符合预期时退回完整解码
+                    message = json.loads(bytes(body))
+                    cmd = message.get("cmd", "").split(":", 1)[0]
+                    if cmd not in cmds:
+                        continue
+                elif cmd not in cmds:
+                    continue
+                else:
+                    message = json.loads(bytes(body))
+                events.append(Event(cmd, message))
+            elif op == OP_HEARTBEAT_REPLY:
+                # 心跳回复正文为 4 字节人气值
+                events.append(Event(VIEW, struct.unpack_from(">I", body)[0] if len(body) >= 4 else 0))
+            elif op == OP_AUTH_REPLY:
+                events.append(Event(VERIFICATION_SUCCESSFUL, json.loads(bytes(body))))
+        return events
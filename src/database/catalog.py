@@ -0,0 +1,101 @@
+import unicodedata
+from typing import NamedTuple
+from src.utils import logger
+
+
+class PlaylistEntry(NamedTuple):
+    id: int
+    song_name: str
+    is_sc: bool
+    sc_price: int
+
+
+def normalize_song_name(song_name: str) -> str:
+    """
+    歌名归一化：全角转半角（NFKC）、大小写折叠、去除所有空白
+    """
+    if not song_name.isascii():
+        song_name = unicodedata.normalize("NFKC", song_name)
+    return "".join(song_name.casefold().split())
+
+
+class PlaylistCatalog:
+    """
+    歌单内存索引
+
+    以归一化后的歌名为键建立哈希索引，供直播点歌时 O(1) 匹配歌单和 SC 价格。
+    同名（归一化后相同）的歌曲匹配时返回 id 最小的一首。
+    """
+
+    def __init__(self):
+        # 归一化歌名 -> 最小 id
+        self._first: dict[str, int] = {}
+        # id -> (id, song_name, is_sc, sc_price)
+        self._rows: dict[int, tuple] = {}
+        # id -> 归一化歌名
+        self._keys: dict[int, str] = {}
+        # 只记录有重名的歌名 -> 升序 id 列表
+        self._dupes: dict[str, list[int]] = {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    async def load(self, conn):
+        """
+        从 playlist 表全量加载
+        """
+        _, rows = await conn.execute_query("SELECT id, song_name, is_sc, sc_price FROM playlist ORDER BY id")
+        ids = [row[0] for row in rows]
+        keys = list(map(normalize_song_name, [row[1] for row in rows]))
+        self._rows = dict(zip(ids, rows))
+        self._keys = dict(zip(ids, keys))
+        # 倒序写入，同名时 id 小的覆盖 id 大的
+        self._first = dict(zip(reversed(keys), reversed(ids)))
+        self._dupes = {}
+        if len(self._first) != len(ids):
+            for id, key in zip(ids, keys):
+                self._dupes.setdefault(key, []).append(id)
+            self._dupes = {key: id_list for key, id_list in self._dupes.items() if len(id_list) > 1}
+        logger.info(f"Playlist catalog loaded with {len(ids)} songs.")
+
+    def upsert(self, id: int, song_name: str, is_sc: bool, sc_price: int):
+        self.remove([id])
+        key = normalize_song_name(song_name)
+        self._rows[id] = (id, song_name, is_sc, sc_price)
+        self._keys[id] = key
+        first = self._first.get(key)
+        if first is None:
+            self._first[key] = id
+            return
+        id_list = self._dupes.setdefault(key, [first])
+        id_list.append(id)
+        id_list.sort()
+        self._first[key] = id_list[0]
+
+    def remove(self, ids: list[int]):
+        for id in ids:
+            key = self._keys.pop(id, None)
+            if key is None:
+                continue
+            del self._rows[id]
+            id_list = self._dupes.get(key)
+            if id_list is None:
+                del self._first[key]
+                continue
+            id_list.remove(id)
+            self._first[key] = id_list[0]
+            if len(id_list) == 1:
+                del self._dupes[key]
+
+    def lookup(self, song_name: str) -> PlaylistEntry | None:
+        id = self._first.get(normalize_song_name(song_name))
+        if id is None:
+            return None
+        id, name, is_sc, sc_price = self._rows[id]
+        return PlaylistEntry(id, name, bool(is_sc), sc_price)
+
+    def clear(self):
+        self._first.clear()
+        self._rows.clear()
+        self._keys.clear()
+        self._dupes.clear()
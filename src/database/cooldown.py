@@ -0,0 +1,56 @@
+from typing import NamedTuple
+from src.utils import logger
+
+
+class CooldownEntry(NamedTuple):
+    history_id: int
+    create_time: int
+
+
+class CooldownIndex:
+    """
+    点歌冷却索引
+
+    以 (source, uid) 为键缓存用户最近一次点歌的时间和历史记录 id，
+    点歌 cd 判断和取消点歌都先查这里。预热后索引包含所有用户，未命中即没有点歌记录，
+    只有未预热时才回落到 songhistory 查询。
+    所有读写都发生在 AsyncWorker 的事件循环中，因此不需要加锁。
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, int], CooldownEntry] = {}
+        self.warmed = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, uid: int, source: str) -> CooldownEntry | None:
+        return self._entries.get((source, uid))
+
+    def update(self, uid: int, source: str, history_id: int, create_time: int):
+        """
+        记录一次点歌，只保留时间最新的一条
+        """
+        key = (source, uid)
+        entry = self._entries.get(key)
+        if entry and (entry.create_time, entry.history_id) > (create_time, history_id):
+            return
+        self._entries[key] = CooldownEntry(history_id, create_time)
+
+    def clear(self):
+        self._entries.clear()
+        self.warmed = False
+
+    async def warm(self, conn):
+        """
+        从 songhistory 预热索引，每个 (source, uid) 取最新的一条
+        """
+        # sqlite 中与 MAX() 同行的裸列取自最大值所在行
+        rows = await conn.execute_query_dict(
+            "SELECT source, uid, id, MAX(create_time) AS create_time FROM songhistory GROUP BY source, uid"
+        )
+        self._entries = {
+            (row["source"], row["uid"]): CooldownEntry(row["id"], row["create_time"]) for row in rows
+        }
+        self.warmed = True
+        logger.info(f"Cooldown index warmed with {len(self._entries)} entries.")
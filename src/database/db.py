@@ -1,15 +1,24 @@
 import os
 import uuid
+from typing import Callable
 from tortoise import Tortoise
 from tortoise.connection import connections
 from tortoise.models import Q
 from aerich import Command
 from .model import BiliConfig, BiliCredential, DyConfig, GloalConfig, SongHistory, Playlist
+from .cooldown import CooldownIndex, CooldownEntry
+from .journal import SongHistoryJournal
+from .catalog import PlaylistCatalog, PlaylistEntry
+from .paging import CountCache, CursorPage, LAST_PAGE, seek_page
+from .search import FullTextIndex
+from .rollup import DailyStatsRollup
+from .storage import StorageProfile, connection_config, get_profile, maintain
 from src.utils import get_path, logger, get_support_dir, __version__ as CURRENT_VERSION
 
 MIGRATIONS_LOCATION = os.path.join(get_support_dir(), "migrations")
+DB_PATH = get_path('vsingerboard.sqlite3', dir_name='data')
 TORTISE_ORM = {
-    "connections": {"default": f"sqlite://{get_path('vsingerboard.sqlite3', dir_name='data')}"},
+    "connections": {"default": connection_config(DB_PATH, get_profile())},
     "apps": {
         CURRENT_VERSION: {
             "models": ["src.database.model", "aerich.models"],
@@ -19,26 +28,96 @@ TORTISE_ORM = {
 }
 
 
+class ConfigCache:
+    """
+    配置缓存
+
+    缓存 GloalConfig / BiliConfig / DyConfig 的配置行，写入时同步刷新并通知订阅者，
+    热路径上读取配置不再访问 SQLite。
+    """
+
+    def __init__(self):
+        self._values: dict[type, object] = {}
+        self._listeners: dict[type, list[Callable]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: type):
+        """
+        返回 (是否命中, 缓存值)，缓存值可能为 None（表示数据库中还没有配置）
+        """
+        if model in self._values:
+            self.hits += 1
+            return True, self._values[model]
+        self.misses += 1
+        return False, None
+
+    def set(self, model: type, value):
+        self._values[model] = value
+        for callback in list(self._listeners.get(model, [])):
+            try:
+                callback(value)
+            except Exception as e:
+                logger.error(f"config listener {callback} error: {e}")
+
+    def subscribe(self, model: type, callback: Callable):
+        """
+        订阅配置变化，已缓存的值会立即回调一次
+        """
+        self._listeners.setdefault(model, []).append(callback)
+        if model in self._values:
+            callback(self._values[model])
+        return callback
+
+    def unsubscribe(self, model: type, callback: Callable):
+        if callback in self._listeners.get(model, []):
+            self._listeners[model].remove(callback)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._values)}
+
+    def clear(self):
+        self._values.clear()
+
+
 class Db:
     _initialized = False
+    _cooldown = CooldownIndex()
+    _config_cache = ConfigCache()
+    _journal = SongHistoryJournal()
+    _catalog = PlaylistCatalog()
+    _counts = CountCache()
+    _search = FullTextIndex()
+    _rollup = DailyStatsRollup()
+    storage_profile: StorageProfile | None = None
 
     @classmethod
-    async def init(cls):
+    async def init(cls, profile: str | None = None):
         """
         初始化database连接
 
         此方法应具有幂等性，并且只能从单个 asyncio 事件循环中调用。
+        profile 为存储配置档名，为 None 时读取环境变量 VSINGERBOARD_DB_PROFILE，默认 balanced。
         """
         if cls._initialized:
             return
 
         try:
             await cls.run_db_upgrade(cls)
-            await Tortoise.init(config=TORTISE_ORM)
+            cls.storage_profile = get_profile(profile)
+            config = {**TORTISE_ORM, "connections": {"default": connection_config(DB_PATH, cls.storage_profile)}}
+            await Tortoise.init(config=config)
             await Tortoise.generate_schemas()
             cls._conn = Tortoise.get_connection("default")
+            await cls._search.setup(cls._conn)
+            await cls._rollup.setup(cls._conn)
+            await cls._cooldown.warm(cls._conn)
+            await cls._journal.start(cls._conn)
+            await cls._catalog.load(cls._conn)
+            for model in (GloalConfig, BiliConfig, DyConfig):
+                await cls._refresh_config(model)
             cls._initialized = True
-            logger.info("Database initialized successfully.")
+            logger.info(f"Database initialized successfully with storage profile '{cls.storage_profile.name}'.")
         except Exception as e:
             logger.exception(f"Database initialization failed: {e}")
             raise
@@ -50,10 +129,31 @@ class Db:
         """
         if not cls._initialized:
             return
+        try:
+            await cls._journal.stop()
+        except Exception as e:
+            logger.exception(f"Flush song history journal failed: {e}")
         await connections.close_all()
+        cls._cooldown.clear()
+        cls._config_cache.clear()
+        cls._catalog.clear()
+        cls._counts.clear()
+        cls._search.clear()
         cls._initialized = False
         logger.info("Database disconnected.")
 
+    @classmethod
+    async def maintain_storage(cls):
+        """
+        WAL checkpoint 和 PRAGMA optimize，由 subscribe_manager 定时调用
+        """
+        if not cls._initialized:
+            return None
+        await cls._journal.flush()
+        result = await maintain(cls._conn)
+        logger.info(f"Database maintenance finished: {result}")
+        return result
+
     async def run_db_upgrade(cls):
         """
         更新database
@@ -107,6 +207,42 @@ class Db:
         res = await BiliCredential.get(**kwargs).first()
         return res
 
+    @classmethod
+    async def _get_config(cls, model: type, **kwargs):
+        """
+        读取配置，无过滤条件时走缓存
+        """
+        if kwargs:
+            return await model.get(**kwargs).first()
+        found, value = cls._config_cache.get(model)
+        if found:
+            return value
+        return await cls._refresh_config(model)
+
+    @classmethod
+    async def _refresh_config(cls, model: type):
+        """
+        从数据库重新加载配置并写入缓存
+        """
+        value = await model.get().first()
+        cls._config_cache.set(model, value)
+        return value
+
+    @classmethod
+    def subscribe_config(cls, model: type, callback: Callable):
+        """
+        订阅配置变化，回调参数为最新的配置行（可能为 None）
+        """
+        return cls._config_cache.subscribe(model, callback)
+
+    @classmethod
+    def unsubscribe_config(cls, model: type, callback: Callable):
+        cls._config_cache.unsubscribe(model, callback)
+
+    @classmethod
+    def get_config_cache_stats(cls):
+        return cls._config_cache.stats()
+
     @classmethod
     async def add_or_update_bili_config(cls, **kwargs):
         id = kwargs.get("id")
@@ -115,22 +251,22 @@ class Db:
         try:
             if bconfig:
                 await bconfig.get(id=id).update(**kwargs)
-                return bconfig.id
             else:
                 bconfig = await BiliConfig.create(**kwargs)
-                return bconfig.id
+            await cls._refresh_config(BiliConfig)
+            return bconfig.id
         except Exception as e:
             logger.error(f"add_or_update_bili_config error: {e}")
             return 0
 
     @classmethod
     async def get_bconfig(cls, **kwargs):
-        res = await BiliConfig.get(**kwargs).first()
+        res = await cls._get_config(BiliConfig, **kwargs)
         return res
 
     @classmethod
     async def get_dy_config(cls, **kwargs):
-        res = await DyConfig.get(**kwargs).first()
+        res = await cls._get_config(DyConfig, **kwargs)
         return res
 
     @classmethod
@@ -141,17 +277,17 @@ class Db:
         try:
             if dy_config:
                 await dy_config.get(id=id).update(**kwargs)
-                return dy_config.id
             else:
                 dy_config = await DyConfig.create(**kwargs)
-                return dy_config.id
+            await cls._refresh_config(DyConfig)
+            return dy_config.id
         except Exception as e:
             logger.error(f"add_or_update_dy_config error: {e}")
             return 0
 
     @classmethod
     async def get_gloal_config(cls, **kwargs):
-        res = await GloalConfig.get(**kwargs).first()
+        res = await cls._get_config(GloalConfig, **kwargs)
         return res
 
     @classmethod
@@ -162,44 +298,99 @@ class Db:
         try:
             if gloal_config:
                 await gloal_config.get(id=id).update(**kwargs)
-                return gloal_config.id
             else:
                 gloal_config = await GloalConfig.create(**kwargs)
-                return gloal_config.id
+            await cls._refresh_config(GloalConfig)
+            return gloal_config.id
         except Exception as e:
             logger.error(f"add_or_update_gloal_config error: {e}")
             return 0
 
     @classmethod
     async def get_song_history(cls, uid: int, source: str):
+        """
+        获取用户最近一次点歌记录，写后日志中未提交的记录比已落盘的更新，直接从内存返回
+        """
+        pending = cls._journal.latest(uid, source)
+        if pending:
+            return pending
         res = await SongHistory.get(uid=uid, source=source).order_by("-create_time").first()
         return res
 
+    @classmethod
+    async def get_last_request(cls, uid: int, source: str) -> CooldownEntry | None:
+        """
+        获取用户最近一次点歌，优先命中冷却索引，索引预热后未命中视为没有点歌记录，不再查询数据库
+        """
+        entry = cls._cooldown.get(uid, source)
+        if entry or cls._cooldown.warmed:
+            return entry
+        history = await cls.get_song_history(uid=uid, source=source)
+        if not history:
+            return None
+        cls._cooldown.update(uid, source, history.id, history.create_time)
+        return cls._cooldown.get(uid, source)
+
     @classmethod
     async def add_song_history(cls, **kwargs):
-        res = await SongHistory.create(**kwargs)
+        """
+        新增点歌记录，写后日志运行时只分配 id 入队，由后台任务批量落盘
+        """
+        if cls._journal.running:
+            res = cls._journal.append(**kwargs)
+        else:
+            res = await SongHistory.create(**kwargs)
+        cls._cooldown.update(res.uid, res.source, res.id, res.create_time)
+        cls._counts.invalidate("songhistory")
         return res
 
     @classmethod
-    async def get_song_history_page(cls,
-                                    uname: str = None,
-                                    song_name: str = None,
-                                    source: str = None,
-                                    start_time: int = 0,
-                                    end_time: int = 0,
-                                    page: int = 1,
-                                    size: int = 20):
+    async def flush_song_history(cls):
+        """
+        立即写入写后日志中的点歌记录
+        """
+        return await cls._journal.flush()
+
+    @classmethod
+    def _contains(cls, query, column: str, term: str, fulltext: bool = True):
+        """
+        子串匹配，全文索引可用时走 FTS5 trigram 索引，否则回落到 LIKE
+        """
+        if fulltext and cls._search.usable(term):
+            return query.filter(id__in=cls._search.match(query.model._meta.db_table, term, column))
+        return query.filter(**{f"{column}__icontains": term})
+
+    @classmethod
+    def _song_history_query(cls, uname: str = None, song_name: str = None, source: str = None,
+                            start_time: int = 0, end_time: int = 0, fulltext: bool = True):
         query = SongHistory.all()
         if uname:
-            query = query.filter(uname__icontains=uname)
+            query = cls._contains(query, "uname", uname, fulltext)
         if song_name:
-            query = query.filter(song_name__icontains=song_name)
+            query = cls._contains(query, "song_name", song_name, fulltext)
         if source:
-            query = query.filter(source__icontains=source)
+            query = query.filter(source=source)
         if start_time:
             query = query.filter(create_time__gte=start_time)
         if end_time:
             query = query.filter(create_time__lte=end_time)
+        return query
+
+    @classmethod
+    async def get_song_history_page(cls,
+                                    uname: str = None,
+                                    song_name: str = None,
+                                    source: str = None,
+                                    start_time: int = 0,
+                                    end_time: int = 0,
+                                    page: int = 1,
+                                    size: int = 20,
+                                    fulltext: bool = True):
+        """
+        按页码获取点歌记录，fulltext 为 True 时昵称和歌名的搜索优先走全文索引
+        """
+        await cls._journal.flush()
+        query = cls._song_history_query(uname, song_name, source, start_time, end_time, fulltext)
 
         total = await query.count()
         songs = await query.offset((page - 1) * size).limit(size).order_by("-create_time").all()
@@ -207,24 +398,100 @@ class Db:
         return total, songs
 
     @classmethod
-    async def get_playlist_page(cls, keyword: str = None, page: int = 1, size: int = 20):
+    async def count_song_history(cls,
+                                 uname: str = None,
+                                 song_name: str = None,
+                                 source: str = None,
+                                 start_time: int = 0,
+                                 end_time: int = 0) -> int:
+        """
+        获取点歌记录总数，按筛选条件缓存，新增点歌记录时失效
+        """
+        await cls._journal.flush()
+        key = ("songhistory", uname or None, song_name or None, source or None, start_time or None, end_time or None)
+        total = cls._counts.get(key)
+        if total is None:
+            total = await cls._song_history_query(uname, song_name, source, start_time, end_time).count()
+            cls._counts.set(key, total)
+        return total
+
+    @classmethod
+    async def get_song_history_cursor(cls,
+                                      uname: str = None,
+                                      song_name: str = None,
+                                      source: str = None,
+                                      start_time: int = 0,
+                                      end_time: int = 0,
+                                      cursor: str | None = None,
+                                      size: int = 20) -> CursorPage:
+        """
+        按游标获取一页点歌记录，cursor 为 None 时取第一页，为 LAST_PAGE 时取最后一页
+        """
+        await cls._journal.flush()
+        total = 0
+        if cursor == LAST_PAGE:
+            total = await cls.count_song_history(uname, song_name, source, start_time, end_time)
+        query = cls._song_history_query(uname, song_name, source, start_time, end_time)
+        return await seek_page(query, cursor, size, total)
+
+    @classmethod
+    def _playlist_query(cls, keyword: str = None, fulltext: bool = True):
         query = Playlist.all()
-        if keyword:
+        if keyword and fulltext and cls._search.usable(keyword):
+            query = query.filter(id__in=cls._search.match("playlist", keyword))
+        elif keyword:
             query = query.filter(Q(song_name__icontains=keyword, tag__icontains=keyword, singer__icontains=keyword, language__icontains=keyword, join_type="OR"))
+        return query
+
+    @classmethod
+    async def get_playlist_page(cls, keyword: str = None, page: int = 1, size: int = 20, fulltext: bool = True):
+        """
+        按页码获取歌单，fulltext 为 True 时关键字搜索优先走全文索引
+        """
+        query = cls._playlist_query(keyword, fulltext)
 
         total = await query.count()
         rows = await query.offset((page - 1) * size).limit(size).order_by("-create_time").all()
 
         return total, rows
 
+    @classmethod
+    async def count_playlist(cls, keyword: str = None) -> int:
+        """
+        获取歌单总数，按关键字缓存，歌单有修改时失效
+        """
+        key = ("playlist", keyword or None)
+        total = cls._counts.get(key)
+        if total is None:
+            total = await cls._playlist_query(keyword).count()
+            cls._counts.set(key, total)
+        return total
+
+    @classmethod
+    async def get_playlist_cursor(cls, keyword: str = None, cursor: str | None = None, size: int = 20) -> CursorPage:
+        """
+        按游标获取一页歌单，cursor 为 None 时取第一页，为 LAST_PAGE 时取最后一页
+        """
+        total = await cls.count_playlist(keyword) if cursor == LAST_PAGE else 0
+        return await seek_page(cls._playlist_query(keyword), cursor, size, total)
+
     @classmethod
     async def get_playlist(cls, **kwargs):
         result = await Playlist.filter(**kwargs).first()
         return result
 
+    @classmethod
+    def match_playlist(cls, song_name: str) -> PlaylistEntry | None:
+        """
+        在歌单内存索引中匹配歌名（忽略全半角、大小写和空白）
+        """
+        return cls._catalog.lookup(song_name)
+
     @classmethod
     async def delete_playlist(cls, ids: list[int]):
         result = await Playlist.filter(id__in=ids).delete()
+        cls._catalog.remove(ids)
+        cls._counts.invalidate("playlist")
         return result
 
     @classmethod
@@ -235,10 +502,12 @@ class Db:
         try:
             if playlist:
                 await Playlist.get(id=id).update(**kwargs)
-                return playlist.id
+                playlist = await Playlist.get(id=id).first()
             else:
                 playlist = await Playlist.create(**kwargs)
-                return playlist.id
+            cls._catalog.upsert(playlist.id, playlist.song_name, playlist.is_sc, playlist.sc_price)
+            cls._counts.invalidate("playlist")
+            return playlist.id
         except Exception as e:
             logger.error(f"add_or_update_playlist error: {e}")
             return 0
@@ -250,11 +519,45 @@ class Db:
             obj = Playlist(**item)
             objects.append(obj)
         await Playlist.bulk_create(objects, batch_size=500)
+        cls._counts.invalidate("playlist")
+        # bulk_create 不会回填 sqlite 自增 id，直接重新加载索引
+        await cls._catalog.load(cls._conn)
 
     @classmethod
-    async def get_statisitic(cls, query_type: str, days: int, source: str | None):
+    async def get_statisitic(cls, query_type: str, days: int, source: str | None, top: int = 1):
+        """
+        最近 days 天每天点歌最多的 top 首歌（query_type 为 song）或 top 个用户（query_type 为 user），
+        读取 song_daily_stats 汇总表
+        """
+        kind = "user" if query_type == "user" else "song"
+        await cls._journal.flush()
+
+        modifier = f"-{int(days)} days"
+        by_source = bool(source and source.strip())
+        params = [modifier, modifier]
+        if by_source:
+            params += [source, source]
+        params.append(int(days) * top)
+
+        _, query_result = await cls._conn.execute_query(cls._rollup.top_per_day_sql(kind, by_source, top), params)
+        return query_result
+
+    @classmethod
+    async def rebuild_song_daily_stats(cls):
+        """
+        从 songhistory 重建 song_daily_stats 汇总表
+        """
+        await cls._journal.flush()
+        return await cls._rollup.rebuild(cls._conn)
+
+    @classmethod
+    async def _raw_statisitic(cls, query_type: str, days: int, source: str | None, top: int = 1):
+        """
+        直接统计 songhistory，作为汇总表查询的对照
+        """
         # 根据 query_type 确定分组和目标字段
         group_field = "uname" if query_type == "user" else "song_name"
+        await cls._journal.flush()
 
         source_filter = ""
         params = [f"-{int(days)} days"]
@@ -281,11 +584,11 @@ class Db:
                 ROW_NUMBER() OVER (PARTITION BY day ORDER BY count DESC) as rn
                 FROM DailyCounts
             )
-            WHERE rn = 1
+            WHERE rn <= ?
             ORDER BY day DESC
             LIMIT ?;
         """
-        params.append(days)
+        params += [top, int(days) * top]
 
         _, query_result = await cls._conn.execute_query(query, params)
         return query_result
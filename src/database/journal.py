@@ -0,0 +1,158 @@
+import asyncio
+from tortoise.transactions import in_transaction
+from .model import SongHistory
+from src.utils import logger
+
+
+class SongHistoryJournal:
+    """
+    SongHistory 写后日志
+
+    点歌记录在内存中分配 id 后立即返回，后台任务每隔 flush_interval 秒或攒满 max_batch 条时，
+    在单个事务中批量写入 songhistory。进程崩溃最多丢失一个刷新窗口内的记录，
+    stop() 会把剩余记录全部写入。
+
+    批量写入连续失败 max_retries 次后改为逐条写入，仍然失败的记录记录日志后丢弃，
+    避免一条坏记录或持续的写入错误挡住之后所有的点歌记录。
+    """
+
+    def __init__(self, flush_interval: float = 0.5, max_batch: int = 200, max_retries: int = 3):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.flushed_rows = 0
+        self.flush_count = 0
+        self.dropped_rows = 0
+        self._failures = 0
+        self._pending: list[SongHistory] = []
+        # 正在写入的批次，提交前仍然可以从内存中读到
+        self._flushing: list[SongHistory] = []
+        self._next_id = 0
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._lock: asyncio.Lock | None = None
+        self._stopping = False
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    async def start(self, conn):
+        """
+        读取当前最大 id 并启动后台刷新任务，必须在数据库所在的事件循环中调用
+        """
+        if self.running:
+            return
+        _, rows = await conn.execute_query("SELECT MAX(id) AS max_id FROM songhistory")
+        _, seq = await conn.execute_query("SELECT seq FROM sqlite_sequence WHERE name = 'songhistory'")
+        self._next_id = max(rows[0]["max_id"] or 0, seq[0]["seq"] if seq else 0, self._next_id)
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"SongHistory journal started, next id {self._next_id + 1}.")
+
+    def append(self, **kwargs) -> SongHistory:
+        """
+        分配 id 并入队，不等待落盘
+        """
+        self._next_id += 1
+        history = SongHistory(id=self._next_id, **kwargs)
+        self._pending.append(history)
+        if len(self._pending) >= self.max_batch and self._wakeup:
+            self._wakeup.set()
+        return history
+
+    def latest(self, uid: int, source: str) -> SongHistory | None:
+        """
+        返回尚未提交的记录中该用户最新的一条，不访问数据库
+        """
+        for rows in (self._pending, self._flushing):
+            for history in reversed(rows):
+                if history.uid == uid and history.source == source:
+                    return history
+        return None
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self):
+        """
+        将队列中的记录在一个事务中写入数据库，返回写入条数
+
+        先取得锁再检查队列：后台任务正在提交时，调用方会等到这一批落盘后才返回。
+        写入失败只记录日志不抛出，读取方法在刷新之后照常查询已落盘的记录。
+        """
+        if self._lock is None:
+            return 0
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            self._flushing = batch
+            try:
+                written = await self._write(batch)
+            except Exception as e:
+                self._failures += 1
+                logger.error(f"SongHistory journal flush failed ({self._failures}/{self.max_retries}): {e}")
+                if self._failures < self.max_retries:
+                    # 放回队首，等待下一个窗口重试
+                    self._pending = batch + self._pending
+                    return 0
+                written = await self._write_each(batch)
+            except BaseException:
+                # 被取消时放回队首，由 stop() 写入
+                self._pending = batch + self._pending
+                raise
+            finally:
+                self._flushing = []
+            self._failures = 0
+            self.flushed_rows += written
+            self.flush_count += 1
+            return written
+
+    async def _write(self, batch: list[SongHistory]) -> int:
+        async with in_transaction():
+            await SongHistory.bulk_create(batch, batch_size=500)
+        return len(batch)
+
+    async def _write_each(self, batch: list[SongHistory]) -> int:
+        """
+        逐条写入，丢弃仍然失败的记录
+        """
+        written = 0
+        for history in batch:
+            try:
+                written += await self._write([history])
+            except Exception as e:
+                self.dropped_rows += 1
+                logger.error(f"Dropped song history {history.id} ({history.source}:{history.uid} "
+                             f"{history.uname} {history.song_name} @{history.create_time}): {e}")
+        return written
+
+    async def stop(self):
+        """
+        停止后台任务并写入剩余记录
+
+        不取消后台任务，等待正在进行的提交完成后再退出，避免事务中途被打断导致丢数据或连接卡住。
+        """
+        if self._task:
+            self._stopping = True
+            self._wakeup.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # 写入失败时继续重试，最后一次逐条写入，保证退出前队列清空
+        for _ in range(self.max_retries):
+            await self.flush()
+            if not self._pending:
+                break
@@ -96,6 +96,10 @@ class Playlist(BaseModel):
     tag = fields.CharField(max_length=500)
     create_time = fields.BigIntField()
 
+    class Meta:
+        # 歌单分页按 (create_time, id) 定位
+        indexes = (("create_time",),)
+
 
 class SongHistory(BaseModel):
     id = fields.BigIntField(primary_key=True, generated=True)
@@ -105,6 +109,34 @@ class SongHistory(BaseModel):
     source = fields.CharField(max_length=100)
     create_time = fields.BigIntField()
 
+    class Meta:
+        # (source, uid, create_time): 冷却查询和冷却索引预热
+        # (source, create_time): 按来源筛选的历史分页和统计
+        # (create_time,): 不限来源的时间范围筛选和按时间排序
+        indexes = (
+            ("source", "uid", "create_time"),
+            ("source", "create_time"),
+            ("create_time",),
+        )
+
+
+class SongDailyStat(BaseModel):
+    """
+    点歌按天汇总，由 songhistory 上的触发器维护，见 rollup.py
+    """
+    id = fields.BigIntField(primary_key=True, generated=True)
+    # 本地时间的日期 YYYY-MM-DD
+    day = fields.CharField(max_length=10)
+    source = fields.CharField(max_length=100)
+    # song 按歌名汇总，user 按昵称汇总
+    kind = fields.CharField(max_length=10)
+    name = fields.CharField(max_length=500)
+    count = fields.IntField(default=0)
+
+    class Meta:
+        table = "song_daily_stats"
+        unique_together = (("kind", "day", "source", "name"),)
+
 
 def ignore_none(kwargs):
     return {k: v for k, v in kwargs.items() if v is not None}
@@ -0,0 +1,117 @@
+import base64
+from typing import Any, NamedTuple
+from tortoise.models import Q
+from tortoise.queryset import QuerySet
+from src.utils import LAST_PAGE
+
+
+class Cursor(NamedTuple):
+    create_time: int
+    id: int
+    # True 表示取游标位置之前（更新）的一页
+    backward: bool = False
+
+
+def encode_cursor(create_time: int, id: int, backward: bool = False) -> str:
+    raw = f"{'p' if backward else 'n'}:{create_time}:{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        direction, create_time, id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        if direction not in ("n", "p"):
+            raise ValueError(direction)
+        return Cursor(int(create_time), int(id), direction == "p")
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+class CursorPage(NamedTuple):
+    rows: list
+    # 没有下一页/上一页时为 None
+    next_cursor: str | None
+    prev_cursor: str | None
+
+
+async def seek_page(query: QuerySet, cursor: str | None = None, size: int = 20, total: int = 0) -> CursorPage:
+    """
+    按 (create_time, id) 倒序做键集分页
+
+    游标记录当前页首/尾行的 (create_time, id)，翻页时直接从索引定位，不再 OFFSET 扫过前面的行，
+    因此任意深度的翻页耗时与第一页相同。跳到最后一页 (LAST_PAGE) 时需要传入总数，
+    使最后一页的条数与按页码分页时一致。
+    """
+    if cursor == LAST_PAGE:
+        # 最后一页按升序从最旧的记录取
+        last_size = total % size or size
+        rows = list(reversed(await query.order_by("create_time", "id").limit(last_size)))
+        prev_cursor = _cursor_of(rows[0], True) if rows and total > last_size else None
+        return CursorPage(rows, None, prev_cursor)
+
+    position = decode_cursor(cursor) if cursor else None
+    if position and position.backward:
+        # 上一页：取游标之后（更新）的 size 条再反转，create_time >= ? 保证能走索引范围查找
+        rows = await query.filter(
+            Q(create_time__gt=position.create_time) | Q(create_time=position.create_time, id__gt=position.id),
+            create_time__gte=position.create_time,
+        ).order_by("create_time", "id").limit(size + 1)
+        has_more = len(rows) > size
+        rows = list(reversed(rows[:size]))
+        prev_cursor = _cursor_of(rows[0], True) if has_more else None
+        next_cursor = _cursor_of(rows[-1]) if rows else None
+        return CursorPage(rows, next_cursor, prev_cursor)
+
+    if position:
+        query = query.filter(
+            Q(create_time__lt=position.create_time) | Q(create_time=position.create_time, id__lt=position.id),
+            create_time__lte=position.create_time,
+        )
+    rows = await query.order_by("-create_time", "-id").limit(size + 1)
+    has_more = len(rows) > size
+    rows = rows[:size]
+    next_cursor = _cursor_of(rows[-1]) if has_more else None
+    prev_cursor = _cursor_of(rows[0], True) if position and rows else None
+    return CursorPage(rows, next_cursor, prev_cursor)
+
+
+def _cursor_of(row: Any, backward: bool = False) -> str:
+    return encode_cursor(row.create_time, row.id, backward)
+
+
+class CountCache:
+    """
+    分页总数缓存
+
+    以 (表名, 筛选条件) 为键缓存 count() 结果，翻页时不再重复统计总数，
+    对应表有写入时整表失效。
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._counts: dict[tuple, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> int | None:
+        count = self._counts.get(key)
+        if count is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return count
+
+    def set(self, key: tuple, count: int):
+        if key not in self._counts and len(self._counts) >= self.max_size:
+            self._counts.pop(next(iter(self._counts)))
+        self._counts[key] = count
+
+    def invalidate(self, table: str):
+        for key in [key for key in self._counts if key[0] == table]:
+            del self._counts[key]
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._counts)}
+
+    def clear(self):
+        self._counts.clear()
@@ -0,0 +1,153 @@
+"""
+点歌按天汇总表 song_daily_stats
+
+每条点歌记录在 song_daily_stats 中对应 (kind, day, source, name) 两行计数：按歌名 (song) 和按昵称 (user)。
+计数由 songhistory 上的触发器在插入、删除、修改时增量维护，写后日志批量落盘也会触发；
+统计页只读取汇总表，不再对整个 songhistory 做 strftime 和分组。
+
+升级后首次启动会自动回填，也可以手动重建：
+
+    python -m src.database.rollup
+"""
+import asyncio
+from tortoise.transactions import in_transaction
+from src.utils import logger
+
+TABLE = "song_daily_stats"
+# kind -> songhistory 中的分组列
+KINDS = {"song": "song_name", "user": "uname"}
+
+
+def day_of(column: str) -> str:
+    """
+    与原统计查询一致，按本地时间取日期
+    """
+    return f"strftime('%Y-%m-%d', {column}, 'unixepoch', 'localtime')"
+
+
+def _upsert(row: str, sign: str) -> str:
+    values = ", ".join(
+        f"({day_of(f'{row}.create_time')}, {row}.source, '{kind}', {row}.{column}, {sign}1)"
+        for kind, column in KINDS.items()
+    )
+    return (
+        f"INSERT INTO {TABLE} (day, source, kind, name, count) VALUES {values} "
+        f"ON CONFLICT (kind, day, source, name) DO UPDATE SET count = count + excluded.count;"
+    )
+
+
+def _drop_empty(row: str) -> str:
+    conditions = " OR ".join(
+        f"(kind = '{kind}' AND name = {row}.{column})" for kind, column in KINDS.items()
+    )
+    return (
+        f"DELETE FROM {TABLE} WHERE day = {day_of(f'{row}.create_time')} AND source = {row}.source "
+        f"AND ({conditions}) AND count <= 0;"
+    )
+
+
+TRIGGERS = f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_ai AFTER INSERT ON songhistory BEGIN
+        {_upsert("new", "+")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_ad AFTER DELETE ON songhistory BEGIN
+        {_upsert("old", "-")}
+        {_drop_empty("old")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_au AFTER UPDATE OF uname, song_name, source, create_time ON songhistory BEGIN
+        {_upsert("old", "-")}
+        {_drop_empty("old")}
+        {_upsert("new", "+")}
+    END;
+"""
+
+
+class DailyStatsRollup:
+    """
+    维护 song_daily_stats 的触发器并按汇总表生成统计查询
+    """
+
+    async def setup(self, conn):
+        """
+        创建触发器，触发器不存在（首次启动或触发器被删除）时从 songhistory 回填
+        """
+        _, rows = await conn.execute_query(
+            "SELECT count(1) AS count FROM sqlite_master WHERE type='trigger' AND name=?", [f"{TABLE}_ai"]
+        )
+        await conn.execute_script(TRIGGERS)
+        if rows[0]["count"] == 0:
+            await self.rebuild(conn)
+
+    async def rebuild(self, conn=None):
+        """
+        清空汇总表并从 songhistory 重新统计，返回汇总行数
+        """
+        selects = " UNION ALL ".join(
+            f"SELECT {day_of('create_time')} AS day, source, '{kind}', {column}, COUNT(*) "
+            f"FROM songhistory GROUP BY day, source, {column}"
+            for kind, column in KINDS.items()
+        )
+        async with in_transaction() as tx:
+            await tx.execute_script(f"DELETE FROM {TABLE}; INSERT INTO {TABLE} (day, source, kind, name, count) {selects};")
+            _, rows = await tx.execute_query(f"SELECT COUNT(*) AS count FROM {TABLE}")
+        logger.info(f"Rebuilt {TABLE} with {rows[0]['count']} rows.")
+        return rows[0]["count"]
+
+    @staticmethod
+    def top_per_day_sql(kind: str, by_source: bool, top: int = 1) -> str:
+        """
+        每天计数最高的 top 个歌名/昵称，参数依次为：时间窗口修饰符（两次）、[来源]、[来源]、返回行数
+
+        窗口起点所在的那一天只能统计起点之后的记录，这一天从 songhistory 按 create_time 索引读取，
+        其余完整的天读取汇总表，结果与直接统计 songhistory 一致。
+        来源不限时同名的不同来源合并计数，source 取计数最多的来源。
+        """
+        column = KINDS[kind]
+        source_filter = " AND source = ?" if by_source else ""
+        uname = "name" if kind == "user" else "NULL"
+        song_name = "name" if kind == "song" else "NULL"
+        return f"""
+            WITH Bounds AS (
+                SELECT unixepoch('now', ?) AS since,
+                       date(unixepoch('now', ?), 'unixepoch', 'localtime') AS first_day
+            ),
+            Buckets AS (
+                SELECT day, source, name, count
+                FROM {TABLE}
+                WHERE kind = '{kind}' AND day > (SELECT first_day FROM Bounds){source_filter}
+                UNION ALL
+                SELECT {day_of('create_time')} AS day, source, {column} AS name, COUNT(*) AS count
+                FROM songhistory
+                WHERE create_time > (SELECT since FROM Bounds)
+                AND create_time < unixepoch((SELECT first_day FROM Bounds), '+1 day', 'utc'){source_filter}
+                GROUP BY day, source, {column}
+            ),
+            DailyCounts AS (
+                -- 只有一个 MAX() 聚合时，裸列 source 取自计数最多的那一行
+                SELECT day, name, source, MAX(count) AS top, SUM(count) AS count
+                FROM Buckets
+                GROUP BY day, name
+            )
+            SELECT {uname} AS uname, {song_name} AS song_name, source, count, day
+            FROM (
+                SELECT *,
+                ROW_NUMBER() OVER (PARTITION BY day ORDER BY count DESC, name) as rn
+                FROM DailyCounts
+            )
+            WHERE rn <= {int(top)}
+            ORDER BY day DESC, count DESC
+            LIMIT ?;
+        """
+
+
+async def _main():
+    from .db import Db
+    await Db.init()
+    try:
+        await Db.rebuild_song_daily_stats()
+    finally:
+        await Db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
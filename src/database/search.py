@@ -0,0 +1,89 @@
+from tortoise.expressions import RawSQL
+from src.utils import logger
+
+# 表名 -> 参与全文索引的列
+TABLES = {
+    "songhistory": ("uname", "song_name"),
+    "playlist": ("song_name", "singer", "tag", "language"),
+}
+# trigram 分词至少需要 3 个字符才能走索引
+MIN_TERM_LENGTH = 3
+
+
+def quote_phrase(term: str) -> str:
+    """
+    把关键字转成 FTS5 短语，使关键字中的运算符和引号都按普通字符匹配
+    """
+    return '"' + term.replace("\x00", "").replace('"', '""') + '"'
+
+
+class FullTextIndex:
+    """
+    点歌历史和歌单的 FTS5 全文索引
+
+    每张表对应一个 trigram 分词的外部内容 FTS5 虚拟表（只存索引，不重复存文本），
+    由触发器与原表保持同步，因此批量写入、写后日志落盘都不需要额外处理。
+    trigram 按 3 个字符切分，中文子串也能命中；关键字不足 3 个字符或 SQLite
+    不支持 FTS5/trigram 时由调用方回落到 LIKE。
+    """
+
+    def __init__(self):
+        self.available = False
+
+    async def setup(self, conn):
+        """
+        创建虚拟表和触发器，新建的虚拟表会从原表重建索引
+        """
+        try:
+            for table, columns in TABLES.items():
+                await self._create(conn, table, columns)
+            self.available = True
+        except Exception as e:
+            self.available = False
+            logger.warning(f"FTS5 trigram search unavailable, falling back to LIKE: {e}")
+
+    async def _create(self, conn, table: str, columns: tuple[str, ...]):
+        fts = f"{table}_fts"
+        _, rows = await conn.execute_query(
+            "SELECT count(1) AS count FROM sqlite_master WHERE type='table' AND name=?", [fts]
+        )
+        created = rows[0]["count"] == 0
+        names = ", ".join(columns)
+        new = ", ".join(f"new.{column}" for column in columns)
+        old = ", ".join(f"old.{column}" for column in columns)
+        await conn.execute_script(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {names}, content='{table}', content_rowid='id', tokenize='trigram'
+            );
+            CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});
+            END;
+            CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old});
+            END;
+            CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old});
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});
+            END;
+        """)
+        if created:
+            await conn.execute_script(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            logger.info(f"Full-text index {fts} built.")
+
+    def clear(self):
+        self.available = False
+
+    def usable(self, term: str) -> bool:
+        return self.available and len(term) >= MIN_TERM_LENGTH
+
+    def match(self, table: str, term: str, column: str | None = None) -> RawSQL:
+        """
+        返回匹配关键字的 rowid 子查询，用于 filter(id__in=...)；column 为 None 时匹配所有索引列
+
+        tortoise 无法给 RawSQL 绑定参数，关键字先转成 FTS5 短语再按 SQL 字符串转义后内联。
+        """
+        query = quote_phrase(term)
+        if column:
+            query = f"{column} : {query}"
+        literal = query.replace("'", "''")
+        return RawSQL(f"(SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH '{literal}')")
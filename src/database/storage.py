@@ -0,0 +1,72 @@
+"""
+SQLite 存储配置
+
+连接建立时按配置档执行 PRAGMA。tortoise 的 sqlite 客户端默认只开启 WAL，其余都是 SQLite 默认值：
+synchronous=FULL 每次提交都 fsync，页缓存约 2MB，不使用 mmap，临时表写磁盘。
+WAL 模式下 synchronous=NORMAL 只在 checkpoint 时 fsync，断电最多丢失最近提交的事务但不会损坏数据库。
+"""
+import os
+from typing import NamedTuple
+from src.utils import logger
+
+
+class StorageProfile(NamedTuple):
+    name: str
+    journal_mode: str
+    synchronous: str
+    # 负数表示 KiB
+    cache_size: int
+    mmap_size: int
+    # 0 默认（磁盘），2 内存
+    temp_store: int
+    busy_timeout: int
+    journal_size_limit: int = 16 * 1024 * 1024
+
+
+PROFILES = {
+    # 每次提交都 fsync，适合经常异常断电的机器
+    "safe": StorageProfile("safe", "WAL", "FULL", -2000, 0, 0, 5000),
+    "balanced": StorageProfile("balanced", "WAL", "NORMAL", -16000, 64 * 1024 * 1024, 2, 5000),
+    # 完全不 fsync，进程崩溃不丢数据；系统崩溃或断电时数据库文件可能损坏，只适合可以随时重建数据的场景
+    "fast": StorageProfile("fast", "WAL", "OFF", -64000, 256 * 1024 * 1024, 2, 5000),
+}
+DEFAULT_PROFILE = "balanced"
+# 通过环境变量选择配置档
+PROFILE_ENV = "VSINGERBOARD_DB_PROFILE"
+
+
+def get_profile(name: str | None = None) -> StorageProfile:
+    name = name or os.environ.get(PROFILE_ENV) or DEFAULT_PROFILE
+    profile = PROFILES.get(name)
+    if profile is None:
+        logger.warning(f"Unknown storage profile '{name}', using '{DEFAULT_PROFILE}'.")
+        profile = PROFILES[DEFAULT_PROFILE]
+    if profile.synchronous == "OFF":
+        logger.warning(f"Storage profile '{profile.name}' uses synchronous=OFF, "
+                       "the database file may be corrupted on power loss or OS crash.")
+    return profile
+
+
+def connection_config(file_path: str, profile: StorageProfile) -> dict:
+    """
+    tortoise 的 sqlite 连接配置，credentials 中除 file_path 外的键都会在建立连接时作为 PRAGMA 执行
+    """
+    pragmas = profile._asdict()
+    del pragmas["name"]
+    return {
+        "engine": "tortoise.backends.sqlite",
+        "credentials": {"file_path": file_path, **pragmas},
+    }
+
+
+async def maintain(conn) -> dict:
+    """
+    WAL checkpoint 并执行 PRAGMA optimize
+
+    PASSIVE 模式不等待读写，只把已提交且没有读者使用的页写回数据库文件；
+    optimize 只在统计信息过期时才运行 ANALYZE，正常情况下开销很小。
+    """
+    _, rows = await conn.execute_query("PRAGMA wal_checkpoint(PASSIVE)")
+    busy, log, checkpointed = rows[0] if rows else (0, -1, -1)
+    await conn.execute_script("PRAGMA optimize")
+    return {"busy": busy, "log": log, "checkpointed": checkpointed}
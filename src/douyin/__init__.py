@@ -1,3 +1,4 @@
 from .client import DouyinLiveWebFetcher
+from .registry import CHAT, GIFT, LIKE, MEMBER, ROOM_STATS, MethodStats
 
-__all__ = ["DouyinLiveWebFetcher"]
+__all__ = ["DouyinLiveWebFetcher", "CHAT", "GIFT", "LIKE", "MEMBER", "ROOM_STATS", "MethodStats"]
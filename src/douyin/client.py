@@ -1,26 +1,57 @@
-import gzip
 import re
 import aiohttp
 import asyncio
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from .signature import generateSignature, generateMsToken
-from .lib import (
-    WebcastImPushFrame,
-    WebcastImResponse,
-    WebcastImChatMessage,
-)
-from src.utils import Decorator, logger, WebSocketClient
+# schema 在首次收发消息时才加载，未配置抖音直播间时不占用启动时间和内存
+from . import lib
+from .wire import DecodedFrame, decode_frame, decode_push_frame, encode_push_frame
+from .registry import CHAT, MethodRegistry
+from .decode_stage import DecodeStage
+from .resolve_cache import ResolveCache, default_resolve_cache
+from src.utils import Decorator, logger, WebSocketClient, ReconnectPolicy, async_worker
+
+# 心跳帧内容固定，只编码一次
+HEARTBEAT_FRAME = encode_push_frame(payload_type="hb")
+DEFAULT_HEARTBEAT_INTERVAL = 5.0
+MIN_HEARTBEAT_INTERVAL = 1.0
+MAX_HEARTBEAT_INTERVAL = 60.0
+# 心跳发出后超过 间隔 * STALE_FACTOR 没有收到任何帧视为连接失效，保证一个间隔内发现
+STALE_FACTOR = 0.8
 
 
 class DouyinLiveWebFetcher(Decorator, WebSocketClient):
-    def __init__(self, live_id: int, max_retries: int = 5, retry_delay: int = 5, abogus_file='a_bogus.js'):
+    def __init__(self, live_id: int, max_retries: int = 5, retry_delay: int = 5, abogus_file='a_bogus.js',
+                 decode_executor: str | None = None, resolve_cache: ResolveCache | None = None):
+        """
+        :param decode_executor: 解码方式，None 在事件循环中解码，"thread"/"process" 把大帧交给线程池/进程池解码
+        :param resolve_cache: ttwid/roomId 解析缓存，None 使用支持目录下的默认缓存
+        """
         super().__init__()
         self.abogus_file = abogus_file
         self.__ttwid = None
         self.__room_id = None
+        self._resolve_cache = resolve_cache
+        self._resolve_checked = False
+        self._revalidate_task: asyncio.Task | None = None
         self.heartheat_task = None
+        # 心跳间隔以服务端下发的 heartbeat_duration 为准
+        self.heartbeat_interval = DEFAULT_HEARTBEAT_INTERVAL
+        self.heartbeat_rtt: deque[float] = deque(maxlen=100)
+        self.stale_count = 0
+        self._heartbeat_sent_at: float | None = None
+        self._received = asyncio.Event()
+        # ack 合并窗口（秒），0 表示立即发送
+        self.ack_window = 0.2
+        self.ack_count = 0
+        self.ack_sent = 0
+        self._pending_ack: bytes | None = None
+        self._ack_task: asyncio.Task | None = None
         self.max_retries = max_retries
-        self.retry_delay = retry_delay
-        self.http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False))
+        self.reconnect_policy = ReconnectPolicy(base_delay=retry_delay)
+        self.http_profile = "douyin"
         self.live_id = str(live_id)
         self.host = "https://www.douyin.com/"
         self.live_url = "https://live.douyin.com/"
@@ -28,6 +59,13 @@ class DouyinLiveWebFetcher(Decorator, WebSocketClient):
         self.headers = {
             'User-Agent': self.user_agent
         }
+        # 按 method 订阅推送消息，只解码已订阅的 method
+        self.registry = MethodRegistry()
+        self.registry.subscribe(CHAT, self._parseChatMsg)  # 聊天消息
+        self._decoder = self.registry.decoder
+        self.decode_executor = decode_executor
+        self._executor: Executor | None = None
+        self._decode_stage: DecodeStage | None = None
 
     @property
     def ws_connect_status(self):
@@ -46,17 +84,10 @@ class DouyinLiveWebFetcher(Decorator, WebSocketClient):
         """
         if self.__ttwid:
             return self.__ttwid
-        headers = {
-            "User-Agent": self.user_agent,
-        }
-        try:
-            response = await self.http_session.get(self.live_url, headers=headers)
-            response.raise_for_status()
-        except Exception as err:
-            logger.error("【X】Request the live url error: ", err)
-        else:
-            self.__ttwid = response.cookies.get('ttwid').value
-            return self.__ttwid
+        self._use_cached_resolution()
+        if not self.__ttwid:
+            self.__ttwid = await self._fetch_ttwid()
+        return self.__ttwid
 
     async def room_id(self):
         """
@@ -66,27 +97,100 @@ class DouyinLiveWebFetcher(Decorator, WebSocketClient):
         """
         if self.__room_id:
             return self.__room_id
-        url = self.live_url + self.live_id
+        self._use_cached_resolution()
+        if self.__room_id:
+            return self.__room_id
         twid = await self.ttwid()
+        self.__room_id = await self._fetch_room_id(twid)
+        if twid and self.__room_id:
+            self.resolve_cache.put(self.live_id, twid, self.__room_id)
+        return self.__room_id
+
+    @property
+    def http_session(self) -> aiohttp.ClientSession:
+        """
+        抖音接口共享的 HTTP 会话，重启时复用连接
+        """
+        return async_worker.http.session(self.http_profile)
+
+    @property
+    def resolve_cache(self) -> ResolveCache:
+        if self._resolve_cache is None:
+            self._resolve_cache = default_resolve_cache()
+        return self._resolve_cache
+
+    def _use_cached_resolution(self):
+        """
+        每个实例只读取一次解析缓存，记录超过 ttl 时先使用，再在后台重新解析
+        """
+        if self._resolve_checked:
+            return
+        self._resolve_checked = True
+        entry, stale = self.resolve_cache.get(self.live_id)
+        if entry is None:
+            return
+        self.__ttwid = entry.ttwid
+        self.__room_id = entry.room_id
+        logger.info(f"Using cached Douyin room id {entry.room_id} for live {self.live_id}")
+        if stale and (self._revalidate_task is None or self._revalidate_task.done()):
+            self._revalidate_task = asyncio.create_task(self._revalidate())
+
+    async def _revalidate(self):
+        twid = await self._fetch_ttwid()
+        if not twid:
+            return
+        room_id = await self._fetch_room_id(twid)
+        if not room_id:
+            return
+        self.resolve_cache.put(self.live_id, twid, room_id)
+        # 已建立的连接不受影响，下次重连使用新的值
+        self.__ttwid = twid
+        self.__room_id = room_id
+
+    def _forget_resolution(self):
+        """
+        丢弃实例和缓存中的解析结果，下次连接重新请求
+        """
+        self.__ttwid = None
+        self.__room_id = None
+        self.resolve_cache.invalidate(self.live_id)
+
+    async def _fetch_ttwid(self):
+        headers = {
+            "User-Agent": self.user_agent,
+        }
+        try:
+            # 不读取正文，async with 退出时释放连接，避免占住共享连接池的名额
+            async with self.http_session.get(self.live_url, headers=headers) as response:
+                response.raise_for_status()
+                cookie = response.cookies.get('ttwid')
+        except Exception as err:
+            logger.error(f"【X】Request the live url error: {err}")
+            return None
+        if cookie is None:
+            logger.warning("【X】No ttwid cookie in the live url response")
+            return None
+        return cookie.value
+
+    async def _fetch_room_id(self, twid):
+        url = self.live_url + self.live_id
         headers = {
             "User-Agent": self.user_agent,
             "cookie": f"ttwid={twid}&msToken={generateMsToken()}; __ac_nonce=0123407cc00a9e438deb4",
             "Accept-Encoding": "gzip, deflate",
         }
         try:
-            response = await self.http_session.get(url, headers=headers)
-            response.raise_for_status()
+            async with self.http_session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                response_text = await response.text(encoding="utf-8")
         except Exception as err:
-            logger.error("【X】Request the live room url error: ", err)
-        else:
-            response_text = await response.text(encoding="utf-8")
-            match = re.search(r'roomId\\":\\"(\d+)\\"', response_text)
-            if match is None or len(match.groups()) < 1:
-                logger.warning("【X】No match found for roomId")
-
-            self.__room_id = match.group(1)
-
-            return self.__room_id
+            logger.error(f"【X】Request the live room url error: {err}")
+            return None
+        match = re.search(r'roomId\\":\\"(\d+)\\"', response_text)
+        if match is None:
+            logger.warning("【X】No match found for roomId")
+            return None
+        return match.group(1)
 
     async def _wss_url(self):
         rid = await self.room_id()
@@ -118,65 +222,170 @@ class DouyinLiveWebFetcher(Decorator, WebSocketClient):
             "cookie": f"ttwid={ttwid}",
             'user-agent': self.user_agent,
         }
+        self._start_decode_stage()
         await self._start()
         self.heartheat_task = asyncio.create_task(self._sendHeartbeat())
 
-    async def _reconnect(self):
+    async def _prepare_reconnect(self):
         # 不确定抖子这边掉线频繁是否跟签名有关，先试试效果
+        if self._retry_count > 1:
+            # 连续重连失败，缓存的 roomId 可能已随重新开播失效
+            self._forget_resolution()
         self.url = await self._wss_url()
+
+    async def _reconnect(self):
         if self.heartheat_task:
             self.heartheat_task.cancel()
+        # 旧连接上的 ack 不再有意义
+        self._pending_ack = None
+        self._heartbeat_sent_at = None
         await super()._reconnect()
         self.heartheat_task = asyncio.create_task(self._sendHeartbeat())
 
     async def disconnect_async(self):
         if self.heartheat_task and not self.heartheat_task.done():
             self.heartheat_task.cancel()
+        if self._ack_task and not self._ack_task.done():
+            self._ack_task.cancel()
+        if self._revalidate_task and not self._revalidate_task.done():
+            self._revalidate_task.cancel()
         await self.close()
+        await self._stop_decode_stage()
 
     async def _sendHeartbeat(self):
         """
-        发送心跳包
+        按服务端要求的间隔发送心跳包，心跳发出后 STALE_FACTOR 个间隔内没有收到任何帧视为连接失效
         """
+        loop = asyncio.get_running_loop()
         while self._is_running:
             try:
                 if self.status_code != 1:
                     logger.warning("ws_clinet 连接状态错误")
                     break
 
-                heartbeat = WebcastImPushFrame(payload_type='hb').SerializeToString()
-                await self.send(heartbeat)
-                # print("【√】发送心跳包")
+                # 心跳前先发出合并中的 ack
+                await self._flush_ack()
+                self._received.clear()
+                sent_at = self._heartbeat_sent_at = loop.time()
+                await self.send(HEARTBEAT_FRAME)
+                interval = self.heartbeat_interval
+                try:
+                    await asyncio.wait_for(self._received.wait(), interval * STALE_FACTOR)
+                except asyncio.TimeoutError:
+                    logger.warning(f"【X】No frame received {interval * STALE_FACTOR:.1f}s after heartbeat, reconnecting")
+                    self.stale_count += 1
+                    if self.ws is not None:
+                        # listen 收到关闭后按重连策略重连
+                        await self.ws.close()
+                    break
             except Exception as e:
-                logger.error("【X】心跳包检测错误: ", e)
+                logger.error(f"【X】心跳包检测错误: {e}")
                 break
             else:
-                await asyncio.sleep(5)
+                await asyncio.sleep(max(0.0, sent_at + interval - loop.time()))
 
     async def on_message(self, message):
-        # 根据proto结构体解析对象
-        package = WebcastImPushFrame().parse(message)
-        response = WebcastImResponse().parse(gzip.decompress(package.payload))
+        self._received.set()
+        # 心跳回复只有几十字节，只对小帧解析帧头，不影响消息帧
+        if len(message) < 64:
+            package = decode_push_frame(message)
+            if package.payload_type == "hb":
+                if self._heartbeat_sent_at is not None:
+                    self.heartbeat_rtt.append(asyncio.get_running_loop().time() - self._heartbeat_sent_at)
+                    self._heartbeat_sent_at = None
+                return
+        if self._decode_stage:
+            await self._decode_stage.put(message)
+        else:
+            await self._handle_frame(decode_frame(message, self._decoder))
+
+    async def _handle_frame(self, frame: DecodedFrame):
+        response = frame.response
+
+        if response.heartbeat_duration:
+            self._set_heartbeat_interval(response.heartbeat_duration)
 
         # 返回直播间服务器链接存活确认消息，便于持续获取数据
         if response.need_ack:
-            ack = WebcastImPushFrame(log_id=package.log_id, payload_type='ack', payload=response.internal_ext.encode('utf-8')).SerializeToString()
-            await self.send(ack)
+            await self._queue_ack(frame.log_id, response.internal_ext)
 
-        for msg in response.messages:
-            method = msg.method
-            try:
-                {
-                    'WebcastChatMessage': self._parseChatMsg,  # 聊天消息
-                }.get(method)(msg.payload)
-            except Exception:
-                pass
+        # 只解码订阅的 method，其余消息直接跳过
+        dispatch = self.registry.dispatch
+        for method, payload in response.messages:
+            dispatch(method, payload)
+
+    def _set_heartbeat_interval(self, duration_ms: int):
+        interval = min(MAX_HEARTBEAT_INTERVAL, max(MIN_HEARTBEAT_INTERVAL, duration_ms / 1000))
+        if interval != self.heartbeat_interval:
+            logger.info(f"Douyin heartbeat interval set to {interval:.1f}s by server")
+            self.heartbeat_interval = interval
+
+    async def _queue_ack(self, log_id: int, internal_ext: str):
+        """
+        ack 携带的 internal_ext 包含服务端游标，新的 ack 覆盖旧的，窗口内只发送最后一个
+        """
+        self._pending_ack = encode_push_frame(log_id, "ack", internal_ext.encode("utf-8"))
+        self.ack_count += 1
+        if self.ack_window <= 0:
+            await self._flush_ack()
+        elif self._ack_task is None or self._ack_task.done():
+            self._ack_task = asyncio.create_task(self._flush_ack_later())
+
+    async def _flush_ack_later(self):
+        await asyncio.sleep(self.ack_window)
+        await self._flush_ack()
+
+    async def _flush_ack(self):
+        ack = self._pending_ack
+        if ack is None:
+            return
+        self._pending_ack = None
+        self.ack_sent += 1
+        await self.send(ack)
+
+    def subscribe(self, method: str, handler):
+        """
+        订阅推送消息，handler 接收原始 payload，method 见 registry 中的常量
+        """
+        self.registry.subscribe(method, handler)
+
+    def unsubscribe(self, method: str):
+        self.registry.unsubscribe(method)
+
+    def method_stats(self):
+        """
+        各 method 的收到/处理/失败数量和处理耗时
+        """
+        return self.registry.stats()
+
+    def _start_decode_stage(self):
+        if self.decode_executor is None or self._decode_stage:
+            return
+        if self.decode_executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=2)
+            decode = partial(decode_frame, decoder=self._decoder, copy_payloads=True)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="douyin-decode")
+            decode = partial(decode_frame, decoder=self._decoder)
+        self._decode_stage = DecodeStage(decode, self._handle_frame, self._executor)
+        self._decode_stage.start()
+
+    async def _stop_decode_stage(self):
+        if self._decode_stage:
+            await self._decode_stage.stop()
+            self._decode_stage = None
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     def _parseChatMsg(self, payload):
         """聊天消息"""
-        message = WebcastImChatMessage().parse(payload)
+        message = lib.WebcastImChatMessage().parse(payload)
         user_name = message.user.nickname
         user_id = message.user.id
         content = message.content
         logger.debug(f"[{user_id}]{user_name}: {content}")
-        self.dispatch("danmu", {"user_name": user_name, "user_id": user_id, "content": content, "fans_club_data": message.user.fans_club.data})
+        # 未加入粉丝团的用户没有 fans_club
+        fans_club = message.user.fans_club
+        fans_club_data = fans_club.data if fans_club else None
+        self.dispatch("danmu", {"user_name": user_name, "user_id": user_id, "content": content, "fans_club_data": fans_club_data})
@@ -0,0 +1,99 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Optional
+from src.utils import logger
+
+
+class DecodeStage:
+    """
+    推送帧解码流水线
+
+    大帧交给 executor（线程池或进程池）解码，事件循环只负责收发和分发；
+    最多 max_in_flight 帧同时解码，超过时 put() 等待，形成背压。
+    结果按帧到达的顺序交给 handle，小于 inline_threshold 的帧在事件循环中直接解码。
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[bytes], Any],
+        handle: Callable[[Any], Awaitable[None]],
+        executor: Optional[Executor] = None,
+        max_in_flight: int = 8,
+        inline_threshold: int = 16 * 1024,
+    ):
+        self.decode = decode
+        self.handle = handle
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+        self.inline_threshold = inline_threshold
+        self.inline_count = 0
+        self.offloaded_count = 0
+        self._pending: deque[asyncio.Future] = deque()
+        self._ready: asyncio.Event | None = None
+        self._space: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def in_flight(self):
+        return len(self._pending)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    async def put(self, frame: bytes):
+        """
+        提交一帧，解码窗口已满时等待
+        """
+        if self.executor is None or len(frame) < self.inline_threshold:
+            self.inline_count += 1
+            if not self._pending:
+                # 前面没有未处理的帧，直接解码和处理
+                await self.handle(self.decode(frame))
+                return
+            future = asyncio.get_running_loop().create_future()
+            try:
+                future.set_result(self.decode(frame))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            while len(self._pending) >= self.max_in_flight:
+                self._space.clear()
+                await self._space.wait()
+            self.offloaded_count += 1
+            future = asyncio.get_running_loop().run_in_executor(self.executor, self.decode, frame)
+        self._pending.append(future)
+        self._ready.set()
+
+    async def _run(self):
+        while True:
+            while not self._pending:
+                self._ready.clear()
+                await self._ready.wait()
+            future = self._pending[0]
+            try:
+                result = await future
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to decode frame: {e}")
+            else:
+                try:
+                    await self.handle(result)
+                except Exception as e:
+                    logger.error(f"Failed to handle frame: {e}")
+            self._pending.popleft()
+            self._space.set()
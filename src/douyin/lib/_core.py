@@ -0,0 +1,14113 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: douyin.proto
+# plugin: python-betterproto2
+# This file has been @generated
+
+
+from dataclasses import dataclass
+
+import betterproto2
+
+from .message_pool import default_message_pool
+
+_COMPILER_VERSION = "0.9.0"
+betterproto2.check_compiler_version(_COMPILER_VERSION)
+
+
+__all__ = (
+    "Webcast",
+    "WebcastDataActivityData",
+    "WebcastDataActivityLiveRecommendConfig",
+    "WebcastDataActivityLiveRecommendConfigEpisodeInfo",
+    "WebcastDataActivityRoomSkinInfo",
+    "WebcastDataAddressInfo",
+    "WebcastDataAgainst",
+    "WebcastDataAiPublicScreenContainer",
+    "WebcastDataAiPublicScreenContainerAbility",
+    "WebcastDataAnchorBottomToolBar",
+    "WebcastDataAnchorLinkmic",
+    "WebcastDataAnchorLinkmicEntranceInfo",
+    "WebcastDataAnchorLinkmicEntranceInfoLeadInfo",
+    "WebcastDataAnchorTabLabel",
+    "WebcastDataAnchorTogetherLive",
+    "WebcastDataAnimatedBgInfo",
+    "WebcastDataAnnouncementInfo",
+    "WebcastDataAppearance",
+    "WebcastDataAppearanceBubble",
+    "WebcastDataAppearanceContentTag",
+    "WebcastDataAppearanceWideCover",
+    "WebcastDataAppointmentData",
+    "WebcastDataAsyncAuthData",
+    "WebcastDataAudienceLimitRoomConfig",
+    "WebcastDataAudienceLinkmicEntranceInfo",
+    "WebcastDataAudioBgData",
+    "WebcastDataAudioSpeakingImageList",
+    "WebcastDataAudioSpeakingImageListSpeakingImage",
+    "WebcastDataAuthor",
+    "WebcastDataAuthorAuthorBasicInfo",
+    "WebcastDataAvatarLiveInfo",
+    "WebcastDataAvatorBorder",
+    "WebcastDataBarrageConfigure",
+    "WebcastDataBasketBallGoalStageDetail",
+    "WebcastDataBasketballStage",
+    "WebcastDataBeautifyInfo",
+    "WebcastDataBindSubProductData",
+    "WebcastDataBlockComponent",
+    "WebcastDataBonus",
+    "WebcastDataBonusAuthor",
+    "WebcastDataBonusCommerce",
+    "WebcastDataBorderInfo",
+    "WebcastDataBottomInputData",
+    "WebcastDataBurstInfo",
+    "WebcastDataBusinessConfigure",
+    "WebcastDataCameraMatchInfo",
+    "WebcastDataCameraPaidInfo",
+    "WebcastDataCameraPaidInfoPaidLiveBizExtra",
+    "WebcastDataCameraPaidInfoPriceInfo",
+    "WebcastDataCartHorizontal",
+    "WebcastDataCartVertical",
+    "WebcastDataCastOttPermission",
+    "WebcastDataCastScreenData",
+    "WebcastDataChangeRoomInfo",
+    "WebcastDataChatGroupExtendData",
+    "WebcastDataChatMentionInfo",
+    "WebcastDataChatReplyRespInfo",
+    "WebcastDataCircleInfo",
+    "WebcastDataClientComponent",
+    "WebcastDataClientComponentFunctionInfo",
+    "WebcastDataClientComponentInfo",
+    "WebcastDataCloudCollaborateData",
+    "WebcastDataCombined",
+    "WebcastDataCommentaryRoomInfo",
+    "WebcastDataCommentBox",
+    "WebcastDataCommentColor",
+    "WebcastDataCommentConfig",
+    "WebcastDataCommentMedal",
+    "WebcastDataCommentRole",
+    "WebcastDataComments",
+    "WebcastDataCommentsTextInfo",
+    "WebcastDataCommentsTextInfoUserInfo",
+    "WebcastDataCommentWallInfo",
+    "WebcastDataCommentWallPosition",
+    "WebcastDataComponentSkin",
+    "WebcastDataContainerLayout",
+    "WebcastDataContentInfo",
+    "WebcastDataContentTip",
+    "WebcastDataCornerMarkReach",
+    "WebcastDataCoupon",
+    "WebcastDataDecoration",
+    "WebcastDataDecorationFontConfig",
+    "WebcastDataDecotationDetail",
+    "WebcastDataDesireInfo",
+    "WebcastDataDslDetail",
+    "WebcastDataDslDetailExtraInfo",
+    "WebcastDataDynamicBorderInfo",
+    "WebcastDataEasterEggData",
+    "WebcastDataEcomAuction",
+    "WebcastDataEcomAvatar",
+    "WebcastDataEcomBidder",
+    "WebcastDataEcomCampaign",
+    "WebcastDataEcomData",
+    "WebcastDataEcomGoodsCard",
+    "WebcastDataEcomIcon",
+    "WebcastDataEcomLiveCard",
+    "WebcastDataEcomLiveReviewInfo",
+    "WebcastDataEcomPop",
+    "WebcastDataEcomPrice",
+    "WebcastDataEcomProduct",
+    "WebcastDataEmojiDetail",
+    "WebcastDataEnterGiftAnimation",
+    "WebcastDataEnterPublicAreaAnimation",
+    "WebcastDataEpisodeExtraInfo",
+    "WebcastDataEpisodeMod",
+    "WebcastDataEpisodePremierePlay",
+    "WebcastDataEpisodePreviewBottom",
+    "WebcastDataEpisodePreviewImage",
+    "WebcastDataESportsStage",
+    "WebcastDataFansChannelCreateInfo",
+    "WebcastDataFeaturedPublicScreenConf",
+    "WebcastDataFeedbackCard",
+    "WebcastDataFeedbackCardClientImpression",
+    "WebcastDataFeedbackCardCondition",
+    "WebcastDataFeedbackCardOption",
+    "WebcastDataFeedbackCardQuestion",
+    "WebcastDataFeedbackCardRoomCardStruct",
+    "WebcastDataFilterReason",
+    "WebcastDataFilterWord",
+    "WebcastDataGameAnchorInfo",
+    "WebcastDataGameCpData",
+    "WebcastDataGameExtra",
+    "WebcastDataGamePlayData",
+    "WebcastDataGameRoomSticker",
+    "WebcastDataGameTagInfo",
+    "WebcastDataGiftPanelTopperTray",
+    "WebcastDataGiftPanelTopperTrayPeriodText",
+    "WebcastDataGlobalCustomIcons",
+    "WebcastDataGoalStageDetail",
+    "WebcastDataGradeBuffInfo",
+    "WebcastDataGroupLiveData",
+    "WebcastDataHeaderMedia",
+    "WebcastDataHeaderMediaViewButton",
+    "WebcastDataHotRoomInfo",
+    "WebcastDataImage",
+    "WebcastDataImageContent",
+    "WebcastDataImageNinePatchSetting",
+    "WebcastDataIndustryCertification",
+    "WebcastDataIndustryCertificationProfile",
+    "WebcastDataIndustryCertificationRoom",
+    "WebcastDataIndustryCertificationRoomRoomOwner",
+    "WebcastDataIndustryServiceInfo",
+    "WebcastDataIndustryServiceInfoConsultInfo",
+    "WebcastDataInputDefaultConfig",
+    "WebcastDataInteractOpenExtra",
+    "WebcastDataIntroduction",
+    "WebcastDataIosClientComponent",
+    "WebcastDataIosContainerLayout",
+    "WebcastDataIosContainerLayoutRule",
+    "WebcastDataIosFragment",
+    "WebcastDataItemInfo",
+    "WebcastDataLabelInfo",
+    "WebcastDataLabelProfileItem",
+    "WebcastDataLeagueInfo",
+    "WebcastDataLifeGrouponInfo",
+    "WebcastDataLikeDisplayConfig",
+    "WebcastDataLinkerDetail",
+    "WebcastDataLinkerUsers",
+    "WebcastDataLinkMic",
+    "WebcastDataLinkMicLinkMicBattleScore",
+    "WebcastDataLinkMicLinkMicBattleSetting",
+    "WebcastDataLinkMicLinkMicChannelInfo",
+    "WebcastDataLiveInfo",
+    "WebcastDataLiveMatrixInfo",
+    "WebcastDataLiveStatusInfo",
+    "WebcastDataLocationInfo",
+    "WebcastDataLowPcuGuideData",
+    "WebcastDataMainCameraMatchInfo",
+    "WebcastDataMatchChatConfig",
+    "WebcastDataMatchDrawer",
+    "WebcastDataMatchInfo",
+    "WebcastDataMatchRoomData",
+    "WebcastDataMatchRoomImInfo",
+    "WebcastDataMatchRoomInfo",
+    "WebcastDataMatchShareBackground",
+    "WebcastDataMatchSkinInfo",
+    "WebcastDataMatchSkinInfoFollowBtnSkin",
+    "WebcastDataMatchTab",
+    "WebcastDataMatchTabFrame",
+    "WebcastDataMatchTitle",
+    "WebcastDataMatchTitleTitleIcon",
+    "WebcastDataMatchUserInfo",
+    "WebcastDataMemberEntranceInfo",
+    "WebcastDataMetricTrackerData",
+    "WebcastDataMoreEntrance",
+    "WebcastDataMorePanelData",
+    "WebcastDataMultiCameraBasicInfo",
+    "WebcastDataMultiTab",
+    "WebcastDataMultiTabBubble",
+    "WebcastDataMultiTabTabItem",
+    "WebcastDataOfficialChannelExtraInfo",
+    "WebcastDataOfficialChannelInfo",
+    "WebcastDataOfficialRoomInfo",
+    "WebcastDataOpenActivityData",
+    "WebcastDataOpenContentData",
+    "WebcastDataOpenGame",
+    "WebcastDataOpenHostInfo",
+    "WebcastDataOpenStreamUrlEncrypt",
+    "WebcastDataOrderData",
+    "WebcastDataPackMetaInfo",
+    "WebcastDataPaidLiveBaseInfo",
+    "WebcastDataPaidLiveConfig",
+    "WebcastDataPaidLiveConfigPriceInfo",
+    "WebcastDataPaidLiveConfigUserRight",
+    "WebcastDataPaidLiveData",
+    "WebcastDataPaidLiveItemInfo",
+    "WebcastDataPaidLivePriceInfo",
+    "WebcastDataPaidLiveSubscribe",
+    "WebcastDataPaidLiveUiBaseConfig",
+    "WebcastDataParentProductSimpleData",
+    "WebcastDataPatternRef",
+    "WebcastDataPayloadStartMicrogameStamp",
+    "WebcastDataPaymentArea",
+    "WebcastDataPaymentAreaAdditionalButton",
+    "WebcastDataPaymentAreaPayButton",
+    "WebcastDataPicoInfo",
+    "WebcastDataPicoInfoMultiStreamInfo",
+    "WebcastDataPicoInfoVirtualLiveBgImages",
+    "WebcastDataPicoInfoVirtualLiveBgImagesConvertedImage",
+    "WebcastDataPlayByPlayItemInfo",
+    "WebcastDataPlayerInfo",
+    "WebcastDataPlayerStats",
+    "WebcastDataPreviewExposeData",
+    "WebcastDataPreviewExposeDataChatMessage",
+    "WebcastDataPreviewExposeDataEtData",
+    "WebcastDataPreviewExposeDataFeedLiveIdeaGuide",
+    "WebcastDataPreviewExposeDataFeedPromoteLiveAnchorPoint",
+    "WebcastDataPreviewExposeDataGrowthTask",
+    "WebcastDataPreviewExposeDataMeta",
+    "WebcastDataPreviewExposeDataMetaHost",
+    "WebcastDataPreviewExposeDataPortraitData",
+    "WebcastDataPreviewExposeDataPreviewButtonData",
+    "WebcastDataPreviewExposeDataPreviewExitGuide",
+    "WebcastDataPreviewExposeDataPreviewExtendArea",
+    "WebcastDataPreviewExposeDataPreviewExtendAreaActionConfig",
+    "WebcastDataPreviewExposeDataPreviewExtendAreaPart",
+    "WebcastDataPreviewExposeDataPreviewGuide",
+    "WebcastDataPreviewExposeDataPreviewHighLight",
+    "WebcastDataPreviewExposeDataPreviewImExtend",
+    "WebcastDataPreviewExposeDataPreviewPromotion",
+    "WebcastDataPreviewExposeDataPreviewPromotionSyncData",
+    "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyBag",
+    "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyMoney",
+    "WebcastDataPreviewExposeDataPreviewSwitch",
+    "WebcastDataPreviewExposeDataRevenueData",
+    "WebcastDataPreviewLabel",
+    "WebcastDataPrivilegeBaseInfo",
+    "WebcastDataPrivilegeInfo",
+    "WebcastDataPrivilegeTicket",
+    "WebcastDataPrivilegeTicketPrivilegeConfigure",
+    "WebcastDataPrivilegeUrl",
+    "WebcastDataProduct",
+    "WebcastDataProductBanner",
+    "WebcastDataProductBasicInfo",
+    "WebcastDataProductComment",
+    "WebcastDataProductComments",
+    "WebcastDataProductCommentUser",
+    "WebcastDataProductPriceRichText",
+    "WebcastDataProductPriceStruct",
+    "WebcastDataProductRichText",
+    "WebcastDataProductRichTextCountDown",
+    "WebcastDataProductRichTextImage",
+    "WebcastDataProductRichTextText",
+    "WebcastDataProductSaleInfo",
+    "WebcastDataProductsData",
+    "WebcastDataProductsDataExplainCard",
+    "WebcastDataProductsDataToolBar",
+    "WebcastDataProductSellingPoint",
+    "WebcastDataProductTag",
+    "WebcastDataProfilePicSpliceLabel",
+    "WebcastDataProfileViewData",
+    "WebcastDataPublicScreenBottomInfo",
+    "WebcastDataPublicScreenBottomInfoBottomCard",
+    "WebcastDataPublicScreenSpeedConf",
+    "WebcastDataPurchaseSimpleData",
+    "WebcastDataQuizExtra",
+    "WebcastDataRating",
+    "WebcastDataRecentPurchasedUser",
+    "WebcastDataRedpack",
+    "WebcastDataRedsShowInfo",
+    "WebcastDataRegionMatch",
+    "WebcastDataRegionRestriction",
+    "WebcastDataRelevantRecommendation",
+    "WebcastDataRelevantRecommendationEcomInfo",
+    "WebcastDataRelevantRecommendationEpisode",
+    "WebcastDataRelevantRecommendationHighLightInfo",
+    "WebcastDataRelevantRecommendationVsInfo",
+    "WebcastDataRelevantRecommendationWhiteCategoryInfo",
+    "WebcastDataReservation",
+    "WebcastDataResourceConfigure",
+    "WebcastDataRoom",
+    "WebcastDataRoomActivityTag",
+    "WebcastDataRoomAnchorData",
+    "WebcastDataRoomAuthStatus",
+    "WebcastDataRoomAuthStatusRoomAuthOffReasons",
+    "WebcastDataRoomAuthStatusRoomAuthSpecialStyle",
+    "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle",
+    "WebcastDataRoomAvator",
+    "WebcastDataRoomBanner",
+    "WebcastDataRoomBasisData",
+    "WebcastDataRoomCart",
+    "WebcastDataRoomCartV2",
+    "WebcastDataRoomChannelData",
+    "WebcastDataRoomChannelInfo",
+    "WebcastDataRoomCore",
+    "WebcastDataRoomExtra",
+    "WebcastDataRoomFeedData",
+    "WebcastDataRoomFeedDataDrawerConfig",
+    "WebcastDataRoomFeedDataDrawerConfigArrowView",
+    "WebcastDataRoomFeedDataDrawerConfigAvatarArea",
+    "WebcastDataRoomFeedDataDrawerConfigEntranceIcon",
+    "WebcastDataRoomFeedDataDrawerConfigEntranceLayout",
+    "WebcastDataRoomFeedDataDrawerConfigEntranceTitle",
+    "WebcastDataRoomFeedDataDrawerConfigFreqInfo",
+    "WebcastDataRoomFeedDataDrawerConfigSpecialConfig",
+    "WebcastDataRoomFeedDataFollowTopAppearance",
+    "WebcastDataRoomFeedDataStreamCutPosition",
+    "WebcastDataRoomFullVideoBtn",
+    "WebcastDataRoomGameData",
+    "WebcastDataRoomGameDataChannelConfig",
+    "WebcastDataRoomGravitySensor",
+    "WebcastDataRoomHealthScoreInfo",
+    "WebcastDataRoomImInfo",
+    "WebcastDataRoomInteractData",
+    "WebcastDataRoomIntroLabel",
+    "WebcastDataRoomOthersData",
+    "WebcastDataRoomPlatformComponentsData",
+    "WebcastDataRoomPublicScreenAttachments",
+    "WebcastDataRoomPublicScreenInfo",
+    "WebcastDataRoomReplayInfo",
+    "WebcastDataRoomReqUserData",
+    "WebcastDataRoomRevenueData",
+    "WebcastDataRoomShortTouchAreaConfig",
+    "WebcastDataRoomShortTouchAreaConfigBigCardDisplayStrategy",
+    "WebcastDataRoomShortTouchAreaConfigElement",
+    "WebcastDataRoomShortTouchAreaConfigForbiddenType",
+    "WebcastDataRoomShortTouchAreaConfigTempStateCondition",
+    "WebcastDataRoomShortTouchAreaConfigTempStateGlobalCondition",
+    "WebcastDataRoomShortTouchAreaConfigTempStateStrategy",
+    "WebcastDataRoomShortTouchAreaConfigTempStateStrategyTempStateStrategyInfo",
+    "WebcastDataRoomShortTouchAreaConfigTempStateType",
+    "WebcastDataRoomSpecificSceneTypeInfo",
+    "WebcastDataRoomStats",
+    "WebcastDataRoomStatsUserCountComposition",
+    "WebcastDataRoomTab",
+    "WebcastDataRoomTitle",
+    "WebcastDataRoomUserAttr",
+    "WebcastDataRoomViewStats",
+    "WebcastDataRtcExtInfo",
+    "WebcastDataSafeReason",
+    "WebcastDataSandwichBorderInfo",
+    "WebcastDataSchemaInfo",
+    "WebcastDataScreenBarConfigure",
+    "WebcastDataSecretChatInfo",
+    "WebcastDataShareAnchorInfo",
+    "WebcastDataShareComponentInfo",
+    "WebcastDataSharePosterInfo",
+    "WebcastDataSharePosterInfoPosterData",
+    "WebcastDataShareResource",
+    "WebcastDataShareTicket",
+    "WebcastDataShortTouchAuth",
+    "WebcastDataShowArea",
+    "WebcastDataSku",
+    "WebcastDataSkuCaremaInfo",
+    "WebcastDataSkuEntityIDsMap",
+    "WebcastDataSkuLimitedFreeNotice",
+    "WebcastDataSkuRelatedSkuSimpleInfo",
+    "WebcastDataSpliceLabel",
+    "WebcastDataStaticBorderInfo",
+    "WebcastDataStreamRecognitionCandidate",
+    "WebcastDataStreamRecognitionContainers",
+    "WebcastDataStreamUrl",
+    "WebcastDataStreamUrlLiveCoreSdkData",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullData",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataCameraHorizontalPosition",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataDisplay",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataExtension",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptions",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality",
+    "WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo",
+    "WebcastDataStreamUrlLiveCoreSdkDataPushData",
+    "WebcastDataStreamUrlLiveCoreSdkDataPushDataResolutionParams",
+    "WebcastDataStreamUrlPlaySetting",
+    "WebcastDataStreamUrlStreamUrlExtra",
+    "WebcastDataStreamUrlStreamUrlExtraAdaptionInfo",
+    "WebcastDataStreamUrlStreamUrlExtraAnchorClientInfo",
+    "WebcastDataStreamUrlStreamUrlExtraSuperResolution",
+    "WebcastDataSubscribeMember",
+    "WebcastDataSubscribeMemberMark",
+    "WebcastDataTeamInfo",
+    "WebcastDataTeamStats",
+    "WebcastDataText",
+    "WebcastDataTextFormat",
+    "WebcastDataTextPiece",
+    "WebcastDataTextPieceGift",
+    "WebcastDataTextPieceHeart",
+    "WebcastDataTextPieceImage",
+    "WebcastDataTextPiecePatternRef",
+    "WebcastDataTextPieceUser",
+    "WebcastDataTicketData",
+    "WebcastDataTicketDataPaidLivePriceInfoV2",
+    "WebcastDataTicketDataTicketSkuDetail",
+    "WebcastDataTitleIcon",
+    "WebcastDataToast",
+    "WebcastDataToolbarBizSkin",
+    "WebcastDataToolBarComponentData",
+    "WebcastDataToolBarData",
+    "WebcastDataToolbarExtraInfo",
+    "WebcastDataToolbarItemConfig",
+    "WebcastDataToolbarPermutation",
+    "WebcastDataToolbarPermutationRule",
+    "WebcastDataTopFan",
+    "WebcastDataToutiaoMatchData",
+    "WebcastDataTvStation",
+    "WebcastDataUnionLiveInfo",
+    "WebcastDataUnionLiveInfoGuestAnchor",
+    "WebcastDataUpperRightWidgetData",
+    "WebcastDataUser",
+    "WebcastDataUserActivityInfo",
+    "WebcastDataUserAnchorInfo",
+    "WebcastDataUserAnchorLevel",
+    "WebcastDataUserAuthenticationInfo",
+    "WebcastDataUserAuthenticationInfoAccountTypeInfo",
+    "WebcastDataUserAuthorStats",
+    "WebcastDataUserBizRelation",
+    "WebcastDataUserBorder",
+    "WebcastDataUserBottomEntry",
+    "WebcastDataUserBrotherhoodInfo",
+    "WebcastDataUserExtraInfo",
+    "WebcastDataUserFansClub",
+    "WebcastDataUserFansClubFansClubData",
+    "WebcastDataUserFansClubFansClubDataUserBadge",
+    "WebcastDataUserFansGroupInfo",
+    "WebcastDataUserFollowInfo",
+    "WebcastDataUserJAccreditInfo",
+    "WebcastDataUserNobleLevelInfo",
+    "WebcastDataUserOwnRoom",
+    "WebcastDataUserPayGrade",
+    "WebcastDataUserPayGradeGradeIcon",
+    "WebcastDataUserPoiInfo",
+    "WebcastDataUserProfileStyleParams",
+    "WebcastDataUserPublicAreaBadgeInfo",
+    "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeList",
+    "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule",
+    "WebcastDataUserSubscribe",
+    "WebcastDataUserUserAttr",
+    "WebcastDataUserUserDressInfo",
+    "WebcastDataUserUserPermissionGrant",
+    "WebcastDataUserUserSettingInfo",
+    "WebcastDataUserUserStats",
+    "WebcastDataUserXiguaParams",
+    "WebcastDataUserXiguaParamsUserExtendInfo",
+    "WebcastDataUserXiguaParamsUserExtendInfoRocketSchema",
+    "WebcastDataUserVipInfo",
+    "WebcastDataUserWorldChatInfo",
+    "WebcastDataVerticalTypeInfo",
+    "WebcastDataVipBadge",
+    "WebcastDataVipData",
+    "WebcastDataVrInfo",
+    "WebcastDataVrInfoVrSixdofTransferInfo",
+    "WebcastDataVsBar",
+    "WebcastDataVsCameraInfo",
+    "WebcastDataVsConfigDrawer",
+    "WebcastDataVsEpisodeHighLight",
+    "WebcastDataVsGiftPannel",
+    "WebcastDataVsItemBar",
+    "WebcastDataVsItemComment",
+    "WebcastDataVsLinkInfo",
+    "WebcastDataVsLinkNode",
+    "WebcastDataVsPannelIcon",
+    "WebcastDataVsPremiereToast",
+    "WebcastDataVsWatermark",
+    "WebcastDataVsWatermarkIcon",
+    "WebcastDataWatchInfo",
+    "WebcastDataWebData",
+    "WebcastDataWebEnterBenefitPointData",
+    "WebcastDataWebLivePortConfig",
+    "WebcastDataWebLivePortOptimization",
+    "WebcastDataWebProgramme",
+    "WebcastDataWebSkinData",
+    "WebcastDataWelfareProjectInfo",
+    "WebcastDataWindmillData",
+    "WebcastImBottomPinInfo",
+    "WebcastImChatMessage",
+    "WebcastImCommon",
+    "WebcastImHoverInfo",
+    "WebcastImLandscapeAreaCommon",
+    "WebcastImMessage",
+    "WebcastImPersonalizedDisplayInfo",
+    "WebcastImPublicAreaCommon",
+    "WebcastImPushFrame",
+    "WebcastImPushHeader",
+    "WebcastImResponse",
+    "WebcastImSuffixText",
+)
+
+
+@dataclass(eq=False, repr=False)
+class Webcast(betterproto2.Message):
+    pass
+
+
+default_message_pool.register_message("douyin", "Webcast", Webcast)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityData(betterproto2.Message):
+    xg_play: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    match: "WebcastDataMatchRoomData | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ActivityData", WebcastDataActivityData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityLiveRecommendConfig(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    level: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    start_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    live_type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    actor_uids: "list[int]" = betterproto2.field(
+        6, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    episode_info: "WebcastDataActivityLiveRecommendConfigEpisodeInfo | None" = (
+        betterproto2.field(7, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    actor_openids: "list[str]" = betterproto2.field(
+        5000, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.ActivityLiveRecommendConfig",
+    WebcastDataActivityLiveRecommendConfig,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityLiveRecommendConfigEpisodeInfo(betterproto2.Message):
+    content_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    content: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.ActivityLiveRecommendConfig.EpisodeInfo",
+    WebcastDataActivityLiveRecommendConfigEpisodeInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataActivityRoomSkinInfo(betterproto2.Message):
+    vertical_screen: "dict[int, WebcastDataImage]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    horizontal_screen: "dict[int, WebcastDataImage]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ActivityRoomSkinInfo", WebcastDataActivityRoomSkinInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAddressInfo(betterproto2.Message):
+    country_geo_name_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    province_code: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    city_code: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    country: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    province: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    city: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AddressInfo", WebcastDataAddressInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAgainst(betterproto2.Message):
+    left_name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    left_logo: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    left_goal: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    left_players: "list[WebcastDataPlayerInfo]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    left_goal_stage_detail: "WebcastDataGoalStageDetail | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    right_name: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    right_logo: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    right_goal: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    right_players: "list[WebcastDataPlayerInfo]" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    right_goal_stage_detail: "WebcastDataGoalStageDetail | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    timestamp: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    version: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    left_team_id: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    right_team_id: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    diff_sei2abs_second: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    final_goal_stage: "int" = betterproto2.field(16, betterproto2.TYPE_INT32)
+
+    current_goal_stage: "int" = betterproto2.field(17, betterproto2.TYPE_INT32)
+
+    left_score_addition: "int" = betterproto2.field(18, betterproto2.TYPE_INT32)
+
+    right_score_addition: "int" = betterproto2.field(19, betterproto2.TYPE_INT32)
+
+    left_goal_int: "int" = betterproto2.field(20, betterproto2.TYPE_UINT64)
+
+    right_goal_int: "int" = betterproto2.field(21, betterproto2.TYPE_UINT64)
+
+    left_score_detail: "WebcastDataBasketBallGoalStageDetail | None" = (
+        betterproto2.field(22, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    right_score_detail: "WebcastDataBasketBallGoalStageDetail | None" = (
+        betterproto2.field(23, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    basketball_stage: "WebcastDataBasketballStage | None" = betterproto2.field(
+        24, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    esport_stage: "WebcastDataESportsStage | None" = betterproto2.field(
+        25, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Against", WebcastDataAgainst
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAiPublicScreenContainer(betterproto2.Message):
+    role: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    nick_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    welcome_tip: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    area_schema: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    abilities: "list[WebcastDataAiPublicScreenContainerAbility]" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AIPublicScreenContainer", WebcastDataAiPublicScreenContainer
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAiPublicScreenContainerAbility(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    name: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    params: "dict[str, str]" = betterproto2.field(
+        5,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.AIPublicScreenContainer.Ability",
+    WebcastDataAiPublicScreenContainerAbility,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorBottomToolBar(betterproto2.Message):
+    anchor_linkmic_entrance: "WebcastDataAnchorLinkmicEntranceInfo | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    audience_linkmic_entrance: "WebcastDataAudienceLinkmicEntranceInfo | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AnchorBottomToolBar", WebcastDataAnchorBottomToolBar
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorLinkmic(betterproto2.Message):
+    channel_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AnchorLinkmic", WebcastDataAnchorLinkmic
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorLinkmicEntranceInfo(betterproto2.Message):
+    panel_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    text: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    pk_to_linkmic_image: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    linkmic_to_pk_image: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    lead_pk_image: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    lead_pk_freq_key: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    pk_icon: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_icon: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    word_type: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    button_lead: "dict[int, WebcastDataAnchorLinkmicEntranceInfoLeadInfo]" = (
+        betterproto2.field(
+            11,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_INT64, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.AnchorLinkmicEntranceInfo",
+    WebcastDataAnchorLinkmicEntranceInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorLinkmicEntranceInfoLeadInfo(betterproto2.Message):
+    lead_image: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    bubble_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    bubble_panel: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.AnchorLinkmicEntranceInfo.LeadInfo",
+    WebcastDataAnchorLinkmicEntranceInfoLeadInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorTabLabel(betterproto2.Message):
+    content: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    label: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    style: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    key: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    accessible_content: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    track_params: "dict[str, str]" = betterproto2.field(
+        8,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    dsl_label: "WebcastDataDslDetail | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AnchorTabLabel", WebcastDataAnchorTabLabel
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnchorTogetherLive(betterproto2.Message):
+    is_together_live: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    user_list: "list[WebcastDataUser]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    schema_url: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    scene: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    is_show: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AnchorTogetherLive", WebcastDataAnchorTogetherLive
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnimatedBgInfo(betterproto2.Message):
+    show_area: "WebcastDataShowArea | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    file_format: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    animated_bg: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AnimatedBgInfo", WebcastDataAnimatedBgInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAnnouncementInfo(betterproto2.Message):
+    scheduled_time_text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    content: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    subscribed: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    appointment_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    scheduled_time: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    scheduled_date: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    scheduled_weekdays: "list[int]" = betterproto2.field(
+        7, betterproto2.TYPE_INT32, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AnnouncementInfo", WebcastDataAnnouncementInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearance(betterproto2.Message):
+    head_bubble: "WebcastDataAppearanceBubble | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    up_right_stats_display_type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    entrance: "WebcastDataMoreEntrance | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    toolbar_list: "list[WebcastDataToolbarItemConfig]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    preview_style: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    cover_gauss: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content_tags: "list[WebcastDataAppearanceContentTag]" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    preview_label: "WebcastDataPreviewLabel | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    cover_dynamic_mask: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    horizontal_background: "WebcastDataImage | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    wide_cover_list: "list[WebcastDataAppearanceWideCover]" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    blur_placeholder_img: "WebcastDataImage | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Appearance", WebcastDataAppearance
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearanceBubble(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    roll_tips: "list[str]" = betterproto2.field(
+        2, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    roll_after_ms: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    coupon_mate_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    et_type: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    extra: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Appearance.Bubble", WebcastDataAppearanceBubble
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearanceContentTag(betterproto2.Message):
+    text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Appearance.ContentTag", WebcastDataAppearanceContentTag
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppearanceWideCover(betterproto2.Message):
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    cover_type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Appearance.WideCover", WebcastDataAppearanceWideCover
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAppointmentData(betterproto2.Message):
+    appointment_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    is_subscribe: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AppointmentData", WebcastDataAppointmentData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAsyncAuthData(betterproto2.Message):
+    keep_alive_time: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    async_authentication_operate: "int" = betterproto2.field(
+        2, betterproto2.TYPE_UINT64
+    )
+
+    async_authentication_ab_type: "int" = betterproto2.field(
+        3, betterproto2.TYPE_UINT64
+    )
+
+    keep_alive_time_stamp: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    buffer: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AsyncAuthData", WebcastDataAsyncAuthData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudienceLimitRoomConfig(betterproto2.Message):
+    version: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    restriction_reason: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    mock_max_audience_cnt: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    extra: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    max_audience_cnt: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AudienceLimitRoomConfig", WebcastDataAudienceLimitRoomConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudienceLinkmicEntranceInfo(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.AudienceLinkmicEntranceInfo",
+    WebcastDataAudienceLinkmicEntranceInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudioBgData(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    image_uri: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    img_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_thumbnail: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_animated_bg: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_normal_avatar: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_startup_avatar: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_chat_join_icon: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_static_bg: "WebcastDataImage | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    speaking_image_list: "WebcastDataAudioSpeakingImageList | None" = (
+        betterproto2.field(11, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    status_color_value: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    public_screen_color_value: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    time_limit: "int" = betterproto2.field(14, betterproto2.TYPE_INT32)
+
+    bg_type: "int" = betterproto2.field(15, betterproto2.TYPE_INT32)
+
+    empty_start_color: "str" = betterproto2.field(16, betterproto2.TYPE_STRING)
+
+    empty_end_color: "str" = betterproto2.field(17, betterproto2.TYPE_STRING)
+
+    image_cold_bg: "WebcastDataImage | None" = betterproto2.field(
+        18, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    mic_bg_color_value: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    icon_mic_normals: "list[WebcastDataImage]" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    icon_mic_lock: "WebcastDataImage | None" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    color_mic_text: "str" = betterproto2.field(22, betterproto2.TYPE_STRING)
+
+    color_mic_line: "str" = betterproto2.field(23, betterproto2.TYPE_STRING)
+
+    color_mic_bg: "str" = betterproto2.field(24, betterproto2.TYPE_STRING)
+
+    theme_label: "str" = betterproto2.field(25, betterproto2.TYPE_STRING)
+
+    bg_status: "int" = betterproto2.field(26, betterproto2.TYPE_INT32)
+
+    animate_info: "WebcastDataAnimatedBgInfo | None" = betterproto2.field(
+        27, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    id_str: "str" = betterproto2.field(28, betterproto2.TYPE_STRING)
+
+    play_mode: "int" = betterproto2.field(29, betterproto2.TYPE_INT32)
+
+    theme_tag: "str" = betterproto2.field(30, betterproto2.TYPE_STRING)
+
+    start_time: "int" = betterproto2.field(31, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(32, betterproto2.TYPE_UINT64)
+
+    format_type: "int" = betterproto2.field(33, betterproto2.TYPE_INT32)
+
+    speaking_image_v2: "WebcastDataAudioSpeakingImageList | None" = betterproto2.field(
+        34, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AudioBGData", WebcastDataAudioBgData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudioSpeakingImageList(betterproto2.Message):
+    male_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    female_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    unknown_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    audio_stage_speaking_image: "WebcastDataAudioSpeakingImageListSpeakingImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AudioSpeakingImageList", WebcastDataAudioSpeakingImageList
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAudioSpeakingImageListSpeakingImage(betterproto2.Message):
+    speaking_low_image: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    speaking_default_image: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    speaking_high_image: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.AudioSpeakingImageList.SpeakingImage",
+    WebcastDataAudioSpeakingImageListSpeakingImage,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAuthor(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    user_info: "WebcastDataUser | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    author_basic_info: "WebcastDataAuthorAuthorBasicInfo | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    jump_schema: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Author", WebcastDataAuthor
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAuthorAuthorBasicInfo(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    intorduce: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Author.AuthorBasicInfo", WebcastDataAuthorAuthorBasicInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAvatarLiveInfo(betterproto2.Message):
+    type: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    text_size: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AvatarLiveInfo", WebcastDataAvatarLiveInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataAvatorBorder(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    level: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    thumb_icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dress_id: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.AvatorBorder", WebcastDataAvatorBorder
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBarrageConfigure(betterproto2.Message):
+    logo: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    atoms_bg_color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    atoms_frame: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    atoms_text: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    schema: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    jump_icon: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BarrageConfigure", WebcastDataBarrageConfigure
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBasketBallGoalStageDetail(betterproto2.Message):
+    first_period: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    second_period: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    third_period: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    forth_period: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    overtime: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    total: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.BasketBallGoalStageDetail",
+    WebcastDataBasketBallGoalStageDetail,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBasketballStage(betterproto2.Message):
+    current_stage: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    final_stage: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BasketballStage", WebcastDataBasketballStage
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBeautifyInfo(betterproto2.Message):
+    use_filter: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    commerce_use_filter: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BeautifyInfo", WebcastDataBeautifyInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBindSubProductData(betterproto2.Message):
+    product_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    parent_product_id: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    live_status: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    ticket_status: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    detail: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    vid: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    room_id: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    delivery_status: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    live_time: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    live_start_time: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    live_end_time: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    view_right: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    is_replay: "bool" = betterproto2.field(15, betterproto2.TYPE_BOOL)
+
+    replay_id: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    replay_id_str: "str" = betterproto2.field(17, betterproto2.TYPE_STRING)
+
+    disable_reason: "int" = betterproto2.field(18, betterproto2.TYPE_INT32)
+
+    camera_id: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    price_info: "WebcastDataProductPriceStruct | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    jump_schema: "str" = betterproto2.field(21, betterproto2.TYPE_STRING)
+
+    item_id: "str" = betterproto2.field(22, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BindSubProductData", WebcastDataBindSubProductData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBlockComponent(betterproto2.Message):
+    component_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    reason: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BlockComponent", WebcastDataBlockComponent
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBonus(betterproto2.Message):
+    bonus_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    author: "WebcastDataBonusAuthor | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    sub_title: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    text: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    style: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    commerce_info: "WebcastDataBonusCommerce | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    open_url: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    token: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    source: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    label: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    scene_id: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    maybe_carp: "bool" = betterproto2.field(13, betterproto2.TYPE_BOOL)
+
+    countdown_second: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.Bonus", WebcastDataBonus)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBonusAuthor(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    avatar_larger: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_thumb: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_medium: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BonusAuthor", WebcastDataBonusAuthor
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBonusCommerce(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BonusCommerce", WebcastDataBonusCommerce
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBorderInfo(betterproto2.Message):
+    border_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    static_border: "WebcastDataStaticBorderInfo | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dynamic_border: "WebcastDataDynamicBorderInfo | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    duration: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BorderInfo", WebcastDataBorderInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBottomInputData(betterproto2.Message):
+    content: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    frequency: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BottomInputData", WebcastDataBottomInputData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBurstInfo(betterproto2.Message):
+    burst_time_remain_seconds: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    multiple: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    property_definition_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    property_icon: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BurstInfo", WebcastDataBurstInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataBusinessConfigure(betterproto2.Message):
+    business_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    bus_type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    delay_second: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    precise_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    display_second: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    res_config: "WebcastDataResourceConfigure | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    del_type: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.BusinessConfigure", WebcastDataBusinessConfigure
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraMatchInfo(betterproto2.Message):
+    match_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    content_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    event_ids: "list[int]" = betterproto2.field(
+        3, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    hide_tab_ids: "list[int]" = betterproto2.field(
+        4, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    match_id_str: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CameraMatchInfo", WebcastDataCameraMatchInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraPaidInfo(betterproto2.Message):
+    max_duration: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    duration: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    price_info: "WebcastDataCameraPaidInfoPriceInfo | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    paid_live_base_info: "WebcastDataPaidLiveBaseInfo | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    paid_live_biz_extra: "WebcastDataCameraPaidInfoPaidLiveBizExtra | None" = (
+        betterproto2.field(5, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    async_auth_data: "WebcastDataAsyncAuthData | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CameraPaidInfo", WebcastDataCameraPaidInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraPaidInfoPaidLiveBizExtra(betterproto2.Message):
+    ticket_panel_six_jump_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    is_replay: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    paid_conversion_jump_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    prepay_cashier_jump_url: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.CameraPaidInfo.PaidLiveBizExtra",
+    WebcastDataCameraPaidInfoPaidLiveBizExtra,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCameraPaidInfoPriceInfo(betterproto2.Message):
+    amount: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    currency: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.CameraPaidInfo.PriceInfo",
+    WebcastDataCameraPaidInfoPriceInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCartHorizontal(betterproto2.Message):
+    allow_show_cart: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CartHorizontal", WebcastDataCartHorizontal
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCartVertical(betterproto2.Message):
+    allow_show_cart: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CartVertical", WebcastDataCartVertical
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCastOttPermission(betterproto2.Message):
+    enable: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    failure_toast: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CastOttPermission", WebcastDataCastOttPermission
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCastScreenData(betterproto2.Message):
+    show_text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    allow_list: "list[int]" = betterproto2.field(
+        2, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    sdk_version: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    permission: "WebcastDataCastOttPermission | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    force_cast_only: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CastScreenData", WebcastDataCastScreenData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataChangeRoomInfo(betterproto2.Message):
+    has_change_room: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    before_room_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    before_anchor_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    open_before_anchor_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ChangeRoomInfo", WebcastDataChangeRoomInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataChatGroupExtendData(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ChatGroupExtendData", WebcastDataChatGroupExtendData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataChatMentionInfo(betterproto2.Message):
+    mention_user_ids: "list[str]" = betterproto2.field(
+        1, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    mention_webcast_user_ids: "list[str]" = betterproto2.field(
+        2, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    show_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ChatMentionInfo", WebcastDataChatMentionInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataChatReplyRespInfo(betterproto2.Message):
+    reply_msg_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    reply_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    reply_text: "WebcastDataText | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    reply_uid: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    reply_webcast_uid: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    reply_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ChatReplyRespInfo", WebcastDataChatReplyRespInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCircleInfo(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    cover_img: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    description: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CircleInfo", WebcastDataCircleInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataClientComponent(betterproto2.Message):
+    portrait_component_map: "dict[str, WebcastDataClientComponentInfo]" = (
+        betterproto2.field(
+            1,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+    landscape_component_map: "dict[str, WebcastDataClientComponentInfo]" = (
+        betterproto2.field(
+            2,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+    is_open: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    template_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    preview_default_component_map: "dict[str, WebcastDataClientComponentInfo]" = (
+        betterproto2.field(
+            5,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ClientComponent", WebcastDataClientComponent
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataClientComponentFunctionInfo(betterproto2.Message):
+    function_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    data: "dict[str, str]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.ClientComponentFunctionInfo",
+    WebcastDataClientComponentFunctionInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataClientComponentInfo(betterproto2.Message):
+    container_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    function_detail: "WebcastDataClientComponentFunctionInfo | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    is_open: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    dsl_detail: "WebcastDataDslDetail | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dsl_layout: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    container_layout: "WebcastDataContainerLayout | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ClientComponentInfo", WebcastDataClientComponentInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCloudCollaborateData(betterproto2.Message):
+    collaborate_room_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    collaborate_room_id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    rejoin_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CloudCollaborateData", WebcastDataCloudCollaborateData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCombined(betterproto2.Message):
+    bind_sub_ticket_list: "list[WebcastDataBindSubProductData]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    parent_ticket_panel_data: "WebcastDataParentProductSimpleData | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    bind_sub_ticket_list_has_more: "bool" = betterproto2.field(
+        3, betterproto2.TYPE_BOOL
+    )
+
+    bind_sub_ticket_total: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    combination_updated: "bool" = betterproto2.field(5, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Combined", WebcastDataCombined
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentaryRoomInfo(betterproto2.Message):
+    user_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    avatar: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    nickname: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    room_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentaryRoomInfo", WebcastDataCommentaryRoomInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentBox(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    placeholder: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentBox", WebcastDataCommentBox
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentColor(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    color: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentColor", WebcastDataCommentColor
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentConfig(betterproto2.Message):
+    comment_colors: "list[WebcastDataCommentColor]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    comment_roles: "list[WebcastDataCommentRole]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    role_suffix: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    role_title: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    unlock_role_tip: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    comment_medals: "list[WebcastDataCommentMedal]" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    medal_title: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentConfig", WebcastDataCommentConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentMedal(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    jump_schema: "dict[str, str]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    keyboard_image: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentMedal", WebcastDataCommentMedal
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentRole(betterproto2.Message):
+    role_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    avatar: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentRole", WebcastDataCommentRole
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataComments(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    count: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    has_more: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    jump_schema: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    texts: "list[WebcastDataCommentsTextInfo]" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Comments", WebcastDataComments
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentsTextInfo(betterproto2.Message):
+    comment_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    user_info: "WebcastDataCommentsTextInfoUserInfo | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    text: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    digg_count: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    create_time_stamp: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    comment_id_str: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Comments.TextInfo", WebcastDataCommentsTextInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentsTextInfoUserInfo(betterproto2.Message):
+    user_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    avatar: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.Comments.TextInfo.UserInfo",
+    WebcastDataCommentsTextInfoUserInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentWallInfo(betterproto2.Message):
+    content: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    comment_msg_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    commenter_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    commenter_nickname: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    event_time: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    msg_time: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    countdown_style: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    operator_id: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    operator_nickname: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    operator_openid: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+    commenter_open_id: "str" = betterproto2.field(5001, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentWallInfo", WebcastDataCommentWallInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCommentWallPosition(betterproto2.Message):
+    x: "float" = betterproto2.field(1, betterproto2.TYPE_DOUBLE)
+
+    y: "float" = betterproto2.field(2, betterproto2.TYPE_DOUBLE)
+
+    event_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CommentWallPosition", WebcastDataCommentWallPosition
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataComponentSkin(betterproto2.Message):
+    vertical: "dict[str, WebcastDataToolbarBizSkin]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    landscape: "dict[str, WebcastDataToolbarBizSkin]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    general: "dict[str, WebcastDataToolbarBizSkin]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ComponentSkin", WebcastDataComponentSkin
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataContainerLayout(betterproto2.Message):
+    width: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    height: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    margin_left: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    margin_top: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    margin_bottom: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    margin_right: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    padding_left: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    padding_right: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    padding_bottom: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    padding_top: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ContainerLayout", WebcastDataContainerLayout
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataContentInfo(betterproto2.Message):
+    content_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    tag_type: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    lastest: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    total: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    category: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    view_right: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    content_id_str: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    duration: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    promise_update_time: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ContentInfo", WebcastDataContentInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataContentTip(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    context: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    click_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    click_context: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ContentTip", WebcastDataContentTip
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCornerMarkReach(betterproto2.Message):
+    need_reach: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    duration: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    elem_type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.CornerMarkReach", WebcastDataCornerMarkReach
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataCoupon(betterproto2.Message):
+    icon: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    start_time: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    expire_time: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    coupon_name: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    url: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    coupon_string: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    countdown: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    show_type: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    coupon_meta_id: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    coupon_type: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Coupon", WebcastDataCoupon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDecoration(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    input_rect: "list[int]" = betterproto2.field(
+        4, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    text_size: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    text_color: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    content: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    max_length: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    status: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    h: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    x: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    w: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    y: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    kind: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    sub_type: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    reservation: "WebcastDataReservation | None" = betterproto2.field(
+        16, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    nine_patch_image: "WebcastDataImage | None" = betterproto2.field(
+        17, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    text_special_effects: "list[int]" = betterproto2.field(
+        18, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    text_image_adjustable_start_position: "int" = betterproto2.field(
+        19, betterproto2.TYPE_UINT64
+    )
+
+    text_image_adjustable_end_position: "int" = betterproto2.field(
+        20, betterproto2.TYPE_UINT64
+    )
+
+    text_font_config: "WebcastDataDecorationFontConfig | None" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    audit_text_color: "str" = betterproto2.field(22, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Decoration", WebcastDataDecoration
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDecorationFontConfig(betterproto2.Message):
+    font_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    download_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    status: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    font_name: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.DecorationFontConfig", WebcastDataDecorationFontConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDecotationDetail(betterproto2.Message):
+    text_decoration: "WebcastDataDecoration | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_decoration: "WebcastDataDecoration | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.DecotationDetail", WebcastDataDecotationDetail
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDesireInfo(betterproto2.Message):
+    desire_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    desire_id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.DesireInfo", WebcastDataDesireInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDslDetail(betterproto2.Message):
+    dsl_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    dsl_type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    dsl_gecko_download_uri: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    dsl_slice_info: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    version: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    dsl_data: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    extra: "WebcastDataDslDetailExtraInfo | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.DSLDetail", WebcastDataDslDetail
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDslDetailExtraInfo(betterproto2.Message):
+    height: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    width: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.DSLDetail.ExtraInfo", WebcastDataDslDetailExtraInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataDynamicBorderInfo(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.DynamicBorderInfo", WebcastDataDynamicBorderInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEasterEggData(betterproto2.Message):
+    has_easter_egg: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    stage: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    total_stage: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    effects_num: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    start_count: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    end_count: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    count: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    panel_url: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    entrance_icon: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EasterEggData", WebcastDataEasterEggData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomAuction(betterproto2.Message):
+    price: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    price_label: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    button_label: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    user: "WebcastDataEcomBidder | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    status: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomAuction", WebcastDataEcomAuction
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomAvatar(betterproto2.Message):
+    url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    width: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    height: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomAvatar", WebcastDataEcomAvatar
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomBidder(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    avatar: "WebcastDataEcomAvatar | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomBidder", WebcastDataEcomBidder
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomCampaign(betterproto2.Message):
+    remaining_seconds: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    auction: "WebcastDataEcomAuction | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomCampaign", WebcastDataEcomCampaign
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomData(betterproto2.Message):
+    live_card: "WebcastDataEcomLiveCard | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pop: "WebcastDataEcomPop | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    goods_card: "WebcastDataEcomGoodsCard | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    reds_show_infos: "list[WebcastDataRedsShowInfo]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    room_cart_v2: "WebcastDataRoomCartV2 | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    instant_type: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    route_rule: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    shop_author_header: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    intro_type: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomData", WebcastDataEcomData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomGoodsCard(betterproto2.Message):
+    product_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    cover: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    min_price: "WebcastDataEcomPrice | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    coupon: "WebcastDataCoupon | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    promotion_id: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    jump_destination: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    card_type: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    redpack: "WebcastDataRedpack | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomGoodsCard", WebcastDataEcomGoodsCard
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomIcon(betterproto2.Message):
+    url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomIcon", WebcastDataEcomIcon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomLiveCard(betterproto2.Message):
+    product: "WebcastDataEcomProduct | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon: "WebcastDataEcomIcon | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    campaign: "WebcastDataEcomCampaign | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomLiveCard", WebcastDataEcomLiveCard
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomLiveReviewInfo(betterproto2.Message):
+    need_review: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    timeout_timestamp: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    review_duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    approval_reason: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomLiveReviewInfo", WebcastDataEcomLiveReviewInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomPop(betterproto2.Message):
+    product_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    promotion_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    cover: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    min_price: "WebcastDataEcomPrice | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    selling_point: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    jumanji_json: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomPop", WebcastDataEcomPop
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomPrice(betterproto2.Message):
+    prefix: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    suffix: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    by_cent: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    format_price: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomPrice", WebcastDataEcomPrice
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEcomProduct(betterproto2.Message):
+    promotion_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    product_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    cover_image: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    price: "WebcastDataEcomPrice | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    regular_price: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    deposit_price: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EcomProduct", WebcastDataEcomProduct
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEmojiDetail(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    content: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EmojiDetail", WebcastDataEmojiDetail
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEnterGiftAnimation(betterproto2.Message):
+    gift_effect_id: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    display_gap: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    display_freq: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EnterGiftAnimation", WebcastDataEnterGiftAnimation
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEnterPublicAreaAnimation(betterproto2.Message):
+    public_area_effect_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.EnterPublicAreaAnimation",
+    WebcastDataEnterPublicAreaAnimation,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodeExtraInfo(betterproto2.Message):
+    episode_mod: "WebcastDataEpisodeMod | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    current_period: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    episode_list_h5: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    watch_info: "WebcastDataWatchInfo | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    episode_id: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    episode_id_str: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    item_id: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    selection_url: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    relation_place_text: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    operation_place_text_list: "list[str]" = betterproto2.field(
+        11, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    toolbar_list: "WebcastDataToolbarItemConfig | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    collected: "bool" = betterproto2.field(13, betterproto2.TYPE_BOOL)
+
+    season_id: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    finish_url: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    release_time: "str" = betterproto2.field(16, betterproto2.TYPE_STRING)
+
+    watch_period: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    latest_period: "int" = betterproto2.field(18, betterproto2.TYPE_UINT64)
+
+    show_name: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    current_period_raw: "int" = betterproto2.field(20, betterproto2.TYPE_INT32)
+
+    video_code: "int" = betterproto2.field(21, betterproto2.TYPE_INT32)
+
+    season_id_str: "str" = betterproto2.field(22, betterproto2.TYPE_STRING)
+
+    watch_pv_raw: "str" = betterproto2.field(23, betterproto2.TYPE_STRING)
+
+    next_special_episode_id: "int" = betterproto2.field(24, betterproto2.TYPE_UINT64)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        25, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    cover_vertical: "WebcastDataImage | None" = betterproto2.field(
+        26, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    style: "int" = betterproto2.field(27, betterproto2.TYPE_INT32)
+
+    play_control: "WebcastDataEpisodePremierePlay | None" = betterproto2.field(
+        28, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_image: "WebcastDataEpisodePreviewImage | None" = betterproto2.field(
+        29, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    gift_pannel: "WebcastDataVsGiftPannel | None" = betterproto2.field(
+        30, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pannel_icon: "WebcastDataVsPannelIcon | None" = betterproto2.field(
+        31, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pannel_toolbar: "list[WebcastDataToolbarItemConfig]" = betterproto2.field(
+        32, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    preview_bottom: "WebcastDataEpisodePreviewBottom | None" = betterproto2.field(
+        33, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    draw_sub_title: "str" = betterproto2.field(34, betterproto2.TYPE_STRING)
+
+    season_cover_vertical: "WebcastDataImage | None" = betterproto2.field(
+        35, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    camera_infos: "list[WebcastDataVsCameraInfo]" = betterproto2.field(
+        36, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    default_camera_id: "int" = betterproto2.field(37, betterproto2.TYPE_UINT64)
+
+    default_camera_id_str: "int" = betterproto2.field(38, betterproto2.TYPE_UINT64)
+
+    default_camera_id_str_v2: "str" = betterproto2.field(39, betterproto2.TYPE_STRING)
+
+    priority_camera: "WebcastDataVsCameraInfo | None" = betterproto2.field(
+        40, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    multi_season_tag: "str" = betterproto2.field(41, betterproto2.TYPE_STRING)
+
+    preview_background: "WebcastDataImage | None" = betterproto2.field(
+        42, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background: "WebcastDataImage | None" = betterproto2.field(
+        43, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    mod: "WebcastDataEpisodeMod | None" = betterproto2.field(
+        44, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    item_comment_icon: "WebcastDataImage | None" = betterproto2.field(
+        45, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vs_watermark: "WebcastDataVsWatermark | None" = betterproto2.field(
+        46, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    item_comment: "WebcastDataVsItemComment | None" = betterproto2.field(
+        47, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    season_type_name: "str" = betterproto2.field(48, betterproto2.TYPE_STRING)
+
+    vs_bar: "WebcastDataVsBar | None" = betterproto2.field(
+        49, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    season_watch_info: "WebcastDataWatchInfo | None" = betterproto2.field(
+        50, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    link_room_info: "WebcastDataVsLinkInfo | None" = betterproto2.field(
+        51, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    comment_config: "WebcastDataCommentConfig | None" = betterproto2.field(
+        52, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    camera_infos_table_title: "str" = betterproto2.field(53, betterproto2.TYPE_STRING)
+
+    episode_status: "int" = betterproto2.field(54, betterproto2.TYPE_INT32)
+
+    match_room_info: "WebcastDataMatchRoomInfo | None" = betterproto2.field(
+        55, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    multi_camera_basic_info: "WebcastDataMultiCameraBasicInfo | None" = (
+        betterproto2.field(56, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    share_poster_info: "WebcastDataSharePosterInfo | None" = betterproto2.field(
+        57, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    premiere_toast: "WebcastDataVsPremiereToast | None" = betterproto2.field(
+        58, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_bottom_text: "str" = betterproto2.field(59, betterproto2.TYPE_STRING)
+
+    business_configure: "list[WebcastDataBusinessConfigure]" = betterproto2.field(
+        60, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    public_screen_color: "str" = betterproto2.field(61, betterproto2.TYPE_STRING)
+
+    chat_tray_color: "str" = betterproto2.field(62, betterproto2.TYPE_STRING)
+
+    multi_tab: "WebcastDataMultiTab | None" = betterproto2.field(
+        63, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    main_camera_cover: "WebcastDataImage | None" = betterproto2.field(
+        64, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    main_camera_title: "str" = betterproto2.field(65, betterproto2.TYPE_STRING)
+
+    privilege_info: "dict[int, WebcastDataPrivilegeInfo]" = betterproto2.field(
+        66,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    is_interact_config_exist: "bool" = betterproto2.field(67, betterproto2.TYPE_BOOL)
+
+    main_camera_match_info: "WebcastDataMainCameraMatchInfo | None" = (
+        betterproto2.field(68, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    group_id: "int" = betterproto2.field(69, betterproto2.TYPE_UINT64)
+
+    vs_config_drawer: "WebcastDataVsConfigDrawer | None" = betterproto2.field(
+        70, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    title_icon: "WebcastDataTitleIcon | None" = betterproto2.field(
+        71, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    group_id_str: "str" = betterproto2.field(72, betterproto2.TYPE_STRING)
+
+    privilege_info_v2: "dict[str, WebcastDataPrivilegeInfo]" = betterproto2.field(
+        73,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    share_type: "int" = betterproto2.field(74, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EpisodeExtraInfo", WebcastDataEpisodeExtraInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodeMod(betterproto2.Message):
+    episode_stage: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    episode_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    episode_sub_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    episode_record_type: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EpisodeMod", WebcastDataEpisodeMod
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodePremierePlay(betterproto2.Message):
+    highlights: "list[WebcastDataVsEpisodeHighLight]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    play_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    start_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    play_text: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    text_duration: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EpisodePremierePlay", WebcastDataEpisodePremierePlay
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodePreviewBottom(betterproto2.Message):
+    watch_period_str: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    latest_period_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EpisodePreviewBottom", WebcastDataEpisodePreviewBottom
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataEpisodePreviewImage(betterproto2.Message):
+    preview_uri_up: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_uri_down: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    preview_word_up: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    preview_word_down: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    preview_background_uri: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.EpisodePreviewImage", WebcastDataEpisodePreviewImage
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataESportsStage(betterproto2.Message):
+    current_stage: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    final_stage: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ESportsStage", WebcastDataESportsStage
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFansChannelCreateInfo(betterproto2.Message):
+    fans_channel_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    group_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    group_id_str: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    expired_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    fans_channel_create_type: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.FansChannelCreateInfo", WebcastDataFansChannelCreateInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeaturedPublicScreenConf(betterproto2.Message):
+    status: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    mode: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    ai_container: "WebcastDataAiPublicScreenContainer | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.FeaturedPublicScreenConf",
+    WebcastDataFeaturedPublicScreenConf,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCard(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    feedback_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    question: "list[WebcastDataFeedbackCardQuestion]" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    condition: "WebcastDataFeedbackCardCondition | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    room_data: "WebcastDataRoom | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    negative_text: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    bgm: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    feedback_type: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    inflow_feedback_type: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+    anchor_feedback_type: "int" = betterproto2.field(11, betterproto2.TYPE_INT32)
+
+    scene: "int" = betterproto2.field(12, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.FeedbackCard", WebcastDataFeedbackCard
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardClientImpression(betterproto2.Message):
+    ignore_submit_counts: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    ignore_submit_show_interval: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    ending_page_show_duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.FeedbackCard.ClientImpression",
+    WebcastDataFeedbackCardClientImpression,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardCondition(betterproto2.Message):
+    from_time: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    to_time: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    action_ids: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    action_type: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    preview_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    pcu_lower_threshold: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    client_impression: "WebcastDataFeedbackCardClientImpression | None" = (
+        betterproto2.field(7, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.FeedbackCard.Condition", WebcastDataFeedbackCardCondition
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardOption(betterproto2.Message):
+    key: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sub_question_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    negative: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    toast_text: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    tendency: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.FeedbackCard.Option", WebcastDataFeedbackCardOption
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardQuestion(betterproto2.Message):
+    question_key: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    question_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    options: "list[WebcastDataFeedbackCardOption]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    question_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    room_cards: "list[WebcastDataFeedbackCardRoomCardStruct]" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.FeedbackCard.Question", WebcastDataFeedbackCardQuestion
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFeedbackCardRoomCardStruct(betterproto2.Message):
+    data: "WebcastDataRoom | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sub_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.FeedbackCard.RoomCardStruct",
+    WebcastDataFeedbackCardRoomCardStruct,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFilterReason(betterproto2.Message):
+    failed: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    can_show: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    reason: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    werr_code: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    filter_name: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.FilterReason", WebcastDataFilterReason
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataFilterWord(betterproto2.Message):
+    id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    is_selected: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    name: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.FilterWord", WebcastDataFilterWord
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameAnchorInfo(betterproto2.Message):
+    category_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    is_key_anchor: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GameAnchorInfo", WebcastDataGameAnchorInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameCpData(betterproto2.Message):
+    is_live_a_promoted_a: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    game_id: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    game_name: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    promote_instance_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GameCPData", WebcastDataGameCpData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameExtra(betterproto2.Message):
+    kind: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    status: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    game_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    gift_limit: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    round_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    game_kind: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    chat: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    loader: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    reload: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    data: "dict[str, str]" = betterproto2.field(
+        10,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GameExtra", WebcastDataGameExtra
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGamePlayData(betterproto2.Message):
+    play_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    play_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    game_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GamePlayData", WebcastDataGamePlayData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameRoomSticker(betterproto2.Message):
+    need_render_sticker_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    need_render_sticker_list: "list[int]" = betterproto2.field(
+        2, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GameRoomSticker", WebcastDataGameRoomSticker
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGameTagInfo(betterproto2.Message):
+    is_game: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    game_tag_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    game_tag_name: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GameTagInfo", WebcastDataGameTagInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftPanelTopperTray(betterproto2.Message):
+    panel_schema: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    period_texts: "list[WebcastDataGiftPanelTopperTrayPeriodText]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    display_duration: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    jump_schema: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    animation_type: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    animation_gap: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    animation_freq: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    text_round_period: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    extra: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GiftPanelTopperTray", WebcastDataGiftPanelTopperTray
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGiftPanelTopperTrayPeriodText(betterproto2.Message):
+    text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    daily_show_times: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    priority: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    panel_enum: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    key: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    extra: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.GiftPanelTopperTray.PeriodText",
+    WebcastDataGiftPanelTopperTrayPeriodText,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGlobalCustomIcons(betterproto2.Message):
+    static_icon_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    animated_icon_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    animated_common_icon_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GlobalCustomIcons", WebcastDataGlobalCustomIcons
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGoalStageDetail(betterproto2.Message):
+    first_half_goal: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    second_half_goal: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    overtime: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    shots: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    total: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GoalStageDetail", WebcastDataGoalStageDetail
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGradeBuffInfo(betterproto2.Message):
+    buff_level: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    status: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    end_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    stats_info: "dict[int, int]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_INT64
+        ),
+    )
+
+    buff_badge: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GradeBuffInfo", WebcastDataGradeBuffInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataGroupLiveData(betterproto2.Message):
+    is_group_live: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    group_live_mode: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    group_live_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.GroupLiveData", WebcastDataGroupLiveData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataHeaderMedia(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    image_info: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    view_button: "WebcastDataHeaderMediaViewButton | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.HeaderMedia", WebcastDataHeaderMedia
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataHeaderMediaViewButton(betterproto2.Message):
+    content: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    jump_schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    schema_type: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.HeaderMedia.ViewButton", WebcastDataHeaderMediaViewButton
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataHotRoomInfo(betterproto2.Message):
+    bit_map: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.HotRoomInfo", WebcastDataHotRoomInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataImage(betterproto2.Message):
+    url_list: "list[str]" = betterproto2.field(
+        1, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    uri: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    height: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    width: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    avg_color: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    image_type: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    open_web_url: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    content: "WebcastDataImageContent | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_animated: "bool" = betterproto2.field(9, betterproto2.TYPE_BOOL)
+
+    flex_setting_list: "list[WebcastDataImageNinePatchSetting]" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    text_setting_list: "list[WebcastDataImageNinePatchSetting]" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.Image", WebcastDataImage)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataImageContent(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    font_color: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    level: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    alternative_text: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Image.Content", WebcastDataImageContent
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataImageNinePatchSetting(betterproto2.Message):
+    setting_list: "list[int]" = betterproto2.field(
+        1, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Image.NinePatchSetting", WebcastDataImageNinePatchSetting
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertification(betterproto2.Message):
+    profile: "WebcastDataIndustryCertificationProfile | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room: "WebcastDataIndustryCertificationRoom | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.IndustryCertification", WebcastDataIndustryCertification
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertificationProfile(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    content_color: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    bg_color: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    cert_type: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.IndustryCertificationProfile",
+    WebcastDataIndustryCertificationProfile,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertificationRoom(betterproto2.Message):
+    room_owner: "WebcastDataIndustryCertificationRoomRoomOwner | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.IndustryCertificationRoom",
+    WebcastDataIndustryCertificationRoom,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryCertificationRoomRoomOwner(betterproto2.Message):
+    title: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sub_title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    left_color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    right_color: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    anchor_industry_type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    brand_store_title: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    brand_store_background: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_reds_icon: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_reds_small_icon: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.IndustryCertificationRoom.RoomOwner",
+    WebcastDataIndustryCertificationRoomRoomOwner,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryServiceInfo(betterproto2.Message):
+    entrance_open: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    icon_image: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    consult_info: "WebcastDataIndustryServiceInfoConsultInfo | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.IndustryServiceInfo", WebcastDataIndustryServiceInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIndustryServiceInfoConsultInfo(betterproto2.Message):
+    biz_info: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    consult_role: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.IndustryServiceInfo.ConsultInfo",
+    WebcastDataIndustryServiceInfoConsultInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataInputDefaultConfig(betterproto2.Message):
+    first_level_text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    second_level_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.InputDefaultConfig", WebcastDataInputDefaultConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataInteractOpenExtra(betterproto2.Message):
+    debug_info: "dict[str, str]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.InteractOpenExtra", WebcastDataInteractOpenExtra
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIntroduction(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    content: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Introduction", WebcastDataIntroduction
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosClientComponent(betterproto2.Message):
+    fragments: "list[WebcastDataIosFragment]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    landscape_layout: "list[WebcastDataIosContainerLayout]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    portrait_layout: "list[WebcastDataIosContainerLayout]" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    is_open: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    template_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    elements: "list[WebcastDataIosFragment]" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.IOSClientComponent", WebcastDataIosClientComponent
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosContainerLayout(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    layout_rule: "WebcastDataIosContainerLayoutRule | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dsl: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.IOSContainerLayout", WebcastDataIosContainerLayout
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosContainerLayoutRule(betterproto2.Message):
+    items: "list[str]" = betterproto2.field(1, betterproto2.TYPE_STRING, repeated=True)
+
+    rule_replace: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    target: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    rule_type: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.IOSContainerLayoutRule", WebcastDataIosContainerLayoutRule
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataIosFragment(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    is_open: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.IOSFragment", WebcastDataIosFragment
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataItemInfo(betterproto2.Message):
+    item_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    tag_type: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    lastest: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    total: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    play_counts: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    view_right: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    item_id_str: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    duration: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ItemInfo", WebcastDataItemInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLabelInfo(betterproto2.Message):
+    label_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    display_type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    splice_label: "WebcastDataSpliceLabel | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    whole_label: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    extra: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    profile_pic_splice_label: "WebcastDataProfilePicSpliceLabel | None" = (
+        betterproto2.field(6, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    et_extra: "dict[str, str]" = betterproto2.field(
+        7,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LabelInfo", WebcastDataLabelInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLabelProfileItem(betterproto2.Message):
+    user_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    nick_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    profile_pic: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LabelProfileItem", WebcastDataLabelProfileItem
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLeagueInfo(betterproto2.Message):
+    league_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    cnn_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    enn_name: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    season: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LeagueInfo", WebcastDataLeagueInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLifeGrouponInfo(betterproto2.Message):
+    permission_status: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    agg_card_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    icon_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    dynamic_url: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    life_live_pack_component_config: "str" = betterproto2.field(
+        5, betterproto2.TYPE_STRING
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LifeGrouponInfo", WebcastDataLifeGrouponInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLikeDisplayConfig(betterproto2.Message):
+    show_text: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    display_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LikeDisplayConfig", WebcastDataLikeDisplayConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkerDetail(betterproto2.Message):
+    linker_play_modes: "list[int]" = betterproto2.field(
+        1, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    big_party_layout_config_version: "int" = betterproto2.field(
+        2, betterproto2.TYPE_INT32
+    )
+
+    accept_audience_pre_apply: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    linker_ui_layout: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    enable_audience_linkmic: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    function_type: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    linker_map_str: "dict[str, str]" = betterproto2.field(
+        7,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    ktv_lyric_mode: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    init_source: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    forbid_apply_from_other: "bool" = betterproto2.field(10, betterproto2.TYPE_BOOL)
+
+    ktv_exhibit_mode: "int" = betterproto2.field(11, betterproto2.TYPE_INT32)
+
+    enlarge_guest_turn_on_source: "int" = betterproto2.field(
+        12, betterproto2.TYPE_UINT64
+    )
+
+    playmode_detail: "dict[str, str]" = betterproto2.field(
+        13,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    client_ui_info: "str" = betterproto2.field(14, betterproto2.TYPE_STRING)
+
+    manual_open_ui: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    feature_list: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LinkerDetail", WebcastDataLinkerDetail
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkerUsers(betterproto2.Message):
+    count: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    users_info: "list[WebcastDataUser]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LinkerUsers", WebcastDataLinkerUsers
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMic(betterproto2.Message):
+    channel_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    channel_info: "WebcastDataLinkMicLinkMicChannelInfo | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    battle_scores: "list[WebcastDataLinkMicLinkMicBattleScore]" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    battle_settings: "WebcastDataLinkMicLinkMicBattleSetting | None" = (
+        betterproto2.field(4, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    rival_anchor_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    linkmic_anchor_count: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    rival_anchor_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LinkMic", WebcastDataLinkMic
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMicLinkMicBattleScore(betterproto2.Message):
+    user_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    score: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.LinkMic.LinkMicBattleScore",
+    WebcastDataLinkMicLinkMicBattleScore,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMicLinkMicBattleSetting(betterproto2.Message):
+    channel_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    duration: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    start_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    start_time_ms: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    theme: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    finished: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    battle_id: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    match_type: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    play_mode: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    team_mode: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    activity_mode: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.LinkMic.LinkMicBattleSetting",
+    WebcastDataLinkMicLinkMicBattleSetting,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLinkMicLinkMicChannelInfo(betterproto2.Message):
+    layout: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    vendor: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    dimension: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.LinkMic.LinkMicChannelInfo",
+    WebcastDataLinkMicLinkMicChannelInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLiveInfo(betterproto2.Message):
+    room_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    episode_stage: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    room_start_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    live_status: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    vid: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    replay_id_str: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    is_replay: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+    delivery: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    view_right: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    anchor_sign_tag_content: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    room_id_str: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    paid_live_bring_product_flag: "int" = betterproto2.field(
+        13, betterproto2.TYPE_INT32
+    )
+
+    living_sku_id: "str" = betterproto2.field(14, betterproto2.TYPE_STRING)
+
+    replay_auto_offline_time: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LiveInfo", WebcastDataLiveInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLiveMatrixInfo(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LiveMatrixInfo", WebcastDataLiveMatrixInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLiveStatusInfo(betterproto2.Message):
+    live_status: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    live_user: "WebcastDataUser | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    live_notify_light: "dict[int, WebcastDataImage]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    preview_text: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LiveStatusInfo", WebcastDataLiveStatusInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLocationInfo(betterproto2.Message):
+    gps_info: "WebcastDataAddressInfo | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ip_info: "WebcastDataAddressInfo | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    enable_permission: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    enable_location_mode: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LocationInfo", WebcastDataLocationInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataLowPcuGuideData(betterproto2.Message):
+    guide_text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    status: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    enable_backup: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    delay_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.LowPcuGuideData", WebcastDataLowPcuGuideData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMainCameraMatchInfo(betterproto2.Message):
+    match_data: "WebcastDataToutiaoMatchData | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    event_ids: "list[int]" = betterproto2.field(
+        3, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    content_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    league_info: "WebcastDataLeagueInfo | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_display_score_type: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    hide_tab_ids: "list[int]" = betterproto2.field(
+        7, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    match_id_str: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    content_id_str: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MainCameraMatchInfo", WebcastDataMainCameraMatchInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchChatConfig(betterproto2.Message):
+    main_group_icon_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    main_group_background_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    guest_group_icon_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    guest_group_background_url: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    aggregate_icon_url: "list[str]" = betterproto2.field(
+        5, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchChatConfig", WebcastDataMatchChatConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchDrawer(betterproto2.Message):
+    entry_name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    entry_icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    drawer_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    drawer_background: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    return_btn_text: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    display_mode: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchDrawer", WebcastDataMatchDrawer
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchInfo(betterproto2.Message):
+    skin: "WebcastDataMatchSkinInfo | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchInfo", WebcastDataMatchInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchRoomData(betterproto2.Message):
+    drawer: "WebcastDataMatchDrawer | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match: "WebcastDataToutiaoMatchData | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    drawer_label: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pcu_str: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    drawer_official_label: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match_background: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match_user_info: "WebcastDataMatchUserInfo | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchRoomData", WebcastDataMatchRoomData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchRoomImInfo(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchRoomImInfo", WebcastDataMatchRoomImInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchRoomInfo(betterproto2.Message):
+    match_tab_frame: "WebcastDataMatchTabFrame | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match_title: "WebcastDataMatchTitle | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match_data: "WebcastDataToutiaoMatchData | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match_host_channel: "dict[int, int]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_INT64
+        ),
+    )
+
+    match_hash_tag: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    background_image_url_list: "list[WebcastDataImage]" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    share_icon: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    im_info: "WebcastDataMatchRoomImInfo | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match_share_background: "WebcastDataMatchShareBackground | None" = (
+        betterproto2.field(9, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    theme_id: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    match_live_share_background: "WebcastDataMatchShareBackground | None" = (
+        betterproto2.field(11, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    match_id: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchRoomInfo", WebcastDataMatchRoomInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchShareBackground(betterproto2.Message):
+    vertical_img: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    horizontal_img: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchShareBackground", WebcastDataMatchShareBackground
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchSkinInfo(betterproto2.Message):
+    unfollow_skin: "WebcastDataMatchSkinInfoFollowBtnSkin | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    followed_skin: "WebcastDataMatchSkinInfoFollowBtnSkin | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tab_selected_color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    tab_unselected_color: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    comment_place_holder_color: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    anchor_name_color: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    anchor_info_color: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    user_banner_image: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tool_bar_image: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    comment_place_holder_bg_color: "str" = betterproto2.field(
+        10, betterproto2.TYPE_STRING
+    )
+
+    share_icon: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchSkinInfo", WebcastDataMatchSkinInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchSkinInfoFollowBtnSkin(betterproto2.Message):
+    left_color: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    right_color: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    font_color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.MatchSkinInfo.FollowBtnSkin",
+    WebcastDataMatchSkinInfoFollowBtnSkin,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTab(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    schema: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchTab", WebcastDataMatchTab
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTabFrame(betterproto2.Message):
+    tabs: "list[WebcastDataMatchTab]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    replay_tabs: "list[WebcastDataMatchTab]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    background_color: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchTabFrame", WebcastDataMatchTabFrame
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTitle(betterproto2.Message):
+    room_title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    title_icon: "WebcastDataMatchTitleTitleIcon | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchTitle", WebcastDataMatchTitle
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchTitleTitleIcon(betterproto2.Message):
+    url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    size_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchTitle.TitleIcon", WebcastDataMatchTitleTitleIcon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMatchUserInfo(betterproto2.Message):
+    user_team_info: "WebcastDataTeamInfo | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    user_quiz_info: "dict[int, int]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_INT64
+        ),
+    )
+
+    is_activity_account: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    need_retry: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MatchUserInfo", WebcastDataMatchUserInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMemberEntranceInfo(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    show_entrance: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    single_entrance_icon: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    double_entrance_icon: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_member: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    tracking_params: "dict[str, str]" = betterproto2.field(
+        50,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MemberEntranceInfo", WebcastDataMemberEntranceInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMetricTrackerData(betterproto2.Message):
+    event_name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    is_common_metric: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    current_room_tracker: "dict[str, str]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    use_once_tracker: "dict[str, str]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    all_room_tracker: "dict[str, str]" = betterproto2.field(
+        5,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MetricTrackerData", WebcastDataMetricTrackerData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMoreEntrance(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MoreEntrance", WebcastDataMoreEntrance
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMorePanelData(betterproto2.Message):
+    load_strategy: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MorePanelData", WebcastDataMorePanelData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiCameraBasicInfo(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon_background_color: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    panel_background_color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    icon_pad: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ban_xgs: "bool" = betterproto2.field(5, betterproto2.TYPE_BOOL)
+
+    support_vs_core: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    name: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    default_display_duration: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MultiCameraBasicInfo", WebcastDataMultiCameraBasicInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiTab(betterproto2.Message):
+    tab_title_color: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    tabs: "list[WebcastDataMultiTabTabItem]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    switch_on: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    disable_background: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    disable_project: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MultiTab", WebcastDataMultiTab
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiTabBubble(betterproto2.Message):
+    switch: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    bubble_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    delay: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    bubble_text: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MultiTab.Bubble", WebcastDataMultiTabBubble
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataMultiTabTabItem(betterproto2.Message):
+    tab_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    tab_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    jump_link: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    tab_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    tab_show_type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    hide_camera_ids: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    bubble: "WebcastDataMultiTabBubble | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    disable_preload: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    color: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    expire_time: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    scene: "list[int]" = betterproto2.field(11, betterproto2.TYPE_INT32, repeated=True)
+
+    h5_color: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.MultiTab.TabItem", WebcastDataMultiTabTabItem
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOfficialChannelExtraInfo(betterproto2.Message):
+    show_start_ts: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    showlist_schema: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    showlist_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    showlist_name: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.OfficialChannelExtraInfo",
+    WebcastDataOfficialChannelExtraInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOfficialChannelInfo(betterproto2.Message):
+    channel_user: "WebcastDataUser | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    channel_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    channel_intro: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    end_timestamp: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    forbidden_before_end: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    current_show_id: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    max_enter_time: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    max_next_time: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    delay_enter_time: "dict[int, int]" = betterproto2.field(
+        9,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_INT64
+        ),
+    )
+
+    host_permission: "bool" = betterproto2.field(10, betterproto2.TYPE_BOOL)
+
+    backup_room_id: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    living_user: "WebcastDataUser | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    host_can_accept_gift: "bool" = betterproto2.field(13, betterproto2.TYPE_BOOL)
+
+    host_uids: "list[int]" = betterproto2.field(
+        14, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    backup_room_id_str: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    enable_host: "bool" = betterproto2.field(16, betterproto2.TYPE_BOOL)
+
+    host_open_ids: "list[str]" = betterproto2.field(
+        5000, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OfficialChannelInfo", WebcastDataOfficialChannelInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOfficialRoomInfo(betterproto2.Message):
+    is_show_more_anchor: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    is_use_server_subtitle: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    server_subtitle: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OfficialRoomInfo", WebcastDataOfficialRoomInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenActivityData(betterproto2.Message):
+    cover_label: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OpenActivityData", WebcastDataOpenActivityData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenContentData(betterproto2.Message):
+    open_activity_data: "WebcastDataOpenActivityData | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OpenContentData", WebcastDataOpenContentData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenGame(betterproto2.Message):
+    stream_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    app_id: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    anchor_type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    interact_type: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OpenGame", WebcastDataOpenGame
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenHostInfo(betterproto2.Message):
+    nickname: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    gender: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    signature: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    avatar_thumb: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_medium: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_large: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    follow_info: "WebcastDataUserFollowInfo | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    schemas: "dict[str, str]" = betterproto2.field(
+        8,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    extra: "dict[str, str]" = betterproto2.field(
+        100,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OpenHostInfo", WebcastDataOpenHostInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOpenStreamUrlEncrypt(betterproto2.Message):
+    rtmp_pull_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    hls_pull_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    flv_pull_url: "dict[str, str]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    stream_data: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    hls: "list[WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo]" = (
+        betterproto2.field(5, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    flv: "list[WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo]" = (
+        betterproto2.field(6, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    hls_pull_url_map: "dict[str, str]" = betterproto2.field(
+        7,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    pull_datas: "dict[str, WebcastDataStreamUrlLiveCoreSdkDataPullData]" = (
+        betterproto2.field(
+            8,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OpenStreamUrlEncrypt", WebcastDataOpenStreamUrlEncrypt
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataOrderData(betterproto2.Message):
+    order_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.OrderData", WebcastDataOrderData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPackMetaInfo(betterproto2.Message):
+    scene: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    env: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    dc: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    trace_id: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    cluster: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    extras: "dict[str, str]" = betterproto2.field(
+        6,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PackMetaInfo", WebcastDataPackMetaInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveBaseInfo(betterproto2.Message):
+    paid_live_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    ticket_session_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    ticket_price: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    view_right: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    delivery: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    ticket_session_id_str: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaidLiveBaseInfo", WebcastDataPaidLiveBaseInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveConfig(betterproto2.Message):
+    spu_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    spu_id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sku_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    sku_id_str: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    sub_title: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    tags: "list[str]" = betterproto2.field(7, betterproto2.TYPE_STRING, repeated=True)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sell_status: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    status: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+    ios_pay_price_info: "list[WebcastDataPaidLiveConfigPriceInfo]" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    android_pay_price_info: "list[WebcastDataPaidLiveConfigPriceInfo]" = (
+        betterproto2.field(12, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    user_right: "WebcastDataPaidLiveConfigUserRight | None" = betterproto2.field(
+        13, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaidLiveConfig", WebcastDataPaidLiveConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveConfigPriceInfo(betterproto2.Message):
+    pay_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    price: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    right_duration: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PaidLiveConfig.PriceInfo",
+    WebcastDataPaidLiveConfigPriceInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveConfigUserRight(betterproto2.Message):
+    view_right: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    delivery: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    need_delivery_notice: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PaidLiveConfig.UserRight",
+    WebcastDataPaidLiveConfigUserRight,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveData(betterproto2.Message):
+    paid_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    view_right: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    ticket_session: "WebcastDataTicketData | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    order_data: "WebcastDataOrderData | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    delivery: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    need_delivery_notice: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    anchor_right: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    pay_ab_type: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    privilege_info: "dict[str, WebcastDataPrivilegeInfo]" = betterproto2.field(
+        10,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    privilege_info_map: "dict[str, WebcastDataPrivilegeInfo]" = betterproto2.field(
+        11,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    async_auth_data: "WebcastDataAsyncAuthData | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    products_data: "WebcastDataProductsData | None" = betterproto2.field(
+        13, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    max_preview_duration: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaidLiveData", WebcastDataPaidLiveData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveItemInfo(betterproto2.Message):
+    item_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    item_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    item_id_str: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaidLiveItemInfo", WebcastDataPaidLiveItemInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLivePriceInfo(betterproto2.Message):
+    start_time: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    end_time: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    price: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    claim_ddl: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    sku_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaidLivePriceInfo", WebcastDataPaidLivePriceInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveSubscribe(betterproto2.Message):
+    paid_live_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    subscribe_event_time: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaidLiveSubscribe", WebcastDataPaidLiveSubscribe
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaidLiveUiBaseConfig(betterproto2.Message):
+    paid_live_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    paid_live_icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    paid_live_icon_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    duration: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    no_right_end_title: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    no_right_end_sub_title: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    has_right_end_title: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    has_right_end_sub_title: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    paid_conversion_jump_url: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    panel_six_jump_url: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    feed_page_purchase_btn_word: "str" = betterproto2.field(
+        11, betterproto2.TYPE_STRING
+    )
+
+    purchase_btn_word: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    im_share_top_title: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    im_share_bottom_title: "str" = betterproto2.field(14, betterproto2.TYPE_STRING)
+
+    search_card_top_title: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    panel_feed_jump_url: "str" = betterproto2.field(16, betterproto2.TYPE_STRING)
+
+    panel_im_card_jump_url: "str" = betterproto2.field(17, betterproto2.TYPE_STRING)
+
+    panel_in_room_jump_url: "str" = betterproto2.field(18, betterproto2.TYPE_STRING)
+
+    panel_search_card_jump_url: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaidLiveUIBaseConfig", WebcastDataPaidLiveUiBaseConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataParentProductSimpleData(betterproto2.Message):
+    product_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sub_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    status: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    view_right: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    bind_sub_product_count: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    data: "WebcastDataPurchaseSimpleData | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sub_title_tag: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    current_show_num: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+    remain_sub_tickets_count: "int" = betterproto2.field(11, betterproto2.TYPE_INT32)
+
+    latest_finish_time: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ParentProductSimpleData", WebcastDataParentProductSimpleData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPatternRef(betterproto2.Message):
+    key: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    default_pattern: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PatternRef", WebcastDataPatternRef
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPayloadStartMicrogameStamp(betterproto2.Message):
+    mp_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    type: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    status: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    task_id: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    task_source: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    entrance_from: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    bid_type: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    bid_price: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    bid_ratio: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PayloadStartMicrogameStamp",
+    WebcastDataPayloadStartMicrogameStamp,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaymentArea(betterproto2.Message):
+    pay_button: "WebcastDataPaymentAreaPayButton | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    additional_button: "WebcastDataPaymentAreaAdditionalButton | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    pay_button_list: "WebcastDataPaymentAreaPayButton | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaymentArea", WebcastDataPaymentArea
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaymentAreaAdditionalButton(betterproto2.Message):
+    content: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    jump_schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    avilable: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    copy_writing: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PaymentArea.AdditionalButton",
+    WebcastDataPaymentAreaAdditionalButton,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPaymentAreaPayButton(betterproto2.Message):
+    content: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    jump_schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    avilable: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    copy_writing: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    click_type: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    is_new_ent_trade: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PaymentArea.PayButton", WebcastDataPaymentAreaPayButton
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPicoInfo(betterproto2.Message):
+    pico_live_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    pico_virtual_live_bg_image_uri: "str" = betterproto2.field(
+        2, betterproto2.TYPE_STRING
+    )
+
+    pico_create_scene: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    custom_info: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    pico_virtual_live_bg_image_digest: "str" = betterproto2.field(
+        5, betterproto2.TYPE_STRING
+    )
+
+    virtual_live_bg_images: "WebcastDataPicoInfoVirtualLiveBgImages | None" = (
+        betterproto2.field(6, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    pitch: "float" = betterproto2.field(7, betterproto2.TYPE_FLOAT)
+
+    client_live_type: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    pico_vr_transfer: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    pico_live_mode: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    stream_mapping: "dict[str, str]" = betterproto2.field(
+        13,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    multi_stream_info: "WebcastDataPicoInfoMultiStreamInfo | None" = betterproto2.field(
+        14, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PicoInfo", WebcastDataPicoInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPicoInfoMultiStreamInfo(betterproto2.Message):
+    multi_stream_scene: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    multi_stream_default_view_angle: "dict[str, int]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_INT64
+        ),
+    )
+
+    multi_stream_type: "dict[str, int]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_INT64
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PicoInfo.MultiStreamInfo",
+    WebcastDataPicoInfoMultiStreamInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPicoInfoVirtualLiveBgImages(betterproto2.Message):
+    original_image: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    original_digest: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    is_upright: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    converted_images: "list[WebcastDataImage]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    converted_list: "list[WebcastDataPicoInfoVirtualLiveBgImagesConvertedImage]" = (
+        betterproto2.field(5, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PicoInfo.VirtualLiveBgImages",
+    WebcastDataPicoInfoVirtualLiveBgImages,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPicoInfoVirtualLiveBgImagesConvertedImage(betterproto2.Message):
+    quality: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    digest: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PicoInfo.VirtualLiveBgImages.ConvertedImage",
+    WebcastDataPicoInfoVirtualLiveBgImagesConvertedImage,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPlayByPlayItemInfo(betterproto2.Message):
+    timestamp: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    player_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    ref_player_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    incident_type: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    elapsed: "float" = betterproto2.field(5, betterproto2.TYPE_DOUBLE)
+
+    elapsed_plus: "float" = betterproto2.field(6, betterproto2.TYPE_DOUBLE)
+
+    player_name: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    ref_player_name: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    player_id_str: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    ref_player_id_str: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    start_time_pts: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    end_time_pts: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    start_time_sei: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    end_time_sei: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PlayByPlayItemInfo", WebcastDataPlayByPlayItemInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPlayerInfo(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    shirt: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    position: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    lineup_type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    portrait: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    last_event: "WebcastDataPlayByPlayItemInfo | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    x_axis: "float" = betterproto2.field(8, betterproto2.TYPE_DOUBLE)
+
+    y_axis: "float" = betterproto2.field(9, betterproto2.TYPE_DOUBLE)
+
+    position_num: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+    playing_time: "float" = betterproto2.field(11, betterproto2.TYPE_DOUBLE)
+
+    player_stats: "WebcastDataPlayerStats | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    player_id_str: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    last_up_event: "WebcastDataPlayByPlayItemInfo | None" = betterproto2.field(
+        14, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    event_list: "list[WebcastDataPlayByPlayItemInfo]" = betterproto2.field(
+        15, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    age: "int" = betterproto2.field(16, betterproto2.TYPE_INT32)
+
+    worth: "float" = betterproto2.field(17, betterproto2.TYPE_DOUBLE)
+
+    club_name: "str" = betterproto2.field(18, betterproto2.TYPE_STRING)
+
+    superstar_flag: "bool" = betterproto2.field(19, betterproto2.TYPE_BOOL)
+
+    superstar_img: "WebcastDataImage | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    superstar_name: "str" = betterproto2.field(21, betterproto2.TYPE_STRING)
+
+    superstar_desc: "str" = betterproto2.field(22, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PlayerInfo", WebcastDataPlayerInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPlayerStats(betterproto2.Message):
+    player_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    team_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    minutes_played: "float" = betterproto2.field(3, betterproto2.TYPE_DOUBLE)
+
+    goals: "float" = betterproto2.field(4, betterproto2.TYPE_DOUBLE)
+
+    assists: "float" = betterproto2.field(5, betterproto2.TYPE_DOUBLE)
+
+    shots: "float" = betterproto2.field(6, betterproto2.TYPE_DOUBLE)
+
+    shots_on: "float" = betterproto2.field(7, betterproto2.TYPE_DOUBLE)
+
+    y_cards: "float" = betterproto2.field(8, betterproto2.TYPE_DOUBLE)
+
+    r_cards: "float" = betterproto2.field(9, betterproto2.TYPE_DOUBLE)
+
+    offsides: "float" = betterproto2.field(10, betterproto2.TYPE_DOUBLE)
+
+    fouls_committed: "float" = betterproto2.field(11, betterproto2.TYPE_DOUBLE)
+
+    own_goals: "float" = betterproto2.field(12, betterproto2.TYPE_DOUBLE)
+
+    saves: "float" = betterproto2.field(13, betterproto2.TYPE_DOUBLE)
+
+    caught_ball: "float" = betterproto2.field(14, betterproto2.TYPE_DOUBLE)
+
+    clean_sheets: "float" = betterproto2.field(15, betterproto2.TYPE_DOUBLE)
+
+    pass_: "float" = betterproto2.field(16, betterproto2.TYPE_DOUBLE)
+
+    key_pass: "float" = betterproto2.field(17, betterproto2.TYPE_DOUBLE)
+
+    passes_completed: "float" = betterproto2.field(18, betterproto2.TYPE_DOUBLE)
+
+    steal: "float" = betterproto2.field(19, betterproto2.TYPE_DOUBLE)
+
+    intercept: "float" = betterproto2.field(20, betterproto2.TYPE_DOUBLE)
+
+    clearances: "float" = betterproto2.field(21, betterproto2.TYPE_DOUBLE)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PlayerStats", WebcastDataPlayerStats
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeData(betterproto2.Message):
+    style: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    preview_guide: "WebcastDataPreviewExposeDataPreviewGuide | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    metas: "list[WebcastDataPreviewExposeDataMeta]" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    chat_msgs: "list[WebcastDataPreviewExposeDataChatMessage]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    force_insertion: "list[WebcastDataPreviewExposeDataMeta]" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    scroll_after_ms: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    need_realtime: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    message_scroll_after_ms: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    message_scroll_interval_ms: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    preview_intro: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    preview_extend_area: "WebcastDataPreviewExposeDataPreviewExtendArea | None" = (
+        betterproto2.field(11, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    show_uv_pv: "int" = betterproto2.field(12, betterproto2.TYPE_INT32)
+
+    show_name_abbreviation: "int" = betterproto2.field(13, betterproto2.TYPE_INT32)
+
+    switch: "WebcastDataPreviewExposeDataPreviewSwitch | None" = betterproto2.field(
+        14, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_preview_use_websocket: "int" = betterproto2.field(15, betterproto2.TYPE_INT32)
+
+    is_aweme_video_feed: "bool" = betterproto2.field(16, betterproto2.TYPE_BOOL)
+
+    show_preview_cards: "bool" = betterproto2.field(17, betterproto2.TYPE_BOOL)
+
+    preview_promotion: "WebcastDataPreviewExposeDataPreviewPromotion | None" = (
+        betterproto2.field(18, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    preview_im_extend: "WebcastDataPreviewExposeDataPreviewImExtend | None" = (
+        betterproto2.field(19, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    et_data: "WebcastDataPreviewExposeDataEtData | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    alive_checker: "int" = betterproto2.field(21, betterproto2.TYPE_INT32)
+
+    enter_public_area_animation: "WebcastDataEnterPublicAreaAnimation | None" = (
+        betterproto2.field(22, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    preview_promotion_sync_data: "WebcastDataPreviewExposeDataPreviewPromotionSyncData | None" = betterproto2.field(
+        23, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    growth_task: "WebcastDataPreviewExposeDataGrowthTask | None" = betterproto2.field(
+        24, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_exit_guide: "WebcastDataPreviewExposeDataPreviewExitGuide | None" = (
+        betterproto2.field(25, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    preview_exit_guide_list: "list[WebcastDataPreviewExposeDataPreviewExitGuide]" = (
+        betterproto2.field(26, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    client_component: "WebcastDataClientComponent | None" = betterproto2.field(
+        27, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ios_client_component: "WebcastDataIosClientComponent | None" = betterproto2.field(
+        28, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    chat_group_extend_data: "list[WebcastDataChatGroupExtendData]" = betterproto2.field(
+        29, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    feed_live_idea_guide: "WebcastDataPreviewExposeDataFeedLiveIdeaGuide | None" = (
+        betterproto2.field(30, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    revenue_data: "WebcastDataPreviewExposeDataRevenueData | None" = betterproto2.field(
+        31, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    portrait_data: "WebcastDataPreviewExposeDataPortraitData | None" = (
+        betterproto2.field(32, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    feed_promote_live_anchor_point: "WebcastDataPreviewExposeDataFeedPromoteLiveAnchorPoint | None" = betterproto2.field(
+        33, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_button: "WebcastDataPreviewExposeDataPreviewButtonData | None" = (
+        betterproto2.field(34, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    show_similar_feed_button: "bool" = betterproto2.field(35, betterproto2.TYPE_BOOL)
+
+    preview_high_light: "WebcastDataPreviewExposeDataPreviewHighLight | None" = (
+        betterproto2.field(36, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PreviewExposeData", WebcastDataPreviewExposeData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataChatMessage(betterproto2.Message):
+    nick_name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    nick_name_color: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    content: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.ChatMessage",
+    WebcastDataPreviewExposeDataChatMessage,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataEtData(betterproto2.Message):
+    type_enter_room: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    type_mob_params: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    type_params: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    type_first_room_params: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    type_first_room_mob_params: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    type_first_show_room_params: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    type_first_show_mob_params: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.EtData",
+    WebcastDataPreviewExposeDataEtData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataFeedLiveIdeaGuide(betterproto2.Message):
+    is_recall: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    latest_live_record: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    show_time_interval: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    disappear_time_interval: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.FeedLiveIdeaGuide",
+    WebcastDataPreviewExposeDataFeedLiveIdeaGuide,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataFeedPromoteLiveAnchorPoint(betterproto2.Message):
+    recall_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    latest_live_record: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    show_time_interval: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    disappear_time_interval: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.FeedPromoteLiveAnchorPoint",
+    WebcastDataPreviewExposeDataFeedPromoteLiveAnchorPoint,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataGrowthTask(betterproto2.Message):
+    task_key: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    main_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sub_text: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    extra: "dict[str, str]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.GrowthTask",
+    WebcastDataPreviewExposeDataGrowthTask,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataMeta(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    host: "WebcastDataPreviewExposeDataMetaHost | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PreviewExposeData.Meta", WebcastDataPreviewExposeDataMeta
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataMetaHost(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tip: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.Meta.Host",
+    WebcastDataPreviewExposeDataMetaHost,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPortraitData(betterproto2.Message):
+    pk_paid: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    exhibition_paid: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PortraitData",
+    WebcastDataPreviewExposeDataPortraitData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewButtonData(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    lottery_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    box_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    button_priority: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    enter_schema: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    extra: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewButtonData",
+    WebcastDataPreviewExposeDataPreviewButtonData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExitGuide(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    main_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sub_text: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    schema_url: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    button_text: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    latest_live_record: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    user_list: "list[WebcastDataUser]" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    tag: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    less_freq: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewExitGuide",
+    WebcastDataPreviewExposeDataPreviewExitGuide,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExtendArea(betterproto2.Message):
+    extend_icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    extend_pre_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    extend_text: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    extend_type: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    extra: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    use_marquee: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    icon_type: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    right_part: "list[WebcastDataPreviewExposeDataPreviewExtendAreaPart]" = (
+        betterproto2.field(8, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    button_part: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    mid_part: "list[WebcastDataPreviewExposeDataPreviewExtendAreaPart]" = (
+        betterproto2.field(10, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    need_delimiter: "bool" = betterproto2.field(11, betterproto2.TYPE_BOOL)
+
+    bottom_part: "list[WebcastDataPreviewExposeDataPreviewExtendAreaPart]" = (
+        betterproto2.field(12, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    ui_type: "int" = betterproto2.field(13, betterproto2.TYPE_INT32)
+
+    version: "int" = betterproto2.field(14, betterproto2.TYPE_INT32)
+
+    action_cfg: "WebcastDataPreviewExposeDataPreviewExtendAreaActionConfig | None" = (
+        betterproto2.field(17, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    use_pass_through_extra_json: "bool" = betterproto2.field(18, betterproto2.TYPE_BOOL)
+
+    pass_through_extra_json: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    extra_enter_room: "dict[str, str]" = betterproto2.field(
+        20,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    extra_business: "str" = betterproto2.field(21, betterproto2.TYPE_STRING)
+
+    no_need_poll: "bool" = betterproto2.field(22, betterproto2.TYPE_BOOL)
+
+    et_extra: "dict[str, str]" = betterproto2.field(
+        23,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    clickable_area: "int" = betterproto2.field(24, betterproto2.TYPE_INT32)
+
+    use_title_fusion: "bool" = betterproto2.field(25, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewExtendArea",
+    WebcastDataPreviewExposeDataPreviewExtendArea,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExtendAreaActionConfig(betterproto2.Message):
+    area_action: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    action_prams: "dict[str, str]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewExtendArea.ActionConfig",
+    WebcastDataPreviewExposeDataPreviewExtendAreaActionConfig,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewExtendAreaPart(betterproto2.Message):
+    font_size: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    interval: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    text: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    cuttable: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    deleted: "bool" = betterproto2.field(5, betterproto2.TYPE_BOOL)
+
+    font_color: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    bold: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    part_type: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background_color: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    left_image: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewExtendArea.Part",
+    WebcastDataPreviewExposeDataPreviewExtendAreaPart,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewGuide(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tip: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    roll_tips: "list[str]" = betterproto2.field(
+        4, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    coupon_mate_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    user_tag_get_coin: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    live_mession_style: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    et_type: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    extra: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    et_extra: "dict[str, str]" = betterproto2.field(
+        10,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    enter_tip: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    enter_roll_tips: "list[str]" = betterproto2.field(
+        12, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewGuide",
+    WebcastDataPreviewExposeDataPreviewGuide,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewHighLight(betterproto2.Message):
+    enable: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    video_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    show_duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    guide_text: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    guide_icon: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    video_id: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    highlight_id: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    highlight_id_str: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    highlight_type: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    m3u8_url: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    reason: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewHighLight",
+    WebcastDataPreviewExposeDataPreviewHighLight,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewImExtend(betterproto2.Message):
+    im_extend_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    main_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    sub_title: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    extra: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewIMExtend",
+    WebcastDataPreviewExposeDataPreviewImExtend,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotion(betterproto2.Message):
+    avatar_icons: "list[WebcastDataImage]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    fast_comments: "list[str]" = betterproto2.field(
+        3, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    fast_comments_emoji: "list[WebcastDataEmojiDetail]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewPromotion",
+    WebcastDataPreviewExposeDataPreviewPromotion,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotionSyncData(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    lucky_bag: "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyBag | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    type: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    lucky_money: "WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyMoney | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewPromotionSyncData",
+    WebcastDataPreviewExposeDataPreviewPromotionSyncData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyBag(
+    betterproto2.Message
+):
+    lottery_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    start_at: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    draw_at: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewPromotionSyncData.LuckyBag",
+    WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyBag,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyMoney(
+    betterproto2.Message
+):
+    box_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    start_at: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    delay_seconds: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    display_end_at: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    status: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    text: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewPromotionSyncData.LuckyMoney",
+    WebcastDataPreviewExposeDataPreviewPromotionSyncDataLuckyMoney,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataPreviewSwitch(betterproto2.Message):
+    title: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    preview_guide: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    dynamic_label: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    assist_label: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    extend_area: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.PreviewSwitch",
+    WebcastDataPreviewExposeDataPreviewSwitch,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewExposeDataRevenueData(betterproto2.Message):
+    exhibition_paid_tip_text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PreviewExposeData.RevenueData",
+    WebcastDataPreviewExposeDataRevenueData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPreviewLabel(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    label_tips: "list[str]" = betterproto2.field(
+        2, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    label_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    label_image: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    hit_test: "bool" = betterproto2.field(5, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PreviewLabel", WebcastDataPreviewLabel
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeBaseInfo(betterproto2.Message):
+    paid_live_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    view_right: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    delivery: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PrivilegeBaseInfo", WebcastDataPrivilegeBaseInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeInfo(betterproto2.Message):
+    entity_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    item_list: "list[WebcastDataPaidLiveItemInfo]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    paid_live_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    paid_live_info: "WebcastDataPrivilegeBaseInfo | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    extra: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    privilege_url: "WebcastDataPrivilegeUrl | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ui_config: "WebcastDataPaidLiveUiBaseConfig | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    entity_config: "WebcastDataPaidLiveConfig | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    entity_id_str: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PrivilegeInfo", WebcastDataPrivilegeInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeTicket(betterproto2.Message):
+    sku_id: "list[str]" = betterproto2.field(1, betterproto2.TYPE_STRING, repeated=True)
+
+    privilege_conf: "list[WebcastDataPrivilegeTicketPrivilegeConfigure]" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    privilege_has_paid: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PrivilegeTicket", WebcastDataPrivilegeTicket
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeTicketPrivilegeConfigure(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    entity_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    privilege_tab_key: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    privilege_type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PrivilegeTicket.PrivilegeConfigure",
+    WebcastDataPrivilegeTicketPrivilegeConfigure,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPrivilegeUrl(betterproto2.Message):
+    privilege_panel_schema: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    privilege_card_schema: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    prepay_cashier_jump_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PrivilegeUrl", WebcastDataPrivilegeUrl
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProduct(betterproto2.Message):
+    basic_info: "WebcastDataProductBasicInfo | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    price_info: "WebcastDataProductPriceStruct | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    live_info: "WebcastDataLiveInfo | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    item_info: "WebcastDataItemInfo | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content_info: "WebcastDataContentInfo | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    payment_arrea: "WebcastDataPaymentArea | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    price_rich_info: "WebcastDataProductPriceRichText | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    product_comments: "WebcastDataProductComments | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    share_ticket: "WebcastDataShareTicket | None" = betterproto2.field(
+        29, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    privilege: "WebcastDataPrivilegeTicket | None" = betterproto2.field(
+        30, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    combined: "WebcastDataCombined | None" = betterproto2.field(
+        31, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    comments: "WebcastDataComments | None" = betterproto2.field(
+        32, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    rating: "WebcastDataRating | None" = betterproto2.field(
+        33, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    user: "WebcastDataUser | None" = betterproto2.field(
+        35, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    authors: "list[WebcastDataAuthor]" = betterproto2.field(
+        36, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    banner: "WebcastDataProductBanner | None" = betterproto2.field(
+        37, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sku_list: "list[WebcastDataSku]" = betterproto2.field(
+        17, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    subscribe_member: "WebcastDataSubscribeMember | None" = betterproto2.field(
+        18, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    filter_node: "WebcastDataFilterReason | None" = betterproto2.field(
+        999, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Product", WebcastDataProduct
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductBanner(betterproto2.Message):
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    schema: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductBanner", WebcastDataProductBanner
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductBasicInfo(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    owner_user_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    status: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    biz: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    category: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    category_content: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    source: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    cover_uri: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    review_status: "int" = betterproto2.field(12, betterproto2.TYPE_INT32)
+
+    performance_status: "int" = betterproto2.field(13, betterproto2.TYPE_INT32)
+
+    disable_reason: "int" = betterproto2.field(14, betterproto2.TYPE_INT32)
+
+    sale_start_time: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    sale_end_time: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    refund_deadline: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    introduction_text: "str" = betterproto2.field(18, betterproto2.TYPE_STRING)
+
+    introduction: "list[WebcastDataIntroduction]" = betterproto2.field(
+        19, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    header_media: "list[WebcastDataHeaderMedia]" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    tags: "WebcastDataProductTag | None" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content_title: "str" = betterproto2.field(22, betterproto2.TYPE_STRING)
+
+    content_category: "str" = betterproto2.field(23, betterproto2.TYPE_STRING)
+
+    content_extent_info: "str" = betterproto2.field(24, betterproto2.TYPE_STRING)
+
+    sale_status: "int" = betterproto2.field(26, betterproto2.TYPE_INT32)
+
+    service_period: "int" = betterproto2.field(27, betterproto2.TYPE_UINT64)
+
+    geo_ban: "bool" = betterproto2.field(28, betterproto2.TYPE_BOOL)
+
+    combined_view_right: "int" = betterproto2.field(29, betterproto2.TYPE_INT32)
+
+    jump_schema: "str" = betterproto2.field(30, betterproto2.TYPE_STRING)
+
+    detail_schema: "str" = betterproto2.field(31, betterproto2.TYPE_STRING)
+
+    new_product: "int" = betterproto2.field(32, betterproto2.TYPE_INT32)
+
+    content_extent_info_color: "str" = betterproto2.field(33, betterproto2.TYPE_STRING)
+
+    create_time: "int" = betterproto2.field(34, betterproto2.TYPE_UINT64)
+
+    show_start_time: "int" = betterproto2.field(35, betterproto2.TYPE_UINT64)
+
+    content_tips: "list[WebcastDataContentTip]" = betterproto2.field(
+        36, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    prepay_cashier_jump_url: "str" = betterproto2.field(37, betterproto2.TYPE_STRING)
+
+    selling_points: "list[WebcastDataProductSellingPoint]" = betterproto2.field(
+        38, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    sale_info: "WebcastDataProductSaleInfo | None" = betterproto2.field(
+        39, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    recent_purchased_user: "list[WebcastDataRecentPurchasedUser]" = betterproto2.field(
+        40, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    update_time: "int" = betterproto2.field(41, betterproto2.TYPE_UINT64)
+
+    owner_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductBasicInfo", WebcastDataProductBasicInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductComment(betterproto2.Message):
+    comment_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    rate: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    create_time: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    digg_count: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    user_digged: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    status: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    anonymous: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    user: "WebcastDataProductCommentUser | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_author_digged: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+    location: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductComment", WebcastDataProductComment
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductComments(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    total_count: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    jump_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    jump_schema: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    comments: "list[WebcastDataProductComment]" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductComments", WebcastDataProductComments
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductCommentUser(betterproto2.Message):
+    uid: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    nick_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    avatar: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductCommentUser", WebcastDataProductCommentUser
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductPriceRichText(betterproto2.Message):
+    rich_texts: "list[WebcastDataProductRichText]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    extra: "dict[str, str]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductPriceRichText", WebcastDataProductPriceRichText
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductPriceStruct(betterproto2.Message):
+    amount: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    currency: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    pos: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    pay_type: "list[int]" = betterproto2.field(
+        4, betterproto2.TYPE_INT32, repeated=True
+    )
+
+    full_price: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    countdown_timestamp: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    start: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductPriceStruct", WebcastDataProductPriceStruct
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichText(betterproto2.Message):
+    rich_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    text: "WebcastDataProductRichTextText | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image: "WebcastDataProductRichTextImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    count_down: "WebcastDataProductRichTextCountDown | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductRichText", WebcastDataProductRichText
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichTextCountDown(betterproto2.Message):
+    countdown: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    font_size: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    place_holder: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.ProductRichText.CountDown",
+    WebcastDataProductRichTextCountDown,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichTextImage(betterproto2.Message):
+    img: "WebcastDataProductRichTextImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    width: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    height: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductRichText.Image", WebcastDataProductRichTextImage
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductRichTextText(betterproto2.Message):
+    text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    font_size: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    background_color: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    font_weight: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    font_style: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    text_decoration: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    font_family: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    line_height: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductRichText.Text", WebcastDataProductRichTextText
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductSaleInfo(betterproto2.Message):
+    sale_cnt: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    helping_sale_cnt: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    written_off_amount: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductSaleInfo", WebcastDataProductSaleInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductsData(betterproto2.Message):
+    tool_bar: "WebcastDataProductsDataToolBar | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    explain_card: "WebcastDataProductsDataExplainCard | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    product_list_tool_bar: "WebcastDataProductsDataToolBar | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    bring_product_switch_status: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    paid_live_bringing_product_flag: "int" = betterproto2.field(
+        5, betterproto2.TYPE_INT32
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductsData", WebcastDataProductsData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductsDataExplainCard(betterproto2.Message):
+    status: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    card_jump_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    last_duration: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    product: "WebcastDataProduct | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.ProductsData.ExplainCard",
+    WebcastDataProductsDataExplainCard,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductsDataToolBar(betterproto2.Message):
+    panel_jump_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    six_jump_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    nine_jump_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductsData.ToolBar", WebcastDataProductsDataToolBar
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductSellingPoint(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    content: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    original_value: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductSellingPoint", WebcastDataProductSellingPoint
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProductTag(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProductTag", WebcastDataProductTag
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProfilePicSpliceLabel(betterproto2.Message):
+    profile_list: "WebcastDataLabelProfileItem | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProfilePicSpliceLabel", WebcastDataProfilePicSpliceLabel
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataProfileViewData(betterproto2.Message):
+    title: "WebcastDataText | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sub_title: "WebcastDataText | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    show_duration: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    source: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ProfileViewData", WebcastDataProfileViewData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPublicScreenBottomInfo(betterproto2.Message):
+    bottom_cards: "WebcastDataPublicScreenBottomInfoBottomCard | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PublicScreenBottomInfo", WebcastDataPublicScreenBottomInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPublicScreenBottomInfoBottomCard(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    priority: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    biz_params: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.PublicScreenBottomInfo.BottomCard",
+    WebcastDataPublicScreenBottomInfoBottomCard,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPublicScreenSpeedConf(betterproto2.Message):
+    update_interval: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    scroll_size: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    fold_size: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    scroll_speed: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PublicScreenSpeedConf", WebcastDataPublicScreenSpeedConf
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataPurchaseSimpleData(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    tags: "list[WebcastDataProductTag]" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    start_sell_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    closing_sell_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    sell_status: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    purchase_status: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    price_info: "WebcastDataProductPriceStruct | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.PurchaseSimpleData", WebcastDataPurchaseSimpleData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataQuizExtra(betterproto2.Message):
+    quiz_infos: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.QuizExtra", WebcastDataQuizExtra
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRating(betterproto2.Message):
+    pass
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Rating", WebcastDataRating
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRecentPurchasedUser(betterproto2.Message):
+    uid: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    avatar_uri: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    avatar: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    episodes: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RecentPurchasedUser", WebcastDataRecentPurchasedUser
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRedpack(betterproto2.Message):
+    redpack_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    redpack_activity_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    redpack_activity_display_text: "str" = betterproto2.field(
+        3, betterproto2.TYPE_STRING
+    )
+
+    start_apply_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    end_apply_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    preheat_time: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    server_time: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    has_applied: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    icon_url: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Redpack", WebcastDataRedpack
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRedsShowInfo(betterproto2.Message):
+    data_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    full_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RedsShowInfo", WebcastDataRedsShowInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRegionMatch(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    allow_list: "list[str]" = betterproto2.field(
+        2, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    deny_list: "list[str]" = betterproto2.field(
+        3, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RegionMatch", WebcastDataRegionMatch
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRegionRestriction(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    white_list: "list[str]" = betterproto2.field(
+        2, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    black_list: "list[str]" = betterproto2.field(
+        3, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RegionRestriction", WebcastDataRegionRestriction
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendation(betterproto2.Message):
+    relevant_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    bottom_bar_category: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    bar_text_prefix: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    bar_text_postfix: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    high_light_info: "WebcastDataRelevantRecommendationHighLightInfo | None" = (
+        betterproto2.field(6, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    ecom_info: "WebcastDataRelevantRecommendationEcomInfo | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vs_info: "WebcastDataRelevantRecommendationVsInfo | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    white_category_info: "WebcastDataRelevantRecommendationWhiteCategoryInfo | None" = (
+        betterproto2.field(9, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RelevantRecommendation", WebcastDataRelevantRecommendation
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationEcomInfo(betterproto2.Message):
+    product_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    product_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RelevantRecommendation.EcomInfo",
+    WebcastDataRelevantRecommendationEcomInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationEpisode(betterproto2.Message):
+    episode_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    episode_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    episode_cover: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    current_period: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    season_id: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    item_id: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RelevantRecommendation.Episode",
+    WebcastDataRelevantRecommendationEpisode,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationHighLightInfo(betterproto2.Message):
+    main_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    bak_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RelevantRecommendation.HighLightInfo",
+    WebcastDataRelevantRecommendationHighLightInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationVsInfo(betterproto2.Message):
+    episodes: "list[WebcastDataRelevantRecommendationEpisode]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RelevantRecommendation.VsInfo",
+    WebcastDataRelevantRecommendationVsInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRelevantRecommendationWhiteCategoryInfo(betterproto2.Message):
+    first_level_tag_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RelevantRecommendation.WhiteCategoryInfo",
+    WebcastDataRelevantRecommendationWhiteCategoryInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataReservation(betterproto2.Message):
+    appointment_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    anchor_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    room_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    start_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    btn_rect: "list[int]" = betterproto2.field(
+        6, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    btn_color: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    is_reserved: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.Reservation", WebcastDataReservation
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataResourceConfigure(betterproto2.Message):
+    resource_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    barrage_conf: "WebcastDataBarrageConfigure | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    screen_bar_conf: "WebcastDataScreenBarConfigure | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ResourceConfigure", WebcastDataResourceConfigure
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoom(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    status: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    owner_user_id: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    user_count: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    create_time: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    linkmic_layout: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    finish_time: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    extra: "WebcastDataRoomExtra | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dynamic_cover_uri: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    dynamic_cover_dict: "dict[int, str]" = betterproto2.field(
+        12,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_STRING
+        ),
+    )
+
+    last_ping_time: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    live_id: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    stream_provider: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    os_type: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    client_version: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    with_linkmic: "bool" = betterproto2.field(18, betterproto2.TYPE_BOOL)
+
+    enable_room_perspective: "bool" = betterproto2.field(19, betterproto2.TYPE_BOOL)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dynamic_cover: "WebcastDataImage | None" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dynamic_cover_low: "WebcastDataImage | None" = betterproto2.field(
+        22, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    share_url: "str" = betterproto2.field(23, betterproto2.TYPE_STRING)
+
+    anchor_share_text: "str" = betterproto2.field(24, betterproto2.TYPE_STRING)
+
+    user_share_text: "str" = betterproto2.field(25, betterproto2.TYPE_STRING)
+
+    stream_id: "int" = betterproto2.field(26, betterproto2.TYPE_UINT64)
+
+    stream_id_str: "str" = betterproto2.field(27, betterproto2.TYPE_STRING)
+
+    stream_url: "WebcastDataStreamUrl | None" = betterproto2.field(
+        28, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    mosaic_status: "int" = betterproto2.field(29, betterproto2.TYPE_UINT64)
+
+    mosaic_tip: "str" = betterproto2.field(30, betterproto2.TYPE_STRING)
+
+    cell_style: "int" = betterproto2.field(31, betterproto2.TYPE_UINT64)
+
+    link_mic: "WebcastDataLinkMic | None" = betterproto2.field(
+        32, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    luckymoney_num: "int" = betterproto2.field(33, betterproto2.TYPE_UINT64)
+
+    deco_list: "list[WebcastDataDecoration]" = betterproto2.field(
+        34, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    top_fans: "list[WebcastDataTopFan]" = betterproto2.field(
+        35, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    stats: "WebcastDataRoomStats | None" = betterproto2.field(
+        36, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sun_daily_icon_content: "str" = betterproto2.field(37, betterproto2.TYPE_STRING)
+
+    distance: "str" = betterproto2.field(38, betterproto2.TYPE_STRING)
+
+    distance_city: "str" = betterproto2.field(39, betterproto2.TYPE_STRING)
+
+    location: "str" = betterproto2.field(40, betterproto2.TYPE_STRING)
+
+    real_distance: "str" = betterproto2.field(41, betterproto2.TYPE_STRING)
+
+    feed_room_label: "WebcastDataImage | None" = betterproto2.field(
+        42, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    common_label_list: "str" = betterproto2.field(43, betterproto2.TYPE_STRING)
+
+    living_room_attrs: "WebcastDataRoomUserAttr | None" = betterproto2.field(
+        44, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    admin_user_ids: "list[int]" = betterproto2.field(
+        45, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    owner: "WebcastDataUser | None" = betterproto2.field(
+        46, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    private_info: "str" = betterproto2.field(47, betterproto2.TYPE_STRING)
+
+    has_commerce_goods: "bool" = betterproto2.field(48, betterproto2.TYPE_BOOL)
+
+    live_type_normal: "bool" = betterproto2.field(49, betterproto2.TYPE_BOOL)
+
+    live_type_linkmic: "bool" = betterproto2.field(50, betterproto2.TYPE_BOOL)
+
+    live_type_audio: "bool" = betterproto2.field(51, betterproto2.TYPE_BOOL)
+
+    live_type_third_party: "bool" = betterproto2.field(52, betterproto2.TYPE_BOOL)
+
+    live_type_screenshot: "bool" = betterproto2.field(53, betterproto2.TYPE_BOOL)
+
+    live_type_sandbox: "bool" = betterproto2.field(54, betterproto2.TYPE_BOOL)
+
+    live_type_official: "bool" = betterproto2.field(55, betterproto2.TYPE_BOOL)
+
+    group_id: "int" = betterproto2.field(59, betterproto2.TYPE_UINT64)
+
+    orientation: "int" = betterproto2.field(60, betterproto2.TYPE_UINT64)
+
+    category: "int" = betterproto2.field(61, betterproto2.TYPE_UINT64)
+
+    tags: "list[int]" = betterproto2.field(62, betterproto2.TYPE_UINT64, repeated=True)
+
+    start_time: "int" = betterproto2.field(63, betterproto2.TYPE_UINT64)
+
+    popularity: "int" = betterproto2.field(64, betterproto2.TYPE_UINT64)
+
+    popularity_str: "str" = betterproto2.field(65, betterproto2.TYPE_STRING)
+
+    fcdn_appid: "int" = betterproto2.field(66, betterproto2.TYPE_UINT64)
+
+    sell_goods: "bool" = betterproto2.field(68, betterproto2.TYPE_BOOL)
+
+    web_count: "int" = betterproto2.field(69, betterproto2.TYPE_UINT64)
+
+    vertical_cover_uri: "str" = betterproto2.field(70, betterproto2.TYPE_STRING)
+
+    base_category: "int" = betterproto2.field(71, betterproto2.TYPE_UINT64)
+
+    room_auth: "WebcastDataRoomAuthStatus | None" = betterproto2.field(
+        72, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room_tabs: "list[WebcastDataRoomTab]" = betterproto2.field(
+        73, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    introduction: "str" = betterproto2.field(74, betterproto2.TYPE_STRING)
+
+    burst: "WebcastDataBurstInfo | None" = betterproto2.field(
+        75, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    health_score: "WebcastDataRoomHealthScoreInfo | None" = betterproto2.field(
+        76, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_replay: "bool" = betterproto2.field(77, betterproto2.TYPE_BOOL)
+
+    vid: "str" = betterproto2.field(78, betterproto2.TYPE_STRING)
+
+    group_source: "int" = betterproto2.field(79, betterproto2.TYPE_UINT64)
+
+    lottery_finish_time: "int" = betterproto2.field(80, betterproto2.TYPE_UINT64)
+
+    activity_tag: "WebcastDataRoomActivityTag | None" = betterproto2.field(
+        81, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    portrait_cover: "WebcastDataImage | None" = betterproto2.field(
+        82, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background: "WebcastDataImage | None" = betterproto2.field(
+        83, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    layout: "int" = betterproto2.field(84, betterproto2.TYPE_UINT64)
+
+    wait_copy: "str" = betterproto2.field(85, betterproto2.TYPE_STRING)
+
+    guide_button: "WebcastDataImage | None" = betterproto2.field(
+        86, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_copy: "str" = betterproto2.field(87, betterproto2.TYPE_STRING)
+
+    is_show_inquiry_ball: "bool" = betterproto2.field(88, betterproto2.TYPE_BOOL)
+
+    match_info: "WebcastDataMatchInfo | None" = betterproto2.field(
+        89, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    use_filter: "bool" = betterproto2.field(90, betterproto2.TYPE_BOOL)
+
+    gift_msg_style: "int" = betterproto2.field(91, betterproto2.TYPE_UINT64)
+
+    distance_km: "str" = betterproto2.field(92, betterproto2.TYPE_STRING)
+
+    finish_url: "str" = betterproto2.field(93, betterproto2.TYPE_STRING)
+
+    official_room_info: "WebcastDataOfficialRoomInfo | None" = betterproto2.field(
+        94, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_show_user_card_switch: "bool" = betterproto2.field(95, betterproto2.TYPE_BOOL)
+
+    video_feed_tag: "str" = betterproto2.field(96, betterproto2.TYPE_STRING)
+
+    forum_extra_data: "str" = betterproto2.field(97, betterproto2.TYPE_STRING)
+
+    fansclub_msg_style: "int" = betterproto2.field(98, betterproto2.TYPE_UINT64)
+
+    follow_msg_style: "int" = betterproto2.field(99, betterproto2.TYPE_UINT64)
+
+    share_msg_style: "int" = betterproto2.field(100, betterproto2.TYPE_UINT64)
+
+    room_layout: "int" = betterproto2.field(101, betterproto2.TYPE_UINT64)
+
+    short_title: "str" = betterproto2.field(102, betterproto2.TYPE_STRING)
+
+    short_touch_area_config: "WebcastDataRoomShortTouchAreaConfig | None" = (
+        betterproto2.field(103, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    book_time: "int" = betterproto2.field(104, betterproto2.TYPE_UINT64)
+
+    book_end_time: "int" = betterproto2.field(105, betterproto2.TYPE_UINT64)
+
+    room_audit_status: "int" = betterproto2.field(106, betterproto2.TYPE_UINT64)
+
+    live_distribution: "list[int]" = betterproto2.field(
+        107, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    tv: "WebcastDataTvStation | None" = betterproto2.field(
+        108, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    replay: "bool" = betterproto2.field(109, betterproto2.TYPE_BOOL)
+
+    challenge_info: "str" = betterproto2.field(110, betterproto2.TYPE_STRING)
+
+    like_count: "int" = betterproto2.field(111, betterproto2.TYPE_UINT64)
+
+    search_id: "int" = betterproto2.field(112, betterproto2.TYPE_UINT64)
+
+    anchor_scheduled_time_text: "str" = betterproto2.field(
+        113, betterproto2.TYPE_STRING
+    )
+
+    hot_sentence_info: "str" = betterproto2.field(114, betterproto2.TYPE_STRING)
+
+    replay_location: "int" = betterproto2.field(115, betterproto2.TYPE_UINT64)
+
+    stream_close_time: "int" = betterproto2.field(116, betterproto2.TYPE_UINT64)
+
+    content_tag: "str" = betterproto2.field(117, betterproto2.TYPE_STRING)
+
+    content_label: "WebcastDataImage | None" = betterproto2.field(
+        118, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    operation_label: "WebcastDataImage | None" = betterproto2.field(
+        119, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_tab_type: "int" = betterproto2.field(120, betterproto2.TYPE_INT32)
+
+    game_extra: "WebcastDataGameExtra | None" = betterproto2.field(
+        121, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    official_channel: "WebcastDataOfficialChannelInfo | None" = betterproto2.field(
+        122, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    stamps: "str" = betterproto2.field(123, betterproto2.TYPE_STRING)
+
+    comment_box: "WebcastDataCommentBox | None" = betterproto2.field(
+        124, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    business_live: "int" = betterproto2.field(125, betterproto2.TYPE_INT32)
+
+    with_ktv: "bool" = betterproto2.field(126, betterproto2.TYPE_BOOL)
+
+    with_draw_something: "bool" = betterproto2.field(127, betterproto2.TYPE_BOOL)
+
+    webcast_comment_tcs: "int" = betterproto2.field(128, betterproto2.TYPE_UINT64)
+
+    room_tag: "int" = betterproto2.field(129, betterproto2.TYPE_UINT64)
+
+    linker_map: "dict[str, int]" = betterproto2.field(
+        130,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_INT64
+        ),
+    )
+
+    finish_reason: "int" = betterproto2.field(131, betterproto2.TYPE_INT32)
+
+    room_cart: "WebcastDataRoomCart | None" = betterproto2.field(
+        132, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    scroll_config: "str" = betterproto2.field(133, betterproto2.TYPE_STRING)
+
+    relation_tag: "str" = betterproto2.field(134, betterproto2.TYPE_STRING)
+
+    owner_device_id: "int" = betterproto2.field(135, betterproto2.TYPE_UINT64)
+
+    auto_cover: "int" = betterproto2.field(136, betterproto2.TYPE_UINT64)
+
+    app_id: "int" = betterproto2.field(137, betterproto2.TYPE_UINT64)
+
+    webcast_sdk_version: "int" = betterproto2.field(138, betterproto2.TYPE_UINT64)
+
+    comment_name_mode: "int" = betterproto2.field(139, betterproto2.TYPE_UINT64)
+
+    room_create_ab_param: "str" = betterproto2.field(140, betterproto2.TYPE_STRING)
+
+    pre_enter_time: "int" = betterproto2.field(141, betterproto2.TYPE_UINT64)
+
+    ranklist_audience_type: "int" = betterproto2.field(142, betterproto2.TYPE_UINT64)
+
+    preview_flow_tag: "int" = betterproto2.field(143, betterproto2.TYPE_UINT64)
+
+    preview_tag_url: "WebcastDataImage | None" = betterproto2.field(
+        144, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    quiz_extra: "WebcastDataQuizExtra | None" = betterproto2.field(
+        145, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_ab_map: "dict[str, str]" = betterproto2.field(
+        146,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    linker_users: "WebcastDataLinkerUsers | None" = betterproto2.field(
+        147, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    linkmic_display_type: "int" = betterproto2.field(148, betterproto2.TYPE_UINT64)
+
+    audio_room_bg_image: "WebcastDataAudioBgData | None" = betterproto2.field(
+        149, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    city_top_linker_users: "WebcastDataLinkerUsers | None" = betterproto2.field(
+        150, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    border_info: "WebcastDataBorderInfo | None" = betterproto2.field(
+        151, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    city_top_background: "WebcastDataImage | None" = betterproto2.field(
+        152, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    city_top_distance: "str" = betterproto2.field(153, betterproto2.TYPE_STRING)
+
+    live_room_mode: "int" = betterproto2.field(154, betterproto2.TYPE_UINT64)
+
+    bonus: "WebcastDataBonus | None" = betterproto2.field(
+        155, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    highlight: "bool" = betterproto2.field(156, betterproto2.TYPE_BOOL)
+
+    is_official_channel_room: "bool" = betterproto2.field(157, betterproto2.TYPE_BOOL)
+
+    activity_room_skin_info: "WebcastDataActivityRoomSkinInfo | None" = (
+        betterproto2.field(158, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    fans_group_admin_user_ids: "list[int]" = betterproto2.field(
+        159, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    replay_info: "WebcastDataRoomReplayInfo | None" = betterproto2.field(
+        160, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    official_channel_uid: "int" = betterproto2.field(161, betterproto2.TYPE_UINT64)
+
+    live_platform_source: "str" = betterproto2.field(162, betterproto2.TYPE_STRING)
+
+    acquaintance_status: "int" = betterproto2.field(163, betterproto2.TYPE_UINT64)
+
+    comment_wall_info: "WebcastDataCommentWallInfo | None" = betterproto2.field(
+        164, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    comment_wall_position: "WebcastDataCommentWallPosition | None" = betterproto2.field(
+        165, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    live_type_vs_live: "bool" = betterproto2.field(166, betterproto2.TYPE_BOOL)
+
+    live_type_vs_premiere: "bool" = betterproto2.field(167, betterproto2.TYPE_BOOL)
+
+    episode_extra: "WebcastDataEpisodeExtraInfo | None" = betterproto2.field(
+        168, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vs_roles: "list[int]" = betterproto2.field(
+        169, betterproto2.TYPE_INT32, repeated=True
+    )
+
+    item_explicit_info: "str" = betterproto2.field(170, betterproto2.TYPE_STRING)
+
+    short_touch_auth: "WebcastDataShortTouchAuth | None" = betterproto2.field(
+        171, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sofa_layout: "int" = betterproto2.field(172, betterproto2.TYPE_UINT64)
+
+    announcement_info: "WebcastDataAnnouncementInfo | None" = betterproto2.field(
+        173, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_need_check_list: "bool" = betterproto2.field(174, betterproto2.TYPE_BOOL)
+
+    live_status_info: "WebcastDataLiveStatusInfo | None" = betterproto2.field(
+        175, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    im_info: "WebcastDataRoomImInfo | None" = betterproto2.field(
+        176, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    assist_label: "WebcastDataLabelInfo | None" = betterproto2.field(
+        177, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    interact_open_extra: "WebcastDataInteractOpenExtra | None" = betterproto2.field(
+        178, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vertical_type_info: "WebcastDataVerticalTypeInfo | None" = betterproto2.field(
+        179, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    filter_words: "list[WebcastDataFilterWord]" = betterproto2.field(
+        180, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    dynamic_label: "WebcastDataLabelInfo | None" = betterproto2.field(
+        181, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    linker_detail: "WebcastDataLinkerDetail | None" = betterproto2.field(
+        182, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    visibility_range: "int" = betterproto2.field(183, betterproto2.TYPE_INT32)
+
+    corner_mark_reach: "WebcastDataCornerMarkReach | None" = betterproto2.field(
+        184, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    preview_expose: "WebcastDataPreviewExposeData | None" = betterproto2.field(
+        185, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    welfare_project_info: "WebcastDataWelfareProjectInfo | None" = betterproto2.field(
+        186, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    game_room_type: "int" = betterproto2.field(187, betterproto2.TYPE_INT32)
+
+    paid_live_data: "WebcastDataPaidLiveData | None" = betterproto2.field(
+        188, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    easter_egg_data: "WebcastDataEasterEggData | None" = betterproto2.field(
+        189, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    title_recommend: "bool" = betterproto2.field(190, betterproto2.TYPE_BOOL)
+
+    danmaku_detail: "int" = betterproto2.field(191, betterproto2.TYPE_UINT64)
+
+    avatar_live_info: "WebcastDataAvatarLiveInfo | None" = betterproto2.field(
+        192, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    circle_info: "WebcastDataCircleInfo | None" = betterproto2.field(
+        193, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    has_promotion_games: "int" = betterproto2.field(194, betterproto2.TYPE_UINT64)
+
+    screenshot_sover: "WebcastDataImage | None" = betterproto2.field(
+        195, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    appearance: "WebcastDataAppearance | None" = betterproto2.field(
+        196, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ecom_data: "WebcastDataEcomData | None" = betterproto2.field(
+        197, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    industry_service_info: "WebcastDataIndustryServiceInfo | None" = betterproto2.field(
+        198, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    relevant_recommendation: "WebcastDataRelevantRecommendation | None" = (
+        betterproto2.field(199, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    scene_type_info: "WebcastDataRoomSpecificSceneTypeInfo | None" = betterproto2.field(
+        200, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    game_cp: "WebcastDataGameCpData | None" = betterproto2.field(
+        201, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    game_play: "WebcastDataGamePlayData | None" = betterproto2.field(
+        202, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    union_live_info: "WebcastDataUnionLiveInfo | None" = betterproto2.field(
+        203, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    beautify_info: "WebcastDataBeautifyInfo | None" = betterproto2.field(
+        204, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    toolbar_data: "WebcastDataToolBarData | None" = betterproto2.field(
+        205, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_tab_label: "WebcastDataAnchorTabLabel | None" = betterproto2.field(
+        206, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    life_groupon_info: "WebcastDataLifeGrouponInfo | None" = betterproto2.field(
+        207, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vip_data: "WebcastDataVipData | None" = betterproto2.field(
+        208, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    toutiao_cover_recommend_level: "int" = betterproto2.field(
+        209, betterproto2.TYPE_UINT64
+    )
+
+    toutiao_title_recommend_level: "int" = betterproto2.field(
+        210, betterproto2.TYPE_UINT64
+    )
+
+    upper_right_widget_data_list: "list[WebcastDataUpperRightWidgetData]" = (
+        betterproto2.field(211, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    live_feedback_card: "WebcastDataFeedbackCard | None" = betterproto2.field(
+        212, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    assist_label_list: "list[WebcastDataLabelInfo]" = betterproto2.field(
+        213, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    desire_info: "WebcastDataDesireInfo | None" = betterproto2.field(
+        214, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    hot_room_info: "WebcastDataHotRoomInfo | None" = betterproto2.field(
+        215, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    with_aggregate_column: "bool" = betterproto2.field(216, betterproto2.TYPE_BOOL)
+
+    cast_screen_data: "WebcastDataCastScreenData | None" = betterproto2.field(
+        217, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    official_channel_extra: "WebcastDataOfficialChannelExtraInfo | None" = (
+        betterproto2.field(218, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    auth_city: "str" = betterproto2.field(219, betterproto2.TYPE_STRING)
+
+    activity_live_recommend_config: "WebcastDataActivityLiveRecommendConfig | None" = (
+        betterproto2.field(220, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    room_channel: "WebcastDataRoomChannelData | None" = betterproto2.field(
+        221, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pack_meta: "WebcastDataPackMetaInfo | None" = betterproto2.field(
+        222, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    activity_data: "WebcastDataActivityData | None" = betterproto2.field(
+        223, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    like_display_config: "WebcastDataLikeDisplayConfig | None" = betterproto2.field(
+        224, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room_view_stats: "WebcastDataRoomViewStats | None" = betterproto2.field(
+        225, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    match: "WebcastDataMatchRoomData | None" = betterproto2.field(
+        226, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    commentary_room_info: "WebcastDataCommentaryRoomInfo | None" = betterproto2.field(
+        227, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    redpacket_audience_auth: "int" = betterproto2.field(228, betterproto2.TYPE_UINT64)
+
+    match_chat_config: "WebcastDataMatchChatConfig | None" = betterproto2.field(
+        229, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vs_main_replay_id: "int" = betterproto2.field(230, betterproto2.TYPE_UINT64)
+
+    screen_capture_sharing_title: "str" = betterproto2.field(
+        231, betterproto2.TYPE_STRING
+    )
+
+    share_resource: "WebcastDataShareResource | None" = betterproto2.field(
+        232, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sharing_music_id_list: "list[str]" = betterproto2.field(
+        233, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    public_screen_bottom_info: "WebcastDataPublicScreenBottomInfo | None" = (
+        betterproto2.field(234, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    push_stream_hkt: "WebcastDataStreamUrl | None" = betterproto2.field(
+        235, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    basis: "WebcastDataRoomBasisData | None" = betterproto2.field(
+        300, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    interact: "WebcastDataRoomInteractData | None" = betterproto2.field(
+        301, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    revenue: "WebcastDataRoomRevenueData | None" = betterproto2.field(
+        302, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    req_user: "WebcastDataRoomReqUserData | None" = betterproto2.field(
+        303, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_data: "WebcastDataRoomAnchorData | None" = betterproto2.field(
+        304, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    others: "WebcastDataRoomOthersData | None" = betterproto2.field(
+        305, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pico_info: "WebcastDataPicoInfo | None" = betterproto2.field(
+        306, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    game_data: "WebcastDataRoomGameData | None" = betterproto2.field(
+        307, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    feed_data: "WebcastDataRoomFeedData | None" = betterproto2.field(
+        308, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    open_content_data: "WebcastDataOpenContentData | None" = betterproto2.field(
+        309, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    client_component_data: "WebcastDataClientComponent | None" = betterproto2.field(
+        310, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    platform_components_data: "WebcastDataRoomPlatformComponentsData | None" = (
+        betterproto2.field(311, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    ios_client_component_data: "WebcastDataIosClientComponent | None" = (
+        betterproto2.field(312, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    owner_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+    admin_user_open_ids: "list[str]" = betterproto2.field(
+        5001, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    fans_group_admin_user_open_ids: "list[str]" = betterproto2.field(
+        5002, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    official_channel_open_id: "str" = betterproto2.field(5003, betterproto2.TYPE_STRING)
+
+    cover_gauss: "WebcastDataImage | None" = betterproto2.field(
+        5004, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.Room", WebcastDataRoom)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomActivityTag(betterproto2.Message):
+    activity_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    extra: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomActivityTag", WebcastDataRoomActivityTag
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAnchorData(betterproto2.Message):
+    finish_schema: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    game_anchor_info: "WebcastDataGameAnchorInfo | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    frame_scale: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    group_id_list: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    conversation_id: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    share_anchor_info: "WebcastDataShareAnchorInfo | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomAnchorData", WebcastDataRoomAnchorData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatus(betterproto2.Message):
+    chat: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    danmaku: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    gift: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    luck_money: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    digg: "bool" = betterproto2.field(5, betterproto2.TYPE_BOOL)
+
+    room_contributor: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    props: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+    user_card: "bool" = betterproto2.field(9, betterproto2.TYPE_BOOL)
+
+    poi: "bool" = betterproto2.field(10, betterproto2.TYPE_BOOL)
+
+    more_anchor: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    banner: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    share: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    user_corner: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    landscape: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    landscape_chat: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    public_screen: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    gift_anchor_mt: "int" = betterproto2.field(18, betterproto2.TYPE_UINT64)
+
+    record_screen: "int" = betterproto2.field(19, betterproto2.TYPE_UINT64)
+
+    donation_sticker: "int" = betterproto2.field(20, betterproto2.TYPE_UINT64)
+
+    hour_rank: "int" = betterproto2.field(21, betterproto2.TYPE_UINT64)
+
+    commerce_card: "int" = betterproto2.field(22, betterproto2.TYPE_UINT64)
+
+    audio_chat: "int" = betterproto2.field(23, betterproto2.TYPE_UINT64)
+
+    danmaku_default: "int" = betterproto2.field(24, betterproto2.TYPE_UINT64)
+
+    ktv_order_song: "int" = betterproto2.field(25, betterproto2.TYPE_UINT64)
+
+    selection_album: "int" = betterproto2.field(26, betterproto2.TYPE_UINT64)
+
+    like: "int" = betterproto2.field(27, betterproto2.TYPE_UINT64)
+
+    multiplier_playback: "int" = betterproto2.field(28, betterproto2.TYPE_UINT64)
+
+    download_video: "int" = betterproto2.field(29, betterproto2.TYPE_UINT64)
+
+    collect: "int" = betterproto2.field(30, betterproto2.TYPE_UINT64)
+
+    timed_shutdown: "int" = betterproto2.field(31, betterproto2.TYPE_UINT64)
+
+    seek: "int" = betterproto2.field(32, betterproto2.TYPE_UINT64)
+
+    denounce: "int" = betterproto2.field(33, betterproto2.TYPE_UINT64)
+
+    dislike: "int" = betterproto2.field(34, betterproto2.TYPE_UINT64)
+
+    only_ta: "int" = betterproto2.field(35, betterproto2.TYPE_UINT64)
+
+    cast_screen: "int" = betterproto2.field(36, betterproto2.TYPE_UINT64)
+
+    comment_wall: "int" = betterproto2.field(37, betterproto2.TYPE_UINT64)
+
+    bullet_style: "int" = betterproto2.field(38, betterproto2.TYPE_UINT64)
+
+    show_game_plugin: "int" = betterproto2.field(39, betterproto2.TYPE_UINT64)
+
+    vs_gift: "int" = betterproto2.field(40, betterproto2.TYPE_UINT64)
+
+    vs_topic: "int" = betterproto2.field(41, betterproto2.TYPE_UINT64)
+
+    vs_rank: "int" = betterproto2.field(42, betterproto2.TYPE_UINT64)
+
+    admin_comment_wall: "int" = betterproto2.field(43, betterproto2.TYPE_UINT64)
+
+    commerce_component: "int" = betterproto2.field(44, betterproto2.TYPE_UINT64)
+
+    dou_plus: "int" = betterproto2.field(45, betterproto2.TYPE_UINT64)
+
+    game_points_playing: "int" = betterproto2.field(46, betterproto2.TYPE_UINT64)
+
+    poster: "int" = betterproto2.field(47, betterproto2.TYPE_UINT64)
+
+    highlights: "int" = betterproto2.field(48, betterproto2.TYPE_UINT64)
+
+    typing_comment_state: "int" = betterproto2.field(49, betterproto2.TYPE_UINT64)
+
+    stroke_up_down_guide: "int" = betterproto2.field(50, betterproto2.TYPE_UINT64)
+
+    up_right_stats_floating_layer: "int" = betterproto2.field(
+        51, betterproto2.TYPE_UINT64
+    )
+
+    cast_screen_explicit: "int" = betterproto2.field(52, betterproto2.TYPE_UINT64)
+
+    selection: "int" = betterproto2.field(53, betterproto2.TYPE_UINT64)
+
+    industry_service: "int" = betterproto2.field(54, betterproto2.TYPE_UINT64)
+
+    vertical_rank: "int" = betterproto2.field(55, betterproto2.TYPE_UINT64)
+
+    enter_effects: "int" = betterproto2.field(56, betterproto2.TYPE_UINT64)
+
+    fans_club: "int" = betterproto2.field(57, betterproto2.TYPE_UINT64)
+
+    emoji_outside: "int" = betterproto2.field(58, betterproto2.TYPE_UINT64)
+
+    can_sell_ticket: "int" = betterproto2.field(59, betterproto2.TYPE_UINT64)
+
+    dou_plus_popularity_gem: "int" = betterproto2.field(60, betterproto2.TYPE_UINT64)
+
+    mission_center: "int" = betterproto2.field(61, betterproto2.TYPE_UINT64)
+
+    expand_screen: "int" = betterproto2.field(62, betterproto2.TYPE_UINT64)
+
+    fans_group: "int" = betterproto2.field(63, betterproto2.TYPE_UINT64)
+
+    topic: "int" = betterproto2.field(64, betterproto2.TYPE_UINT64)
+
+    anchor_mission: "int" = betterproto2.field(65, betterproto2.TYPE_UINT64)
+
+    teleprompter: "int" = betterproto2.field(66, betterproto2.TYPE_UINT64)
+
+    chat_dynamic_slide_speed: "int" = betterproto2.field(67, betterproto2.TYPE_UINT64)
+
+    small_window_display: "int" = betterproto2.field(68, betterproto2.TYPE_UINT64)
+
+    message_dispatch: "int" = betterproto2.field(69, betterproto2.TYPE_UINT64)
+
+    room_channel: "int" = betterproto2.field(70, betterproto2.TYPE_UINT64)
+
+    chat_dispatch: "int" = betterproto2.field(71, betterproto2.TYPE_UINT64)
+
+    linkmic_guest_like: "int" = betterproto2.field(72, betterproto2.TYPE_UINT64)
+
+    media_linkmic: "int" = betterproto2.field(73, betterproto2.TYPE_UINT64)
+
+    video_share: "int" = betterproto2.field(74, betterproto2.TYPE_UINT64)
+
+    chat_guide_emoji: "int" = betterproto2.field(75, betterproto2.TYPE_UINT64)
+
+    chat_guide_image: "int" = betterproto2.field(76, betterproto2.TYPE_UINT64)
+
+    pc_play: "int" = betterproto2.field(77, betterproto2.TYPE_UINT64)
+
+    pad_play: "int" = betterproto2.field(78, betterproto2.TYPE_UINT64)
+
+    long_touch: "int" = betterproto2.field(79, betterproto2.TYPE_UINT64)
+
+    first_feed_hist_chat: "int" = betterproto2.field(80, betterproto2.TYPE_UINT64)
+
+    more_hist_chat: "int" = betterproto2.field(81, betterproto2.TYPE_UINT64)
+
+    word_association: "int" = betterproto2.field(82, betterproto2.TYPE_UINT64)
+
+    landscape_screen_capture: "int" = betterproto2.field(83, betterproto2.TYPE_UINT64)
+
+    landscape_screen_recording: "int" = betterproto2.field(84, betterproto2.TYPE_UINT64)
+
+    screen_projection_barrage: "int" = betterproto2.field(85, betterproto2.TYPE_UINT64)
+
+    small_window_player: "int" = betterproto2.field(86, betterproto2.TYPE_UINT64)
+
+    chat_operate: "int" = betterproto2.field(87, betterproto2.TYPE_UINT64)
+
+    ecom_fans_club: "int" = betterproto2.field(88, betterproto2.TYPE_UINT64)
+
+    audio_chat_totext: "int" = betterproto2.field(89, betterproto2.TYPE_UINT64)
+
+    common_card: "int" = betterproto2.field(90, betterproto2.TYPE_UINT64)
+
+    short_touch: "int" = betterproto2.field(91, betterproto2.TYPE_UINT64)
+
+    host_team_channel: "int" = betterproto2.field(92, betterproto2.TYPE_UINT64)
+
+    landscape_chat_dynamic_slide_speed: "int" = betterproto2.field(
+        93, betterproto2.TYPE_UINT64
+    )
+
+    host_team: "int" = betterproto2.field(94, betterproto2.TYPE_UINT64)
+
+    anchor_hot_message_aggregated: "int" = betterproto2.field(
+        95, betterproto2.TYPE_UINT64
+    )
+
+    anchor_cold_message_tiled: "int" = betterproto2.field(96, betterproto2.TYPE_UINT64)
+
+    screen_bottom_info: "int" = betterproto2.field(97, betterproto2.TYPE_UINT64)
+
+    preview_hot_comment_switch: "int" = betterproto2.field(98, betterproto2.TYPE_UINT64)
+
+    room_widget: "int" = betterproto2.field(99, betterproto2.TYPE_UINT64)
+
+    off_reason: "WebcastDataRoomAuthStatusRoomAuthOffReasons | None" = (
+        betterproto2.field(100, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    special_style: "WebcastDataRoomAuthStatusRoomAuthSpecialStyle | None" = (
+        betterproto2.field(101, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    panel_ec_service: "int" = betterproto2.field(102, betterproto2.TYPE_UINT64)
+
+    fixed_chat: "int" = betterproto2.field(103, betterproto2.TYPE_UINT64)
+
+    landscape_gift: "int" = betterproto2.field(104, betterproto2.TYPE_UINT64)
+
+    hot_chat_tray: "int" = betterproto2.field(105, betterproto2.TYPE_UINT64)
+
+    item_share: "int" = betterproto2.field(106, betterproto2.TYPE_UINT64)
+
+    short_touch_temp_state: "int" = betterproto2.field(107, betterproto2.TYPE_UINT64)
+
+    sticky_message: "int" = betterproto2.field(108, betterproto2.TYPE_UINT64)
+
+    projection_btn: "int" = betterproto2.field(109, betterproto2.TYPE_UINT64)
+
+    chat_dynamic_slide_speed_anchor: "int" = betterproto2.field(
+        110, betterproto2.TYPE_UINT64
+    )
+
+    poster_cache: "int" = betterproto2.field(111, betterproto2.TYPE_UINT64)
+
+    media_history_message: "int" = betterproto2.field(112, betterproto2.TYPE_UINT64)
+
+    toolbar_bubble: "int" = betterproto2.field(113, betterproto2.TYPE_UINT64)
+
+    im_heat_value: "int" = betterproto2.field(114, betterproto2.TYPE_UINT64)
+
+    interactive_component: "int" = betterproto2.field(115, betterproto2.TYPE_UINT64)
+
+    chat_reply: "int" = betterproto2.field(116, betterproto2.TYPE_UINT64)
+
+    chat_mention: "int" = betterproto2.field(117, betterproto2.TYPE_UINT64)
+
+    frequently_chat: "int" = betterproto2.field(118, betterproto2.TYPE_UINT64)
+
+    stream_adaptation: "int" = betterproto2.field(119, betterproto2.TYPE_UINT64)
+
+    video_amplification_type: "int" = betterproto2.field(120, betterproto2.TYPE_UINT64)
+
+    featured_public_screen: "int" = betterproto2.field(121, betterproto2.TYPE_UINT64)
+
+    landscape_screen_share: "int" = betterproto2.field(122, betterproto2.TYPE_UINT64)
+
+    vertical_screen_share: "int" = betterproto2.field(123, betterproto2.TYPE_UINT64)
+
+    anchor_audio_chat: "int" = betterproto2.field(124, betterproto2.TYPE_UINT64)
+
+    preview_chat_expose: "int" = betterproto2.field(125, betterproto2.TYPE_UINT64)
+
+    fusion_emoji: "int" = betterproto2.field(126, betterproto2.TYPE_UINT64)
+
+    my_live_entrance: "int" = betterproto2.field(127, betterproto2.TYPE_UINT64)
+
+    chat_identity: "int" = betterproto2.field(128, betterproto2.TYPE_UINT64)
+
+    mark_user: "int" = betterproto2.field(129, betterproto2.TYPE_UINT64)
+
+    long_press_option: "int" = betterproto2.field(130, betterproto2.TYPE_UINT64)
+
+    clear_entrance_option: "int" = betterproto2.field(131, betterproto2.TYPE_UINT64)
+
+    player_rank_list: "int" = betterproto2.field(132, betterproto2.TYPE_UINT64)
+
+    ai_clone: "int" = betterproto2.field(133, betterproto2.TYPE_UINT64)
+
+    gift_vote: "int" = betterproto2.field(134, betterproto2.TYPE_UINT64)
+
+    text_gift: "int" = betterproto2.field(135, betterproto2.TYPE_UINT64)
+
+    fans_club_letter: "int" = betterproto2.field(136, betterproto2.TYPE_UINT64)
+
+    fans_club_blessing: "int" = betterproto2.field(137, betterproto2.TYPE_UINT64)
+
+    fans_club_notice: "int" = betterproto2.field(138, betterproto2.TYPE_UINT64)
+
+    fans_club_declaration: "int" = betterproto2.field(139, betterproto2.TYPE_UINT64)
+
+    message_gift: "int" = betterproto2.field(140, betterproto2.TYPE_UINT64)
+
+    enhanced_touch: "int" = betterproto2.field(141, betterproto2.TYPE_UINT64)
+
+    chat_mention_v_2: "int" = betterproto2.field(142, betterproto2.TYPE_UINT64)
+
+    room_chat_operate_panel: "int" = betterproto2.field(143, betterproto2.TYPE_UINT64)
+
+    room_chat_like_display: "int" = betterproto2.field(144, betterproto2.TYPE_UINT64)
+
+    room_secret_chat: "int" = betterproto2.field(145, betterproto2.TYPE_UINT64)
+
+    room_anchor_fans_channel: "int" = betterproto2.field(146, betterproto2.TYPE_UINT64)
+
+    room_pin_highlight: "int" = betterproto2.field(147, betterproto2.TYPE_UINT64)
+
+    highlight_area_container: "int" = betterproto2.field(148, betterproto2.TYPE_UINT64)
+
+    low_pcu_guide_chat_data: "int" = betterproto2.field(149, betterproto2.TYPE_UINT64)
+
+    preview_dan_ma_ku: "int" = betterproto2.field(160, betterproto2.TYPE_UINT64)
+
+    world_square: "int" = betterproto2.field(161, betterproto2.TYPE_UINT64)
+
+    vs_comment_bar: "int" = betterproto2.field(200, betterproto2.TYPE_UINT64)
+
+    vs_welcome_danmaku: "int" = betterproto2.field(201, betterproto2.TYPE_UINT64)
+
+    vs_fans_club: "int" = betterproto2.field(202, betterproto2.TYPE_UINT64)
+
+    vs_extension_enable_follow: "int" = betterproto2.field(
+        203, betterproto2.TYPE_UINT64
+    )
+
+    vs_dou_plus: "int" = betterproto2.field(204, betterproto2.TYPE_UINT64)
+
+    quiz_game_points_playing: "int" = betterproto2.field(205, betterproto2.TYPE_UINT64)
+
+    ugc_vs_replay_delete: "int" = betterproto2.field(206, betterproto2.TYPE_UINT64)
+
+    ugc_vs_replay_visibility: "int" = betterproto2.field(207, betterproto2.TYPE_UINT64)
+
+    interaction_gift: "int" = betterproto2.field(208, betterproto2.TYPE_UINT64)
+
+    subscribe_card_package: "int" = betterproto2.field(209, betterproto2.TYPE_UINT64)
+
+    show_qualification: "int" = betterproto2.field(210, betterproto2.TYPE_UINT64)
+
+    use_host_info: "int" = betterproto2.field(301, betterproto2.TYPE_UINT64)
+
+    count_type: "int" = betterproto2.field(5000, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomAuthStatus", WebcastDataRoomAuthStatus
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatusRoomAuthOffReasons(betterproto2.Message):
+    gift: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomAuthStatus.RoomAuthOffReasons",
+    WebcastDataRoomAuthStatusRoomAuthOffReasons,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatusRoomAuthSpecialStyle(betterproto2.Message):
+    chat: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    gift: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    room_contributor: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    like: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(4, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    room_channel: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(5, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    share: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(6, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    cast_screen_auth: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(7, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    landscape: "WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle | None" = (
+        betterproto2.field(8, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomAuthStatus.RoomAuthSpecialStyle",
+    WebcastDataRoomAuthStatusRoomAuthSpecialStyle,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle(betterproto2.Message):
+    unable_style: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    content: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    off_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    anchor_switch: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    switch_status_tip_msg: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    switch_status_anchor_tip_msg: "str" = betterproto2.field(
+        6, betterproto2.TYPE_STRING
+    )
+
+    anchor_switch_for_paid_live: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    content_for_paid_live: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomAuthStatus.RoomAuthSpecialStyle.Style",
+    WebcastDataRoomAuthStatusRoomAuthSpecialStyleStyle,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomAvator(betterproto2.Message):
+    avatar: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    authentication_info: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    nick_name: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    has_fans_club: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    follow_status: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    invalid_follow_status: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    follow_report_scene: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    border: "WebcastDataAvatorBorder | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    first_label: "list[int]" = betterproto2.field(
+        9, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    second_label: "list[int]" = betterproto2.field(
+        10, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    fans_club_type: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    animation_type: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    uid: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    sec_uid: "str" = betterproto2.field(14, betterproto2.TYPE_STRING)
+
+    fan_ticket: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    like_count: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    total_user_str: "str" = betterproto2.field(17, betterproto2.TYPE_STRING)
+
+    secret: "int" = betterproto2.field(18, betterproto2.TYPE_INT32)
+
+    first_tab_label: "WebcastDataAnchorTabLabel | None" = betterproto2.field(
+        19, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    second_tab_label: "WebcastDataAnchorTabLabel | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    profile_view_data: "list[WebcastDataProfileViewData]" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomAvator", WebcastDataRoomAvator
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomBanner(betterproto2.Message):
+    auth_msg: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomBanner", WebcastDataRoomBanner
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomBasisData(betterproto2.Message):
+    next_ping: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    is_customize_audio_room: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    need_request_luckybox: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    secret_room: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    foreign_user_room: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomBasisData", WebcastDataRoomBasisData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomCart(betterproto2.Message):
+    contain_cart: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    total: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    flash_total: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    cart_icon: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    show_cart: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    vertical: "WebcastDataCartVertical | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    horizontal: "WebcastDataCartHorizontal | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    global_custom_icons: "WebcastDataGlobalCustomIcons | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomCart", WebcastDataRoomCart
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomCartV2(betterproto2.Message):
+    show_cart: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomCartV2", WebcastDataRoomCartV2
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomChannelData(betterproto2.Message):
+    status: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    channel_list: "list[WebcastDataRoomChannelInfo]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    support_room_channel_mode: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    limit_of_num: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    can_create: "bool" = betterproto2.field(5, betterproto2.TYPE_BOOL)
+
+    background: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tab_landing: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    can_link_mic: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+    user_in_fans_group_map: "dict[int, bool]" = betterproto2.field(
+        9,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(betterproto2.TYPE_INT64, betterproto2.TYPE_BOOL),
+    )
+
+    user_channel_apply_map: "dict[int, bool]" = betterproto2.field(
+        10,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(betterproto2.TYPE_INT64, betterproto2.TYPE_BOOL),
+    )
+
+    user_in_fans_club_map: "dict[int, bool]" = betterproto2.field(
+        11,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(betterproto2.TYPE_INT64, betterproto2.TYPE_BOOL),
+    )
+
+    hide_landscape: "bool" = betterproto2.field(101, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomChannelData", WebcastDataRoomChannelData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomChannelInfo(betterproto2.Message):
+    channel_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    token: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    is_owner: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    member_count: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    top_user: "list[WebcastDataUser]" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    channel_name: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    room_channel_mode: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    need_approval_user: "WebcastDataUser | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    owner: "WebcastDataUser | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    max_member_count: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    create_type: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    secret_chat_info: "WebcastDataSecretChatInfo | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    channel_id_str: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    enable_announcement: "bool" = betterproto2.field(14, betterproto2.TYPE_BOOL)
+
+    channel_announcement: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    fans_create_info: "WebcastDataFansChannelCreateInfo | None" = betterproto2.field(
+        16, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    disable_member_invite: "bool" = betterproto2.field(17, betterproto2.TYPE_BOOL)
+
+    invite_disable_toast: "str" = betterproto2.field(18, betterproto2.TYPE_STRING)
+
+    create_app_id: "int" = betterproto2.field(19, betterproto2.TYPE_UINT64)
+
+    channel_state: "int" = betterproto2.field(20, betterproto2.TYPE_UINT64)
+
+    avatar_thumb: "WebcastDataImage | None" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    group_live_member: "WebcastDataUser | None" = betterproto2.field(
+        22, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    rtc_ext_info: "WebcastDataRtcExtInfo | None" = betterproto2.field(
+        200, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomChannelInfo", WebcastDataRoomChannelInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomCore(betterproto2.Message):
+    room_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    anchor_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    anchor_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomCore", WebcastDataRoomCore
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomExtra(betterproto2.Message):
+    is_sandbox: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    enter_region_restriction: "WebcastDataRegionRestriction | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    enter_region_match: "WebcastDataRegionMatch | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    filter_with_no_context: "WebcastDataSafeReason | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    xigua_uid: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    limit_strategy: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    limit_appid: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    geo_block: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    vr_type: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    is_virtual_anchor: "bool" = betterproto2.field(10, betterproto2.TYPE_BOOL)
+
+    create_scene: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    realtime_replay_enabled: "bool" = betterproto2.field(12, betterproto2.TYPE_BOOL)
+
+    realtime_playback_shift: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    realtime_playback_start_shift: "int" = betterproto2.field(
+        14, betterproto2.TYPE_UINT64
+    )
+
+    realtime_playback_qualities: "list[WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality]" = betterproto2.field(
+        15, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    facial_unrecognised: "int" = betterproto2.field(16, betterproto2.TYPE_INT32)
+
+    vs_type: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    location_info: "WebcastDataLocationInfo | None" = betterproto2.field(
+        18, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    max_audience_cnt: "int" = betterproto2.field(19, betterproto2.TYPE_INT32)
+
+    virtual_tool: "str" = betterproto2.field(20, betterproto2.TYPE_STRING)
+
+    payload_start_microgame_stamp: "WebcastDataPayloadStartMicrogameStamp | None" = (
+        betterproto2.field(21, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    audience_limit_config: "WebcastDataAudienceLimitRoomConfig | None" = (
+        betterproto2.field(22, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    ecom_live_shop_v2: "int" = betterproto2.field(23, betterproto2.TYPE_INT32)
+
+    ecom_live_review_info: "WebcastDataEcomLiveReviewInfo | None" = betterproto2.field(
+        24, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomExtra", WebcastDataRoomExtra
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedData(betterproto2.Message):
+    relation_label: "WebcastDataLabelInfo | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    follow_top_appearance: "WebcastDataRoomFeedDataFollowTopAppearance | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    cut_position: "WebcastDataRoomFeedDataStreamCutPosition | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    drawer_config: "WebcastDataRoomFeedDataDrawerConfig | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    can_show_inner_card: "bool" = betterproto2.field(5, betterproto2.TYPE_BOOL)
+
+    share_count: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    module_title: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    is_superior: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+    distribution_scene_id: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomFeedData", WebcastDataRoomFeedData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfig(betterproto2.Message):
+    avatar_area: "WebcastDataRoomFeedDataDrawerConfigAvatarArea | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    entrance_icon: "WebcastDataRoomFeedDataDrawerConfigEntranceIcon | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    entrace_title: "WebcastDataRoomFeedDataDrawerConfigEntranceTitle | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    arrow_view: "WebcastDataRoomFeedDataDrawerConfigArrowView | None" = (
+        betterproto2.field(4, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    entrance_layout: "WebcastDataRoomFeedDataDrawerConfigEntranceLayout | None" = (
+        betterproto2.field(5, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    special_config: "WebcastDataRoomFeedDataDrawerConfigSpecialConfig | None" = (
+        betterproto2.field(6, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig",
+    WebcastDataRoomFeedDataDrawerConfig,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigArrowView(betterproto2.Message):
+    visibility: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig.ArrowView",
+    WebcastDataRoomFeedDataDrawerConfigArrowView,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigAvatarArea(betterproto2.Message):
+    can_show_follow: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig.AvatarArea",
+    WebcastDataRoomFeedDataDrawerConfigAvatarArea,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigEntranceIcon(betterproto2.Message):
+    image: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anim_show_method: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    anim_stop_method: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    height: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig.EntranceIcon",
+    WebcastDataRoomFeedDataDrawerConfigEntranceIcon,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigEntranceLayout(betterproto2.Message):
+    layout_params: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig.EntranceLayout",
+    WebcastDataRoomFeedDataDrawerConfigEntranceLayout,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigEntranceTitle(betterproto2.Message):
+    text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig.EntranceTitle",
+    WebcastDataRoomFeedDataDrawerConfigEntranceTitle,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigFreqInfo(betterproto2.Message):
+    show_duration: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    freq_key: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    freq_duration: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig.FreqInfo",
+    WebcastDataRoomFeedDataDrawerConfigFreqInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataDrawerConfigSpecialConfig(betterproto2.Message):
+    entrace_title: "WebcastDataRoomFeedDataDrawerConfigEntranceTitle | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    more_live_tab: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    insert_room_reason: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    freq_info: "WebcastDataRoomFeedDataDrawerConfigFreqInfo | None" = (
+        betterproto2.field(4, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    current_talent: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.DrawerConfig.SpecialConfig",
+    WebcastDataRoomFeedDataDrawerConfigSpecialConfig,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataFollowTopAppearance(betterproto2.Message):
+    style: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    cut_position: "WebcastDataRoomFeedDataStreamCutPosition | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.FollowTopAppearance",
+    WebcastDataRoomFeedDataFollowTopAppearance,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFeedDataStreamCutPosition(betterproto2.Message):
+    x1: "float" = betterproto2.field(1, betterproto2.TYPE_DOUBLE)
+
+    y1: "float" = betterproto2.field(2, betterproto2.TYPE_DOUBLE)
+
+    x2: "float" = betterproto2.field(3, betterproto2.TYPE_DOUBLE)
+
+    y2: "float" = betterproto2.field(4, betterproto2.TYPE_DOUBLE)
+
+    source_width: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    source_height: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomFeedData.StreamCutPosition",
+    WebcastDataRoomFeedDataStreamCutPosition,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomFullVideoBtn(betterproto2.Message):
+    show: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    disable_icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    show_type: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomFullVideoBTN", WebcastDataRoomFullVideoBtn
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomGameData(betterproto2.Message):
+    room_game_data_channel_config: "WebcastDataRoomGameDataChannelConfig | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    game_tag_info: "WebcastDataGameTagInfo | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sandwich_border_info: "WebcastDataSandwichBorderInfo | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    game_room_sticker: "WebcastDataGameRoomSticker | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomGameData", WebcastDataRoomGameData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomGameDataChannelConfig(betterproto2.Message):
+    fusion_tag_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    game_id: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    live_stay_limit: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomGameDataChannelConfig",
+    WebcastDataRoomGameDataChannelConfig,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomGravitySensor(betterproto2.Message):
+    open: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomGravitySensor", WebcastDataRoomGravitySensor
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomHealthScoreInfo(betterproto2.Message):
+    score: "float" = betterproto2.field(1, betterproto2.TYPE_DOUBLE)
+
+    bubble_message: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    jump_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomHealthScoreInfo", WebcastDataRoomHealthScoreInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomImInfo(betterproto2.Message):
+    welcome_messages: "list[str]" = betterproto2.field(
+        1, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    room_tag: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    hide_gift_message: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomIMInfo", WebcastDataRoomImInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomInteractData(betterproto2.Message):
+    landscape_comment_style: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    vs_component_extra: "WebcastDataEpisodeExtraInfo | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    featured_public_screen_data: "WebcastDataFeaturedPublicScreenConf | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    public_screen_speed_conf: "WebcastDataPublicScreenSpeedConf | None" = (
+        betterproto2.field(4, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    public_room_intro_label: "WebcastDataRoomIntroLabel | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    input_default_config: "WebcastDataInputDefaultConfig | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    low_pcu_guide_info: "WebcastDataLowPcuGuideData | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    user_world_chat_info: "WebcastDataUserWorldChatInfo | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    bottom_input_custom_topic: "WebcastDataBottomInputData | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomInteractData", WebcastDataRoomInteractData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomIntroLabel(betterproto2.Message):
+    label_tag: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    label_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    label_text: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    label_icon: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    type_name: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    show_text: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    selected: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    show_order: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomIntroLabel", WebcastDataRoomIntroLabel
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomOthersData(betterproto2.Message):
+    deco_detail: "WebcastDataDecotationDetail | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    more_panel_info: "WebcastDataMorePanelData | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    appointment_info: "WebcastDataAppointmentData | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    web_skin: "WebcastDataWebSkinData | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    programme: "WebcastDataWebProgramme | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    live_matrix_info: "WebcastDataLiveMatrixInfo | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    web_live_port_optimization: "WebcastDataWebLivePortOptimization | None" = (
+        betterproto2.field(7, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    gift_panel_topper_tray: "WebcastDataGiftPanelTopperTray | None" = (
+        betterproto2.field(8, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    enter_gift_animation: "WebcastDataEnterGiftAnimation | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    paid_live_subscribe: "WebcastDataPaidLiveSubscribe | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    group_live_data: "WebcastDataGroupLiveData | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    lvideo_item_id: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    web_enter_benefit_point_data: "WebcastDataWebEnterBenefitPointData | None" = (
+        betterproto2.field(13, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    recognition_containers: "WebcastDataStreamRecognitionContainers | None" = (
+        betterproto2.field(14, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    anchor_bottom_tool_bar: "WebcastDataAnchorBottomToolBar | None" = (
+        betterproto2.field(15, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    anchor_together_live: "WebcastDataAnchorTogetherLive | None" = betterproto2.field(
+        16, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    mosaic_version: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    web_data: "WebcastDataWebData | None" = betterproto2.field(
+        18, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    metric_tracker_data_list: "WebcastDataMetricTrackerData | None" = (
+        betterproto2.field(19, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    vr_info: "WebcastDataVrInfo | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    cloud_collaborate_data: "WebcastDataCloudCollaborateData | None" = (
+        betterproto2.field(21, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    windmill_data: "WebcastDataWindmillData | None" = betterproto2.field(
+        22, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room_chat_guide_locale_city: "str" = betterproto2.field(
+        23, betterproto2.TYPE_STRING
+    )
+
+    redirect_from: "int" = betterproto2.field(24, betterproto2.TYPE_INT32)
+
+    change_room_info: "WebcastDataChangeRoomInfo | None" = betterproto2.field(
+        25, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    panel_guidance: "str" = betterproto2.field(26, betterproto2.TYPE_STRING)
+
+    participant_activity: "str" = betterproto2.field(27, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomOthersData", WebcastDataRoomOthersData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomPlatformComponentsData(betterproto2.Message):
+    room_title: "WebcastDataRoomTitle | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room_count: "WebcastDataRoomViewStats | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room_avator: "WebcastDataRoomAvator | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    public_screen_info: "WebcastDataRoomPublicScreenInfo | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    full_video_btn: "WebcastDataRoomFullVideoBtn | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    banner: "WebcastDataRoomBanner | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    core: "WebcastDataRoomCore | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    share_component_info: "WebcastDataShareComponentInfo | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room_gravity_sensor: "WebcastDataRoomGravitySensor | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomPlatformComponentsData",
+    WebcastDataRoomPlatformComponentsData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomPublicScreenAttachments(betterproto2.Message):
+    hot_message_tray: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    height_setting: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    first_message_show_opt: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    anchor_cold_message_show_opt: "int" = betterproto2.field(
+        4, betterproto2.TYPE_UINT64
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomPublicScreenAttachments",
+    WebcastDataRoomPublicScreenAttachments,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomPublicScreenInfo(betterproto2.Message):
+    attachments: "WebcastDataRoomPublicScreenAttachments | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background_color: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    long_press_color: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomPublicScreenInfo", WebcastDataRoomPublicScreenInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomReplayInfo(betterproto2.Message):
+    replay_duration: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    replay_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    content_uniq_id: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomReplayInfo", WebcastDataRoomReplayInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomReqUserData(betterproto2.Message):
+    user_share_room_score: "float" = betterproto2.field(1, betterproto2.TYPE_FLOAT)
+
+    enter_user_device_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomReqUserData", WebcastDataRoomReqUserData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomRevenueData(betterproto2.Message):
+    open_game: "WebcastDataOpenGame | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_linkmic: "WebcastDataAnchorLinkmic | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomRevenueData", WebcastDataRoomRevenueData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfig(betterproto2.Message):
+    elements: "dict[int, WebcastDataRoomShortTouchAreaConfigElement]" = (
+        betterproto2.field(
+            1,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+    forbidden_types_map: "dict[int, WebcastDataRoomShortTouchAreaConfigForbiddenType]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    temp_state_condition_map: "dict[int, WebcastDataRoomShortTouchAreaConfigTempStateCondition]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    temp_state_strategy: "dict[int, WebcastDataRoomShortTouchAreaConfigTempStateStrategy]" = betterproto2.field(
+        5,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    strategy_feat_whitelist: "list[str]" = betterproto2.field(
+        6, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    temp_state_global_condition: "WebcastDataRoomShortTouchAreaConfigTempStateGlobalCondition | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    big_card_display_strategy: "dict[int, WebcastDataRoomShortTouchAreaConfigBigCardDisplayStrategy]" = betterproto2.field(
+        8,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig",
+    WebcastDataRoomShortTouchAreaConfig,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigBigCardDisplayStrategy(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    allow_repeat_display: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.BigCardDisplayStrategy",
+    WebcastDataRoomShortTouchAreaConfigBigCardDisplayStrategy,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigElement(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    priority: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.Element",
+    WebcastDataRoomShortTouchAreaConfigElement,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigForbiddenType(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    reason: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.ForbiddenType",
+    WebcastDataRoomShortTouchAreaConfigForbiddenType,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateCondition(betterproto2.Message):
+    type: "WebcastDataRoomShortTouchAreaConfigTempStateType | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    minimum_gap: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.TempStateCondition",
+    WebcastDataRoomShortTouchAreaConfigTempStateCondition,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateGlobalCondition(betterproto2.Message):
+    duration_gap: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    allow_count: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    ignore_strategy_types: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.TempStateGlobalCondition",
+    WebcastDataRoomShortTouchAreaConfigTempStateGlobalCondition,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateStrategy(betterproto2.Message):
+    short_touch_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    strategy_map: "dict[int, WebcastDataRoomShortTouchAreaConfigTempStateStrategyTempStateStrategyInfo]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.TempStateStrategy",
+    WebcastDataRoomShortTouchAreaConfigTempStateStrategy,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateStrategyTempStateStrategyInfo(
+    betterproto2.Message
+):
+    type: "WebcastDataRoomShortTouchAreaConfigTempStateType | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    duration: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    strategy_method: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.TempStateStrategy.TempStateStrategyInfo",
+    WebcastDataRoomShortTouchAreaConfigTempStateStrategyTempStateStrategyInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomShortTouchAreaConfigTempStateType(betterproto2.Message):
+    strategy_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    priority: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomShortTouchAreaConfig.TempStateType",
+    WebcastDataRoomShortTouchAreaConfigTempStateType,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomSpecificSceneTypeInfo(betterproto2.Message):
+    is_union_live_room: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    is_life: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    is_protected_room: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    is_lasted_goods_room: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    is_desire_room: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    commentary_type: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    is_sub_orientation_vertical_room: "int" = betterproto2.field(
+        7, betterproto2.TYPE_INT32
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomSpecificSceneTypeInfo",
+    WebcastDataRoomSpecificSceneTypeInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomStats(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    fan_ticket: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    money: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    total_user: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    gift_uv_count: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    follow_count: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    user_count_composition: "WebcastDataRoomStatsUserCountComposition | None" = (
+        betterproto2.field(8, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    watermelon: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    digg_count: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    enter_count: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    dou_plus_promotion: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    total_user_desp: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    like_count: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    total_user_str: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    user_count_str: "str" = betterproto2.field(16, betterproto2.TYPE_STRING)
+
+    comment_count: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    welfare_donation_amount: "int" = betterproto2.field(18, betterproto2.TYPE_UINT64)
+
+    up_right_stats_str: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    up_right_stats_str_complete: "str" = betterproto2.field(
+        20, betterproto2.TYPE_STRING
+    )
+
+    total_user_uv_preview_str: "str" = betterproto2.field(21, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomStats", WebcastDataRoomStats
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomStatsUserCountComposition(betterproto2.Message):
+    city: "float" = betterproto2.field(1, betterproto2.TYPE_DOUBLE)
+
+    video_detail: "float" = betterproto2.field(2, betterproto2.TYPE_DOUBLE)
+
+    my_follow: "float" = betterproto2.field(3, betterproto2.TYPE_DOUBLE)
+
+    other: "float" = betterproto2.field(4, betterproto2.TYPE_DOUBLE)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.RoomStats.UserCountComposition",
+    WebcastDataRoomStatsUserCountComposition,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomTab(betterproto2.Message):
+    tab_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    tab_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    tab_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomTab", WebcastDataRoomTab
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomTitle(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    introduction: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    left_tag: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    left_period: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    left_toast: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    left_icon: "WebcastDataTitleIcon | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ui_type: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    portrait_show: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+    landscape_show: "bool" = betterproto2.field(9, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomTitle", WebcastDataRoomTitle
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomUserAttr(betterproto2.Message):
+    room_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    room_id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    silence_flag: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    admin_flag: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    rank: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomUserAttr", WebcastDataRoomUserAttr
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRoomViewStats(betterproto2.Message):
+    is_hidden: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    display_short: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    display_middle: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    display_long: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    display_value: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    display_version: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    incremental: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    display_type: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    display_short_anchor: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    display_middle_anchor: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    display_long_anchor: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RoomViewStats", WebcastDataRoomViewStats
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataRtcExtInfo(betterproto2.Message):
+    link_mic_id_str: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    rtc_ext_info: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    live_core_exr_info: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    rtc_strategy: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    public_stream_id: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.RtcExtInfo", WebcastDataRtcExtInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSafeReason(betterproto2.Message):
+    safe_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SafeReason", WebcastDataSafeReason
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSandwichBorderInfo(betterproto2.Message):
+    top: "float" = betterproto2.field(1, betterproto2.TYPE_DOUBLE)
+
+    bottom: "float" = betterproto2.field(2, betterproto2.TYPE_DOUBLE)
+
+    left: "float" = betterproto2.field(3, betterproto2.TYPE_DOUBLE)
+
+    right: "float" = betterproto2.field(4, betterproto2.TYPE_DOUBLE)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SandwichBorderInfo", WebcastDataSandwichBorderInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSchemaInfo(betterproto2.Message):
+    schema_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SchemaInfo", WebcastDataSchemaInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataScreenBarConfigure(betterproto2.Message):
+    image: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_dynamic_img: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    jump_prompt: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ScreenBarConfigure", WebcastDataScreenBarConfigure
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSecretChatInfo(betterproto2.Message):
+    owner_uid: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    guest_uid: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    status: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    user_avatar_thumb_map: "dict[int, WebcastDataImage]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    owner_user_openid: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+    guest_user_openid: "str" = betterproto2.field(5001, betterproto2.TYPE_STRING)
+
+    open_user_avatar_thumb_map: "dict[str, WebcastDataImage]" = betterproto2.field(
+        5002,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SecretChatInfo", WebcastDataSecretChatInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShareAnchorInfo(betterproto2.Message):
+    is_latest_anchor: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    is_reflow_anchor: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    is_low_fans_anchor: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ShareAnchorInfo", WebcastDataShareAnchorInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShareComponentInfo(betterproto2.Message):
+    int_64_string: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ShareComponentInfo", WebcastDataShareComponentInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSharePosterInfo(betterproto2.Message):
+    data: "WebcastDataSharePosterInfoPosterData | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SharePosterInfo", WebcastDataSharePosterInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSharePosterInfoPosterData(betterproto2.Message):
+    poster: "list[WebcastDataImage]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    decorator: "list[WebcastDataImage]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.SharePosterInfo.PosterData",
+    WebcastDataSharePosterInfoPosterData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShareResource(betterproto2.Message):
+    toast_background: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    qrcode: "dict[str, str]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    ug_share_info: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ShareResource", WebcastDataShareResource
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShareTicket(betterproto2.Message):
+    has_share: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    from_user: "WebcastDataUser | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    package_record_id: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    has_grab_share: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ShareTicket", WebcastDataShareTicket
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShortTouchAuth(betterproto2.Message):
+    commerce_lottery: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ShortTouchAuth", WebcastDataShortTouchAuth
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataShowArea(betterproto2.Message):
+    x: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    y: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    h: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    w: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ShowArea", WebcastDataShowArea
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSku(betterproto2.Message):
+    id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    category: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    price: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    sale_start_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    sale_end_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    refundable: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    cover_uri: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    introduction: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    sale_status: "int" = betterproto2.field(11, betterproto2.TYPE_INT32)
+
+    product_id: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    related_sku_simple_infos: "list[WebcastDataSkuRelatedSkuSimpleInfo]" = (
+        betterproto2.field(13, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    order_item_type: "int" = betterproto2.field(14, betterproto2.TYPE_INT32)
+
+    order_biz_ext_info: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    limit_count: "int" = betterproto2.field(16, betterproto2.TYPE_INT32)
+
+    purchase_status: "int" = betterproto2.field(17, betterproto2.TYPE_INT32)
+
+    can_purchase: "bool" = betterproto2.field(18, betterproto2.TYPE_BOOL)
+
+    episode: "int" = betterproto2.field(19, betterproto2.TYPE_UINT64)
+
+    introduction_text: "str" = betterproto2.field(20, betterproto2.TYPE_STRING)
+
+    price_type: "int" = betterproto2.field(21, betterproto2.TYPE_INT32)
+
+    camera_info: "WebcastDataSkuCaremaInfo | None" = betterproto2.field(
+        22, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    entity_ids_map: "list[WebcastDataSkuEntityIDsMap]" = betterproto2.field(
+        23, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    free_status: "int" = betterproto2.field(24, betterproto2.TYPE_INT32)
+
+    limited_free_notice: "WebcastDataSkuLimitedFreeNotice | None" = betterproto2.field(
+        25, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    live_status: "int" = betterproto2.field(26, betterproto2.TYPE_INT32)
+
+    enable_renew_vip: "bool" = betterproto2.field(27, betterproto2.TYPE_BOOL)
+
+    bonus_amount: "int" = betterproto2.field(28, betterproto2.TYPE_UINT64)
+
+    right_valid_duration: "int" = betterproto2.field(29, betterproto2.TYPE_UINT64)
+
+    create_time: "int" = betterproto2.field(30, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.SKU", WebcastDataSku)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuCaremaInfo(betterproto2.Message):
+    camera_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    camera_id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SKU.CaremaInfo", WebcastDataSkuCaremaInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuEntityIDsMap(betterproto2.Message):
+    entity_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    releated_entity_ids: "list[int]" = betterproto2.field(
+        23, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SKU.EntityIDsMap", WebcastDataSkuEntityIDsMap
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuLimitedFreeNotice(betterproto2.Message):
+    icon_uri: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SKU.LimitedFreeNotice", WebcastDataSkuLimitedFreeNotice
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSkuRelatedSkuSimpleInfo(betterproto2.Message):
+    sku_id: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    product_id: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.SKU.RelatedSkuSimpleInfo",
+    WebcastDataSkuRelatedSkuSimpleInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSpliceLabel(betterproto2.Message):
+    text: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    text_color: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    background_image: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon_image: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background_color: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    icon_width: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    icon_height: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    icon_raduis: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    text_front_size: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    text_front_bold: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    text_front_italic: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SpliceLabel", WebcastDataSpliceLabel
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStaticBorderInfo(betterproto2.Message):
+    top: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    bottom: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    left: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    right: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.StaticBorderInfo", WebcastDataStaticBorderInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamRecognitionCandidate(betterproto2.Message):
+    scene_enum: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    priority: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamRecognitionCandidate",
+    WebcastDataStreamRecognitionCandidate,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamRecognitionContainers(betterproto2.Message):
+    recognition_candidates: "WebcastDataStreamRecognitionCandidate | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamRecognitionContainers",
+    WebcastDataStreamRecognitionContainers,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrl(betterproto2.Message):
+    provider: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    id_str: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    resolution_name: "dict[str, str]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    default_resolution: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    extra: "WebcastDataStreamUrlStreamUrlExtra | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    rtmp_push_url: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    rtmp_pull_url: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    flv_pull_url: "dict[str, str]" = betterproto2.field(
+        9,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    candidate_resolution: "list[str]" = betterproto2.field(
+        10, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    hls_pull_url: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    hls_pull_url_params: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    rtmp_pull_url_params: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    flv_pull_url_params: "dict[str, str]" = betterproto2.field(
+        14,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    rtmp_push_url_params: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    push_urls: "str" = betterproto2.field(16, betterproto2.TYPE_STRING)
+
+    live_core_sdk_data: "WebcastDataStreamUrlLiveCoreSdkData | None" = (
+        betterproto2.field(17, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    hls_pull_url_map: "dict[str, str]" = betterproto2.field(
+        18,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    complete_push_urls: "list[str]" = betterproto2.field(
+        19, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    stream_control_type: "int" = betterproto2.field(20, betterproto2.TYPE_INT32)
+
+    stream_orientation: "int" = betterproto2.field(21, betterproto2.TYPE_INT32)
+
+    push_stream_type: "int" = betterproto2.field(22, betterproto2.TYPE_INT32)
+
+    pull_datas: "dict[str, WebcastDataStreamUrlLiveCoreSdkDataPullData]" = (
+        betterproto2.field(
+            23,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+    play: "WebcastDataStreamUrlPlaySetting | None" = betterproto2.field(
+        24, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    push_datas: "dict[str, WebcastDataStreamUrlLiveCoreSdkDataPushData]" = (
+        betterproto2.field(
+            25,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+    vr_type: "int" = betterproto2.field(26, betterproto2.TYPE_INT32)
+
+    multi_stream_scene: "int" = betterproto2.field(27, betterproto2.TYPE_INT32)
+
+    resolution_select_panel_resident: "int" = betterproto2.field(
+        28, betterproto2.TYPE_INT32
+    )
+
+    open_stream_url_encrypt: "WebcastDataOpenStreamUrlEncrypt | None" = (
+        betterproto2.field(5000, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.StreamUrl", WebcastDataStreamUrl
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkData(betterproto2.Message):
+    pull_data: "WebcastDataStreamUrlLiveCoreSdkDataPullData | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    push_data: "WebcastDataStreamUrlLiveCoreSdkDataPushData | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    size: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData",
+    WebcastDataStreamUrlLiveCoreSdkData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullData(betterproto2.Message):
+    stream_data: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    options: "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptions | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    version: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    hls_data_unencrypted: "dict[str, str]" = betterproto2.field(
+        4,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    kind: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    extension: "WebcastDataStreamUrlLiveCoreSdkDataPullDataExtension | None" = (
+        betterproto2.field(6, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    hls: "list[WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo]" = (
+        betterproto2.field(7, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    flv: "list[WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo]" = (
+        betterproto2.field(8, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    codec: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    display: "WebcastDataStreamUrlLiveCoreSdkDataPullDataDisplay | None" = (
+        betterproto2.field(10, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    compensatory_data: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData",
+    WebcastDataStreamUrlLiveCoreSdkDataPullData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataCameraHorizontalPosition(
+    betterproto2.Message
+):
+    anchor: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    x: "float" = betterproto2.field(2, betterproto2.TYPE_FLOAT)
+
+    y: "float" = betterproto2.field(3, betterproto2.TYPE_FLOAT)
+
+    w: "float" = betterproto2.field(4, betterproto2.TYPE_FLOAT)
+
+    h: "float" = betterproto2.field(5, betterproto2.TYPE_FLOAT)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData.CameraHorizontalPosition",
+    WebcastDataStreamUrlLiveCoreSdkDataPullDataCameraHorizontalPosition,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataClip(betterproto2.Message):
+    x: "float" = betterproto2.field(1, betterproto2.TYPE_FLOAT)
+
+    y: "float" = betterproto2.field(2, betterproto2.TYPE_FLOAT)
+
+    w: "float" = betterproto2.field(3, betterproto2.TYPE_FLOAT)
+
+    h: "float" = betterproto2.field(4, betterproto2.TYPE_FLOAT)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData.Clip",
+    WebcastDataStreamUrlLiveCoreSdkDataPullDataClip,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataDisplay(betterproto2.Message):
+    scale_width: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    scale_height: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData.Display",
+    WebcastDataStreamUrlLiveCoreSdkDataPullDataDisplay,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataExtension(betterproto2.Message):
+    game_clip: "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip | None" = (
+        betterproto2.field(1, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    camera_clip: "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip | None" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    camera_hidden: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    ts: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    refresh: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    display_mode: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    game_hidden: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    game_room_id: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    layout: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    camera_clip_custom: "WebcastDataStreamUrlLiveCoreSdkDataPullDataClip | None" = (
+        betterproto2.field(10, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    camera_vertical_type: "int" = betterproto2.field(11, betterproto2.TYPE_INT32)
+
+    camera_horizontal_position: "WebcastDataStreamUrlLiveCoreSdkDataPullDataCameraHorizontalPosition | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    camera_horizontal_hidden: "int" = betterproto2.field(13, betterproto2.TYPE_INT32)
+
+    camera_horizontal_type: "int" = betterproto2.field(14, betterproto2.TYPE_INT32)
+
+    multi_view_data: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData.Extension",
+    WebcastDataStreamUrlLiveCoreSdkDataPullDataExtension,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataOptions(betterproto2.Message):
+    default_quality: "WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    qualities: "list[WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality]" = (
+        betterproto2.field(2, betterproto2.TYPE_MESSAGE, repeated=True)
+    )
+
+    vpass_default: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    quality_strategy: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData.Options",
+    WebcastDataStreamUrlLiveCoreSdkDataPullDataOptions,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    sdk_key: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    v_codec: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    resolution: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    level: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    v_bit_rate: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    additional_content: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    fps: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    disable: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData.Options.Quality",
+    WebcastDataStreamUrlLiveCoreSdkDataPullDataOptionsQuality,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo(betterproto2.Message):
+    url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    quality_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    params: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PullData.PlayInfo",
+    WebcastDataStreamUrlLiveCoreSdkDataPullDataPlayInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPushData(betterproto2.Message):
+    resolution_params: "dict[str, WebcastDataStreamUrlLiveCoreSdkDataPushDataResolutionParams]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    push_stream_level: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    pre_schedule: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    rtmp_push_url: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    push_params: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    kind: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    stream_id: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    stream_id_str: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PushData",
+    WebcastDataStreamUrlLiveCoreSdkDataPushData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlLiveCoreSdkDataPushDataResolutionParams(betterproto2.Message):
+    width: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    height: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    default_bitrate: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    min_bitrate: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    max_bitrate: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    fps: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.LiveCoreSDKData.PushData.ResolutionParams",
+    WebcastDataStreamUrlLiveCoreSdkDataPushDataResolutionParams,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlPlaySetting(betterproto2.Message):
+    horizontal: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    vertical: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.StreamUrl.PlaySetting", WebcastDataStreamUrlPlaySetting
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtra(betterproto2.Message):
+    height: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    width: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    fps: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    max_bitrate: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    min_bitrate: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    default_bitrate: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    bitrate_adapt_strategy: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    anchor_interact_profile: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    audience_interact_profile: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    hardware_encode: "bool" = betterproto2.field(10, betterproto2.TYPE_BOOL)
+
+    video_profile: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    super_resolution: "WebcastDataStreamUrlStreamUrlExtraSuperResolution | None" = (
+        betterproto2.field(14, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    h265_enable: "bool" = betterproto2.field(15, betterproto2.TYPE_BOOL)
+
+    gop_sec: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    bframe_enable: "bool" = betterproto2.field(17, betterproto2.TYPE_BOOL)
+
+    roi: "bool" = betterproto2.field(18, betterproto2.TYPE_BOOL)
+
+    sw_roi: "bool" = betterproto2.field(19, betterproto2.TYPE_BOOL)
+
+    bytevc1_enable: "bool" = betterproto2.field(20, betterproto2.TYPE_BOOL)
+
+    anchor_client_info: "WebcastDataStreamUrlStreamUrlExtraAnchorClientInfo | None" = (
+        betterproto2.field(21, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    adaption_info: "WebcastDataStreamUrlStreamUrlExtraAdaptionInfo | None" = (
+        betterproto2.field(22, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    business_name: "str" = betterproto2.field(23, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.StreamUrlExtra",
+    WebcastDataStreamUrlStreamUrlExtra,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtraAdaptionInfo(betterproto2.Message):
+    vertical_resize_mode: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.StreamUrlExtra.AdaptionInfo",
+    WebcastDataStreamUrlStreamUrlExtraAdaptionInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtraAnchorClientInfo(betterproto2.Message):
+    custom_info: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.StreamUrlExtra.AnchorClientInfo",
+    WebcastDataStreamUrlStreamUrlExtraAnchorClientInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataStreamUrlStreamUrlExtraSuperResolution(betterproto2.Message):
+    enable: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    strength: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    antialiasing: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.StreamUrl.StreamUrlExtra.SuperResolution",
+    WebcastDataStreamUrlStreamUrlExtraSuperResolution,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSubscribeMember(betterproto2.Message):
+    pay_schema: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sub_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    price_info: "WebcastDataProductPriceStruct | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    subscribe_status: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    valid_start_time: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    valid_end_time: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SubscribeMember", WebcastDataSubscribeMember
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataSubscribeMemberMark(betterproto2.Message):
+    subscribe_member_watch_free: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.SubscribeMemberMark", WebcastDataSubscribeMemberMark
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTeamInfo(betterproto2.Message):
+    team_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    team_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    schema_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    team_icon: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    team_badge: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    team_background: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    system_msg: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    team_id_str: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    team_avatar_box: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TeamInfo", WebcastDataTeamInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTeamStats(betterproto2.Message):
+    team_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    possession: "float" = betterproto2.field(2, betterproto2.TYPE_DOUBLE)
+
+    shot_on: "float" = betterproto2.field(3, betterproto2.TYPE_DOUBLE)
+
+    shot_off: "float" = betterproto2.field(4, betterproto2.TYPE_DOUBLE)
+
+    free_kick: "float" = betterproto2.field(5, betterproto2.TYPE_DOUBLE)
+
+    corner: "float" = betterproto2.field(6, betterproto2.TYPE_DOUBLE)
+
+    counter: "float" = betterproto2.field(7, betterproto2.TYPE_DOUBLE)
+
+    saves: "float" = betterproto2.field(8, betterproto2.TYPE_DOUBLE)
+
+    offside: "float" = betterproto2.field(9, betterproto2.TYPE_DOUBLE)
+
+    foul_commit: "float" = betterproto2.field(10, betterproto2.TYPE_DOUBLE)
+
+    yellow_cards: "float" = betterproto2.field(11, betterproto2.TYPE_DOUBLE)
+
+    red_cards: "float" = betterproto2.field(12, betterproto2.TYPE_DOUBLE)
+
+    pass_: "float" = betterproto2.field(13, betterproto2.TYPE_DOUBLE)
+
+    key_pass: "float" = betterproto2.field(14, betterproto2.TYPE_DOUBLE)
+
+    passes_completed: "float" = betterproto2.field(15, betterproto2.TYPE_DOUBLE)
+
+    steal: "float" = betterproto2.field(16, betterproto2.TYPE_DOUBLE)
+
+    intercept: "float" = betterproto2.field(17, betterproto2.TYPE_DOUBLE)
+
+    shots: "float" = betterproto2.field(18, betterproto2.TYPE_DOUBLE)
+
+    possession_five_min: "float" = betterproto2.field(19, betterproto2.TYPE_DOUBLE)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TeamStats", WebcastDataTeamStats
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataText(betterproto2.Message):
+    key: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    default_pattern: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    default_format: "WebcastDataTextFormat | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pieces: "list[WebcastDataTextPiece]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    schema_infos: "dict[str, WebcastDataSchemaInfo]" = betterproto2.field(
+        20,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.Text", WebcastDataText)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextFormat(betterproto2.Message):
+    color: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    bold: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    italic: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    weight: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    italic_angle: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    font_size: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    use_heigh_light_color: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+    use_remote_clor: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+    ignore_color_mapping: "bool" = betterproto2.field(9, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TextFormat", WebcastDataTextFormat
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPiece(betterproto2.Message):
+    type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    format: "WebcastDataTextFormat | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    value_ref: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    string_value: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    user_value: "WebcastDataTextPieceUser | None" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    gift_value: "WebcastDataTextPieceGift | None" = betterproto2.field(
+        22, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    heart_value: "WebcastDataTextPieceHeart | None" = betterproto2.field(
+        23, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pattern_ref_value: "WebcastDataTextPiecePatternRef | None" = betterproto2.field(
+        24, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    image_value: "WebcastDataTextPieceImage | None" = betterproto2.field(
+        25, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    schema_key: "str" = betterproto2.field(100, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TextPiece", WebcastDataTextPiece
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceGift(betterproto2.Message):
+    gift_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    name_ref: "WebcastDataPatternRef | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TextPieceGift", WebcastDataTextPieceGift
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceHeart(betterproto2.Message):
+    color: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TextPieceHeart", WebcastDataTextPieceHeart
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceImage(betterproto2.Message):
+    image: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    scaling_rate: "float" = betterproto2.field(2, betterproto2.TYPE_FLOAT)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TextPieceImage", WebcastDataTextPieceImage
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPiecePatternRef(betterproto2.Message):
+    key: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    default_pattern: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TextPiecePatternRef", WebcastDataTextPiecePatternRef
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTextPieceUser(betterproto2.Message):
+    user: "WebcastDataUser | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    with_colon: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    self_show_real_name: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    left_show_extension: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    left_additional_content: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    right_additional_content: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TextPieceUser", WebcastDataTextPieceUser
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTicketData(betterproto2.Message):
+    ticket_session_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    sub_title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    price: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    raw_release_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    tags: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    ticket_explanation_card_jump_url: "str" = betterproto2.field(
+        7, betterproto2.TYPE_STRING
+    )
+
+    ticket_panel_jump_url: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    ticket_session_id_str: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    sell_status: "int" = betterproto2.field(10, betterproto2.TYPE_INT32)
+
+    cover_uri: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    cover_uri_vertical: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    introduction: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    raw_show_start_time: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    raw_show_end_time: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    raw_sale_start_time: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    raw_sale_end_time: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    raw_refund_deadline: "int" = betterproto2.field(18, betterproto2.TYPE_UINT64)
+
+    raw_early_bird_start_time: "int" = betterproto2.field(19, betterproto2.TYPE_UINT64)
+
+    raw_early_bird_end_time: "int" = betterproto2.field(20, betterproto2.TYPE_UINT64)
+
+    raw_full_price_start_time: "int" = betterproto2.field(21, betterproto2.TYPE_UINT64)
+
+    raw_full_price_end_time: "int" = betterproto2.field(22, betterproto2.TYPE_UINT64)
+
+    raw_activity_start_time: "int" = betterproto2.field(23, betterproto2.TYPE_UINT64)
+
+    raw_activity_end_time: "int" = betterproto2.field(24, betterproto2.TYPE_UINT64)
+
+    early_bird_price: "str" = betterproto2.field(25, betterproto2.TYPE_STRING)
+
+    activity_price: "str" = betterproto2.field(26, betterproto2.TYPE_STRING)
+
+    status: "int" = betterproto2.field(27, betterproto2.TYPE_INT32)
+
+    show_start_time: "str" = betterproto2.field(28, betterproto2.TYPE_STRING)
+
+    show_end_time: "str" = betterproto2.field(29, betterproto2.TYPE_STRING)
+
+    sale_start_time: "str" = betterproto2.field(30, betterproto2.TYPE_STRING)
+
+    sale_end_time: "str" = betterproto2.field(31, betterproto2.TYPE_STRING)
+
+    early_bird_start_time: "str" = betterproto2.field(32, betterproto2.TYPE_STRING)
+
+    early_bird_end_time: "str" = betterproto2.field(33, betterproto2.TYPE_STRING)
+
+    full_price_start_time: "str" = betterproto2.field(34, betterproto2.TYPE_STRING)
+
+    full_price_end_time: "str" = betterproto2.field(35, betterproto2.TYPE_STRING)
+
+    activity_start_time: "str" = betterproto2.field(36, betterproto2.TYPE_STRING)
+
+    activity_end_time: "str" = betterproto2.field(37, betterproto2.TYPE_STRING)
+
+    refund_deadline: "str" = betterproto2.field(38, betterproto2.TYPE_STRING)
+
+    activity_title: "str" = betterproto2.field(39, betterproto2.TYPE_STRING)
+
+    activity_jump_url: "str" = betterproto2.field(40, betterproto2.TYPE_STRING)
+
+    release_time: "str" = betterproto2.field(41, betterproto2.TYPE_STRING)
+
+    ticket_explanation_card_status: "int" = betterproto2.field(
+        42, betterproto2.TYPE_INT32
+    )
+
+    last_duration: "int" = betterproto2.field(43, betterproto2.TYPE_INT32)
+
+    paid_conversion_jump_url: "str" = betterproto2.field(44, betterproto2.TYPE_STRING)
+
+    ticket_panel_six_jump_url: "str" = betterproto2.field(45, betterproto2.TYPE_STRING)
+
+    ticket_panel_nine_jump_url: "str" = betterproto2.field(46, betterproto2.TYPE_STRING)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        47, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ios_pay_type: "int" = betterproto2.field(48, betterproto2.TYPE_INT32)
+
+    android_pay_type: "int" = betterproto2.field(49, betterproto2.TYPE_INT32)
+
+    ios_pay_price: "int" = betterproto2.field(50, betterproto2.TYPE_INT32)
+
+    android_pay_price: "int" = betterproto2.field(51, betterproto2.TYPE_INT32)
+
+    right_duration: "int" = betterproto2.field(52, betterproto2.TYPE_INT32)
+
+    friend_priceInfo: "WebcastDataPaidLivePriceInfo | None" = betterproto2.field(
+        53, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    helping_priceInfo: "WebcastDataPaidLivePriceInfo | None" = betterproto2.field(
+        54, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    price_info: "dict[int, WebcastDataTicketDataPaidLivePriceInfoV2]" = (
+        betterproto2.field(
+            55,
+            betterproto2.TYPE_MAP,
+            map_meta=betterproto2.map_meta(
+                betterproto2.TYPE_INT64, betterproto2.TYPE_MESSAGE
+            ),
+        )
+    )
+
+    ticket_anchor_id: "int" = betterproto2.field(56, betterproto2.TYPE_UINT64)
+
+    extra: "str" = betterproto2.field(57, betterproto2.TYPE_STRING)
+
+    sku_details: "list[WebcastDataTicketDataTicketSkuDetail]" = betterproto2.field(
+        58, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    final_price_info: "WebcastDataTicketDataPaidLivePriceInfoV2 | None" = (
+        betterproto2.field(59, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    parent_ticket_session_id: "int" = betterproto2.field(60, betterproto2.TYPE_UINT64)
+
+    parent_ticket_session_id_str: "str" = betterproto2.field(
+        61, betterproto2.TYPE_STRING
+    )
+
+    ticket_category: "int" = betterproto2.field(62, betterproto2.TYPE_INT32)
+
+    prepay_cashier_jump_url: "str" = betterproto2.field(63, betterproto2.TYPE_STRING)
+
+    subscribe_member_mark: "WebcastDataSubscribeMemberMark | None" = betterproto2.field(
+        64, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ticket_anchor_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TicketData", WebcastDataTicketData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTicketDataPaidLivePriceInfoV2(betterproto2.Message):
+    amount: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    currency: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    pos: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    pay_type: "list[int]" = betterproto2.field(
+        4, betterproto2.TYPE_INT32, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.TicketData.PaidLivePriceInfoV2",
+    WebcastDataTicketDataPaidLivePriceInfoV2,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTicketDataTicketSkuDetail(betterproto2.Message):
+    ticket_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    ticket_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    start_sell_time: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    closing_sell_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    sell_status: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    price_info: "WebcastDataTicketDataPaidLivePriceInfoV2 | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dou_price_info: "WebcastDataTicketDataPaidLivePriceInfoV2 | None" = (
+        betterproto2.field(7, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    sku_id: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.TicketData.TicketSkuDetail",
+    WebcastDataTicketDataTicketSkuDetail,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTitleIcon(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    size_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TitleIcon", WebcastDataTitleIcon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToast(betterproto2.Message):
+    start_time: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    content: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    schema: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    toast_id: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.Toast", WebcastDataToast)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarBizSkin(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToolbarBizSkin", WebcastDataToolbarBizSkin
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolBarComponentData(betterproto2.Message):
+    group_id: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    component_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    op_type: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    text: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    schema_url: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    show_type: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    data_status: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    extra: "str" = betterproto2.field(99, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToolBarComponentData", WebcastDataToolBarComponentData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolBarData(betterproto2.Message):
+    entrance_list: "list[WebcastDataToolBarComponentData]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    more_panel: "list[WebcastDataToolBarComponentData]" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    max_entrance_cnt: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    landscape_up_right: "list[WebcastDataToolBarComponentData]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    skin_resource: "dict[int, WebcastDataComponentSkin]" = betterproto2.field(
+        5,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    max_entrance_cnt_landscape: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    permutation: "WebcastDataToolbarPermutation | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    extra_info: "WebcastDataToolbarExtraInfo | None" = betterproto2.field(
+        100, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToolBarData", WebcastDataToolBarData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarExtraInfo(betterproto2.Message):
+    game_promotion_coexist: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToolbarExtraInfo", WebcastDataToolbarExtraInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarItemConfig(betterproto2.Message):
+    toolbar_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    jump_schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    display_type: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    dynamic_icon: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon_vertical: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dynamic_bottom_icon: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    bottom_icon: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    toast_list: "list[WebcastDataToast]" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    extra: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToolbarItemConfig", WebcastDataToolbarItemConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarPermutation(betterproto2.Message):
+    vertical: "WebcastDataToolbarPermutationRule | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    landscape: "WebcastDataToolbarPermutationRule | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    general: "WebcastDataToolbarPermutationRule | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    on_demand_component_list: "list[int]" = betterproto2.field(
+        4, betterproto2.TYPE_INT32, repeated=True
+    )
+
+    block_component_list: "list[WebcastDataBlockComponent]" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToolbarPermutation", WebcastDataToolbarPermutation
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToolbarPermutationRule(betterproto2.Message):
+    group_priority: "list[int]" = betterproto2.field(
+        1, betterproto2.TYPE_INT32, repeated=True
+    )
+
+    component_sequence: "list[int]" = betterproto2.field(
+        2, betterproto2.TYPE_INT32, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToolbarPermutation.Rule", WebcastDataToolbarPermutationRule
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTopFan(betterproto2.Message):
+    fan_ticket: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    user: "WebcastDataUser | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TopFan", WebcastDataTopFan
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataToutiaoMatchData(betterproto2.Message):
+    match_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    match_title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    against: "WebcastDataAgainst | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    started_time: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    city: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    venue_name: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    referee: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    team_stats: "WebcastDataTeamStats | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    player_stats: "list[WebcastDataPlayerStats]" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    match_group: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    match_round: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    match_phase_name: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    can_subscribe: "bool" = betterproto2.field(13, betterproto2.TYPE_BOOL)
+
+    display_status: "int" = betterproto2.field(14, betterproto2.TYPE_INT32)
+
+    bjt_format: "str" = betterproto2.field(15, betterproto2.TYPE_STRING)
+
+    local_time_format: "str" = betterproto2.field(16, betterproto2.TYPE_STRING)
+
+    live_status: "int" = betterproto2.field(17, betterproto2.TYPE_INT32)
+
+    match_status: "int" = betterproto2.field(18, betterproto2.TYPE_INT32)
+
+    match_id_str: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    started_time_unix: "int" = betterproto2.field(20, betterproto2.TYPE_UINT64)
+
+    left_score_addition: "int" = betterproto2.field(21, betterproto2.TYPE_INT32)
+
+    right_score_addition: "int" = betterproto2.field(22, betterproto2.TYPE_INT32)
+
+    duration: "str" = betterproto2.field(23, betterproto2.TYPE_STRING)
+
+    event_ids: "list[int]" = betterproto2.field(
+        24, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    winner_id: "int" = betterproto2.field(25, betterproto2.TYPE_UINT64)
+
+    winner_id_str: "str" = betterproto2.field(26, betterproto2.TYPE_STRING)
+
+    winner_icon: "WebcastDataImage | None" = betterproto2.field(
+        27, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    event_name: "str" = betterproto2.field(28, betterproto2.TYPE_STRING)
+
+    bo_num: "str" = betterproto2.field(29, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.ToutiaoMatchData", WebcastDataToutiaoMatchData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataTvStation(betterproto2.Message):
+    is_idle: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    state_desc: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.TVStation", WebcastDataTvStation
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUnionLiveInfo(betterproto2.Message):
+    guest_anchors: "list[WebcastDataUnionLiveInfoGuestAnchor]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    avatar_description: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    fixed_sort: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    tag: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    type: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.UnionLiveInfo", WebcastDataUnionLiveInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUnionLiveInfoGuestAnchor(betterproto2.Message):
+    user: "WebcastDataUser | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tag: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    status: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.UnionLiveInfo.GuestAnchor",
+    WebcastDataUnionLiveInfoGuestAnchor,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUpperRightWidgetData(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    widget_type: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    extra: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    priority: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.UpperRightWidgetData", WebcastDataUpperRightWidgetData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUser(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    short_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    nickname: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    gender: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    signature: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    level: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    birthday: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    telephone: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    avatar_thumb: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_medium: "WebcastDataImage | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_large: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    verified: "bool" = betterproto2.field(12, betterproto2.TYPE_BOOL)
+
+    experience: "int" = betterproto2.field(13, betterproto2.TYPE_INT32)
+
+    city: "str" = betterproto2.field(14, betterproto2.TYPE_STRING)
+
+    status: "int" = betterproto2.field(15, betterproto2.TYPE_INT32)
+
+    create_time: "int" = betterproto2.field(16, betterproto2.TYPE_UINT64)
+
+    modify_time: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    secret: "int" = betterproto2.field(18, betterproto2.TYPE_INT32)
+
+    share_qrcode_uri: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    income_share_percent: "int" = betterproto2.field(20, betterproto2.TYPE_INT32)
+
+    badge_image_list: "list[WebcastDataImage]" = betterproto2.field(
+        21, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    follow_info: "WebcastDataUserFollowInfo | None" = betterproto2.field(
+        22, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pay_grade: "WebcastDataUserPayGrade | None" = betterproto2.field(
+        23, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    fans_club: "WebcastDataUserFansClub | None" = betterproto2.field(
+        24, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    border: "WebcastDataUserBorder | None" = betterproto2.field(
+        25, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    special_id: "str" = betterproto2.field(26, betterproto2.TYPE_STRING)
+
+    avatar_border: "WebcastDataImage | None" = betterproto2.field(
+        27, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    medal: "WebcastDataImage | None" = betterproto2.field(
+        28, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    real_time_icons: "list[WebcastDataImage]" = betterproto2.field(
+        29, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    new_real_time_icons: "list[WebcastDataImage]" = betterproto2.field(
+        30, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    top_vip_no: "int" = betterproto2.field(31, betterproto2.TYPE_UINT64)
+
+    user_attr: "WebcastDataUserUserAttr | None" = betterproto2.field(
+        32, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    own_room: "WebcastDataUserOwnRoom | None" = betterproto2.field(
+        33, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pay_score: "int" = betterproto2.field(34, betterproto2.TYPE_UINT64)
+
+    ticket_count: "int" = betterproto2.field(35, betterproto2.TYPE_UINT64)
+
+    anchor_info: "WebcastDataUserAnchorInfo | None" = betterproto2.field(
+        36, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    link_mic_stats: "int" = betterproto2.field(37, betterproto2.TYPE_INT32)
+
+    display_id: "str" = betterproto2.field(38, betterproto2.TYPE_STRING)
+
+    with_commerce_permission: "bool" = betterproto2.field(39, betterproto2.TYPE_BOOL)
+
+    with_fusion_shop_entry: "bool" = betterproto2.field(40, betterproto2.TYPE_BOOL)
+
+    total_recharge_diamond_count: "int" = betterproto2.field(
+        41, betterproto2.TYPE_UINT64
+    )
+
+    webcast_anchor_level: "WebcastDataUserAnchorLevel | None" = betterproto2.field(
+        42, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    verified_content: "str" = betterproto2.field(43, betterproto2.TYPE_STRING)
+
+    author_stats: "WebcastDataUserAuthorStats | None" = betterproto2.field(
+        44, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    top_fans: "list[WebcastDataUser]" = betterproto2.field(
+        45, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    sec_uid: "str" = betterproto2.field(46, betterproto2.TYPE_STRING)
+
+    user_role: "int" = betterproto2.field(47, betterproto2.TYPE_INT32)
+
+    xigua_info: "WebcastDataUserXiguaParams | None" = betterproto2.field(
+        48, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    activity_reward: "WebcastDataUserActivityInfo | None" = betterproto2.field(
+        49, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    noble_info: "WebcastDataUserNobleLevelInfo | None" = betterproto2.field(
+        50, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    brotherhood_info: "WebcastDataUserBrotherhoodInfo | None" = betterproto2.field(
+        51, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    personal_card: "WebcastDataImage | None" = betterproto2.field(
+        52, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    authentication_info: "WebcastDataUserAuthenticationInfo | None" = (
+        betterproto2.field(53, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    authorization_info: "int" = betterproto2.field(54, betterproto2.TYPE_INT32)
+
+    adversary_authorization_info: "int" = betterproto2.field(
+        55, betterproto2.TYPE_INT32
+    )
+
+    poi_info: "WebcastDataUserPoiInfo | None" = betterproto2.field(
+        56, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    media_badge_image_list: "list[WebcastDataImage]" = betterproto2.field(
+        57, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    adversary_user_status: "int" = betterproto2.field(58, betterproto2.TYPE_INT32)
+
+    user_vip_info: "WebcastDataUserVipInfo | None" = betterproto2.field(
+        59, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    commerce_webcast_config_ids: "list[int]" = betterproto2.field(
+        60, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    badge_image_list_v2: "list[WebcastDataImage]" = betterproto2.field(
+        61, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    industry_certification: "WebcastDataIndustryCertification | None" = (
+        betterproto2.field(62, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    location_city: "str" = betterproto2.field(63, betterproto2.TYPE_STRING)
+
+    fans_group_info: "WebcastDataUserFansGroupInfo | None" = betterproto2.field(
+        64, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    remark_name: "str" = betterproto2.field(65, betterproto2.TYPE_STRING)
+
+    mystery_man: "int" = betterproto2.field(66, betterproto2.TYPE_INT32)
+
+    web_rid: "str" = betterproto2.field(67, betterproto2.TYPE_STRING)
+
+    desensitized_nickname: "str" = betterproto2.field(68, betterproto2.TYPE_STRING)
+
+    j_accredit_info: "WebcastDataUserJAccreditInfo | None" = betterproto2.field(
+        69, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    subscribe: "WebcastDataUserSubscribe | None" = betterproto2.field(
+        70, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    is_anonymous: "bool" = betterproto2.field(71, betterproto2.TYPE_BOOL)
+
+    consume_diamond_level: "int" = betterproto2.field(72, betterproto2.TYPE_INT32)
+
+    webcast_uid: "str" = betterproto2.field(73, betterproto2.TYPE_STRING)
+
+    profile_style_params: "WebcastDataUserProfileStyleParams | None" = (
+        betterproto2.field(74, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    user_dress_info: "WebcastDataUserUserDressInfo | None" = betterproto2.field(
+        75, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    biz_relation: "WebcastDataUserBizRelation | None" = betterproto2.field(
+        76, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    member_entrance_info: "WebcastDataMemberEntranceInfo | None" = betterproto2.field(
+        77, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    public_area_badge_info: "WebcastDataUserPublicAreaBadgeInfo | None" = (
+        betterproto2.field(78, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    extra_info: "WebcastDataUserExtraInfo | None" = betterproto2.field(
+        79, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    user_setting_info: "WebcastDataUserUserSettingInfo | None" = betterproto2.field(
+        80, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    public_area_oper_freq: "int" = betterproto2.field(81, betterproto2.TYPE_UINT64)
+
+    user_permission_grant_info: "WebcastDataUserUserPermissionGrant | None" = (
+        betterproto2.field(82, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    user_canceled: "bool" = betterproto2.field(83, betterproto2.TYPE_BOOL)
+
+    allow_be_located: "bool" = betterproto2.field(1001, betterproto2.TYPE_BOOL)
+
+    allow_find_by_contacts: "bool" = betterproto2.field(1002, betterproto2.TYPE_BOOL)
+
+    allow_others_download_video: "bool" = betterproto2.field(
+        1003, betterproto2.TYPE_BOOL
+    )
+
+    allow_others_download_when_sharing_video: "bool" = betterproto2.field(
+        1004, betterproto2.TYPE_BOOL
+    )
+
+    allow_share_show_profile: "bool" = betterproto2.field(1005, betterproto2.TYPE_BOOL)
+
+    allow_show_in_gossip: "bool" = betterproto2.field(1006, betterproto2.TYPE_BOOL)
+
+    allow_show_my_action: "bool" = betterproto2.field(1007, betterproto2.TYPE_BOOL)
+
+    allow_strange_comment: "bool" = betterproto2.field(1008, betterproto2.TYPE_BOOL)
+
+    allow_unfollower_comment: "bool" = betterproto2.field(1009, betterproto2.TYPE_BOOL)
+
+    allow_use_linkmic: "bool" = betterproto2.field(1010, betterproto2.TYPE_BOOL)
+
+    anchor_level: "WebcastDataUserAnchorLevel | None" = betterproto2.field(
+        1011, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_jpg: "WebcastDataImage | None" = betterproto2.field(
+        1012, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    bg_img_url: "str" = betterproto2.field(1013, betterproto2.TYPE_STRING)
+
+    birthday_description: "str" = betterproto2.field(1014, betterproto2.TYPE_STRING)
+
+    birthday_valid: "bool" = betterproto2.field(1015, betterproto2.TYPE_BOOL)
+
+    block_status: "int" = betterproto2.field(1016, betterproto2.TYPE_INT32)
+
+    comment_restrict: "int" = betterproto2.field(1017, betterproto2.TYPE_INT32)
+
+    constellation: "str" = betterproto2.field(1018, betterproto2.TYPE_STRING)
+
+    disable_ichat: "int" = betterproto2.field(1019, betterproto2.TYPE_INT32)
+
+    enable_ichat_img: "int" = betterproto2.field(1020, betterproto2.TYPE_UINT64)
+
+    exp: "int" = betterproto2.field(1021, betterproto2.TYPE_INT32)
+
+    fan_ticket_count: "int" = betterproto2.field(1022, betterproto2.TYPE_UINT64)
+
+    fold_stranger_chat: "bool" = betterproto2.field(1023, betterproto2.TYPE_BOOL)
+
+    follow_status: "int" = betterproto2.field(1024, betterproto2.TYPE_UINT64)
+
+    hotsoon_verified: "bool" = betterproto2.field(1025, betterproto2.TYPE_BOOL)
+
+    hotsoon_verified_reason: "str" = betterproto2.field(1026, betterproto2.TYPE_STRING)
+
+    ichat_restrict_type: "int" = betterproto2.field(1027, betterproto2.TYPE_INT32)
+
+    id_str: "str" = betterproto2.field(1028, betterproto2.TYPE_STRING)
+
+    is_follower: "bool" = betterproto2.field(1029, betterproto2.TYPE_BOOL)
+
+    is_following: "bool" = betterproto2.field(1030, betterproto2.TYPE_BOOL)
+
+    need_profile_guide: "bool" = betterproto2.field(1031, betterproto2.TYPE_BOOL)
+
+    pay_scores: "int" = betterproto2.field(1032, betterproto2.TYPE_UINT64)
+
+    push_comment_status: "bool" = betterproto2.field(1033, betterproto2.TYPE_BOOL)
+
+    push_digg: "bool" = betterproto2.field(1034, betterproto2.TYPE_BOOL)
+
+    push_follow: "bool" = betterproto2.field(1035, betterproto2.TYPE_BOOL)
+
+    push_friend_action: "bool" = betterproto2.field(1036, betterproto2.TYPE_BOOL)
+
+    push_ichat: "bool" = betterproto2.field(1037, betterproto2.TYPE_BOOL)
+
+    push_status: "bool" = betterproto2.field(1038, betterproto2.TYPE_BOOL)
+
+    push_video_post: "bool" = betterproto2.field(1039, betterproto2.TYPE_BOOL)
+
+    push_video_recommend: "bool" = betterproto2.field(1040, betterproto2.TYPE_BOOL)
+
+    stats: "WebcastDataUserUserStats | None" = betterproto2.field(
+        1041, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    verified_mobile: "bool" = betterproto2.field(1042, betterproto2.TYPE_BOOL)
+
+    verified_reason: "str" = betterproto2.field(1043, betterproto2.TYPE_STRING)
+
+    with_car_management_permission: "bool" = betterproto2.field(
+        1044, betterproto2.TYPE_BOOL
+    )
+
+    age_range: "int" = betterproto2.field(1045, betterproto2.TYPE_INT32)
+
+    watch_duration_month: "int" = betterproto2.field(1046, betterproto2.TYPE_UINT64)
+
+    foreign_user: "int" = betterproto2.field(1047, betterproto2.TYPE_INT32)
+
+    bottom_entry: "WebcastDataUserBottomEntry | None" = betterproto2.field(
+        1048, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    user_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+    host_info: "WebcastDataOpenHostInfo | None" = betterproto2.field(
+        5001, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.User", WebcastDataUser)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserActivityInfo(betterproto2.Message):
+    badge: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    story_tag: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.ActivityInfo", WebcastDataUserActivityInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAnchorInfo(betterproto2.Message):
+    level: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.AnchorInfo", WebcastDataUserAnchorInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAnchorLevel(betterproto2.Message):
+    level: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    experience: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    lowest_experience_this_level: "int" = betterproto2.field(
+        3, betterproto2.TYPE_UINT64
+    )
+
+    highest_experience_this_level: "int" = betterproto2.field(
+        4, betterproto2.TYPE_UINT64
+    )
+
+    task_start_experience: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    task_start_time: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    task_decrease_experience: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    task_target_experience: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    task_end_time: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    profile_dialog_bg: "WebcastDataImage | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    profile_dialog_bg_back: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    stage_level: "WebcastDataImage | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    small_icon: "WebcastDataImage | None" = betterproto2.field(
+        13, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.AnchorLevel", WebcastDataUserAnchorLevel
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAuthenticationInfo(betterproto2.Message):
+    custom_verify: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    enterprise_verify_reason: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    authentication_badge: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    level_list: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    account_type_info: "WebcastDataUserAuthenticationInfoAccountTypeInfo | None" = (
+        betterproto2.field(10, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    authentication_badge_v2: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    account_cert_info: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.AuthenticationInfo", WebcastDataUserAuthenticationInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAuthenticationInfoAccountTypeInfo(betterproto2.Message):
+    account_type_map: "dict[int, bool]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(betterproto2.TYPE_INT64, betterproto2.TYPE_BOOL),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.AuthenticationInfo.AccountTypeInfo",
+    WebcastDataUserAuthenticationInfoAccountTypeInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserAuthorStats(betterproto2.Message):
+    video_total_count: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    video_total_play_count: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    video_total_share_count: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    video_total_series_count: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    variety_show_play_count: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    video_total_favorite_count: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.AuthorStats", WebcastDataUserAuthorStats
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserBizRelation(betterproto2.Message):
+    shop_fans_club_reverse: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.BizRelation", WebcastDataUserBizRelation
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserBorder(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    level: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    thumb_icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    dress_id: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.Border", WebcastDataUserBorder
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserBottomEntry(betterproto2.Message):
+    status: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    icon: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    schema: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    mystery_man: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    grade_level: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    hide_grade_level: "bool" = betterproto2.field(7, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.BottomEntry", WebcastDataUserBottomEntry
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserBrotherhoodInfo(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    level: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    background: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    font_color: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.BrotherhoodInfo", WebcastDataUserBrotherhoodInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserExtraInfo(betterproto2.Message):
+    is_contract: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.ExtraInfo", WebcastDataUserExtraInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansClub(betterproto2.Message):
+    data: "WebcastDataUserFansClubFansClubData | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    prefer_data: "dict[int, WebcastDataUserFansClubFansClubData]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.FansClub", WebcastDataUserFansClub
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansClubFansClubData(betterproto2.Message):
+    club_name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    level: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    user_fans_club_status: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    badge: "WebcastDataUserFansClubFansClubDataUserBadge | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    available_gift_ids: "list[int]" = betterproto2.field(
+        5, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    anchor_id: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    badge_type: "int" = betterproto2.field(7, betterproto2.TYPE_INT32)
+
+    user_guard_status: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    guard_expired_time: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    anchor_open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.FansClub.FansClubData",
+    WebcastDataUserFansClubFansClubData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansClubFansClubDataUserBadge(betterproto2.Message):
+    icons: "dict[int, WebcastDataImage]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT32, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.FansClub.FansClubData.UserBadge",
+    WebcastDataUserFansClubFansClubDataUserBadge,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFansGroupInfo(betterproto2.Message):
+    list_fans_group_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.FansGroupInfo", WebcastDataUserFansGroupInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserFollowInfo(betterproto2.Message):
+    following_count: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    follower_count: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    follow_status: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    push_status: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    remark_name: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    follower_count_str: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    following_count_str: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    invalid_follow_status: "bool" = betterproto2.field(8, betterproto2.TYPE_BOOL)
+
+    follwer_count_display: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.FollowInfo", WebcastDataUserFollowInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserJAccreditInfo(betterproto2.Message):
+    j_accredit_basic: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    j_accredit_advance: "int" = betterproto2.field(2, betterproto2.TYPE_INT32)
+
+    j_accredit_content: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    j_accredit_live: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.JAccreditInfo", WebcastDataUserJAccreditInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserNobleLevelInfo(betterproto2.Message):
+    noble_background: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    noble_level: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    noble_icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    noble_name: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    expire_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    noble_big_icon: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    noble_icon_with_back: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    noble_boarder: "WebcastDataImage | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    noble_background_color: "list[str]" = betterproto2.field(
+        9, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.NobleLevelInfo", WebcastDataUserNobleLevelInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserOwnRoom(betterproto2.Message):
+    room_ids: "list[int]" = betterproto2.field(
+        1, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    room_ids_str: "list[str]" = betterproto2.field(
+        2, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    room_ids_display: "list[int]" = betterproto2.field(
+        3, betterproto2.TYPE_INT32, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.OwnRoom", WebcastDataUserOwnRoom
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPayGrade(betterproto2.Message):
+    total_diamond_count: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    diamond_icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    name: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    next_name: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    level: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    next_icon: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    next_diamond: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    now_diamond: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    this_grade_min_diamond: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    this_grade_max_diamond: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    pay_diamond_bak: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    grade_describe: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    grade_icon_list: "list[WebcastDataUserPayGradeGradeIcon]" = betterproto2.field(
+        14, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    screen_chat_type: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    im_icon: "WebcastDataImage | None" = betterproto2.field(
+        16, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    im_icon_with_level: "WebcastDataImage | None" = betterproto2.field(
+        17, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    live_icon: "WebcastDataImage | None" = betterproto2.field(
+        18, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    new_im_icon_with_level: "WebcastDataImage | None" = betterproto2.field(
+        19, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    new_live_icon: "WebcastDataImage | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    upgrade_need_consume: "int" = betterproto2.field(21, betterproto2.TYPE_UINT64)
+
+    next_privileges: "str" = betterproto2.field(22, betterproto2.TYPE_STRING)
+
+    background: "WebcastDataImage | None" = betterproto2.field(
+        23, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background_back: "WebcastDataImage | None" = betterproto2.field(
+        24, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    score: "int" = betterproto2.field(25, betterproto2.TYPE_UINT64)
+
+    buff_info: "WebcastDataGradeBuffInfo | None" = betterproto2.field(
+        26, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    grade_describe_shining: "bool" = betterproto2.field(27, betterproto2.TYPE_BOOL)
+
+    in_rebirth: "bool" = betterproto2.field(28, betterproto2.TYPE_BOOL)
+
+    recent_consume_badge: "WebcastDataImage | None" = betterproto2.field(
+        29, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    grade_banner: "str" = betterproto2.field(1001, betterproto2.TYPE_STRING)
+
+    profile_dialog_bg: "WebcastDataImage | None" = betterproto2.field(
+        1002, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    profile_dialog_bg_back: "WebcastDataImage | None" = betterproto2.field(
+        1003, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.PayGrade", WebcastDataUserPayGrade
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPayGradeGradeIcon(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon_diamond: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    level: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    level_str: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.PayGrade.GradeIcon", WebcastDataUserPayGradeGradeIcon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPoiInfo(betterproto2.Message):
+    is_poi_enabled: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    poi_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    poi_name: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    poi_id_str: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    follower_count_permission: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    white_user_permission: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.PoiInfo", WebcastDataUserPoiInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserProfileStyleParams(betterproto2.Message):
+    profile_style: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    smart_switch: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.ProfileStyleParams", WebcastDataUserProfileStyleParams
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPublicAreaBadgeInfo(betterproto2.Message):
+    badge_info_map: "dict[int, WebcastDataImage]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    badge_list: "list[int]" = betterproto2.field(
+        2, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    webcast_dsl_badge_list: "list[WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeList]" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.PublicAreaBadgeInfo",
+    WebcastDataUserPublicAreaBadgeInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeList(betterproto2.Message):
+    badge_list: "list[int]" = betterproto2.field(
+        1, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    target_dsl_rule: "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    filter_dsl_rule: "WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.PublicAreaBadgeInfo.WebcastDslBadgeList",
+    WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeList,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule(
+    betterproto2.Message
+):
+    app_id: "list[int]" = betterproto2.field(1, betterproto2.TYPE_UINT64, repeated=True)
+
+    version_code: "list[int]" = betterproto2.field(
+        2, betterproto2.TYPE_UINT64, repeated=True
+    )
+
+    ab_params: "dict[str, str]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.PublicAreaBadgeInfo.WebcastDslBadgeList.DslRule",
+    WebcastDataUserPublicAreaBadgeInfoWebcastDslBadgeListDslRule,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserSubscribe(betterproto2.Message):
+    is_member: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    level: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    identity_type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    buy_type: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    open: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.Subscribe", WebcastDataUserSubscribe
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserAttr(betterproto2.Message):
+    is_muted: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    is_admin: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    is_super_admin: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    admin_privileges: "list[int]" = betterproto2.field(
+        4, betterproto2.TYPE_INT32, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.UserAttr", WebcastDataUserUserAttr
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserDressInfo(betterproto2.Message):
+    dress_wear_ids: "list[str]" = betterproto2.field(
+        1, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    dress_own_ids: "list[str]" = betterproto2.field(
+        2, betterproto2.TYPE_STRING, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.UserDressInfo", WebcastDataUserUserDressInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserPermissionGrant(betterproto2.Message):
+    hide_on_private_room: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.UserPermissionGrant",
+    WebcastDataUserUserPermissionGrant,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserSettingInfo(betterproto2.Message):
+    live_visitor_switch: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.UserSettingInfo", WebcastDataUserUserSettingInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserUserStats(betterproto2.Message):
+    id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    following_count: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    follower_count: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    record_count: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    total_duration: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    daily_fan_ticket_count: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    daily_income: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    item_count: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    favorite_item_count: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    diamond_count: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    diamond_consumed_count: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    tuwen_item_count: "int" = betterproto2.field(13, betterproto2.TYPE_UINT64)
+
+    open_id: "str" = betterproto2.field(5000, betterproto2.TYPE_STRING)
+
+    open_id_str: "str" = betterproto2.field(5001, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.UserStats", WebcastDataUserUserStats
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserXiguaParams(betterproto2.Message):
+    user_auth_info: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    ugc_publish_media_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    media_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    author_desc: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    description: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    user_verified: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    user_extend_info: "WebcastDataUserXiguaParamsUserExtendInfo | None" = (
+        betterproto2.field(7, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    xigua_uid: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    nick_name: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+    avatar_thumb: "WebcastDataImage | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_medium: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    avatar_large: "WebcastDataImage | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.User.XiguaParams", WebcastDataUserXiguaParams
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserXiguaParamsUserExtendInfo(betterproto2.Message):
+    share_url: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    r_schema_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    rocket_schema_info: "WebcastDataUserXiguaParamsUserExtendInfoRocketSchema | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.XiguaParams.UserExtendInfo",
+    WebcastDataUserXiguaParamsUserExtendInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserXiguaParamsUserExtendInfoRocketSchema(betterproto2.Message):
+    r_schema: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    r_token: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    download_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.User.XiguaParams.UserExtendInfo.RocketSchema",
+    WebcastDataUserXiguaParamsUserExtendInfoRocketSchema,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserVipInfo(betterproto2.Message):
+    vip_level: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    vip_level_name: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    status: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    start_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    remaining_days: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    total_consume: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    target_consume: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    badge: "WebcastDataVipBadge | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    privileges: "dict[int, bool]" = betterproto2.field(
+        10,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(betterproto2.TYPE_INT64, betterproto2.TYPE_BOOL),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.UserVIPInfo", WebcastDataUserVipInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataUserWorldChatInfo(betterproto2.Message):
+    enable: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    input_tip_text: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.UserWorldChatInfo", WebcastDataUserWorldChatInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVerticalTypeInfo(betterproto2.Message):
+    name: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    tab_type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    tag_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    is_sub_tag: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    valid_time: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    priority: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    extra: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    event_extra: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VerticalTypeInfo", WebcastDataVerticalTypeInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVipBadge(betterproto2.Message):
+    icons: "dict[int, WebcastDataImage]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_INT64, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VIPBadge", WebcastDataVipBadge
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVipData(betterproto2.Message):
+    vip_room: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VipData", WebcastDataVipData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVrInfo(betterproto2.Message):
+    vr_transfer_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    stream_mapping: "dict[str, int]" = betterproto2.field(
+        2,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_INT64
+        ),
+    )
+
+    vr_sixdof_transfer_info: "WebcastDataVrInfoVrSixdofTransferInfo | None" = (
+        betterproto2.field(3, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VrInfo", WebcastDataVrInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVrInfoVrSixdofTransferInfo(betterproto2.Message):
+    material_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    material_url: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    layer_status: "dict[str, int]" = betterproto2.field(
+        3,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_INT64
+        ),
+    )
+
+    stream_layout_version: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.VrInfo.VrSixdofTransferInfo",
+    WebcastDataVrInfoVrSixdofTransferInfo,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsBar(betterproto2.Message):
+    item_comment: "WebcastDataVsItemBar | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    item_bar: "WebcastDataVsItemBar | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message("douyin", "Webcast.Data.VSBar", WebcastDataVsBar)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsCameraInfo(betterproto2.Message):
+    camera_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    camera_id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    cover: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    cover_vertical: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    stream_info: "WebcastDataStreamUrl | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    start_time: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    end_time: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    style: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    camera_room_auth: "WebcastDataRoomAuthStatus | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vr_type: "int" = betterproto2.field(11, betterproto2.TYPE_INT32)
+
+    camera_paid_info: "WebcastDataCameraPaidInfo | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    camera_match_info: "WebcastDataCameraMatchInfo | None" = betterproto2.field(
+        13, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    group_id: "int" = betterproto2.field(14, betterproto2.TYPE_UINT64)
+
+    camera_type: "int" = betterproto2.field(15, betterproto2.TYPE_INT32)
+
+    label: "WebcastDataImage | None" = betterproto2.field(
+        16, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pcu: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    is_subscribed: "bool" = betterproto2.field(18, betterproto2.TYPE_BOOL)
+
+    group_id_str: "str" = betterproto2.field(19, betterproto2.TYPE_STRING)
+
+    preview_image: "WebcastDataEpisodePreviewImage | None" = betterproto2.field(
+        20, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    ban_switch: "bool" = betterproto2.field(21, betterproto2.TYPE_BOOL)
+
+    paid_live_type: "int" = betterproto2.field(22, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSCameraInfo", WebcastDataVsCameraInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsConfigDrawer(betterproto2.Message):
+    drawer: "WebcastDataMatchDrawer | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    drawer_label: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    drawer_background: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSConfigDrawer", WebcastDataVsConfigDrawer
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsEpisodeHighLight(betterproto2.Message):
+    location: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    description: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    image: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    pid: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VsEpisodeHighLight", WebcastDataVsEpisodeHighLight
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsGiftPannel(betterproto2.Message):
+    background_colors: "list[str]" = betterproto2.field(
+        1, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    background: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    selected: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    top_title: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background_bottom: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    background_top: "WebcastDataImage | None" = betterproto2.field(
+        6, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSGiftPannel", WebcastDataVsGiftPannel
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsItemBar(betterproto2.Message):
+    icon_dark: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon_light: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    seperator: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    detail: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    watch_info_pv: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    watch_info_heat: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    collection_id: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    tab_id: "int" = betterproto2.field(9, betterproto2.TYPE_INT32)
+
+    content_type: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSItemBar", WebcastDataVsItemBar
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsItemComment(betterproto2.Message):
+    item_comment_icon_dark: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    item_comment_icon_light: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSItemComment", WebcastDataVsItemComment
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsLinkInfo(betterproto2.Message):
+    title: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    tab_title: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    rooms: "list[WebcastDataVsLinkNode]" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    pattern: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    project_name: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    is_main_room: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSLinkInfo", WebcastDataVsLinkInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsLinkNode(betterproto2.Message):
+    room_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    room_id_str: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    title: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    live_room_mode: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    owner: "WebcastDataUser | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    source: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSLinkNode", WebcastDataVsLinkNode
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsPannelIcon(betterproto2.Message):
+    sp_landscape_icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    sp_vertical_icon: "WebcastDataImage | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    landscape_vertical_switch_icon: "WebcastDataImage | None" = betterproto2.field(
+        3, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    lock_screen_icon: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    landscape_more_icon: "WebcastDataImage | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vertical_more_icon: "WebcastDataImage | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    landscape_comment_icon: "WebcastDataImage | None" = betterproto2.field(
+        11, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vertical_comment_icon: "WebcastDataImage | None" = betterproto2.field(
+        12, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vertical_landscape_switch_icon: "WebcastDataImage | None" = betterproto2.field(
+        13, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    vertical_lock_screen_icon: "WebcastDataImage | None" = betterproto2.field(
+        14, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSPannelIcon", WebcastDataVsPannelIcon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsPremiereToast(betterproto2.Message):
+    left_top_toast: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    player_toast: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    player_top_toast: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSPremiereToast", WebcastDataVsPremiereToast
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsWatermark(betterproto2.Message):
+    position: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    landscape_dis: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    vertical_dis: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    watermark_icon: "list[WebcastDataVsWatermarkIcon]" = betterproto2.field(
+        4, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSWatermark", WebcastDataVsWatermark
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataVsWatermarkIcon(betterproto2.Message):
+    icon: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    icon_width: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    icon_type: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    landscape_dis: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    vertical_dis: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.VSWatermarkIcon", WebcastDataVsWatermarkIcon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWatchInfo(betterproto2.Message):
+    desc: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    count: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    count_with_backup: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    real_count: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    real_count_int64: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    live_count_display_type: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    display_type_start_time: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    format_count: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WatchInfo", WebcastDataWatchInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebData(betterproto2.Message):
+    additional_stream_url: "WebcastDataStreamUrl | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WebData", WebcastDataWebData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebEnterBenefitPointData(betterproto2.Message):
+    has_ongoing_lottery: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    has_ongoing_lucky_money: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin",
+    "Webcast.Data.WebEnterBenefitPointData",
+    WebcastDataWebEnterBenefitPointData,
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebLivePortConfig(betterproto2.Message):
+    strategy_type: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+    use_config_duration: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    pause_monitor_duration: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WebLivePortConfig", WebcastDataWebLivePortConfig
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebLivePortOptimization(betterproto2.Message):
+    strategy_config: "dict[str, WebcastDataWebLivePortConfig]" = betterproto2.field(
+        1,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_MESSAGE
+        ),
+    )
+
+    strategy_extra: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WebLivePortOptimization", WebcastDataWebLivePortOptimization
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebProgramme(betterproto2.Message):
+    enable_programme: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WebProgramme", WebcastDataWebProgramme
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWebSkinData(betterproto2.Message):
+    enable_skin: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WebSkinData", WebcastDataWebSkinData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWelfareProjectInfo(betterproto2.Message):
+    project_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    show_frequency: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    container_card_url: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    welfare_detail_page_url: "str" = betterproto2.field(4, betterproto2.TYPE_STRING)
+
+    project_id_str: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WelfareProjectInfo", WebcastDataWelfareProjectInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastDataWindmillData(betterproto2.Message):
+    clue_live_life_product: "int" = betterproto2.field(1, betterproto2.TYPE_INT32)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Data.WindmillData", WebcastDataWindmillData
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImBottomPinInfo(betterproto2.Message):
+    stay_duration: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    exit_strategy: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.BottomPinInfo", WebcastImBottomPinInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImChatMessage(betterproto2.Message):
+    common: "WebcastImCommon | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    user: "WebcastDataUser | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    content: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+    visible_to_sender: "bool" = betterproto2.field(4, betterproto2.TYPE_BOOL)
+
+    background_image: "WebcastDataImage | None" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    full_screen_text_color: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    background_image_v2: "WebcastDataImage | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    public_area_common: "WebcastImPublicAreaCommon | None" = betterproto2.field(
+        9, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    gift_image: "WebcastDataImage | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    agree_msg_id: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    priority_level: "int" = betterproto2.field(12, betterproto2.TYPE_INT32)
+
+    landscape_area_common: "WebcastImLandscapeAreaCommon | None" = betterproto2.field(
+        13, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    event_time: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    send_review: "bool" = betterproto2.field(16, betterproto2.TYPE_BOOL)
+
+    from_intercom: "bool" = betterproto2.field(17, betterproto2.TYPE_BOOL)
+
+    intercom_hide_user_card: "bool" = betterproto2.field(18, betterproto2.TYPE_BOOL)
+
+    chat_tags: "list[int]" = betterproto2.field(
+        19, betterproto2.TYPE_INT32, repeated=True
+    )
+
+    chat_by: "int" = betterproto2.field(20, betterproto2.TYPE_UINT64)
+
+    individual_chat_priority: "int" = betterproto2.field(21, betterproto2.TYPE_INT32)
+
+    rtf_content: "WebcastDataText | None" = betterproto2.field(
+        40, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    rtf_content_v2: "WebcastDataText | None" = betterproto2.field(
+        41, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    model_info: "dict[str, str]" = betterproto2.field(
+        200,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.ChatMessage", WebcastImChatMessage
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImCommon(betterproto2.Message):
+    method: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    msg_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    room_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    create_time: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    monitor: "int" = betterproto2.field(5, betterproto2.TYPE_INT32)
+
+    is_show_msg: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    describe: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    display_text: "WebcastDataText | None" = betterproto2.field(
+        8, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    fold_type: "int" = betterproto2.field(9, betterproto2.TYPE_UINT64)
+
+    anchor_fold_type: "int" = betterproto2.field(10, betterproto2.TYPE_UINT64)
+
+    priority_score: "int" = betterproto2.field(11, betterproto2.TYPE_UINT64)
+
+    log_id: "str" = betterproto2.field(12, betterproto2.TYPE_STRING)
+
+    msg_process_filter_k: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    msg_process_filter_v: "str" = betterproto2.field(14, betterproto2.TYPE_STRING)
+
+    user: "WebcastDataUser | None" = betterproto2.field(
+        15, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    room: "WebcastDataRoom | None" = betterproto2.field(
+        16, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    anchor_fold_type_v2: "int" = betterproto2.field(17, betterproto2.TYPE_UINT64)
+
+    process_at_sei_time_ms: "int" = betterproto2.field(18, betterproto2.TYPE_UINT64)
+
+    random_dispatch_ms: "int" = betterproto2.field(19, betterproto2.TYPE_UINT64)
+
+    is_dispatch: "bool" = betterproto2.field(20, betterproto2.TYPE_BOOL)
+
+    channel_id: "int" = betterproto2.field(21, betterproto2.TYPE_UINT64)
+
+    diff_sei2abs_second: "int" = betterproto2.field(22, betterproto2.TYPE_UINT64)
+
+    anchor_fold_duration: "int" = betterproto2.field(23, betterproto2.TYPE_UINT64)
+
+    app_id: "int" = betterproto2.field(24, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message("douyin", "Webcast.Im.Common", WebcastImCommon)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImHoverInfo(betterproto2.Message):
+    is_hover: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    priority: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    duration: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    duration_involve_display_time: "int" = betterproto2.field(
+        4, betterproto2.TYPE_UINT64
+    )
+
+    duration_threshold: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.HoverInfo", WebcastImHoverInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImLandscapeAreaCommon(betterproto2.Message):
+    show_head: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    show_nickname: "bool" = betterproto2.field(2, betterproto2.TYPE_BOOL)
+
+    show_font_color: "bool" = betterproto2.field(3, betterproto2.TYPE_BOOL)
+
+    color_value: "list[str]" = betterproto2.field(
+        4, betterproto2.TYPE_STRING, repeated=True
+    )
+
+    comment_type_tags: "list[int]" = betterproto2.field(
+        5, betterproto2.TYPE_INT32, repeated=True
+    )
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.LandscapeAreaCommon", WebcastImLandscapeAreaCommon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImMessage(betterproto2.Message):
+    method: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    payload: "bytes" = betterproto2.field(2, betterproto2.TYPE_BYTES)
+
+    msg_id: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    msg_type: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    offset: "int" = betterproto2.field(5, betterproto2.TYPE_UINT64)
+
+    need_wrds_store: "bool" = betterproto2.field(6, betterproto2.TYPE_BOOL)
+
+    wrds_version: "int" = betterproto2.field(7, betterproto2.TYPE_UINT64)
+
+    wrds_sub_key: "str" = betterproto2.field(8, betterproto2.TYPE_STRING)
+
+    message_extra: "dict[str, str]" = betterproto2.field(
+        9,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    tenant_id: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message("douyin", "Webcast.Im.Message", WebcastImMessage)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPersonalizedDisplayInfo(betterproto2.Message):
+    is_personalized: "bool" = betterproto2.field(1, betterproto2.TYPE_BOOL)
+
+    fold_type: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.PersonalizedDisplayInfo", WebcastImPersonalizedDisplayInfo
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPublicAreaCommon(betterproto2.Message):
+    user_label: "WebcastDataImage | None" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    user_consume_in_room: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    user_send_gift_cnt_in_room: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    individual_priority: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    individual_strategy_result: "dict[str, str]" = betterproto2.field(
+        5,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    support_pin: "int" = betterproto2.field(6, betterproto2.TYPE_UINT64)
+
+    suffix_text: "WebcastImSuffixText | None" = betterproto2.field(
+        7, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    im_action: "int" = betterproto2.field(8, betterproto2.TYPE_INT32)
+
+    forbidden_profile: "bool" = betterproto2.field(9, betterproto2.TYPE_BOOL)
+
+    reply_resp: "WebcastDataChatReplyRespInfo | None" = betterproto2.field(
+        10, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tracking_params: "dict[str, str]" = betterproto2.field(
+        11,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    is_featured: "int" = betterproto2.field(12, betterproto2.TYPE_UINT64)
+
+    need_filter_display: "bool" = betterproto2.field(13, betterproto2.TYPE_BOOL)
+
+    personalized_display_info: "WebcastImPersonalizedDisplayInfo | None" = (
+        betterproto2.field(14, betterproto2.TYPE_MESSAGE, optional=True)
+    )
+
+    force_insertion_priority: "int" = betterproto2.field(15, betterproto2.TYPE_UINT64)
+
+    mention_info: "WebcastDataChatMentionInfo | None" = betterproto2.field(
+        16, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    hover_info: "WebcastImHoverInfo | None" = betterproto2.field(
+        17, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    show_in_danmaku: "bool" = betterproto2.field(18, betterproto2.TYPE_BOOL)
+
+    is_like_comment: "bool" = betterproto2.field(19, betterproto2.TYPE_BOOL)
+
+    batch_refresh: "bool" = betterproto2.field(20, betterproto2.TYPE_BOOL)
+
+    is_ai_msg: "bool" = betterproto2.field(21, betterproto2.TYPE_BOOL)
+
+    should_log_light_interact_mob: "bool" = betterproto2.field(
+        22, betterproto2.TYPE_BOOL
+    )
+
+    light_interact_mob_params: "dict[str, str]" = betterproto2.field(
+        23,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    tail_interact_type: "int" = betterproto2.field(24, betterproto2.TYPE_INT32)
+
+    default_click_schema_url: "str" = betterproto2.field(25, betterproto2.TYPE_STRING)
+
+    bottom_pin_config: "WebcastImBottomPinInfo | None" = betterproto2.field(
+        26, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    forced_insert: "bool" = betterproto2.field(27, betterproto2.TYPE_BOOL)
+
+    with_user_feature_label: "bool" = betterproto2.field(28, betterproto2.TYPE_BOOL)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.PublicAreaCommon", WebcastImPublicAreaCommon
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPushFrame(betterproto2.Message):
+    seq_id: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    log_id: "int" = betterproto2.field(2, betterproto2.TYPE_UINT64)
+
+    service: "int" = betterproto2.field(3, betterproto2.TYPE_INT32)
+
+    method: "int" = betterproto2.field(4, betterproto2.TYPE_INT32)
+
+    headers: "list[WebcastImPushHeader]" = betterproto2.field(
+        5, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    payload_encoding: "str" = betterproto2.field(6, betterproto2.TYPE_STRING)
+
+    payload_type: "str" = betterproto2.field(7, betterproto2.TYPE_STRING)
+
+    payload: "bytes" = betterproto2.field(8, betterproto2.TYPE_BYTES)
+
+    lod_id_new: "str" = betterproto2.field(9, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.PushFrame", WebcastImPushFrame
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImPushHeader(betterproto2.Message):
+    key: "str" = betterproto2.field(1, betterproto2.TYPE_STRING)
+
+    value: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.PushHeader", WebcastImPushHeader
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImResponse(betterproto2.Message):
+    messages: "list[WebcastImMessage]" = betterproto2.field(
+        1, betterproto2.TYPE_MESSAGE, repeated=True
+    )
+
+    cursor: "str" = betterproto2.field(2, betterproto2.TYPE_STRING)
+
+    fetch_interval: "int" = betterproto2.field(3, betterproto2.TYPE_UINT64)
+
+    now: "int" = betterproto2.field(4, betterproto2.TYPE_UINT64)
+
+    internal_ext: "str" = betterproto2.field(5, betterproto2.TYPE_STRING)
+
+    fetch_type: "int" = betterproto2.field(6, betterproto2.TYPE_INT32)
+
+    route_params: "dict[str, str]" = betterproto2.field(
+        7,
+        betterproto2.TYPE_MAP,
+        map_meta=betterproto2.map_meta(
+            betterproto2.TYPE_STRING, betterproto2.TYPE_STRING
+        ),
+    )
+
+    heartbeat_duration: "int" = betterproto2.field(8, betterproto2.TYPE_UINT64)
+
+    need_ack: "bool" = betterproto2.field(9, betterproto2.TYPE_BOOL)
+
+    push_server: "str" = betterproto2.field(10, betterproto2.TYPE_STRING)
+
+    live_cursor: "str" = betterproto2.field(11, betterproto2.TYPE_STRING)
+
+    history_no_more: "bool" = betterproto2.field(12, betterproto2.TYPE_BOOL)
+
+    proxy_server: "str" = betterproto2.field(13, betterproto2.TYPE_STRING)
+
+    push_server_v2: "str" = betterproto2.field(14, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.Response", WebcastImResponse
+)
+
+
+@dataclass(eq=False, repr=False)
+class WebcastImSuffixText(betterproto2.Message):
+    biz_type: "int" = betterproto2.field(1, betterproto2.TYPE_UINT64)
+
+    text: "WebcastDataText | None" = betterproto2.field(
+        2, betterproto2.TYPE_MESSAGE, optional=True
+    )
+
+    tags: "str" = betterproto2.field(3, betterproto2.TYPE_STRING)
+
+
+default_message_pool.register_message(
+    "douyin", "Webcast.Im.SuffixText", WebcastImSuffixText
+)
+
+
@@ -0,0 +1,111 @@
+"""
+抖音推送消息的 method 订阅表
+
+处理器按 method 订阅，ResponseDecoder 只解码已订阅的 method，未订阅的消息在线格式层面就被跳过。
+分发时只做一次字典查找，并按 method 统计收到、处理成功、处理失败的数量和处理耗时。
+"""
+import time
+from typing import Any, Callable, NamedTuple
+from src.utils import logger
+from . import lib
+from .wire import ResponseDecoder
+
+CHAT = "WebcastChatMessage"
+GIFT = "WebcastGiftMessage"
+LIKE = "WebcastLikeMessage"
+MEMBER = "WebcastMemberMessage"
+ROOM_STATS = "WebcastRoomStatsMessage"
+
+# method 对应的 schema 类型名，subscribe_message 用它解析 payload
+MESSAGE_TYPES = {
+    CHAT: "WebcastImChatMessage",
+    GIFT: "WebcastImGiftMessage",
+    LIKE: "WebcastImLikeMessage",
+    MEMBER: "WebcastImMemberMessage",
+    ROOM_STATS: "WebcastImRoomStatsMessage",
+}
+
+Handler = Callable[[memoryview], Any]
+
+
+class MethodStats(NamedTuple):
+    received: int
+    handled: int
+    failed: int
+    # 处理器累计耗时（秒），包含 payload 解析
+    decode_time: float
+
+
+class _Counter:
+    __slots__ = ("received", "handled", "failed", "decode_time")
+
+    def __init__(self):
+        self.received = 0
+        self.handled = 0
+        self.failed = 0
+        self.decode_time = 0.0
+
+
+class MethodRegistry:
+    def __init__(self):
+        self.decoder = ResponseDecoder(())
+        self._entries: dict[str, tuple[Handler, _Counter]] = {}
+        # 取消订阅后保留统计
+        self._counters: dict[str, _Counter] = {}
+
+    def subscribe(self, method: str, handler: Handler):
+        """
+        订阅 method，handler 接收原始 payload；每个 method 只有一个处理器，重复订阅会替换
+        """
+        counter = self._counters.setdefault(method, _Counter())
+        self._entries[method] = (handler, counter)
+        self.decoder.set_methods(self._entries)
+
+    def subscribe_message(self, method: str, callback: Callable[[Any], Any]):
+        """
+        订阅 method，payload 按 MESSAGE_TYPES 解析为 schema 消息后交给 callback
+        """
+        message_type = getattr(lib, MESSAGE_TYPES[method])
+
+        def handler(payload):
+            return callback(message_type().parse(payload))
+
+        self.subscribe(method, handler)
+
+    def unsubscribe(self, method: str):
+        if self._entries.pop(method, None) is not None:
+            self.decoder.set_methods(self._entries)
+
+    def __contains__(self, method: str):
+        return method in self._entries
+
+    @property
+    def methods(self) -> frozenset[str]:
+        return self.decoder.methods
+
+    def dispatch(self, method: str, payload: memoryview):
+        entry = self._entries.get(method)
+        # 解码和取消订阅之间的消息直接丢弃
+        if entry is None:
+            return
+        handler, counter = entry
+        counter.received += 1
+        start = time.perf_counter()
+        try:
+            handler(payload)
+        except Exception as e:
+            counter.failed += 1
+            if counter.failed == 1:
+                logger.warning(f"Douyin {method} handler failed: {e!r}")
+            else:
+                logger.debug(f"Douyin {method} handler failed: {e!r}")
+        else:
+            counter.handled += 1
+        finally:
+            counter.decode_time += time.perf_counter() - start
+
+    def stats(self) -> dict[str, MethodStats]:
+        return {
+            method: MethodStats(counter.received, counter.handled, counter.failed, counter.decode_time)
+            for method, counter in self._counters.items()
+        }
@@ -0,0 +1,92 @@
+"""
+抖音直播间解析结果缓存
+
+每次创建 DouyinLiveWebFetcher 都要先请求 live.douyin.com 获取 ttwid，再下载整个直播间页面匹配 roomId。
+解析结果按 live_id 持久化到 JSON 文件：
+
+- 未超过 ttl 的记录直接使用，不发任何请求
+- 超过 ttl 但未超过 max_age 的记录先使用，同时在后台重新解析（stale-while-revalidate）
+- 超过 max_age 或没有记录时同步解析
+"""
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import NamedTuple
+from src.utils import logger, get_path
+
+# 抖音开播后 roomId 会变化，ttl 不宜过长；ttwid 有效期很长，过期记录仍可先用再后台刷新
+DEFAULT_TTL = 10 * 60
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+
+class Resolution(NamedTuple):
+    ttwid: str
+    room_id: str
+    resolved_at: float
+
+
+class ResolveCache:
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL, max_age: float = DEFAULT_MAX_AGE, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, Resolution] | None = None
+
+    def _load(self) -> dict[str, Resolution]:
+        if self._entries is None:
+            entries = {}
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for live_id, item in json.load(f).items():
+                        entries[live_id] = Resolution(item["ttwid"], item["room_id"], float(item["resolved_at"]))
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable Douyin resolve cache {self.path}: {e}")
+            self._entries = entries
+        return self._entries
+
+    def _save(self):
+        data = {live_id: entry._asdict() for live_id, entry in self._entries.items()}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            # 先写临时文件再替换，避免中途退出留下半个文件
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save Douyin resolve cache {self.path}: {e}")
+
+    def get(self, live_id: str) -> tuple[Resolution | None, bool]:
+        """
+        返回 (记录, 是否需要后台刷新)，记录不存在或超过 max_age 时返回 (None, False)
+        """
+        with self._lock:
+            entry = self._load().get(live_id)
+        if entry is None:
+            return None, False
+        age = self._clock() - entry.resolved_at
+        if age < 0 or age >= self.max_age:
+            return None, False
+        return entry, age >= self.ttl
+
+    def put(self, live_id: str, ttwid: str, room_id: str) -> Resolution:
+        entry = Resolution(ttwid, room_id, self._clock())
+        with self._lock:
+            self._load()[live_id] = entry
+            self._save()
+        return entry
+
+    def invalidate(self, live_id: str):
+        with self._lock:
+            if self._load().pop(live_id, None) is not None:
+                self._save()
+
+
+@lru_cache(maxsize=None)
+def default_resolve_cache() -> ResolveCache:
+    return ResolveCache(get_path("douyin_resolve.json", dir_name="cache"))
@@ -2,6 +2,8 @@ import os
 import hashlib
 import random
 import string
+import threading
+import time
 import urllib.parse
 from quickjs import Function
 from functools import cache
@@ -21,17 +23,71 @@ def open_file(file_path: str):
         return ctx
 
 
+class SignatureEngine:
+    """
+    QuickJS 签名引擎
+
+    每个 (文件, 函数) 在进程内只编译一次，之后复用同一个 quickjs.Function；
+    Function 自身会把调用串行到固定线程，这里只需保证编译不重复。
+    """
+
+    def __init__(self, sign_ttl: float = 60):
+        self._functions: dict[tuple[str, str], Function] = {}
+        self._lock = threading.Lock()
+        self.compile_count = 0
+        # 签名里带有时间戳，相同参数的签名只在 sign_ttl 秒内复用
+        self.sign_ttl = sign_ttl
+        self._signatures: dict[tuple[str, str], tuple[float, str]] = {}
+        self.sign_hits = 0
+
+    def function(self, js_file: str, func_name: str) -> Function:
+        key = (js_file, func_name)
+        func = self._functions.get(key)
+        if func is not None:
+            return func
+        with self._lock:
+            func = self._functions.get(key)
+            if func is None:
+                func = Function(func_name, open_file(get_real_path(js_file)))
+                self._functions[key] = func
+                self.compile_count += 1
+            return func
+
+    def call(self, js_file: str, func_name: str, *args):
+        return self.function(js_file, func_name)(*args)
+
+    def sign(self, md5_param: str, script_file: str = 'sign_v1.js') -> str:
+        """
+        计算签名，sign_ttl 秒内相同的 md5 参数直接返回缓存结果
+        """
+        key = (script_file, md5_param)
+        now = time.monotonic()
+        cached = self._signatures.get(key)
+        if cached and cached[0] > now:
+            self.sign_hits += 1
+            return cached[1]
+        signature = self.call(script_file, "get_sign", md5_param)
+        if len(self._signatures) >= 256:
+            self._signatures = {k: v for k, v in self._signatures.items() if v[0] > now}
+        self._signatures[key] = (now + self.sign_ttl, signature)
+        return signature
+
+    def clear(self):
+        with self._lock:
+            self._functions.clear()
+        self._signatures.clear()
+
+
+engine = SignatureEngine()
+
+
 def execute_js(*args, js_file: str, func_name: str):
     """
-    执行 JavaScript 文件
+    执行 JavaScript 文件中的函数，脚本只在首次调用时编译
     :param js_file: JavaScript 文件路径
     :return: 执行结果
     """
-    js_path = get_real_path(js_file)
-    js_code = open_file(js_path)
-
-    ctx = Function(func_name, js_code)
-    return ctx(*args)
+    return engine.call(js_file, func_name, *args)
 
 
 def generateSignature(wss, script_file='sign_v1.js'):
@@ -51,8 +107,7 @@ def generateSignature(wss, script_file='sign_v1.js'):
     md5_param = md5.hexdigest()
 
     try:
-        signature = execute_js(md5_param, js_file=script_file, func_name="get_sign")
-        return signature
+        return engine.sign(md5_param, script_file)
     except Exception as e:
         logger.error(e)
 
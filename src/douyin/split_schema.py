@@ -0,0 +1,110 @@
+"""
+拆分 betterproto2 生成的抖音 schema
+
+生成的 lib/__init__.py 有两千多个消息类型，导入时全部定义并注册到 default_message_pool。
+本脚本把热路径（ROOTS 及其引用的类型）写入 lib/_core.py，其余类型写入 lib/_schema.py，
+lib/__init__.py 只保留 __all__ 和按需导入的模块 __getattr__。
+
+重新编译 douyin.proto 后执行：
+
+    python -m src.douyin.split_schema <编译输出的 __init__.py> src/douyin/lib
+"""
+import argparse
+import re
+from pathlib import Path
+
+# DouyinLiveWebFetcher 处理的消息类型
+ROOTS = ("WebcastImPushFrame", "WebcastImResponse", "WebcastImChatMessage")
+
+_CLASS_NAME = re.compile(r"^class (\w+)\(", re.M)
+_IDENTIFIER = re.compile(r"\b(Webcast\w*)\b")
+
+
+def split_generated(source: str):
+    """
+    返回 (文件头, 全部类型名, 热路径类型代码块, 其余类型代码块)
+    """
+    chunks = re.split(r"^(?=@dataclass|class )", source, flags=re.M)
+    header = chunks[0]
+    blocks: dict[str, str] = {}
+    pending = ""
+    for chunk in chunks[1:]:
+        pending += chunk
+        if chunk.startswith("class "):
+            blocks[_CLASS_NAME.search(pending).group(1)] = pending
+            pending = ""
+    if pending:
+        raise ValueError("unexpected trailing code after the last message")
+
+    refs = {name: set(_IDENTIFIER.findall(block)) & blocks.keys() for name, block in blocks.items()}
+    core: set[str] = set()
+    stack = list(ROOTS)
+    while stack:
+        name = stack.pop()
+        if name not in core:
+            core.add(name)
+            stack.extend(refs[name] - core)
+
+    # 去掉 __all__，其余导入和版本检查两个模块都需要
+    header = re.sub(r"^__all__ = \(.*?^\)\n", "", header, flags=re.M | re.S)
+    core_blocks = [block for name, block in blocks.items() if name in core]
+    rest_blocks = [block for name, block in blocks.items() if name not in core]
+    core_names = [name for name in blocks if name in core]
+    return header, list(blocks), core_names, core_blocks, rest_blocks
+
+
+def _tuple(name: str, items: list[str]):
+    return f"{name} = (\n" + "".join(f'    "{item}",\n' for item in items) + ")\n"
+
+
+def write_modules(source: str, out_dir: Path):
+    header, names, core_names, core_blocks, rest_blocks = split_generated(source)
+
+    (out_dir / "_core.py").write_text(
+        header + _tuple("__all__", core_names) + "\n\n" + "".join(core_blocks), encoding="utf-8"
+    )
+    (out_dir / "_schema.py").write_text(
+        header + "from ._core import *  # noqa: F401,F403\n\n\n" + "".join(rest_blocks), encoding="utf-8"
+    )
+    (out_dir / "__init__.py").write_text(
+        '''# Generated by src/douyin/split_schema.py from the betterproto2 output.  DO NOT EDIT!
+"""
+抖音 protobuf schema，首次访问时才导入定义消息类型的模块：
+
+- _core: DouyinLiveWebFetcher 热路径用到的类型
+- _schema: 其余全部类型
+"""
+import importlib
+
+'''
+        + _tuple("__all__", names)
+        + "\n"
+        + _tuple("_CORE", core_names).replace("_CORE = (", "_CORE = frozenset((").rstrip("\n")
+        + ")\n\n\n"
+        + '''def __getattr__(name: str):
+    if name in _CORE:
+        module = importlib.import_module("._core", __name__)
+    elif name in __all__:
+        module = importlib.import_module("._schema", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
+''',
+        encoding="utf-8",
+    )
+    return len(names), len(core_names)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("generated")
+    parser.add_argument("out_dir", nargs="?", default=str(Path(__file__).parent / "lib"))
+    args = parser.parse_args()
+    total, core = write_modules(Path(args.generated).read_text(encoding="utf-8"), Path(args.out_dir))
+    print(f"{total} messages, {core} on the hot path")
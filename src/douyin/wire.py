@@ -0,0 +1,235 @@
+"""
+抖音推送帧的选择性解码
+
+直接遍历 protobuf 线格式，只读取需要的字段：
+
+- WebcastImPushFrame: log_id(2)、payload_encoding(6)、payload_type(7)、payload(8)
+- WebcastImResponse: messages(1)、internal_ext(5)、heartbeat_duration(8)、need_ack(9)
+- WebcastImMessage: method(1)、payload(2)
+
+未订阅的 method 不会被解码为字符串，其 payload 直接跳过；订阅的 payload 以 memoryview 返回，
+交给 betterproto2 解析为完整的消息。
+
+客户端发送的心跳和 ack 帧字段固定，由 encode_push_frame 直接编码。
+"""
+import zlib
+from typing import Iterable, NamedTuple
+
+_VARINT = 0
+_I64 = 1
+_LEN = 2
+_I32 = 5
+
+
+class PushFrame(NamedTuple):
+    log_id: int
+    payload_encoding: str
+    payload_type: str
+    payload: memoryview
+
+
+class Response(NamedTuple):
+    # (method, payload)，只包含订阅的 method
+    messages: list[tuple[str, memoryview]]
+    need_ack: bool
+    internal_ext: str
+    # 服务端要求的心跳间隔（毫秒），0 表示未指定
+    heartbeat_duration: int = 0
+
+
+def _read_varint(buf: memoryview, pos: int) -> tuple[int, int]:
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = buf[pos]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos + 1
+        shift += 7
+        if shift >= 64:
+            raise ValueError("varint is too long")
+
+
+def _skip(buf: memoryview, pos: int, wire_type: int) -> int:
+    if wire_type == _VARINT:
+        while buf[pos] & 0x80:
+            pos += 1
+        return pos + 1
+    if wire_type == _LEN:
+        length, pos = _read_varint(buf, pos)
+        return pos + length
+    if wire_type == _I64:
+        return pos + 8
+    if wire_type == _I32:
+        return pos + 4
+    raise ValueError(f"unsupported wire type {wire_type}")
+
+
+def decode_push_frame(data: bytes | memoryview) -> PushFrame:
+    buf = memoryview(data)
+    end = len(buf)
+    pos = 0
+    log_id = 0
+    payload_encoding = payload_type = ""
+    payload = buf[0:0]
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 7
+        if wire_type == _LEN and field in (6, 7, 8):
+            length, pos = _read_varint(buf, pos)
+            value = buf[pos:pos + length]
+            pos += length
+            if field == 8:
+                payload = value
+            elif field == 7:
+                payload_type = str(value, "utf-8")
+            else:
+                payload_encoding = str(value, "utf-8")
+        elif field == 2 and wire_type == _VARINT:
+            log_id, pos = _read_varint(buf, pos)
+        else:
+            pos = _skip(buf, pos, wire_type)
+    if pos != end:
+        raise ValueError("truncated push frame")
+    return PushFrame(log_id, payload_encoding, payload_type, payload)
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode_push_frame(log_id: int = 0, payload_type: str = "", payload: bytes = b"") -> bytes:
+    """
+    编码只含 log_id(2)、payload_type(7)、payload(8) 的 WebcastImPushFrame，与 betterproto2 的输出一致
+    """
+    out = bytearray()
+    if log_id:
+        out.append(2 << 3 | _VARINT)
+        _write_varint(out, log_id)
+    for field, value in ((7, payload_type.encode("utf-8")), (8, payload)):
+        if value:
+            out.append(field << 3 | _LEN)
+            _write_varint(out, len(value))
+            out += value
+    return bytes(out)
+
+
+def gunzip(payload: memoryview) -> bytes:
+    """
+    解压 gzip 负载，不复制输入
+    """
+    return zlib.decompress(payload, 31)
+
+
+class ResponseDecoder:
+    """
+    WebcastImResponse 选择性解码器，methods 为订阅的 method 名
+    """
+
+    def __init__(self, methods: Iterable[str]):
+        self.set_methods(methods)
+
+    def set_methods(self, methods: Iterable[str]):
+        """
+        更新订阅的 method，新的分组构建完成后整体替换，解码线程不会看到中间状态
+        """
+        # method 按字节长度分组，比较时先比长度，再原地比较内容，不创建新对象
+        by_length: dict[int, list[tuple[bytes, str]]] = {}
+        methods = frozenset(methods)
+        for method in methods:
+            encoded = method.encode("utf-8")
+            by_length.setdefault(len(encoded), []).append((encoded, method))
+        self._by_length = by_length
+        self.methods = methods
+
+    def decode(self, data: bytes) -> Response:
+        buf = memoryview(data)
+        end = len(buf)
+        pos = 0
+        messages = []
+        need_ack = False
+        internal_ext = ""
+        heartbeat_duration = 0
+        while pos < end:
+            key, pos = _read_varint(buf, pos)
+            field, wire_type = key >> 3, key & 7
+            if field == 1 and wire_type == _LEN:
+                length, pos = _read_varint(buf, pos)
+                message = self._decode_message(data, buf, pos, pos + length)
+                if message is not None:
+                    messages.append(message)
+                pos += length
+            elif field == 9 and wire_type == _VARINT:
+                value, pos = _read_varint(buf, pos)
+                need_ack = value != 0
+            elif field == 8 and wire_type == _VARINT:
+                heartbeat_duration, pos = _read_varint(buf, pos)
+            elif field == 5 and wire_type == _LEN:
+                length, pos = _read_varint(buf, pos)
+                internal_ext = str(buf[pos:pos + length], "utf-8")
+                pos += length
+            else:
+                pos = _skip(buf, pos, wire_type)
+        if pos != end:
+            raise ValueError("truncated response")
+        return Response(messages, need_ack, internal_ext, heartbeat_duration)
+
+    def _decode_message(self, data: bytes, buf: memoryview, pos: int, end: int):
+        method = None
+        payload = None
+        while pos < end:
+            key, pos = _read_varint(buf, pos)
+            field, wire_type = key >> 3, key & 7
+            if wire_type == _LEN and field in (1, 2):
+                length, pos = _read_varint(buf, pos)
+                if field == 1:
+                    method = self._match(data, pos, length)
+                    if method is None:
+                        return None
+                else:
+                    payload = buf[pos:pos + length]
+                pos += length
+            else:
+                pos = _skip(buf, pos, wire_type)
+        if method is None:
+            return None
+        return method, payload if payload is not None else buf[0:0]
+
+    def _match(self, data: bytes, pos: int, length: int) -> str | None:
+        candidates = self._by_length.get(length)
+        if candidates is None:
+            return None
+        for encoded, method in candidates:
+            if data.startswith(encoded, pos):
+                return method
+        return None
+
+
+class DecodedFrame(NamedTuple):
+    log_id: int
+    response: Response
+    payload_type: str = "msg"
+
+
+_EMPTY_RESPONSE = Response([], False, "")
+
+
+def decode_frame(frame: bytes, decoder: ResponseDecoder, copy_payloads: bool = False) -> DecodedFrame:
+    """
+    解码一帧推送消息，copy_payloads 为 True 时 payload 转为 bytes，便于跨进程返回
+    """
+    package = decode_push_frame(frame)
+    # 心跳回复等没有负载的帧
+    if not package.payload:
+        return DecodedFrame(package.log_id, _EMPTY_RESPONSE, package.payload_type)
+    response = decoder.decode(gunzip(package.payload))
+    if copy_payloads:
+        response = response._replace(messages=[(method, bytes(payload)) for method, payload in response.messages])
+    return DecodedFrame(package.log_id, response, package.payload_type)
@@ -1,8 +1,36 @@
 import time
 import asyncio
-from src.utils import logger, DanmuInfo, async_worker, send_notification
+from src.utils import logger, DanmuInfo, EventEmitter, RequestQueue, async_worker, send_notification
 from src.database import Db
+from src.database.model import BiliConfig, GloalConfig
+from .parser import CommandType, get_parser
 from bilibili_api import live, Credential
+from bilibili_api.utils import network
+from src.bilibili import BiliLiveClient
+
+
+# 单个平台点歌队列上限，超出后淘汰最早的点歌
+MAX_QUEUE_SIZE = 1000
+NOTIFY_SUMMARY = "收到 {count} 首新的点歌"
+# True 使用项目内的 BiliLiveClient，只解码订阅的 cmd；False 使用 bilibili_api 的 LiveDanmaku
+RAW_CLIENT = False
+# LiveDanmaku 没有事件的状态变化的兜底轮询间隔（秒）
+STATUS_POLL_INTERVAL = 5
+
+
+async def _close_bilibili_client():
+    """
+    bilibili_api 按事件循环缓存自己的请求客户端，工作者停止时一并关闭
+    """
+    loop = asyncio.get_running_loop()
+    name, _ = network.get_selected_client()
+    client = network.session_pool.get(name, {}).pop(loop, None)
+    network.lazy_settings.get(name, {}).pop(loop, None)
+    if client is not None:
+        await client.close()
+
+
+async_worker.http.add_closer(_close_bilibili_client)
 
 
 class Bili:
@@ -10,9 +38,15 @@ class Bili:
         self._stop_event = asyncio.Event()
         self._run_future = None
         self.live = None
-        self.danmus: list[DanmuInfo] = []
+        # 队列和连接状态变化通过 events 推送: add/remove/clear/status
+        self.events = EventEmitter()
+        self.status = -1
+        self.danmus = RequestQueue(capacity=MAX_QUEUE_SIZE, on_evict=self._on_evict)
         self.config = None
         self.credential = None
+        self.notification = False
+        Db.subscribe_config(BiliConfig, self._on_config_change)
+        Db.subscribe_config(GloalConfig, self._on_global_config_change)
 
     def start(self):
         if self._run_future and not self._run_future.done():
@@ -24,6 +58,7 @@ class Bili:
     async def _start_and_run_client(self):
         from src.manager import subscribe_manager
         self.live = None
+        status_task = None
         try:
             config = await Db.get_bconfig()
             if not config or config.room_id == 0:
@@ -46,13 +81,23 @@ class Bili:
             else:
                 credential = None
 
-            self.live = live.LiveDanmaku(room_display_id=self.config.room_id, credential=credential, max_retry=99)
+            if RAW_CLIENT:
+                self.live = BiliLiveClient(room_display_id=self.config.room_id, credential=credential, max_retry=99)
+                self.live.on_status_change = self._set_status
+            else:
+                self.live = live.LiveDanmaku(room_display_id=self.config.room_id, credential=credential, max_retry=99)
+                self.live.on("VERIFICATION_SUCCESSFUL")(self._on_verified)
+                self.live.on("TIMEOUT")(self._on_timeout)
+                status_task = asyncio.create_task(self._watch_status())
             self.live.on("DANMU_MSG")(self.on_msg)
             self.live.on("SUPER_CHAT_MESSAGE")(self.on_sc)
             if credential:
                 subscribe_manager.register("interval", minutes=30, id="refresh_credential", replace_existing=True)(self.refresh_credential)
 
-            await self.live.connect()
+            if RAW_CLIENT:
+                await self.live.connect_async()
+            else:
+                await self.live.connect()
             logger.info("Bilibili live client starting.")
             await self._stop_event.wait()
         except asyncio.CancelledError:
@@ -60,6 +105,8 @@ class Bili:
         except Exception as e:
             logger.error(f"Bilibili task failed: {e}")
         finally:
+            if status_task:
+                status_task.cancel()
             if self.live:
                 try:
                     await self.live.disconnect()
@@ -67,8 +114,14 @@ class Bili:
                     logger.error(f"Bilibili disconnect failed when trying to disconnect: {e}")
                 self.live.remove_event_listener("DANMU_MSG", self.on_msg)
                 self.live.remove_event_listener("SUPER_CHAT_MESSAGE", self.on_sc)
+                if RAW_CLIENT:
+                    self.live.on_status_change = None
+                else:
+                    self.live.remove_event_listener("VERIFICATION_SUCCESSFUL", self._on_verified)
+                    self.live.remove_event_listener("TIMEOUT", self._on_timeout)
                 self.live = None
                 self.credential = None
+            self._set_status(-1)
             logger.info("Bilibili live client stopped.")
 
     async def stop(self):
@@ -94,23 +147,64 @@ class Bili:
         await asyncio.sleep(1)
         self.start()
 
+    def _on_config_change(self, config):
+        """
+        房间配置变化，点歌指令/cd/等级限制即时生效，房间号变化仍需 restart
+        """
+        if config:
+            self.config = config
+
+    def _on_global_config_change(self, config):
+        self.notification = bool(config and config.notification)
+
     def get_status(self):
         if self.live:
             return self.live.get_status()
         else:
             return -1
 
+    def _set_status(self, status):
+        if self.status != status:
+            self.status = status
+            self.events.emit_sync("status", "bilibili", status)
+
+    async def _on_verified(self, event):
+        self._set_status(self.get_status())
+
+    async def _on_timeout(self, event):
+        # 心跳超时后 LiveDanmaku 关闭连接并重连
+        self._set_status(live.LiveDanmaku.STATUS_CONNECTING)
+
+    async def _watch_status(self):
+        """
+        LiveDanmaku 的兜底状态轮询
+
+        BiliLiveClient 通过 on_status_change 推送状态；bilibili_api 的 LiveDanmaku 只有认证成功
+        (VERIFICATION_SUCCESSFUL) 和心跳超时 (TIMEOUT) 两个事件，接收出错、服务端断开后的重连没有事件，
+        这些状态变化只能低频轮询补上。
+        """
+        while self.live:
+            self._set_status(self.get_status())
+            await asyncio.sleep(STATUS_POLL_INTERVAL)
+
     def get_list(self):
         return self.danmus
 
     def del_list(self, msg_id):
-        self.danmus = [item for item in self.danmus if item.msg_id != msg_id]
+        item = self.danmus.remove(msg_id)
+        if item:
+            self.events.emit_sync("remove", item)
 
     def clear_list(self):
         self.danmus.clear()
+        self.events.emit_sync("clear", "bilibili")
 
     def add_list(self, data):
-        self.danmus.insert(0, data)
+        if self.danmus.append(data):
+            self.events.emit_sync("add", data)
+
+    def _on_evict(self, item):
+        self.events.emit_sync("remove", item)
 
     async def on_msg(self, event):
         info = event["data"]["info"]
@@ -128,23 +222,24 @@ class Bili:
             guard_level = user_info["medal"]["guard_level"]
 
         logger.debug(f"[{medal_name} {medal_level}]:{uname}:{msg}")
-        if msg.startswith("取消点歌"):
-            history = await Db.get_song_history(uid=uid, source="bilibili")
-            if history:
-                self.del_list(history.id)
-            return
-        if not msg.startswith(f"{self.config.sing_prefix} "):
+        parser = get_parser(self.config.sing_prefix, self.config.modal_level, self.config.user_level)
+        command = parser.parse(msg, medal_level, guard_level)
+        if command.type == CommandType.CANCEL:
+            last_request = await Db.get_last_request(uid=uid, source="bilibili")
+            if last_request:
+                self.del_list(last_request.history_id)
             return
-        if self.config.modal_level > 0 and medal_level < self.config.modal_level:
-            return
-        if self.config.user_level > 0 and guard_level > self.config.user_level:
+        if command.type != CommandType.REQUEST:
             return
         if self.config.sing_cd > 0:
-            history = await Db.get_song_history(uid=uid, source="bilibili")
-            if history and (now - history.create_time) / 1000 < self.config.sing_cd:
+            last_request = await Db.get_last_request(uid=uid, source="bilibili")
+            if last_request and (now - last_request.create_time) / 1000 < self.config.sing_cd:
                 return
 
-        song_name = msg.replace(self.config.sing_prefix, "", 1).strip()
+        song_name = command.song_name
+        song_info = Db.match_playlist(song_name)
+        if song_info:
+            song_name = song_info.song_name
         logger.info(song_name)
 
         history = await Db.add_song_history(uid=uid, uname=uname, song_name=song_name, source="bilibili", create_time=now)
@@ -160,13 +255,12 @@ class Bili:
             send_time=now,
             source="bilibili"
         )
-        self.danmus.append(danmu_info)
+        self.add_list(danmu_info)
 
-        config = await Db.get_gloal_config()
-        if not config or not config.notification:
+        if not self.notification:
             return
 
-        send_notification("收到新的点歌", song_name)
+        send_notification("收到新的点歌", song_name, summary=NOTIFY_SUMMARY)
 
     async def on_sc(self, event):
         sc_data = event["data"]["data"]
@@ -184,22 +278,22 @@ class Bili:
             medal_name = sc_data["medal_info"]["medal_name"]
 
         logger.debug(f"[{medal_name} {medal_level}]:{uname}:{message}")
-        if self.config.modal_level > 0 and medal_level < self.config.modal_level:
-            return
-        if self.config.user_level > 0 and guard_level > self.config.user_level:
+        parser = get_parser(self.config.sing_prefix, self.config.modal_level, self.config.user_level)
+        command = parser.parse_super_chat(message, medal_level, guard_level)
+        if command.type != CommandType.REQUEST:
             return
         if self.config.sing_cd > 0:
-            history = await Db.get_song_history(uid=uid, source="bilibili")
-            if history and (now - history.create_time) / 1000 < self.config.sing_cd:
+            last_request = await Db.get_last_request(uid=uid, source="bilibili")
+            if last_request and (now - last_request.create_time) / 1000 < self.config.sing_cd:
                 return
 
-        song_name = message.replace(self.config.sing_prefix, "", 1).strip()
-        logger.info(song_name)
-
-        song_info = await Db.get_playlist(song_name=song_name)
+        song_name = command.song_name
+        song_info = Db.match_playlist(song_name)
         if song_info:
             if song_info.is_sc and price < song_info.sc_price:
                 return
+            song_name = song_info.song_name
+        logger.info(song_name)
 
         history = await Db.add_song_history(uid=uid, uname=uname, song_name=song_name, source="bilibili", create_time=now)
 
@@ -214,13 +308,12 @@ class Bili:
             send_time=now,
             source="bilibili"
         )
-        self.danmus.append(sc_info)
+        self.add_list(sc_info)
 
-        config = await Db.get_gloal_config()
-        if not config or not config.notification:
+        if not self.notification:
             return
 
-        send_notification("收到新的点歌", song_name)
+        send_notification("收到新的点歌", song_name, summary=NOTIFY_SUMMARY)
 
     async def refresh_credential(self):
         if not self.credential:
@@ -1,8 +1,17 @@
 import time
 import asyncio
 from src.database import Db
+from src.database.model import DyConfig, GloalConfig
 from src.douyin import DouyinLiveWebFetcher
-from src.utils import logger, DanmuInfo, async_worker, send_notification
+from src.utils import logger, DanmuInfo, EventEmitter, RequestQueue, async_worker, send_notification
+from .parser import CommandType, get_parser
+
+
+# 单个平台点歌队列上限，超出后淘汰最早的点歌
+MAX_QUEUE_SIZE = 1000
+NOTIFY_SUMMARY = "收到 {count} 首新的点歌"
+# 推送帧解码方式，None 在事件循环中解码，"thread"/"process" 把大帧交给线程池/进程池
+DECODE_EXECUTOR = None
 
 
 class Douyin:
@@ -10,11 +19,17 @@ class Douyin:
         self._run_future = None
         self._stop_event = asyncio.Event()
         self.live = None
-        self.danmus: list[DanmuInfo] = []
+        # 队列和连接状态变化通过 events 推送: add/remove/clear/status
+        self.events = EventEmitter()
+        self.status = -1
+        self.danmus = RequestQueue(capacity=MAX_QUEUE_SIZE, on_evict=self._on_evict)
         self.sing_prefix = ""
         self.room_id = 0
         self.sing_cd = 0
         self.fans_level = 0
+        self.notification = False
+        Db.subscribe_config(DyConfig, self._on_config_change)
+        Db.subscribe_config(GloalConfig, self._on_global_config_change)
 
     def start(self):
         if self._run_future and not self._run_future.done():
@@ -37,8 +52,9 @@ class Douyin:
             self.room_id = config.room_id
             self.sing_cd = config.sing_cd
             self.fans_level = config.fans_level
-            self.live = DouyinLiveWebFetcher(live_id=self.room_id, max_retries=99)
+            self.live = DouyinLiveWebFetcher(live_id=self.room_id, max_retries=99, decode_executor=DECODE_EXECUTOR)
             self.live.on("danmu")(self.add_dydanmu)
+            self.live.on_status_change = self._set_status
 
             await self.live.connect_async()
             logger.info("Douyin live client connected.")
@@ -55,6 +71,7 @@ class Douyin:
                 await self.live.disconnect_async()
                 self.live.remove_listener("danmu", self.add_dydanmu)
                 self.live = None
+            self._set_status(-1)
             logger.info("Douyin live client stopped.")
 
     async def stop(self):
@@ -78,23 +95,47 @@ class Douyin:
         await asyncio.sleep(1)
         self.start()
 
+    def _on_config_change(self, config):
+        """
+        房间配置变化，点歌指令/cd/粉团等级即时生效，房间号变化仍需 restart
+        """
+        if config:
+            self.sing_prefix = config.sing_prefix
+            self.sing_cd = config.sing_cd
+            self.fans_level = config.fans_level
+
+    def _on_global_config_change(self, config):
+        self.notification = bool(config and config.notification)
+
     def get_status(self):
         if self.live:
             return self.live.ws_connect_status
         else:
             return -1
 
+    def _set_status(self, status):
+        if self.status != status:
+            self.status = status
+            self.events.emit_sync("status", "douyin", status)
+
     def get_list(self):
         return self.danmus
 
     def del_list(self, msg_id):
-        self.danmus = [item for item in self.danmus if item.msg_id != msg_id]
+        item = self.danmus.remove(msg_id)
+        if item:
+            self.events.emit_sync("remove", item)
 
     def clear_list(self):
         self.danmus.clear()
+        self.events.emit_sync("clear", "douyin")
 
     def add_list(self, data):
-        self.danmus.insert(0, data)
+        if self.danmus.append(data):
+            self.events.emit_sync("add", data)
+
+    def _on_evict(self, item):
+        self.events.emit_sync("remove", item)
 
     async def add_dydanmu(self, danmu):
         content = danmu.get("content", "")
@@ -106,21 +147,23 @@ class Douyin:
         guard_level = getattr(fans_club_data, "user_fans_club_status", 0)
         now = int(time.time())
 
-        if content.startswith("取消点歌"):
-            history = await Db.get_song_history(uid=uid, source="douyin")
-            if history:
-                self.del_list(history.id)
-            return
-        if not content.startswith(f"{self.sing_prefix} "):
+        command = get_parser(self.sing_prefix, self.fans_level).parse(content, medal_level, guard_level)
+        if command.type == CommandType.CANCEL:
+            last_request = await Db.get_last_request(uid=uid, source="douyin")
+            if last_request:
+                self.del_list(last_request.history_id)
             return
-        if self.fans_level > 0 and medal_level < self.fans_level:
+        if command.type != CommandType.REQUEST:
             return
         if self.sing_cd > 0:
-            history = await Db.get_song_history(uid=uid, source="douyin")
-            if history and (now - history.create_time) / 1000 < self.sing_cd:
+            last_request = await Db.get_last_request(uid=uid, source="douyin")
+            if last_request and (now - last_request.create_time) / 1000 < self.sing_cd:
                 return
 
-        song_name = content.replace(self.sing_prefix, "", 1).strip()
+        song_name = command.song_name
+        song_info = Db.match_playlist(song_name)
+        if song_info:
+            song_name = song_info.song_name
         logger.info(song_name)
 
         history = await Db.add_song_history(uid=uid, uname=uname, song_name=song_name, source="douyin", create_time=now)
@@ -136,13 +179,12 @@ class Douyin:
             send_time=now,
             source="douyin",
         )
-        self.danmus.append(danmu_info)
+        self.add_list(danmu_info)
 
-        config = await Db.get_gloal_config()
-        if not config or not config.notification:
+        if not self.notification:
             return
 
-        send_notification("收到新的点歌", song_name)
+        send_notification("收到新的点歌", song_name, summary=NOTIFY_SUMMARY)
 
 
 douyin_manager = Douyin()
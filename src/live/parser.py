@@ -0,0 +1,87 @@
+import re
+from enum import IntEnum
+from functools import lru_cache
+from typing import NamedTuple
+
+CANCEL_KEYWORD = "取消点歌"
+
+
+class CommandType(IntEnum):
+    IGNORE = 0
+    REQUEST = 1
+    CANCEL = 2
+
+
+class Command(NamedTuple):
+    type: CommandType
+    song_name: str = ""
+
+
+IGNORE = Command(CommandType.IGNORE)
+CANCEL = Command(CommandType.CANCEL)
+
+
+class RequestParser:
+    """
+    点歌指令解析器
+
+    把直播间的点歌指令和粉丝牌/大航海限制编译成一个预编译的匹配器，
+    哔哩哔哩和抖音共用同一套规则：
+
+    - 以 "取消点歌" 开头：取消点歌，不受等级限制
+    - 以 "{prefix} " 开头：点歌，歌名为指令后去掉首尾空白的内容
+    - 其他：忽略
+    """
+
+    def __init__(self, prefix: str, medal_level: int = 0, guard_level: int = 0):
+        """
+        :param prefix: 点歌指令
+        :param medal_level: 最低粉丝牌（粉丝团）等级，0 表示不限制
+        :param guard_level: 大航海等级上限（数值越小等级越高），0 表示不限制
+        """
+        self.prefix = prefix
+        self.medal_level = medal_level
+        self.guard_level = guard_level
+        escaped = re.escape(prefix)
+        self._danmaku = re.compile(rf"(?:(?P<cancel>{CANCEL_KEYWORD})|{escaped} \s*(?P<song>.*?)\s*\Z)", re.S)
+        self._super_chat = re.compile(rf"\s*(?:{escaped})?\s*(?P<song>.*?)\s*\Z", re.S)
+
+    def _allowed(self, medal_level: int, guard_level: int):
+        if self.medal_level > 0 and medal_level < self.medal_level:
+            return False
+        if self.guard_level > 0 and guard_level > self.guard_level:
+            return False
+        return True
+
+    def parse(self, text: str, medal_level: int = 0, guard_level: int = 0) -> Command:
+        """
+        解析一条弹幕
+        """
+        match = self._danmaku.match(text)
+        if match is None:
+            return IGNORE
+        song_name = match.group("song")
+        if song_name is None:
+            return CANCEL
+        if not song_name or not self._allowed(medal_level, guard_level):
+            return IGNORE
+        return Command(CommandType.REQUEST, song_name)
+
+    def parse_super_chat(self, text: str, medal_level: int = 0, guard_level: int = 0) -> Command:
+        """
+        解析一条醒目留言，整条留言视为点歌，点歌指令可省略
+        """
+        if not self._allowed(medal_level, guard_level):
+            return IGNORE
+        song_name = self._super_chat.match(text).group("song")
+        if not song_name:
+            return IGNORE
+        return Command(CommandType.REQUEST, song_name)
+
+
+@lru_cache(maxsize=16)
+def get_parser(prefix: str, medal_level: int = 0, guard_level: int = 0) -> RequestParser:
+    """
+    按房间规则获取（并缓存）解析器，配置变化时自动编译新的解析器
+    """
+    return RequestParser(prefix, medal_level, guard_level)
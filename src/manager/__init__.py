@@ -1,9 +1,13 @@
 from .subscribe_manager import subscribe_manager, start_subscribe, stop_subscribe, cancel_subscribe
 from .server_manager import start_websocket_server, start_network_check, stop_all_servers
-from .messages import MessageManager
+from .messages import MessageManager, MessageDelta, MessageOp, MessageSnapshot, apply_delta
 
 __all__ = [
     "MessageManager",
+    "MessageDelta",
+    "MessageOp",
+    "MessageSnapshot",
+    "apply_delta",
     "start_websocket_server",
     "start_network_check",
     "stop_all_servers",
@@ -1,7 +1,59 @@
 import asyncio
-from . import subscribe_manager, cancel_subscribe
+from typing import NamedTuple
 from src.live import douyin_manager, bili_manager
-from src.utils import async_worker, logger, DanmuInfo, EventEmitter
+from src.utils import async_worker, logger, DanmuInfo, EventEmitter, RequestQueue
+
+
+class MessageOp(NamedTuple):
+    """
+    点歌列表的单个变更
+
+    - add: 在 index（按 send_time 倒序）处插入 item
+    - remove: 移除 msg_id
+    - move: msg_id 被新的 item 替换并移动到 index
+    """
+    op: str
+    msg_id: int
+    index: int = -1
+    item: DanmuInfo | None = None
+
+
+class MessageDelta(NamedTuple):
+    """
+    on_message_delta 事件，version 单调递增，接收方应按顺序应用 ops
+    """
+    version: int
+    ops: list[MessageOp]
+
+
+def apply_delta(items: list[DanmuInfo], ops: list[MessageOp]) -> list[DanmuInfo]:
+    """
+    将变更应用到按 send_time 倒序的点歌列表，返回新列表，不修改 items
+
+    接收方替换引用即可，其他线程读取旧列表（例如导出）时不会看到修改到一半的列表。
+    连续的移除合并成一次按 msg_id 集合的过滤，不再逐条扫描列表。
+    """
+    result = list(items)
+    removed: set[int] = set()
+    for op in ops:
+        if op.op != "add":
+            removed.add(op.msg_id)
+        if op.op != "remove":
+            if removed:
+                result = [item for item in result if item.msg_id not in removed]
+                removed.clear()
+            result.insert(op.index, op.item)
+    if removed:
+        result = [item for item in result if item.msg_id not in removed]
+    return result
+
+
+class MessageSnapshot(NamedTuple):
+    """
+    on_message_update 事件，version 之前的变更已包含在 items 中
+    """
+    version: int
+    items: list[DanmuInfo]
 
 
 class MessageManager():
@@ -11,7 +63,15 @@ class MessageManager():
         self._run_future = None
         self.douyin_status = 0
         self.bilibili_status = 0
-        self.danmaku_list: list[DanmuInfo] = []
+        self.danmaku_queue = RequestQueue()
+        self.version = 0
+
+    @property
+    def danmaku_list(self) -> list[DanmuInfo]:
+        """
+        按 send_time 倒序的点歌列表
+        """
+        return self.danmaku_queue.snapshot(newest_first=True)
 
     def start(self):
         if self._run_future and not self._run_future.done():
@@ -21,64 +81,103 @@ class MessageManager():
         self._run_future = async_worker.submit(self._start_and_run_client())
         logger.info("message_manager main task submitted to worker...")
 
-    async def _periodic_broadcast_task(self):
-        if not self._stop_event.is_set():
-            try:
-                douyin_list = douyin_manager.get_list()
-                bili_list = bili_manager.get_list()
-                combine_list = douyin_list + bili_list
-                if set(combine_list) != set(self.danmaku_list):
-                    combine_list.sort(key=lambda x: x.send_time, reverse=True)
-                    self.danmaku_list = combine_list[:]
-                    await self.events.emit("on_message_update", self.danmaku_list)
-
-                douyin_status = douyin_manager.get_status()
-                if self.douyin_status != douyin_status:
-                    dy_connect_status = douyin_status == 1
-                    dy_msg = "抖音已连接" if dy_connect_status else "抖音未连接"
-                    self.douyin_status = douyin_status
-                    await self.events.emit("on_status_change", {"is_connect": dy_connect_status, "message": dy_msg})
-
-                bilibili_status = bili_manager.get_status()
-                if self.bilibili_status != bilibili_status:
-                    bili_connect_status = bilibili_status == 2
-                    bili_msg = "哔哩哔哩已连接" if bili_connect_status else "哔哩哔哩未连接"
-                    self.bilibili_status = bilibili_status
-                    await self.events.emit("on_status_change", {"is_connect": bili_connect_status, "message": bili_msg})
-
-            except asyncio.CancelledError:
-                logger.info("periodic broadcast task was cancelled...")
-            except Exception as ex:
-                logger.error(f"Error in periodic broadcast task: {ex}")
+    def _attach(self):
+        """
+        订阅直播管理器的队列和连接状态事件，并同步一次当前状态
+        """
+        for manager in (douyin_manager, bili_manager):
+            manager.events.on("add", self._on_add)
+            manager.events.on("remove", self._on_remove)
+            manager.events.on("clear", self._on_clear)
+            manager.events.on("status", self._on_status)
+
+        danmaku_queue = RequestQueue()
+        for manager in (douyin_manager, bili_manager):
+            for item in manager.get_list():
+                danmaku_queue.append(item)
+        self.danmaku_queue = danmaku_queue
+        self.version += 1
+        self._publish("on_message_update", self.snapshot())
+        self._on_status("douyin", douyin_manager.get_status())
+        self._on_status("bilibili", bili_manager.get_status())
+
+    def _detach(self):
+        for manager in (douyin_manager, bili_manager):
+            manager.events.off("add", self._on_add)
+            manager.events.off("remove", self._on_remove)
+            manager.events.off("clear", self._on_clear)
+            manager.events.off("status", self._on_status)
+
+    def _publish(self, event_name: str, data):
+        async_worker.submit(self.events.emit(event_name, data))
+
+    def _publish_delta(self, ops: list[MessageOp]):
+        if not ops:
+            return
+        self.version += 1
+        self._publish("on_message_delta", MessageDelta(self.version, ops))
+
+    def snapshot(self) -> MessageSnapshot:
+        return MessageSnapshot(self.version, self.danmaku_list)
+
+    def _on_add(self, item: DanmuInfo):
+        moved = item.msg_id in self.danmaku_queue
+        if not self.danmaku_queue.append(item):
+            return
+        index = self.danmaku_queue.index(item.msg_id, newest_first=True)
+        self._publish_delta([MessageOp("move" if moved else "add", item.msg_id, index, item)])
+
+    def _on_remove(self, item: DanmuInfo):
+        if self.danmaku_queue.remove(item.msg_id):
+            self._publish_delta([MessageOp("remove", item.msg_id)])
+
+    def _on_clear(self, source: str):
+        ops = []
+        for item in [item for item in self.danmaku_queue if item.source == source]:
+            self.danmaku_queue.remove(item.msg_id)
+            ops.append(MessageOp("remove", item.msg_id))
+        self._publish_delta(ops)
+
+    def _on_status(self, source: str, status: int):
+        if source == "douyin" and self.douyin_status != status:
+            dy_connect_status = status == 1
+            dy_msg = "抖音已连接" if dy_connect_status else "抖音未连接"
+            self.douyin_status = status
+            self._publish("on_status_change", {"is_connect": dy_connect_status, "message": dy_msg})
+        if source == "bilibili" and self.bilibili_status != status:
+            bili_connect_status = status == 2
+            bili_msg = "哔哩哔哩已连接" if bili_connect_status else "哔哩哔哩未连接"
+            self.bilibili_status = status
+            self._publish("on_status_change", {"is_connect": bili_connect_status, "message": bili_msg})
 
     async def _start_and_run_client(self):
         try:
-            subscribe_manager.register("interval", seconds=2, id="flet_on_notify", replace_existing=True)(self._periodic_broadcast_task)
+            self._attach()
             await self._stop_event.wait()
         except asyncio.CancelledError:
             logger.warning("message_manager task was cancelled...")
         except Exception as ex:
             logger.error(f"message_manager task failed: {ex}")
         finally:
-            cancel_subscribe("flet_on_notify")
+            self._detach()
             logger.info("message_manager resources cleaned up...")
 
     def delete_message(self, source: str, msg_id: int):
         """
         删除单条消息
         """
+        # 点歌队列只在工作者线程中修改
         if source == "bilibili":
-            bili_manager.del_list(msg_id)
+            async_worker.call_soon(bili_manager.del_list, msg_id)
         if source == "douyin":
-            douyin_manager.del_list(msg_id)
+            async_worker.call_soon(douyin_manager.del_list, msg_id)
 
     async def clear_all_messages(self):
         """
         清空所有消息
         """
-        bili_manager.clear_list()
-        douyin_manager.clear_list()
-        await self.events.emit("on_message_update", [])
+        async_worker.call_soon(bili_manager.clear_list)
+        async_worker.call_soon(douyin_manager.clear_list)
 
     def add_manual_message(self, data: dict):
         """
@@ -86,15 +185,19 @@ class MessageManager():
         """
         source = data["source"]
         if source == "bilibili":
-            bili_manager.add_list(data["data"])
+            async_worker.call_soon(bili_manager.add_list, data["data"])
         if source == "douyin":
-            douyin_manager.add_list(data["data"])
+            async_worker.call_soon(douyin_manager.add_list, data["data"])
 
     async def sync_current_messages(self):
         """
-        手动触发同步当前列表（对应原 on_mount）
+        手动触发同步当前列表（对应原 on_mount），以 on_message_update 发送完整快照
         """
-        await self.events.emit("on_message_update", self.danmaku_list)
+        async def take_snapshot():
+            return self.snapshot()
+
+        snapshot = await async_worker.run_db_operation(take_snapshot())
+        await self.events.emit("on_message_update", snapshot)
 
     async def stop(self):
         if self._run_future and not self._run_future.done():
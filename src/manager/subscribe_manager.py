@@ -39,6 +39,7 @@ add_job = subscribe_manager.register
 async def start_subscribe():
     logger.info("start_subscribe called")
     subscribe_manager.start()
+    add_job("interval", minutes=30, id="maintain_database", replace_existing=True)(maintain_database)
     config = await Db.get_gloal_config()
     if config and config.check_update:
         add_job("interval", hours=5, id="check_updates", replace_existing=True)(check_update)
@@ -64,3 +65,7 @@ async def check_update():
         return
     if result["code"] == 0 and result["url"]:
         send_notification("提示", result["msg"])
+
+
+async def maintain_database():
+    await Db.maintain_storage()
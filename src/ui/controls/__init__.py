@@ -2,10 +2,12 @@ from .paging import Pagination
 from .progress import NProgress
 from .toast import ModernToast
 from .appbar import MenuBar
+from .song_list import SongList
 
 __all__ = [
     "Pagination",
     "NProgress",
     "ModernToast",
     "MenuBar",
+    "SongList",
 ]
@@ -2,6 +2,7 @@ import inspect
 import flet as ft
 from typing import Optional
 from flet import control, Card, ControlEventHandler, Ref
+from src.utils import LAST_PAGE
 
 
 @control
@@ -20,13 +21,24 @@ class Pagination(Card):
     分页大小
     """
 
+    next_cursor: Optional[str] = None
+    """
+    下一页游标，使用游标分页时由页面在加载数据后设置
+    """
+
+    prev_cursor: Optional[str] = None
+    """
+    上一页游标，使用游标分页时由页面在加载数据后设置
+    """
+
     on_page_change: Optional[ControlEventHandler["Pagination"]] = None
     """
-    翻页时触发
+    翻页时触发，data 为目标页码，cursor 为目标页的游标（首页为 None）
     """
 
     def init(self):
         self._page = 1
+        self.cursor = None
         self._page_num = (self.total + self.size - 1) // self.size
         self._ref_page = Ref[ft.Text]()
         self._ref_first_page = Ref[ft.IconButton]()
@@ -78,7 +90,14 @@ class Pagination(Card):
         self._ref_last_page.current.disabled = self._page == self._page_num
         return super().before_update()
 
-    async def _set_page(self, p=None, delta=0):
+    def reset(self):
+        """
+        回到第一页，重新搜索时调用
+        """
+        self._page = 1
+        self.cursor = None
+
+    async def _set_page(self, p=None, delta=0, cursor=None):
         if self.on_page_change is None:
             return
         if p is not None:
@@ -88,6 +107,7 @@ class Pagination(Card):
         else:
             return
         self.data = self._page
+        self.cursor = cursor
         # 判断是否异步函数
         if inspect.iscoroutinefunction(self.on_page_change):
             await self.on_page_change(ft.Event[self](name="Pagination", control=self))
@@ -97,11 +117,12 @@ class Pagination(Card):
 
     async def _next_page(self, e):
         if self._page < self._page_num:
-            await self._set_page(delta=1)
+            await self._set_page(delta=1, cursor=self.next_cursor)
 
     async def _prev_page(self, e):
         if self._page > 1:
-            await self._set_page(delta=-1)
+            # 上一页就是首页时不需要游标
+            await self._set_page(delta=-1, cursor=self.prev_cursor if self._page > 2 else None)
 
     async def _goto_first_page(self, e):
         if self._page > 1:
@@ -109,4 +130,4 @@ class Pagination(Card):
 
     async def _goto_last_page(self, e):
         if self._page != self._page_num:
-            await self._set_page(p=self._page_num)
+            await self._set_page(p=self._page_num, cursor=LAST_PAGE)
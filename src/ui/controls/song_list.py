@@ -0,0 +1,162 @@
+import flet as ft
+from typing import Awaitable, Callable, Optional
+from flet import control
+from src.utils import DanmuInfo
+
+
+@control
+class SongRow(ft.Column):
+    """
+    点歌列表中的一行，隔离控件：列表更新时不再逐个比较各行的子控件，行内变化由行自己 update()
+    """
+
+    def is_isolated(self):
+        return True
+
+
+@control
+class SongList(ft.ListView):
+    """
+    SongList 点歌列表
+
+    以 msg_id 为键保存每一行的控件，变更只插入或移除对应的行，
+    page.update() 时不会重新发送未变化的行。
+    只渲染前 page_size 行，其余点歌留在内存中，点击“显示更多”再展开，
+    每次更新比较的子控件数量与队列长度无关。
+    """
+
+    page_size: int = 50
+    """
+    默认渲染的行数，也是每次“显示更多”增加的行数
+    """
+
+    on_copy: Optional[Callable[[str], Awaitable[None]]] = None
+    """
+    点击复制时触发，参数为歌名
+    """
+
+    on_delete: Optional[Callable[[DanmuInfo], None]] = None
+    """
+    点击移除时触发，参数为对应的点歌
+    """
+
+    def init(self):
+        # 完整列表：msg_id 顺序与点歌，渲染的行是 _order 的前 len(_rows) 个
+        self._order: list[int] = []
+        self._items: dict[int, DanmuInfo] = {}
+        self._rows: dict[int, SongRow] = {}
+        self._limit = self.page_size
+        self._more = ft.TextButton("显示更多", key="more", on_click=self._handle_more)
+        self._more_shown = False
+
+    def reset(self, items: list[DanmuInfo]):
+        """
+        按完整快照重建列表
+        """
+        self._order = [item.msg_id for item in items]
+        self._items = {item.msg_id: item for item in items}
+        self._limit = self.page_size
+        self._rows = {item.msg_id: self._build_row(item) for item in items[:self._limit]}
+        self.controls = list(self._rows.values())
+        self._more_shown = False
+        self._sync_more()
+
+    def insert(self, index: int, item: DanmuInfo):
+        self.remove(item.msg_id)
+        index = min(index, len(self._order))
+        self._order.insert(index, item.msg_id)
+        self._items[item.msg_id] = item
+        if index >= self._limit:
+            self._sync_more()
+            return
+        row = self._build_row(item)
+        self._rows[item.msg_id] = row
+        self.controls.insert(index, row)
+        if len(self._rows) > self._limit:
+            # 超出窗口的最后一行移出渲染
+            del self._rows[self._order[self._limit]]
+            del self.controls[self._limit]
+        self._sync_more()
+
+    def remove(self, msg_id: int):
+        if self._items.pop(msg_id, None) is None:
+            return
+        # 渲染的行与 _order 顺序一致，按下标移除，不再逐个比较控件
+        index = self._order.index(msg_id)
+        del self._order[index]
+        if self._rows.pop(msg_id, None) is not None:
+            del self.controls[index]
+            if len(self._order) >= self._limit:
+                self._show(self._limit - 1)
+        self._sync_more()
+
+    def _show(self, index: int):
+        item = self._items[self._order[index]]
+        row = self._build_row(item)
+        self._rows[item.msg_id] = row
+        self.controls.insert(index, row)
+
+    def _sync_more(self):
+        more = len(self._order) > self._limit
+        if more and not self._more_shown:
+            self.controls.append(self._more)
+        elif not more and self._more_shown:
+            self.controls.pop()
+        self._more_shown = more
+
+    def _handle_more(self, e: ft.Event[ft.TextButton]):
+        self._limit += self.page_size
+        for index in range(len(self._rows), min(self._limit, len(self._order))):
+            self._show(index)
+        self._sync_more()
+        self.update()
+
+    def _build_row(self, item: DanmuInfo):
+        row = SongRow(
+            key=item.msg_id,
+            data={"title": item.uname, "subtitle": item.msg},
+            controls=[
+                ft.ListTile(
+                    leading=ft.Icon(ft.Icons.ACCOUNT_CIRCLE),
+                    bgcolor=ft.Colors.PRIMARY_CONTAINER,
+                    shape=ft.RoundedRectangleBorder(radius=15),
+                    title=item.uname,
+                    subtitle=item.msg,
+                    trailing=ft.Row(
+                        tight=True,
+                        alignment=ft.MainAxisAlignment.END,
+                        controls=[
+                            ft.IconButton(
+                                icon=ft.Icons.COPY,
+                                data=item,
+                                tooltip="复制",
+                                on_click=self._handle_copy,
+                            ),
+                            ft.IconButton(
+                                icon=ft.Icons.DELETE,
+                                icon_color=ft.Colors.RED,
+                                data=item,
+                                tooltip="移除",
+                                on_click=self._handle_delete,
+                            ),
+                        ]
+                    ),
+                ),
+            ],
+        )
+        return row
+
+    async def _handle_copy(self, e: ft.Event[ft.IconButton]):
+        if self.on_copy:
+            await self.on_copy(e.control.data.msg)
+
+    def _handle_delete(self, e: ft.Event[ft.IconButton]):
+        item: DanmuInfo = e.control.data
+        row = self._rows.get(item.msg_id)
+        if row is None:
+            return
+        # 只更新本行，等待删除事件到达后再移除
+        row.disabled = True
+        row.update()
+        if self.on_delete:
+            self.on_delete(item)
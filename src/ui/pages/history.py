@@ -33,9 +33,9 @@ def main(page: ft.Page):
     total = 0
     songs_rows: list[HistoryItem] = []
 
-    async def load_data(current_page: int):
+    async def load_data(current_page: int, cursor: str | None = None):
         """
-        获取数据
+        获取数据，按游标分页，总数单独获取并缓存
         """
         nonlocal total, songs_rows
         NProgress.start(page)
@@ -55,20 +55,27 @@ def main(page: ft.Page):
             if end_date_picker.current.value
             else None
         )
-        total, songs = await async_worker.run_db_operation(
-            db.get_song_history_page(
-                uname, song_name, source, start_time, end_time, current_page, 20
+        total = await async_worker.run_db_operation(
+            db.count_song_history(uname, song_name, source, start_time, end_time)
+        )
+        result = await async_worker.run_db_operation(
+            db.get_song_history_cursor(
+                uname, song_name, source, start_time, end_time, cursor, 20
             )
         )
-        songs_rows = songs
+        songs_rows = result.rows
+        if current_page == 1 and cursor is None:
+            pagination.current.reset()
         pagination.current.total = total
+        pagination.current.next_cursor = result.next_cursor
+        pagination.current.prev_cursor = result.prev_cursor
         list_view.current.controls = generate_list()
         await list_view.current.scroll_to(offset=0)
         NProgress.stop(page)
         page.update()
 
     async def handle_paging(e: ft.Event[Pagination]):
-        await load_data(e.control.data)
+        await load_data(e.control.data, e.control.cursor)
 
     def create_paging():
         """
@@ -1,34 +1,72 @@
 import time
 import io
+import threading
+from collections import deque
 import pandas as pd
 import flet as ft
 from flet import Ref
 from typing import cast
 from src.utils import DanmuInfo, logger, timespan_to_localtime
-from src.manager import MessageManager
-from ..controls import ModernToast
+from src.manager import MessageManager, MessageDelta, MessageSnapshot, apply_delta
+from ..controls import ModernToast, SongList
 
 
 def main(page: ft.Page):
     height = page.window.height
-    list_tile_list: list[ft.Column] = []
     danmaku_list: list[DanmuInfo] = []
+    version = 0
+    # 待渲染的快照/变更，按到达顺序在 UI 线程中依次应用
+    pending_renders: deque = deque()
+    render_lock = threading.Lock()
 
     message_handler = cast(MessageManager, page.data["message_handler"])
 
-    def on_message(msg):
+    def render():
+        with render_lock:
+            if not pending_renders:
+                return
+            while pending_renders:
+                kind, data = pending_renders.popleft()
+                if kind == "snapshot":
+                    list_view.reset(data)
+                    continue
+                for op in data:
+                    if op.op == "remove":
+                        list_view.remove(op.msg_id)
+                    else:
+                        list_view.insert(op.index, op.item)
+            list_view.update()
+
+    def on_message(snapshot: MessageSnapshot):
+        """
+        用完整快照替换点歌列表
+        """
+        nonlocal danmaku_list, version
+        if snapshot.version < version:
+            return
+        danmaku_list = list(snapshot.items)
+        version = snapshot.version
+        pending_renders.append(("snapshot", danmaku_list[:]))
+        page.run_thread(render)
+
+    def on_message_delta(delta: MessageDelta):
         """
-        更新点歌列表
+        应用点歌列表变更，快照已包含的变更直接跳过，版本不连续时重新同步快照
         """
-        nonlocal danmaku_list
-        danmaku_list = msg
-
-        def update_ui():
-            list_view.controls = generate_list()
-            page.update()
-        page.run_thread(update_ui)
+        nonlocal danmaku_list, version
+        if delta.version <= version:
+            return
+        if delta.version != version + 1:
+            page.run_task(message_handler.sync_current_messages)
+            return
+        # 换成新列表，UI 线程中的导出始终读取完整的一版
+        danmaku_list = apply_delta(danmaku_list, delta.ops)
+        version = delta.version
+        pending_renders.append(("delta", delta.ops))
+        page.run_thread(render)
 
     message_handler.events.on("on_message_update", on_message)
+    message_handler.events.on("on_message_delta", on_message_delta)
 
     async def on_mount():
         """
@@ -36,18 +74,12 @@ def main(page: ft.Page):
         """
         await message_handler.sync_current_messages()
 
-    async def handle_context_click(e: ft.Event[ft.IconButton]):
+    def on_delete(item: DanmuInfo):
         """
-        ContextMenu 事件
+        移除单条点歌
         """
-        if e.control.data["action"] == "copy":
-            await on_copy(e.control.data["msg"])
-        if e.control.data["action"] == "delete":
-            message_handler.delete_message(
-                e.control.data["source"], 
-                e.control.data["msg_id"]
-            )
-            ModernToast.success(page, "已移除")
+        message_handler.delete_message(item.source, item.msg_id)
+        ModernToast.success(page, "已移除")
 
     async def on_copy(data):
         """
@@ -75,16 +107,18 @@ def main(page: ft.Page):
         导出列表
         """
         try:
-            if len(danmaku_list) == 0:
+            # 只读取一次引用，导出过程中列表被替换也不会出现各列长度不一致
+            items = danmaku_list
+            if len(items) == 0:
                 ModernToast.info(page, "没有数据")
                 return
             df_dict = {
                 "日期": [
-                    timespan_to_localtime(item.send_time) for item in danmaku_list
+                    timespan_to_localtime(item.send_time) for item in items
                 ],
-                "昵称": [item.uname for item in danmaku_list],
-                "歌名": [item.msg for item in danmaku_list],
-                "平台": [item.source for item in danmaku_list],
+                "昵称": [item.uname for item in items],
+                "歌名": [item.msg for item in items],
+                "平台": [item.source for item in items],
             }
             df = pd.DataFrame(df_dict)
             excel_buffer = io.BytesIO()
@@ -122,7 +156,8 @@ def main(page: ft.Page):
                 {
                     "source": "bilibili",
                     "data": DanmuInfo(
-                        msg_id=int(time.time()),
+                        # 同一秒内多次手动点歌也不能重复，队列按 msg_id 去重
+                        msg_id=time.time_ns(),
                         uid=1,
                         uname="主播",
                         msg=song_name_text.current.value,
@@ -149,53 +184,7 @@ def main(page: ft.Page):
             )
         )
 
-    def generate_list():
-        """
-        生成列表
-        """
-        nonlocal list_tile_list
-        list_tile_list.clear()
-        for item in danmaku_list:
-            col = ft.Column(
-                data={"title": item.uname, "subtitle": item.msg},
-                controls=[
-                    ft.ListTile(
-                        leading=ft.Icon(ft.Icons.ACCOUNT_CIRCLE),
-                        bgcolor=ft.Colors.PRIMARY_CONTAINER,
-                        shape=ft.RoundedRectangleBorder(radius=15),
-                        title=item.uname,
-                        subtitle=item.msg,
-                        trailing=ft.Row(
-                            tight=True,
-                            alignment=ft.MainAxisAlignment.END,
-                            controls=[
-                                ft.IconButton(
-                                    icon=ft.Icons.COPY,
-                                    data={"action": "copy", "msg": item.msg},
-                                    tooltip="复制",
-                                    on_click=handle_context_click,
-                                ),
-                                ft.IconButton(
-                                    icon=ft.Icons.DELETE,
-                                    icon_color=ft.Colors.RED,
-                                    data={
-                                        "action": "delete",
-                                        "source": item.source,
-                                        "msg_id": item.msg_id,
-                                    },
-                                    tooltip="移除",
-                                    on_click=handle_context_click,
-                                ),
-                            ]
-                        ),
-                    ),
-                ],
-            )
-
-            list_tile_list.append(col)
-        return list_tile_list
-
-    list_view = ft.ListView(spacing=10, padding=20, scroll="auto", controls=[])
+    list_view = SongList(spacing=10, padding=20, scroll="auto", on_copy=on_copy, on_delete=on_delete)
 
     def create_main_card():
         """
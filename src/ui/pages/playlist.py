@@ -19,24 +19,28 @@ def main(page: ft.Page):
 
     total = 0
 
-    async def load_data(current_page: int):
+    async def load_data(current_page: int, cursor: str | None = None):
         """
-        获取数据
+        获取数据，按游标分页，总数单独获取并缓存
         """
         nonlocal total
         NProgress.start(page)
         keyword = keyword_text.current.value if keyword_text.current else None
-        count, songs = await async_worker.run_db_operation(
-            db.get_playlist_page(keyword, current_page, 20)
+        total = await async_worker.run_db_operation(db.count_playlist(keyword))
+        result = await async_worker.run_db_operation(
+            db.get_playlist_cursor(keyword, cursor, 20)
         )
-        total = count
+        if current_page == 1 and cursor is None:
+            pagination.current.reset()
         pagination.current.total = total
-        data_table.rows = generate_rows(songs)
+        pagination.current.next_cursor = result.next_cursor
+        pagination.current.prev_cursor = result.prev_cursor
+        data_table.rows = generate_rows(result.rows)
         NProgress.stop(page)
         page.update()
 
     async def handle_paging(e: ft.Event[Pagination]):
-        await load_data(e.control.data)
+        await load_data(e.control.data, e.control.cursor)
 
     def create_paging():
         """
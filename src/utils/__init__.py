@@ -26,12 +26,16 @@ from .models import (
     PlaylistItem,
     BiliCredentialItem,
     HistoryItem,
+    LAST_PAGE,
 )
+from .reconnect import ReconnectPolicy, ReconnectAttempt, ReconnectStats
 from .ws_client import WebSocketClient
 from .worker import async_worker
 from .ws_server import WebSocketServer
 from .emoji import bilibili_emoji, douyin_emoji
 from .event import EventEmitter
+from .request_queue import RequestQueue
+from .notifier import NotificationDispatcher, notification_dispatcher
 
 __all__ = [
     "logger",
@@ -53,6 +57,9 @@ __all__ = [
     "globalfigItem",
     "check_for_updates",
     "WebSocketClient",
+    "ReconnectPolicy",
+    "ReconnectAttempt",
+    "ReconnectStats",
     "async_worker",
     "send_notification",
     "WebSocketServer",
@@ -62,7 +69,11 @@ __all__ = [
     "PlaylistItem",
     "BiliCredentialItem",
     "HistoryItem",
+    "LAST_PAGE",
     "bilibili_emoji",
     "douyin_emoji",
     "EventEmitter",
+    "RequestQueue",
+    "NotificationDispatcher",
+    "notification_dispatcher",
 ]
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+import aiohttp
+
+logger = logging.getLogger("danmaku")
+
+# 连接池配置，按用途分组，同组的请求复用 TCP/TLS 连接和 DNS 缓存
+PROFILES = {
+    "default": {},
+    # 抖音接口和推送服务器不校验证书
+    "douyin": {"ssl": False},
+}
+CONNECTOR_OPTIONS = {
+    "limit": 100,
+    "limit_per_host": 10,
+    "ttl_dns_cache": 300,
+    "keepalive_timeout": 60,
+}
+
+
+class HttpClients:
+    """
+    进程内共享的 aiohttp 会话注册表
+
+    会话绑定创建它的事件循环，每个循环、每个 profile 只创建一个，由 AsyncWorker 在停止时关闭。
+    会话使用 DummyCookieJar，不在请求之间保留 cookie，需要 cookie 的请求自行设置请求头。
+    """
+
+    def __init__(self):
+        self._sessions: dict[asyncio.AbstractEventLoop, dict[str, aiohttp.ClientSession]] = {}
+        self._closers: list[Callable[[], Awaitable[None]]] = []
+
+    def session(self, profile: str = "default") -> aiohttp.ClientSession:
+        """获取当前事件循环下指定 profile 的共享会话，必须在事件循环中调用。"""
+        loop = asyncio.get_running_loop()
+        sessions = self._sessions.get(loop)
+        if sessions is None:
+            # 顺带丢弃已关闭循环的会话
+            for stale in [item for item in self._sessions if item.is_closed()]:
+                del self._sessions[stale]
+            sessions = self._sessions[loop] = {}
+        session = sessions.get(profile)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(**CONNECTOR_OPTIONS, **PROFILES[profile])
+            session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+            sessions[profile] = session
+        return session
+
+    def add_closer(self, closer: Callable[[], Awaitable[None]]):
+        """注册关闭时额外执行的清理协程，例如第三方库自行维护的会话。"""
+        self._closers.append(closer)
+
+    async def close(self):
+        """关闭当前事件循环下的全部会话。"""
+        loop = asyncio.get_running_loop()
+        sessions = self._sessions.pop(loop, {})
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+        for closer in self._closers:
+            try:
+                await closer()
+            except Exception as e:
+                logger.warning(f"HTTP client cleanup failed: {e}")
+        if sessions:
+            logger.info(f"Closed {len(sessions)} shared HTTP session(s).")
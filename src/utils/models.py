@@ -1,6 +1,9 @@
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
 
+# 分页游标：跳到最后一页，分页控件和数据库分页共用
+LAST_PAGE = "last"
+
 
 class DanmuInfo(BaseModel):
     model_config = {"frozen": True}
@@ -0,0 +1,161 @@
+import queue
+import threading
+import time
+import logging
+from typing import Callable, NamedTuple, Optional
+from src.notifypy import Notify
+
+logger = logging.getLogger("danmaku")
+
+
+class Notification(NamedTuple):
+    title: str
+    message: str
+    # 合并时使用的标题模板，{count} 为合并条数；为 None 时不参与合并
+    summary: Optional[str] = None
+
+
+class NotificationDispatcher:
+    """
+    桌面通知分发器
+
+    所有通知经有界队列交给一个常驻线程发送，调用方不会阻塞：
+
+    - window 秒内到达的同一 summary 的通知合并为一条，如 "收到 12 首新的点歌"
+    - 两次发送至少间隔 min_interval 秒，等待期间到达的通知并入下一批
+    - 队列满时丢弃新的通知
+    """
+
+    def __init__(
+        self,
+        send: Optional[Callable[[str, str], None]] = None,
+        window: float = 1.0,
+        min_interval: float = 3.0,
+        max_pending: int = 200,
+    ):
+        self.window = window
+        self.min_interval = min_interval
+        self.sent_count = 0
+        self.merged_count = 0
+        self.dropped_count = 0
+        self._send = send
+        self._queue: queue.Queue[Notification | None] = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._last_sent = 0.0
+
+    def post(self, title: str, message: str, summary: Optional[str] = None) -> bool:
+        """
+        投递一条通知，返回是否进入队列
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(Notification(title, message, summary))
+            return True
+        except queue.Full:
+            self.dropped_count += 1
+            return False
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="NotificationDispatcher")
+                self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        """
+        发送队列中剩余的通知后停止线程
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stopping = self._collect(batch, time.monotonic() + self.window)
+            # 限速：距离上次发送不足 min_interval 时继续收集
+            wait_until = self._last_sent + self.min_interval
+            if not stopping and time.monotonic() < wait_until:
+                stopping = self._collect(batch, wait_until)
+            for notification in self._merge(batch):
+                self._deliver(notification)
+            if stopping:
+                return
+
+    def _collect(self, batch: list[Notification], deadline: float) -> bool:
+        """
+        收集 deadline 之前到达的通知，收到停止信号时返回 True
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                notification = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            if notification is None:
+                return True
+            batch.append(notification)
+
+    def _merge(self, batch: list[Notification]) -> list[Notification]:
+        merged: list[Notification] = []
+        groups: dict[str, list[Notification]] = {}
+        for notification in batch:
+            if notification.summary is None:
+                merged.append(notification)
+                continue
+            group = groups.get(notification.summary)
+            if group is None:
+                groups[notification.summary] = group = []
+                merged.append(notification)
+            group.append(notification)
+
+        result = []
+        for notification in merged:
+            group = groups.get(notification.summary) if notification.summary else None
+            if group is None or len(group) == 1:
+                result.append(notification)
+                continue
+            self.merged_count += len(group) - 1
+            message = "、".join(item.message for item in group[:5])
+            if len(group) > 5:
+                message += " 等"
+            result.append(Notification(notification.summary.format(count=len(group)), message))
+        return result
+
+    def _deliver(self, notification: Notification):
+        try:
+            (self._send or _send_desktop_notification)(notification.title, notification.message)
+            self.sent_count += 1
+        except Exception as e:
+            logger.error(f"Failed to send notification: {e}")
+        self._last_sent = time.monotonic()
+
+
+_notify = None
+
+
+def _send_desktop_notification(title: str, message: str):
+    """
+    在分发线程中同步发送，复用同一个 Notify 实例
+    """
+    global _notify
+    if _notify is None:
+        _notify = Notify(enable_logging=True)
+        _notify.application_name = "点歌姬"
+    _notify.title = title
+    _notify.message = message
+    _notify.start_notification_thread(threading.Event())
+
+
+notification_dispatcher = NotificationDispatcher()
@@ -0,0 +1,110 @@
+import random
+import time
+from collections import deque
+from typing import NamedTuple
+
+
+class ReconnectAttempt(NamedTuple):
+    attempt: int
+    # 等待的退避时间（秒）
+    delay: float
+    # 从安排重连到连接成功或失败的时间（秒），包含 delay
+    duration: float
+    success: bool
+
+
+class ReconnectStats(NamedTuple):
+    attempts: int
+    failures: int
+    recoveries: int
+    # 断线到恢复连接的时间（秒）
+    last_recovery: float
+    mean_recovery: float
+    max_recovery: float
+
+
+class ReconnectPolicy:
+    """
+    WebSocket 重连策略
+
+    - 第一次重连立即进行（immediate_first），应对偶发断线
+    - 之后按 base_delay * 2^n 指数退避，上限 max_delay，实际等待 [0, 上限) 之间的随机值（full jitter）
+    - 连接保持 stable_after 秒以上再断开才重置 attempt，反复连上即断的情况会持续退避
+    - attempt 只决定退避时间，是否放弃重连由 WebSocketClient 按连续失败次数判断
+    """
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 60.0, stable_after: float = 30.0,
+                 immediate_first: bool = True, history: int = 100, clock=time.monotonic, rand=random.random):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stable_after = stable_after
+        self.immediate_first = immediate_first
+        self.attempt = 0
+        self.history: deque[ReconnectAttempt] = deque(maxlen=history)
+        self.recoveries: deque[float] = deque(maxlen=history)
+        self._clock = clock
+        self._rand = rand
+        self._connected_at: float | None = None
+        self._down_since: float | None = None
+        # (attempt, delay, 开始时间)
+        self._pending: tuple[int, float, float] | None = None
+        self._attempts = 0
+        self._failures = 0
+
+    def next_delay(self) -> float:
+        """开始一次重连，返回需要等待的秒数"""
+        self.attempt += 1
+        exponent = self.attempt - 2 if self.immediate_first else self.attempt - 1
+        if exponent < 0:
+            delay = 0.0
+        else:
+            delay = self._rand() * min(self.max_delay, self.base_delay * 2 ** exponent)
+        self._pending = (self.attempt, delay, self._clock())
+        self._attempts += 1
+        return delay
+
+    def on_connected(self):
+        now = self._clock()
+        self._finish(now, True)
+        if self._down_since is not None:
+            self.recoveries.append(now - self._down_since)
+            self._down_since = None
+        self._connected_at = now
+
+    def on_disconnected(self):
+        """连接断开或连接失败时调用"""
+        now = self._clock()
+        self._finish(now, False)
+        if self._connected_at is not None and now - self._connected_at >= self.stable_after:
+            self.attempt = 0
+        self._connected_at = None
+        if self._down_since is None:
+            self._down_since = now
+
+    def _finish(self, now: float, success: bool):
+        if self._pending is None:
+            return
+        attempt, delay, started = self._pending
+        self._pending = None
+        self.history.append(ReconnectAttempt(attempt, delay, now - started, success))
+        if not success:
+            self._failures += 1
+
+    def reset(self):
+        self.attempt = 0
+        self._connected_at = None
+        self._down_since = None
+        self._pending = None
+
+    def stats(self) -> ReconnectStats:
+        recoveries = self.recoveries
+        if not recoveries:
+            return ReconnectStats(self._attempts, self._failures, 0, 0.0, 0.0, 0.0)
+        return ReconnectStats(
+            self._attempts,
+            self._failures,
+            len(recoveries),
+            recoveries[-1],
+            sum(recoveries) / len(recoveries),
+            max(recoveries),
+        )
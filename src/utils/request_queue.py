@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from typing import Callable, Iterator, Optional
+from .models import DanmuInfo
+
+
+class RequestQueue:
+    """
+    点歌队列
+
+    以 OrderedDict(msg_id -> DanmuInfo) 按 send_time 升序保存点歌，另维护 (source, uid) 二级索引：
+
+    - append / remove(msg_id) / get(msg_id) / latest_by_uid(uid) 均为 O(1)
+    - 迭代顺序即 send_time 升序
+    - capacity > 0 时限制队列长度，eviction 为 "oldest" 时淘汰最早的点歌，为 "reject" 时拒绝新的点歌
+    """
+
+    def __init__(self, capacity: int = 0, eviction: str = "oldest", on_evict: Optional[Callable[[DanmuInfo], None]] = None):
+        if eviction not in ("oldest", "reject"):
+            raise ValueError(f"unknown eviction policy: {eviction}")
+        self.capacity = capacity
+        self.eviction = eviction
+        self.on_evict = on_evict
+        self.version = 0
+        self._items: OrderedDict[int, DanmuInfo] = OrderedDict()
+        self._by_uid: dict[tuple[str, int], dict[int, None]] = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[DanmuInfo]:
+        return iter(self._items.values())
+
+    def __reversed__(self) -> Iterator[DanmuInfo]:
+        return reversed(self._items.values())
+
+    def __contains__(self, msg_id: int):
+        return msg_id in self._items
+
+    def get(self, msg_id: int) -> DanmuInfo | None:
+        return self._items.get(msg_id)
+
+    def index(self, msg_id: int, newest_first: bool = False) -> int:
+        """
+        点歌在队列中的位置，从对应一端开始查找，新点歌在 newest_first 时为 O(1)
+        """
+        keys = reversed(self._items) if newest_first else iter(self._items)
+        for i, key in enumerate(keys):
+            if key == msg_id:
+                return i
+        raise ValueError(f"{msg_id} is not in queue")
+
+    def latest_by_uid(self, uid: int, source: str = "") -> DanmuInfo | None:
+        """
+        获取用户在队列中最新的一条点歌
+        """
+        msg_ids = self._by_uid.get((source, uid))
+        if not msg_ids:
+            return None
+        return self._items[next(reversed(msg_ids))]
+
+    def append(self, item: DanmuInfo) -> bool:
+        """
+        加入队列，返回是否被接受
+        """
+        if item.msg_id in self._items:
+            self.remove(item.msg_id)
+        if self.capacity > 0 and len(self._items) >= self.capacity:
+            if self.eviction == "reject":
+                return False
+            _, evicted = self._items.popitem(last=False)
+            self._unindex(evicted)
+            if self.on_evict:
+                self.on_evict(evicted)
+
+        self._items[item.msg_id] = item
+        if len(self._items) > 1:
+            self._reorder(item)
+        self._by_uid.setdefault((item.source, item.uid), {})[item.msg_id] = None
+        self.version += 1
+        return True
+
+    def _reorder(self, item: DanmuInfo):
+        """
+        新元素已追加到末尾，send_time 乱序时调整位置
+        """
+        items = iter(reversed(self._items.values()))
+        next(items)
+        previous = next(items)
+        if previous.send_time <= item.send_time:
+            return
+        first = next(iter(self._items.values()))
+        if item.send_time <= first.send_time or first is previous:
+            self._items.move_to_end(item.msg_id, last=False)
+            return
+        # 极少出现的中间插入，整体重排
+        self._items = OrderedDict(sorted(self._items.items(), key=lambda kv: kv[1].send_time))
+
+    def remove(self, msg_id: int) -> DanmuInfo | None:
+        item = self._items.pop(msg_id, None)
+        if item is None:
+            return None
+        self._unindex(item)
+        self.version += 1
+        return item
+
+    def _unindex(self, item: DanmuInfo):
+        key = (item.source, item.uid)
+        msg_ids = self._by_uid.get(key)
+        if msg_ids is None:
+            return
+        msg_ids.pop(item.msg_id, None)
+        if not msg_ids:
+            del self._by_uid[key]
+
+    def clear(self):
+        self._items.clear()
+        self._by_uid.clear()
+        self.version += 1
+
+    def snapshot(self, newest_first: bool = False) -> list[DanmuInfo]:
+        return list(reversed(self._items.values())) if newest_first else list(self._items.values())
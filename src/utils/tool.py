@@ -6,10 +6,10 @@ import logging
 import getpass
 import re
 import socket
-import aiohttp
 from pathlib import Path
 from ._version import __version__ as CURRENT_VERSION
-from src.notifypy import Notify
+from .notifier import notification_dispatcher
+from .worker import async_worker
 
 if sys.platform == "win32":
     import winreg
@@ -120,22 +120,19 @@ def resource_path(relative_path: str):
     return resource_dir.as_posix()
 
 
-def send_notification(title, message):
+def send_notification(title, message, summary=None):
     """
-    发送桌面通知。
+    发送桌面通知，交给后台分发线程，不阻塞调用方。
 
     Args:
         title (str): 通知标题。
         message (str): 通知内容。
+        summary (str, optional): 合并时使用的标题模板，如 "收到 {count} 首新的点歌"，为 None 时不合并。
 
     Returns:
         None
     """
-    notification = Notify(enable_logging=True)
-    notification.application_name = "点歌姬"
-    notification.title = title
-    notification.message = message
-    notification.send(block=False)
+    notification_dispatcher.post(title, message, summary)
 
 
 def get_autostart_command():
@@ -319,9 +316,8 @@ async def check_for_updates():
         return 0
 
     try:
-        async with aiohttp.ClientSession() as session:
-            response = await session.get(repo_url)
-        latest_release = await response.json()
+        async with async_worker.http.session().get(repo_url) as response:
+            latest_release = await response.json()
 
         # 区分处理有release和没有release的场景
         if "tag_name" not in latest_release:
@@ -1,9 +1,11 @@
 import asyncio
 import threading
 import logging
-from typing import Coroutine, Callable, Any, TypeVar, Union
+from collections import deque
+from typing import Coroutine, Callable, Any, NamedTuple, TypeVar, Union
 from asyncio.futures import Future as AsyncioFuture
 from concurrent.futures import Future as ConcurrentFuture, ThreadPoolExecutor
+from .http import HttpClients
 
 # 定义回调函数的类型签名
 DoneCallback = Callable[[Any], None]
@@ -12,6 +14,54 @@ T = TypeVar("T")
 logger = logging.getLogger("danmaku")
 
 
+class LoopLag(NamedTuple):
+    """
+    事件循环延迟统计（毫秒）
+    """
+    last: float
+    mean: float
+    p99: float
+    max: float
+
+
+class LoopLagMonitor:
+    """
+    事件循环延迟监测
+
+    每隔 interval 秒 sleep 一次，实际唤醒时间比预期晚的部分即为事件循环被阻塞的时间，
+    保留最近 window 个样本。
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 600, warn_threshold: float = 0.5):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self._samples: deque[float] = deque(maxlen=window)
+        self._max = 0.0
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._samples.append(lag)
+            self._max = max(self._max, lag)
+            if lag > self.warn_threshold:
+                logger.warning(f"AsyncWorker event loop blocked for {lag * 1000:.0f} ms.")
+
+    def stats(self) -> LoopLag:
+        if not self._samples:
+            return LoopLag(0.0, 0.0, 0.0, 0.0)
+        ordered = sorted(self._samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        mean = sum(ordered) / len(ordered)
+        return LoopLag(self._samples[-1] * 1000, mean * 1000, p99 * 1000, self._max * 1000)
+
+    def reset(self):
+        self._samples.clear()
+        self._max = 0.0
+
+
 class AsyncWorker:
     """
     在专用后台线程中运行一个持久的 asyncio 事件循环的单例工作者。
@@ -22,6 +72,9 @@ class AsyncWorker:
         self._loop = None
         self._thread = None
         self._ready = threading.Event()  # 用于发信号通知循环已准备就绪
+        self.lag_monitor = LoopLagMonitor()
+        # 共享的 HTTP 会话，在工作者循环中创建，停止时统一关闭
+        self.http = HttpClients()
 
     def start(self):
         """启动后台线程和事件循环。"""
@@ -39,6 +92,7 @@ class AsyncWorker:
         # 在此循环中初始化数据库，然后再开始永久运行
         from src.database import Db
         self._loop.run_until_complete(Db.init())
+        self._loop.create_task(self.lag_monitor.run())
 
         self._ready.set()  # 发信号通知循环已准备好
         self._loop.run_forever()  # 运行循环直到 stop() 被调用
@@ -54,6 +108,8 @@ class AsyncWorker:
                 task.cancel()
             # 等待所有任务完成取消
             await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
+            # 任务都结束后再关闭共享会话，避免取消过程中的请求使用已关闭的会话
+            await self.http.close()
 
         if not self._loop.is_closed():
             try:
@@ -95,6 +151,16 @@ class AsyncWorker:
 
         return future
 
+    def loop_lag(self) -> LoopLag:
+        """获取工作者事件循环的延迟统计，用于观察解码、数据库等操作是否阻塞了循环。"""
+        return self.lag_monitor.stats()
+
+    def call_soon(self, callback: Callable[..., Any], *args):
+        """在工作者的事件循环线程中执行一个普通函数，用于线程安全地修改循环内的状态。"""
+        if self._loop is None or not self._loop.is_running():
+            raise RuntimeError("AsyncWorker is not running.")
+        return self._loop.call_soon_threadsafe(callback, *args)
+
     async def run_db_operation(self, coro: Union[Coroutine[Any, Any, T], AsyncioFuture, ConcurrentFuture]) -> T:
         """
         在工作者循环中运行一个协程并等待其结果。
@@ -1,7 +1,9 @@
 import asyncio
 import aiohttp
-from typing import Optional
+from typing import Callable, Optional
 from .log import logger
+from .worker import async_worker
+from .reconnect import ReconnectPolicy
 
 
 class WebSocketClient:
@@ -20,14 +22,32 @@ class WebSocketClient:
         self.url = ""
         self.headers = {}
         self.max_retries = 5
-        self.retry_delay = 5
+        # 连续重连失败次数，与 max_retries 比较，连接成功即重置；退避时间由 reconnect_policy 决定
+        self._retry_count = 0
+        self.reconnect_policy = ReconnectPolicy()
+        # 使用 async_worker.http 中该 profile 的共享会话，不随客户端关闭
+        self.http_profile = "default"
         self.session: Optional[aiohttp.ClientSession] = None
         self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self._is_running = False
-        self._retry_count = 0
         self._reconnect_task: Optional[asyncio.Task] = None
         self._listen_task: Optional[asyncio.Task] = None
-        self.status_code = 0  # 0:未连接, 1:已连接, 2:已断开, 3:连接失败
+        self._status_code = 0
+        self.on_status_change: Optional[Callable[[int], None]] = None
+
+    @property
+    def status_code(self):
+        """
+        连接状态码，0:未连接, 1:已连接, 2:已断开, 3:连接失败
+        """
+        return self._status_code
+
+    @status_code.setter
+    def status_code(self, value: int):
+        changed = self._status_code != value
+        self._status_code = value
+        if changed and self.on_status_change:
+            self.on_status_change(value)
 
     @property
     def is_connected(self):
@@ -42,16 +62,18 @@ class WebSocketClient:
         """
         连接到WebSocket服务器。
         """
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        self.session = async_worker.http.session(self.http_profile)
 
         try:
-            self.ws = await self.session.ws_connect(self.url, ssl=False, autoclose=False, heartbeat=5)
+            self.ws = await self.session.ws_connect(self.url, headers=self.headers, ssl=False, autoclose=False, heartbeat=5)
             logger.info(f"成功连接到 {self.url}")
             self._is_running = True
             self.status_code = 1  # 已连接
             self._retry_count = 0  # 重置重连计数器
-            if self._reconnect_task:
+            # 退避次数在连接稳定一段时间后才重置，见 ReconnectPolicy
+            self.reconnect_policy.on_connected()
+            # 重连时 connect 本身就在 _reconnect_task 中执行，不能取消自己
+            if self._reconnect_task and self._reconnect_task is not asyncio.current_task():
                 self._reconnect_task.cancel()
             self._listen_task = asyncio.create_task(self.listen())
         except aiohttp.ClientError as e:
@@ -72,7 +94,9 @@ class WebSocketClient:
                     await self.on_message(msg.data)
                 elif msg.type == aiohttp.WSMsgType.BINARY:
                     await self.on_message(msg.data)
-                elif msg.type in [aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR]:
+                elif msg.type in [aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING,
+                                  aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR]:
+                    # autoclose=False 时服务端主动关闭会先收到 CLOSE，不处理会一直等到心跳超时
                     if msg.type == aiohttp.WSMsgType.ERROR:
                         logger.error(f"WebSocket 错误: {self.ws.exception()}")
                     else:
@@ -110,17 +134,30 @@ class WebSocketClient:
         """
         安排重连任务。
         """
+        policy = self.reconnect_policy
+        policy.on_disconnected()
         if self._is_running and self._retry_count < self.max_retries:
             self._retry_count += 1
+            delay = policy.next_delay()
             self.status_code = 2
-            logger.info(f"将在 {self.retry_delay} 秒后尝试重新连接 (第 {self._retry_count}/{self.max_retries} 次)")
-            self._reconnect_task = asyncio.create_task(self._reconnect())
+            logger.info(f"将在 {delay:.2f} 秒后尝试重新连接 (第 {self._retry_count}/{self.max_retries} 次)")
+            self._reconnect_task = asyncio.create_task(self._reconnect_later(delay))
         else:
             if self._is_running:
                 logger.error("已达到最大重连次数，将关闭客户端。")
                 self.status_code = 3  # 连接失败
                 await self.close()
 
+    async def _reconnect_later(self, delay: float):
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._reconnect()
+
+    async def _prepare_reconnect(self):
+        """
+        重连前的准备工作，例如刷新连接地址。子类可重写此方法。
+        """
+
     async def _reconnect(self):
         """
         执行重连操作。
@@ -130,12 +167,12 @@ class WebSocketClient:
         if self.ws:
             await self.ws.close()
         self.ws = None
-        await asyncio.sleep(self.retry_delay)
+        await self._prepare_reconnect()
         await self.connect()
 
     async def close(self):
         """
-        关闭WebSocket连接和客户端会话。
+        关闭WebSocket连接，共享会话由 async_worker 统一关闭。
         """
         if self._is_running and self.status_code != 3:
             self.status_code = 2  # 已断开
@@ -148,9 +185,6 @@ class WebSocketClient:
         if self.ws and not self.ws.closed:
             await self.ws.close()
             logger.info("WebSocket连接已成功关闭")
-        if self.session and not self.session.closed:
-            await self.session.close()
-            logger.info("客户端会话已成功关闭")
         self.ws = None
         self.session = None
 
@@ -160,4 +194,6 @@ class WebSocketClient:
         """
         if not self._is_running:
             self.status_code = 0  # 重置状态
+            self.reconnect_policy.reset()
+            self._retry_count = 0
             await self.connect()
@@ -57,6 +57,10 @@ class TestBilibili(unittest.IsolatedAsyncioTestCase):
         mock_bili_live.LiveDanmaku.assert_called_once()
         mock_live_danmaku.connect.assert_awaited_once()
         self.assertIsNotNone(bili.live)
+        # LiveDanmaku 的连接状态由认证成功和心跳超时事件推送
+        events = [call.args[0] for call in mock_live_danmaku.on.call_args_list]
+        self.assertIn("VERIFICATION_SUCCESSFUL", events)
+        self.assertIn("TIMEOUT", events)
 
         # 调用 stop
         await bili.stop()
@@ -65,7 +69,7 @@ class TestBilibili(unittest.IsolatedAsyncioTestCase):
 
         # 验证 stop 逻辑
         mock_live_danmaku.disconnect.assert_awaited_once()
-        self.assertEqual(mock_live_danmaku.remove_event_listener.call_count, 2)
+        self.assertEqual(mock_live_danmaku.remove_event_listener.call_count, 4)
         self.assertIsNone(bili.live)
         self.assertIsNone(bili._run_future)
 
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import struct
+import unittest
+import zlib
+from unittest import mock
+import brotli
+from aiohttp import web, WSMsgType
+from aiohttp.test_utils import TestServer
+from bilibili_api import Credential
+
+from src.bilibili import BiliLiveClient
+from src.bilibili.wire import (
+    OP_AUTH,
+    OP_AUTH_REPLY,
+    OP_HEARTBEAT,
+    OP_HEARTBEAT_REPLY,
+    OP_MESSAGE,
+    PROTO_BROTLI,
+    PROTO_JSON,
+    PROTO_ZLIB,
+    CommandDecoder,
+    iter_packets,
+    pack,
+    read_cmd,
+)
+from src.utils import async_worker
+
+
+def message(body: bytes) -> bytes:
+    return pack(body, OP_MESSAGE, PROTO_JSON)
+
+
+DANMU = {"cmd": "DANMU_MSG:4:0:2:2:2:0", "info": [[0], "点歌 晴天", [5, "user"]]}
+SUPER_CHAT = {"cmd": "SUPER_CHAT_MESSAGE", "data": {"uid": 6, "message": "点歌 稻香", "price": 30}}
+# 未订阅的 cmd，正文不是合法 JSON，解码就会报错
+INTERACT = b'{"cmd":"INTERACT_WORD","data":{not json'
+
+
+def batch(*bodies: bytes, protover=PROTO_BROTLI) -> bytes:
+    inner = b"".join(message(body) for body in bodies)
+    compressed = brotli.compress(inner) if protover == PROTO_BROTLI else zlib.compress(inner)
+    return pack(compressed, OP_MESSAGE, protover)
+
+
+class TestBilibiliWire(unittest.TestCase):
+
+    def test_iter_packets_nested(self):
+        """
+        测试拆分 brotli/zlib 压缩和未压缩的数据包
+        """
+        data = batch(b'{"cmd":"A"}', b'{"cmd":"B"}') + batch(b'{"cmd":"C"}', protover=PROTO_ZLIB) + message(b'{"cmd":"D"}')
+        self.assertEqual([read_cmd(body) for _, _, body in iter_packets(data)], ["A", "B", "C", "D"])
+        with self.assertRaises(ValueError):
+            list(iter_packets(data[:-2]))
+
+    def test_decode_only_subscribed(self):
+        """
+        测试只解码订阅的 cmd，事件名去掉 DANMU_MSG 的后缀而正文保持原样，未订阅的正文不会 json 解码
+        """
+        decoder = CommandDecoder(["DANMU_MSG", "SUPER_CHAT_MESSAGE"])
+        data = batch(json.dumps(DANMU).encode(), INTERACT, json.dumps(SUPER_CHAT, ensure_ascii=False).encode())
+        events = decoder.decode(data)
+        self.assertEqual([cmd for cmd, _ in events], ["DANMU_MSG", "SUPER_CHAT_MESSAGE"])
+        self.assertEqual(events[0].data["info"][1], "点歌 晴天")
+        self.assertEqual(events[0].data["cmd"], DANMU["cmd"])
+        self.assertEqual(events[1].data["data"]["price"], 30)
+
+        decoder.set_cmds(["INTERACT_WORD"])
+        with self.assertRaises(ValueError):
+            decoder.decode(data)
+
+    def test_cmd_not_at_start_falls_back(self):
+        """
+        测试 cmd 不在正文开头时退回完整解码
+        """
+        body = json.dumps({"data": {"x": "y" * 100}, "cmd": "DANMU_MSG"}).encode()
+        self.assertIsNone(read_cmd(memoryview(body)))
+        events = CommandDecoder(["DANMU_MSG"]).decode(message(body))
+        self.assertEqual([cmd for cmd, _ in events], ["DANMU_MSG"])
+
+    def test_control_packets(self):
+        """
+        测试认证回复和心跳回复
+        """
+        decoder = CommandDecoder([])
+        events = decoder.decode(pack(b'{"code":0}', OP_AUTH_REPLY) + pack(struct.pack(">I", 1234), OP_HEARTBEAT_REPLY))
+        self.assertEqual(events, [("VERIFICATION_SUCCESSFUL", {"code": 0}), ("VIEW", 1234)])
+
+
+class LocalClient(BiliLiveClient):
+    async def _prepare_reconnect(self):
+        self.room_real_id = 1000
+        self._token = "token"
+
+
+class TestBiliLiveClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.auth = None
+
+        async def handler(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            async for msg in ws:
+                if msg.type != WSMsgType.BINARY:
+                    continue
+                for _, op, body in iter_packets(msg.data):
+                    if op == OP_AUTH:
+                        self.auth = json.loads(bytes(body))
+                        await ws.send_bytes(pack(b'{"code":0}', OP_AUTH_REPLY))
+                        await ws.send_bytes(batch(json.dumps(DANMU).encode(), INTERACT,
+                                                  json.dumps(SUPER_CHAT).encode()))
+                    elif op == OP_HEARTBEAT:
+                        await ws.send_bytes(pack(struct.pack(">I", 42), OP_HEARTBEAT_REPLY))
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/sub", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        await async_worker.http.close()
+
+    async def test_events_match_live_danmaku(self):
+        """
+        测试认证、心跳和订阅事件，事件结构与 bilibili_api 的 LiveDanmaku 一致
+        """
+        client = LocalClient(room_display_id=1, credential=Credential(dedeuserid="7", buvid3="buvid"))
+        client.url = str(self.server.make_url("/sub"))
+        events = asyncio.Queue()
+        client.on("DANMU_MSG")(events.put)
+        client.on("SUPER_CHAT_MESSAGE")(events.put)
+        client.on("VIEW")(events.put)
+        statuses = []
+        client.on_status_change = statuses.append
+
+        await client.connect_async()
+        received = [await asyncio.wait_for(events.get(), 5) for _ in range(3)]
+        self.assertEqual(client.get_status(), BiliLiveClient.STATUS_ESTABLISHED)
+        self.assertEqual((self.auth["uid"], self.auth["roomid"], self.auth["key"], self.auth["protover"]), (7, 1000, "token", 3))
+
+        by_type = {event["type"]: event for event in received}
+        self.assertEqual(by_type["DANMU_MSG"]["data"]["info"][2], [5, "user"])
+        self.assertEqual(by_type["DANMU_MSG"]["data"]["cmd"], DANMU["cmd"])
+        self.assertEqual(by_type["SUPER_CHAT_MESSAGE"]["data"]["data"]["uid"], 6)
+        self.assertEqual(by_type["VIEW"]["data"], 42)
+        self.assertEqual(by_type["VIEW"]["room_real_id"], 1000)
+
+        await client.disconnect()
+        self.assertEqual(client.get_status(), BiliLiveClient.STATUS_CLOSED)
+        # 状态变化直接推送，认证成功后才是已连接
+        self.assertEqual(statuses[-2:], [BiliLiveClient.STATUS_ESTABLISHED, BiliLiveClient.STATUS_CLOSED])
+        self.assertTrue(all(a != b for a, b in zip(statuses, statuses[1:])), statuses)
+
+    async def test_dispatch_keeps_task_references(self):
+        """
+        测试异步处理函数的任务在完成前被持有，异常会记录日志
+        """
+        client = LocalClient(room_display_id=1)
+        release = asyncio.Event()
+
+        async def handler(event):
+            await release.wait()
+            raise RuntimeError(event["type"])
+
+        client.on("DANMU_MSG")(handler)
+        with mock.patch("src.bilibili.client.logger") as logger:
+            client.dispatch("DANMU_MSG", {"type": "DANMU_MSG"})
+            self.assertEqual(len(client._tasks), 1)
+            release.set()
+            await asyncio.gather(*client._tasks, return_exceptions=True)
+            await asyncio.sleep(0)
+        self.assertFalse(client._tasks)
+        logger.error.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
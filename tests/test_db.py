@@ -0,0 +1,276 @@
+import asyncio
+import unittest
+from tortoise import Tortoise
+
+from src.database import Db
+from src.database.journal import SongHistoryJournal
+from src.database.paging import LAST_PAGE
+from src.database.model import GloalConfig, SongHistory
+
+
+class TestDb(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["src.database.model"]})
+        await Tortoise.generate_schemas()
+        Db._conn = Tortoise.get_connection("default")
+        Db._cooldown.clear()
+        Db._config_cache.clear()
+        Db._catalog.clear()
+        Db._counts.clear()
+        Db._search.clear()
+
+    async def asyncTearDown(self):
+        await Tortoise.close_connections()
+
+    async def test_cooldown_index_warm_and_update(self):
+        """
+        测试冷却索引从 songhistory 预热，并在新增点歌时更新。
+        """
+        await SongHistory.create(uid=1, uname="a", song_name="x", source="bilibili", create_time=100)
+        latest = await SongHistory.create(uid=1, uname="a", song_name="y", source="bilibili", create_time=200)
+        await SongHistory.create(uid=1, uname="a", song_name="z", source="douyin", create_time=300)
+
+        await Db._cooldown.warm(Db._conn)
+        self.assertEqual(len(Db._cooldown), 2)
+
+        entry = await Db.get_last_request(uid=1, source="bilibili")
+        self.assertEqual(entry.history_id, latest.id)
+        self.assertEqual(entry.create_time, 200)
+
+        history = await Db.add_song_history(uid=1, uname="a", song_name="w", source="bilibili", create_time=400)
+        entry = await Db.get_last_request(uid=1, source="bilibili")
+        self.assertEqual(entry.history_id, history.id)
+
+        # 预热后未命中直接视为没有记录，绕过 Db 写入的记录不会被查到
+        await SongHistory.create(uid=5, uname="e", song_name="x", source="douyin", create_time=500)
+        self.assertIsNone(await Db.get_last_request(uid=5, source="douyin"))
+
+    async def test_cooldown_index_miss_falls_back_to_db(self):
+        """
+        测试索引未预热时，未命中回落到数据库查询并回填索引。
+        """
+        history = await SongHistory.create(uid=2, uname="b", song_name="x", source="douyin", create_time=100)
+
+        self.assertIsNone(Db._cooldown.get(2, "douyin"))
+        entry = await Db.get_last_request(uid=2, source="douyin")
+        self.assertEqual(entry.history_id, history.id)
+        self.assertIsNotNone(Db._cooldown.get(2, "douyin"))
+        self.assertIsNone(await Db.get_last_request(uid=3, source="douyin"))
+
+    async def test_config_cache_write_through(self):
+        """
+        测试配置缓存命中、写入刷新以及订阅通知。
+        """
+        changes = []
+        Db.subscribe_config(GloalConfig, changes.append)
+        before = Db.get_config_cache_stats()
+        self.assertIsNone(await Db.get_gloal_config())
+        self.assertIsNone(await Db.get_gloal_config())
+        after = Db.get_config_cache_stats()
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        self.assertEqual(after["misses"] - before["misses"], 1)
+
+        config_id = await Db.add_or_update_gloal_config(
+            id=0, dark_mode=False, check_update=False, startup=False,
+            notification=True, navSideTour=False, collapse=False
+        )
+        self.assertTrue(changes[-1].notification)
+        await Db.add_or_update_gloal_config(id=config_id, notification=False)
+        self.assertFalse(changes[-1].notification)
+        self.assertFalse((await Db.get_gloal_config()).notification)
+        Db.unsubscribe_config(GloalConfig, changes.append)
+
+    async def test_song_history_journal_group_commit(self):
+        """
+        测试写后日志立即分配 id，并在刷新或停止时批量落盘。
+        """
+        await SongHistory.create(uid=1, uname="a", song_name="x", source="bilibili", create_time=100)
+        Db._journal = SongHistoryJournal(flush_interval=60, max_batch=1000)
+        await Db._journal.start(Db._conn)
+        try:
+            rows = [
+                await Db.add_song_history(uid=i, uname="u", song_name=f"s{i}", source="douyin", create_time=200 + i)
+                for i in range(5)
+            ]
+            self.assertEqual([row.id for row in rows], [2, 3, 4, 5, 6])
+            self.assertEqual(Db._journal.pending, 5)
+            self.assertEqual(await SongHistory.all().count(), 1)
+            # 最近一次点歌直接从日志中读取，不触发落盘
+            history = await Db.get_song_history(uid=4, source="douyin")
+            self.assertEqual(history.id, 6)
+            self.assertEqual(Db._journal.pending, 5)
+            await Db.add_song_history(uid=9, uname="u", song_name="last", source="douyin", create_time=300)
+        finally:
+            await Db._journal.stop()
+            Db._journal = SongHistoryJournal()
+        self.assertEqual(await SongHistory.all().count(), 7)
+
+    async def test_song_history_journal_inflight_flush(self):
+        """
+        测试后台提交进行中时，flush() 等待这一批落盘后返回，stop() 不会打断提交而丢数据。
+        """
+        Db._journal = SongHistoryJournal(flush_interval=60, max_batch=100000)
+        await Db._journal.start(Db._conn)
+        try:
+            for batch in range(2):
+                for i in range(5000):
+                    await Db.add_song_history(uid=i, uname="u", song_name="s", source="bilibili", create_time=i)
+                Db._journal._wakeup.set()
+                while not Db._journal._flushing:
+                    await asyncio.sleep(0)
+                self.assertEqual(Db._journal.pending, 0)
+                self.assertEqual(Db._journal.latest(4999, "bilibili").id, (batch + 1) * 5000)
+                if batch == 0:
+                    await Db.flush_song_history()
+                    self.assertEqual(await SongHistory.all().count(), 5000)
+        finally:
+            await Db._journal.stop()
+            Db._journal = SongHistoryJournal()
+        self.assertEqual(await SongHistory.all().count(), 10000)
+
+    async def test_song_history_journal_drops_bad_rows(self):
+        """
+        测试批量写入失败不影响读取，重试达到上限后逐条写入并丢弃坏记录，之后的记录照常落盘。
+        """
+        Db._journal = SongHistoryJournal(flush_interval=60, max_batch=1000, max_retries=2)
+        await Db._journal.start(Db._conn)
+        try:
+            await Db.add_song_history(uid=1, uname="u", song_name="a", source="douyin", create_time=100)
+            bad = await Db.add_song_history(uid=2, uname="u", song_name="b", source="douyin", create_time=101)
+            # song_name 不允许为空，整批写入会失败
+            bad.song_name = None
+            await Db.add_song_history(uid=3, uname="u", song_name="c", source="douyin", create_time=102)
+
+            total, _ = await Db.get_song_history_page()
+            self.assertEqual(total, 0)
+            self.assertEqual(Db._journal.pending, 3)
+            await Db.flush_song_history()
+            self.assertEqual(Db._journal.pending, 0)
+            self.assertEqual(Db._journal.dropped_rows, 1)
+            self.assertEqual(await SongHistory.all().order_by("id").values_list("song_name", flat=True), ["a", "c"])
+
+            await Db.add_song_history(uid=4, uname="u", song_name="d", source="douyin", create_time=103)
+            self.assertEqual(await Db.count_song_history(), 3)
+        finally:
+            await Db._journal.stop()
+            Db._journal = SongHistoryJournal()
+
+    async def test_playlist_catalog_sync(self):
+        """
+        测试歌单索引的归一化匹配，以及增删改时与数据库保持同步。
+        """
+        base = {"singer": "s", "language": "国语", "tag": "流行", "create_time": 1}
+        await Db.bulk_add_playlist([
+            {"song_name": "Hello World", "is_sc": True, "sc_price": 30, **base},
+            {"song_name": "晴天", "is_sc": False, "sc_price": 0, **base},
+        ])
+        entry = Db.match_playlist("  ｈｅｌｌｏ  world ")
+        self.assertEqual(entry.song_name, "Hello World")
+        self.assertTrue(entry.is_sc)
+        self.assertEqual(entry.sc_price, 30)
+
+        dupe_id = await Db.add_or_update_playlist(id=0, song_name="hello world", is_sc=False, sc_price=0, **base)
+        self.assertEqual(Db.match_playlist("HELLOWORLD").id, entry.id)
+        await Db.add_or_update_playlist(id=entry.id, sc_price=50)
+        self.assertEqual(Db.match_playlist("hello world").sc_price, 50)
+
+        await Db.delete_playlist([entry.id])
+        self.assertEqual(Db.match_playlist("hello world").id, dupe_id)
+        await Db.delete_playlist([dupe_id])
+        self.assertIsNone(Db.match_playlist("hello world"))
+        self.assertEqual(Db.match_playlist("晴 天").song_name, "晴天")
+
+    async def test_song_history_cursor_pages(self):
+        """
+        测试游标分页与按页码分页结果一致，能前后翻页和跳到最后一页，create_time 相同时按 id 排序。
+        """
+        await SongHistory.bulk_create([
+            SongHistory(uid=i, uname="u", song_name=f"s{i}", source="douyin" if i % 2 else "bilibili", create_time=i // 3)
+            for i in range(23)
+        ])
+        expected = await SongHistory.filter(source="douyin").order_by("-create_time", "-id").values_list("id", flat=True)
+
+        pages = []
+        result = await Db.get_song_history_cursor(source="douyin", size=5)
+        self.assertIsNone(result.prev_cursor)
+        while True:
+            pages.append([row.id for row in result.rows])
+            if result.next_cursor is None:
+                break
+            result = await Db.get_song_history_cursor(source="douyin", cursor=result.next_cursor, size=5)
+        self.assertEqual([len(rows) for rows in pages], [5, 5, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+        prev = await Db.get_song_history_cursor(source="douyin", cursor=result.prev_cursor, size=5)
+        self.assertEqual([row.id for row in prev.rows], pages[1])
+        prev = await Db.get_song_history_cursor(source="douyin", cursor=prev.prev_cursor, size=5)
+        self.assertEqual([row.id for row in prev.rows], pages[0])
+        self.assertIsNone(prev.prev_cursor)
+
+        last = await Db.get_song_history_cursor(source="douyin", cursor=LAST_PAGE, size=5)
+        self.assertEqual([row.id for row in last.rows], pages[-1])
+        self.assertIsNone(last.next_cursor)
+        prev = await Db.get_song_history_cursor(source="douyin", cursor=last.prev_cursor, size=5)
+        self.assertEqual([row.id for row in prev.rows], pages[1])
+
+        with self.assertRaises(ValueError):
+            await Db.get_song_history_cursor(cursor="bogus")
+
+    async def test_page_count_cache(self):
+        """
+        测试分页总数按筛选条件缓存，新增点歌和修改歌单时失效。
+        """
+        await SongHistory.create(uid=1, uname="a", song_name="x", source="bilibili", create_time=100)
+        self.assertEqual(await Db.count_song_history(source="bilibili"), 1)
+        self.assertEqual(await Db.count_song_history(source="bilibili"), 1)
+        self.assertEqual(Db._counts.stats()["hits"], 1)
+        await Db.add_song_history(uid=2, uname="b", song_name="y", source="bilibili", create_time=200)
+        self.assertEqual(await Db.count_song_history(source="bilibili"), 2)
+
+        base = {"singer": "s", "language": "国语", "tag": "流行", "is_sc": False, "sc_price": 0}
+        await Db.bulk_add_playlist([{"song_name": f"s{i}", "create_time": i, **base} for i in range(3)])
+        self.assertEqual(await Db.count_playlist(), 3)
+        await Db.add_or_update_playlist(id=0, song_name="晴天", create_time=9, **base)
+        self.assertEqual(await Db.count_playlist("晴"), 1)
+        page = await Db.get_playlist_cursor(size=2)
+        self.assertEqual([row.song_name for row in page.rows], ["晴天", "s2"])
+        page = await Db.get_playlist_cursor(cursor=page.next_cursor, size=2)
+        self.assertEqual([row.song_name for row in page.rows], ["s1", "s0"])
+        self.assertIsNone(page.next_cursor)
+
+    async def test_fulltext_search_matches_like(self):
+        """
+        测试 FTS5 trigram 搜索与 LIKE 结果一致，中文子串、引号都能匹配，短关键字回落到 LIKE，增删改由触发器同步。
+        """
+        await Db._search.setup(Db._conn)
+        if not Db._search.available:
+            self.skipTest("sqlite without fts5 trigram")
+        names = ["晴天", "七里香", "告白气球", "Hello World", 'say "hi"', "it's", "夜曲"]
+        await SongHistory.bulk_create([
+            SongHistory(uid=i, uname=f"用户{i}", song_name=name, source="bilibili", create_time=i)
+            for i, name in enumerate(names)
+        ])
+        base = {"language": "国语", "tag": "流行", "is_sc": False, "sc_price": 0, "create_time": 1}
+        await Db.bulk_add_playlist([{"song_name": name, "singer": "周杰伦", **base} for name in names])
+
+        for term in ["七里香", "告白气", "hello", 'y "h', "it's", "晴天", "用户1", "不存在"]:
+            with self.subTest(term):
+                like = await Db.get_song_history_page(song_name=term, fulltext=False)
+                fts = await Db.get_song_history_page(song_name=term)
+                self.assertEqual([row.id for row in fts[1]], [row.id for row in like[1]])
+                like = await Db.get_playlist_page(term, fulltext=False)
+                fts = await Db.get_playlist_page(term)
+                self.assertEqual(sorted(row.id for row in fts[1]), sorted(row.id for row in like[1]))
+        self.assertEqual((await Db.get_playlist_page("周杰伦"))[0], len(names))
+        self.assertEqual((await Db.get_song_history_page(uname="户3", song_name="Wor"))[0], 1)
+
+        song = await SongHistory.get(song_name="夜曲").first()
+        await SongHistory.filter(id=song.id).update(song_name="稻香夜曲")
+        self.assertEqual((await Db.get_song_history_page(song_name="稻香夜"))[0], 1)
+        await SongHistory.filter(id=song.id).delete()
+        self.assertEqual((await Db.get_song_history_page(song_name="稻香夜"))[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
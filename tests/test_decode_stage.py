@@ -0,0 +1,44 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.douyin.decode_stage import DecodeStage
+
+
+class TestDecodeStage(unittest.IsolatedAsyncioTestCase):
+
+    async def test_order_and_window(self):
+        """
+        测试线程池解码乱序完成时仍按到达顺序处理，小帧内联解码，在途帧数不超过窗口。
+        """
+        handled = []
+        max_in_flight = 0
+
+        def decode(frame: bytes):
+            # 越早到达的大帧解码越慢
+            if len(frame) >= 8:
+                time.sleep(0.02 * (10 - frame[0]) / 10)
+            return frame[0]
+
+        async def handle(result):
+            handled.append(result)
+
+        executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(executor.shutdown)
+        stage = DecodeStage(decode, handle, executor, max_in_flight=3, inline_threshold=8)
+        stage.start()
+        for i in range(10):
+            frame = bytes([i]) * (1 if i % 3 == 0 else 16)
+            await stage.put(frame)
+            max_in_flight = max(max_in_flight, stage.in_flight)
+
+        for _ in range(100):
+            if len(handled) == 10:
+                break
+            await asyncio.sleep(0.02)
+        await stage.stop()
+
+        self.assertEqual(handled, list(range(10)))
+        self.assertLessEqual(max_in_flight, 3)
+        self.assertEqual((stage.inline_count, stage.offloaded_count), (4, 6))
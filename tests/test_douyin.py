@@ -51,7 +51,7 @@ class TestDouyin(unittest.IsolatedAsyncioTestCase):
 
         # 验证 start 逻辑
         mock_async_worker.submit.assert_called_once()
-        mock_douyin_fetcher.assert_called_with(live_id=456, max_retries=99)
+        mock_douyin_fetcher.assert_called_with(live_id=456, max_retries=99, decode_executor=None)
         mock_fetcher_instance.connect_async.assert_awaited_once()
         self.assertIsNotNone(douyin.live)
 
@@ -0,0 +1,120 @@
+import asyncio
+import gzip
+import unittest
+from aiohttp import web, WSMsgType
+from aiohttp.test_utils import TestServer
+
+from src.douyin import lib, DouyinLiveWebFetcher
+from src.douyin.client import HEARTBEAT_FRAME
+from src.douyin.wire import ResponseDecoder, decode_push_frame, encode_push_frame
+from src.utils import async_worker
+
+
+class TestHeartbeatFrames(unittest.TestCase):
+
+    def test_encode_matches_betterproto(self):
+        """
+        测试直接编码的心跳和 ack 帧与 betterproto2 序列化结果一致
+        """
+        self.assertEqual(HEARTBEAT_FRAME, bytes(lib.WebcastImPushFrame(payload_type="hb")))
+        ack = lib.WebcastImPushFrame(log_id=2**63 + 5, payload_type="ack", payload="internal_src:dim|x".encode())
+        self.assertEqual(encode_push_frame(2**63 + 5, "ack", b"internal_src:dim|x"), bytes(ack))
+
+    def test_decode_heartbeat_duration(self):
+        """
+        测试选择性解码读取服务端下发的心跳间隔
+        """
+        response = lib.WebcastImResponse(heartbeat_duration=10000, need_ack=True, internal_ext="ext")
+        decoded = ResponseDecoder([]).decode(bytes(response))
+        self.assertEqual((decoded.heartbeat_duration, decoded.need_ack, decoded.internal_ext), (10000, True, "ext"))
+
+
+class LocalFetcher(DouyinLiveWebFetcher):
+    async def _prepare_reconnect(self):
+        # 重连仍然连接本地替身服务
+        pass
+
+
+def msg_frame(log_id, heartbeat_duration=0):
+    response = lib.WebcastImResponse(need_ack=True, internal_ext=f"ext-{log_id}", heartbeat_duration=heartbeat_duration)
+    return bytes(lib.WebcastImPushFrame(log_id=log_id, payload_encoding="gzip", payload_type="msg",
+                                        payload=gzip.compress(bytes(response))))
+
+
+class TestHeartbeatAgainstServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.received = []
+        self.connections = 0
+        # 为 False 时不回复心跳，模拟服务端已失效但 TCP 未断开
+        self.reply_heartbeat = True
+        self.frames_to_send = []
+
+        async def handler(request):
+            ws = web.WebSocketResponse(autoping=True)
+            await ws.prepare(request)
+            self.connections += 1
+            for frame in self.frames_to_send:
+                await ws.send_bytes(frame)
+            async for msg in ws:
+                if msg.type != WSMsgType.BINARY:
+                    continue
+                frame = decode_push_frame(msg.data)
+                self.received.append((self.connections, frame.payload_type, frame.log_id, bytes(frame.payload)))
+                if frame.payload_type == "hb" and self.reply_heartbeat:
+                    await ws.send_bytes(HEARTBEAT_FRAME)
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.fetcher = LocalFetcher(live_id=1, max_retries=5)
+        self.fetcher.url = str(self.server.make_url("/ws"))
+
+    async def asyncTearDown(self):
+        await self.fetcher.disconnect_async()
+        await self.server.close()
+        await async_worker.http.close()
+
+    async def start(self):
+        await self.fetcher._start()
+        self.fetcher.heartheat_task = asyncio.create_task(self.fetcher._sendHeartbeat())
+
+    async def wait_until(self, predicate, timeout=5):
+        async def poll():
+            while not predicate():
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(poll(), timeout)
+
+    async def test_acks_coalesced_and_interval_from_server(self):
+        """
+        测试窗口内的多个 ack 只发送最新的一个，并采用服务端下发的心跳间隔，记录心跳往返时间
+        """
+        self.frames_to_send = [msg_frame(1), msg_frame(2), msg_frame(3, heartbeat_duration=2000)]
+        await self.start()
+        await self.wait_until(lambda: any(kind == "ack" for _, kind, _, _ in self.received))
+        await asyncio.sleep(self.fetcher.ack_window * 2)
+
+        acks = [(log_id, payload) for _, kind, log_id, payload in self.received if kind == "ack"]
+        self.assertEqual(acks, [(3, b"ext-3")])
+        self.assertEqual((self.fetcher.ack_count, self.fetcher.ack_sent), (3, 1))
+        self.assertEqual(self.fetcher.heartbeat_interval, 2.0)
+        await self.wait_until(lambda: len(self.fetcher.heartbeat_rtt) > 0)
+        self.assertLess(self.fetcher.heartbeat_rtt[0], 1)
+
+    async def test_stale_connection_detected_within_interval(self):
+        """
+        测试心跳没有回复时在一个间隔内判定连接失效并重连
+        """
+        self.fetcher.heartbeat_interval = 0.3
+        self.reply_heartbeat = False
+        await self.start()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await self.wait_until(lambda: self.connections >= 2)
+        self.assertLess(loop.time() - started, 0.3 + 0.2)
+        self.assertEqual(self.fetcher.stale_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
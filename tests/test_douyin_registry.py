@@ -0,0 +1,98 @@
+import gzip
+import unittest
+
+from src.douyin import lib, DouyinLiveWebFetcher, CHAT, GIFT, LIKE
+from src.douyin.registry import MethodRegistry
+from src.douyin.wire import decode_frame
+
+
+def build_frame(*messages):
+    response = lib.WebcastImResponse(
+        messages=[lib.WebcastImMessage(method=method, payload=payload, msg_id=i) for i, (method, payload) in enumerate(messages)],
+    )
+    return bytes(lib.WebcastImPushFrame(log_id=1, payload_encoding="gzip", payload_type="msg", payload=gzip.compress(bytes(response))))
+
+
+class TestMethodRegistry(unittest.TestCase):
+
+    def test_subscription_updates_decoder(self):
+        """
+        测试订阅和取消订阅会同步更新解码器，未订阅的 method 不会被解码
+        """
+        registry = MethodRegistry()
+        registry.subscribe(CHAT, lambda payload: None)
+        registry.subscribe(GIFT, lambda payload: None)
+        self.assertEqual(registry.methods, {CHAT, GIFT})
+        registry.unsubscribe(GIFT)
+        self.assertEqual(registry.methods, {CHAT})
+        self.assertNotIn(GIFT, registry)
+
+        frame = build_frame((CHAT, b"a"), (GIFT, b"b"), (LIKE, b"c"))
+        decoded = decode_frame(frame, registry.decoder)
+        self.assertEqual([method for method, _ in decoded.response.messages], [CHAT])
+
+    def test_dispatch_counts(self):
+        """
+        测试按 method 统计收到、成功、失败和耗时，处理器异常不会向外抛出
+        """
+        registry = MethodRegistry()
+        handled = []
+
+        def handler(payload):
+            if bytes(payload) == b"bad":
+                raise ValueError("bad payload")
+            handled.append(bytes(payload))
+
+        registry.subscribe(CHAT, handler)
+        for payload in (b"a", b"bad", b"b"):
+            registry.dispatch(CHAT, memoryview(payload))
+        registry.dispatch(GIFT, memoryview(b"ignored"))
+
+        self.assertEqual(handled, [b"a", b"b"])
+        stats = registry.stats()
+        self.assertEqual(list(stats), [CHAT])
+        self.assertEqual(stats[CHAT][:3], (3, 2, 1))
+        self.assertGreater(stats[CHAT].decode_time, 0)
+
+        # 取消订阅后统计保留
+        registry.unsubscribe(CHAT)
+        self.assertEqual(registry.stats()[CHAT].received, 3)
+
+    def test_subscribe_message(self):
+        """
+        测试 subscribe_message 把 payload 解析为对应的 schema 消息
+        """
+        registry = MethodRegistry()
+        gifts = []
+        registry.subscribe_message(GIFT, gifts.append)
+        gift = lib.WebcastImGiftMessage(gift_id=42, repeat_count=3)
+        registry.dispatch(GIFT, memoryview(bytes(gift)))
+        self.assertEqual(gifts, [gift])
+
+
+class TestFetcherDispatch(unittest.IsolatedAsyncioTestCase):
+
+    async def test_handle_frame_dispatches_chat(self):
+        """
+        测试抖音客户端默认订阅聊天消息，并可以额外订阅其他 method
+        """
+        fetcher = DouyinLiveWebFetcher(live_id=1)
+        danmus = []
+        fetcher.dispatch = lambda event, data: danmus.append((event, data["content"]))
+        likes = []
+        fetcher.subscribe(LIKE, lambda payload: likes.append(bytes(payload)))
+
+        chat = lib.WebcastImChatMessage(content="点歌 晴天", user=lib.WebcastDataUser(id=5, nickname="user"))
+        frame = build_frame((CHAT, bytes(chat)), (LIKE, b"\x08\x01"), (GIFT, b"\x08\x02"))
+        await fetcher.on_message(frame)
+
+        self.assertEqual(danmus, [("danmu", "点歌 晴天")])
+        self.assertEqual(likes, [b"\x08\x01"])
+        stats = fetcher.method_stats()
+        self.assertEqual(stats[CHAT].handled, 1)
+        self.assertEqual(stats[LIKE].handled, 1)
+        self.assertNotIn(GIFT, stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
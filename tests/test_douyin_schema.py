@@ -0,0 +1,46 @@
+import gzip
+import subprocess
+import sys
+import unittest
+
+from src.douyin import lib
+
+
+class TestDouyinSchema(unittest.TestCase):
+
+    def test_lazy_import(self):
+        """
+        测试导入抖音客户端时不加载 schema，热路径类型只加载 _core。
+        """
+        code = (
+            "import sys\n"
+            "import src.douyin.client\n"
+            "from src.douyin import lib\n"
+            "assert 'src.douyin.lib._core' not in sys.modules\n"
+            "lib.WebcastImChatMessage\n"
+            "assert 'src.douyin.lib._core' in sys.modules\n"
+            "assert 'src.douyin.lib._schema' not in sys.modules\n"
+            "lib.WebcastImGiftMessage\n"
+            "assert 'src.douyin.lib._schema' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_hot_path_round_trip(self):
+        """
+        测试热路径消息的编码和解码。
+        """
+        chat = lib.WebcastImChatMessage(content="点歌 晴天", user=lib.WebcastDataUser(id=5, nickname="user"))
+        response = lib.WebcastImResponse(
+            messages=[lib.WebcastImMessage(method="WebcastChatMessage", payload=bytes(chat))],
+            need_ack=True,
+        )
+        frame = lib.WebcastImPushFrame(log_id=3, payload=gzip.compress(bytes(response)))
+
+        package = lib.WebcastImPushFrame().parse(bytes(frame))
+        decoded = lib.WebcastImResponse().parse(gzip.decompress(package.payload))
+        message = lib.WebcastImChatMessage().parse(decoded.messages[0].payload)
+        self.assertEqual(package.log_id, 3)
+        self.assertTrue(decoded.need_ack)
+        self.assertEqual((message.content, message.user.id, message.user.nickname), ("点歌 晴天", 5, "user"))
+        with self.assertRaises(AttributeError):
+            lib.WebcastNoSuchMessage
@@ -0,0 +1,45 @@
+import gzip
+import unittest
+
+from src.douyin import lib
+from src.douyin.wire import ResponseDecoder, decode_push_frame, gunzip
+
+
+class TestDouyinWire(unittest.TestCase):
+
+    def test_selective_decode(self):
+        """
+        测试选择性解码与 betterproto2 完整解析结果一致，未订阅的 method 被跳过。
+        """
+        chat = lib.WebcastImChatMessage(content="点歌 晴天", user=lib.WebcastDataUser(id=5, nickname="user"))
+        response = lib.WebcastImResponse(
+            messages=[
+                lib.WebcastImMessage(method="WebcastMemberMessage", payload=b"\x01" * 300, msg_id=1),
+                lib.WebcastImMessage(method="WebcastChatMessage", payload=bytes(chat), msg_id=2, message_extra={"k": "v"}),
+                lib.WebcastImMessage(method="WebcastChatMessageX", payload=b"\x02", msg_id=3),
+            ],
+            cursor="cursor",
+            now=1700000000000,
+            internal_ext="internal_src:dim",
+            route_params={"a": "b"},
+            need_ack=True,
+        )
+        raw = bytes(lib.WebcastImPushFrame(
+            seq_id=7,
+            log_id=2**63 - 1,
+            headers=[lib.WebcastImPushHeader(key="compress_type", value="gzip")],
+            payload_encoding="gzip",
+            payload_type="msg",
+            payload=gzip.compress(bytes(response)),
+        ))
+
+        package = decode_push_frame(raw)
+        self.assertEqual((package.log_id, package.payload_encoding, package.payload_type), (2**63 - 1, "gzip", "msg"))
+        decoded = ResponseDecoder(["WebcastChatMessage", "WebcastGiftMessage"]).decode(gunzip(package.payload))
+        self.assertTrue(decoded.need_ack)
+        self.assertEqual(decoded.internal_ext, "internal_src:dim")
+        self.assertEqual([method for method, _ in decoded.messages], ["WebcastChatMessage"])
+        self.assertEqual(lib.WebcastImChatMessage().parse(decoded.messages[0][1]), chat)
+
+        with self.assertRaises((ValueError, IndexError)):
+            decode_push_frame(raw[:-3])
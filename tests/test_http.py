@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+
+from src.utils.http import HttpClients
+
+
+class TestHttpClients(unittest.IsolatedAsyncioTestCase):
+    async def test_session_shared_per_profile(self):
+        """
+        测试同一事件循环下同一 profile 复用会话，不同 profile 使用各自的连接池
+        """
+        clients = HttpClients()
+        default = clients.session()
+        self.assertIs(clients.session("default"), default)
+        douyin = clients.session("douyin")
+        self.assertIsNot(douyin, default)
+        self.assertFalse(douyin.connector._ssl)
+        await clients.close()
+        self.assertTrue(default.closed)
+        self.assertTrue(douyin.closed)
+
+    async def test_session_recreated_after_close(self):
+        """
+        测试关闭后再次获取会创建新的会话
+        """
+        clients = HttpClients()
+        first = clients.session()
+        await clients.close()
+        second = clients.session()
+        self.assertIsNot(first, second)
+        self.assertFalse(second.closed)
+        await clients.close()
+
+    async def test_closers_run_on_close(self):
+        """
+        测试 close 会执行注册的清理协程，清理失败不影响其他清理
+        """
+        clients = HttpClients()
+        calls = []
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        async def closer():
+            calls.append(asyncio.get_running_loop())
+
+        clients.add_closer(failing)
+        clients.add_closer(closer)
+        await clients.close()
+        self.assertEqual(calls, [asyncio.get_running_loop()])
+
+    def test_session_requires_running_loop(self):
+        """
+        测试在事件循环外获取会话会报错
+        """
+        with self.assertRaises(RuntimeError):
+            HttpClients().session()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,16 +8,18 @@ class TestMain(unittest.TestCase):
     @patch('main.main')
     @patch('os._exit')
     @patch('main.async_worker')
+    @patch('main.notification_dispatcher')
     def test_run_app_normal_exit(
-        self, mock_async_worker, mock_os_exit, mock_main_func
+        self, mock_notification_dispatcher, mock_async_worker, mock_os_exit, mock_main_func
     ):
         """
-        测试 run_app 在正常退出时调用 async_worker.stop 和 os._exit
+        测试 run_app 在正常退出时调用 async_worker.stop、notification_dispatcher.stop 和 os._exit
         """
         main_module.run_app()
 
         mock_main_func.assert_called_once()
         mock_async_worker.stop.assert_called_once()
+        mock_notification_dispatcher.stop.assert_called_once()
         mock_os_exit.assert_called_once_with(0)
 
     @patch('main.main', side_effect=Exception("Test Exception"))
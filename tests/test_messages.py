@@ -0,0 +1,49 @@
+import unittest
+from unittest import mock
+
+from src.manager import MessageManager, MessageDelta, apply_delta
+from src.utils import DanmuInfo, EventEmitter
+
+
+def make_item(msg_id, send_time, source="bilibili"):
+    return DanmuInfo(1, "user", msg_id=msg_id, msg=f"song{msg_id}", send_time=send_time, source=source)
+
+
+class TestMessageManager(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = MessageManager(EventEmitter())
+        self.published = []
+        patcher = mock.patch.object(self.manager, "_publish", side_effect=lambda name, data: self.published.append((name, data)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_deltas_match_snapshot(self):
+        """
+        测试按顺序应用增量后与完整快照一致，版本号单调递增。
+        """
+        items = []
+        self.manager._on_add(make_item(1, 10))
+        self.manager._on_add(make_item(2, 30))
+        self.manager._on_add(make_item(3, 20, source="douyin"))
+        self.manager._on_add(make_item(1, 40))
+        self.manager._on_remove(make_item(2, 30))
+        self.manager._on_remove(make_item(2, 30))
+        self.manager._on_clear("douyin")
+
+        deltas = [data for name, data in self.published]
+        self.assertTrue(all(isinstance(delta, MessageDelta) for delta in deltas))
+        self.assertEqual([delta.version for delta in deltas], [1, 2, 3, 4, 5, 6])
+        self.assertEqual([op.op for op in deltas[3].ops], ["move"])
+        self.assertEqual(deltas[2].ops[0].index, 1)
+        for delta in deltas:
+            before = list(items)
+            updated = apply_delta(items, delta.ops)
+            # 不修改原列表
+            self.assertEqual(items, before)
+            items = updated
+
+        snapshot = self.manager.snapshot()
+        self.assertEqual(snapshot.version, 6)
+        self.assertEqual(items, snapshot.items)
+        self.assertEqual([item.msg_id for item in items], [1])
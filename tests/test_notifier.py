@@ -0,0 +1,45 @@
+import time
+import unittest
+
+from src.utils import NotificationDispatcher
+
+
+class TestNotificationDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.sent = []
+        self.dispatcher = NotificationDispatcher(
+            send=lambda title, message: self.sent.append((time.monotonic(), title, message)),
+            window=0.1,
+            min_interval=0.5,
+        )
+        self.addCleanup(self.dispatcher.stop)
+
+    def test_burst_is_coalesced(self):
+        """
+        测试窗口内的点歌通知合并为一条，不合并的通知单独发送。
+        """
+        for i in range(50):
+            self.assertTrue(self.dispatcher.post("收到新的点歌", f"song{i}", summary="收到 {count} 首新的点歌"))
+        self.dispatcher.post("警告", "网络已断开连接")
+        self.dispatcher.stop()
+
+        self.assertEqual([(title, message) for _, title, message in self.sent], [
+            ("收到 50 首新的点歌", "song0、song1、song2、song3、song4 等"),
+            ("警告", "网络已断开连接"),
+        ])
+        self.assertEqual(self.dispatcher.merged_count, 49)
+
+    def test_rate_limit(self):
+        """
+        测试两次发送之间至少间隔 min_interval，等待期间的通知并入下一批。
+        """
+        self.dispatcher.post("收到新的点歌", "song0", summary="收到 {count} 首新的点歌")
+        time.sleep(0.15)
+        self.dispatcher.post("收到新的点歌", "song1", summary="收到 {count} 首新的点歌")
+        time.sleep(0.15)
+        self.dispatcher.post("收到新的点歌", "song2", summary="收到 {count} 首新的点歌")
+        time.sleep(0.8)
+
+        self.assertEqual([message for _, _, message in self.sent], ["song0", "song1、song2"])
+        self.assertGreaterEqual(self.sent[1][0] - self.sent[0][0], 0.5)
@@ -0,0 +1,42 @@
+import unittest
+
+from src.live.parser import CommandType, RequestParser
+
+
+class TestRequestParser(unittest.TestCase):
+
+    def test_parse_danmaku(self):
+        """
+        测试点歌、取消点歌和普通弹幕的解析。
+        """
+        parser = RequestParser("点歌")
+        command = parser.parse("点歌  晴天 ")
+        self.assertEqual(command.type, CommandType.REQUEST)
+        self.assertEqual(command.song_name, "晴天")
+        self.assertEqual(parser.parse("取消点歌 晴天").type, CommandType.CANCEL)
+        self.assertEqual(parser.parse("点歌晴天").type, CommandType.IGNORE)
+        self.assertEqual(parser.parse("点歌 ").type, CommandType.IGNORE)
+        self.assertEqual(parser.parse("主播好").type, CommandType.IGNORE)
+
+    def test_level_rules(self):
+        """
+        测试粉丝牌和大航海限制，取消点歌不受限制。
+        """
+        parser = RequestParser("sing*", medal_level=5, guard_level=2)
+        self.assertEqual(parser.parse("sing* a", medal_level=4, guard_level=1).type, CommandType.IGNORE)
+        self.assertEqual(parser.parse("sing* a", medal_level=5, guard_level=3).type, CommandType.IGNORE)
+        self.assertEqual(parser.parse("sing* a", medal_level=5, guard_level=2).song_name, "a")
+        self.assertEqual(parser.parse("取消点歌", medal_level=0).type, CommandType.CANCEL)
+
+    def test_parse_super_chat(self):
+        """
+        测试醒目留言的指令可省略。
+        """
+        parser = RequestParser("点歌")
+        self.assertEqual(parser.parse_super_chat("点歌 晴天").song_name, "晴天")
+        self.assertEqual(parser.parse_super_chat(" 稻香 ").song_name, "稻香")
+        self.assertEqual(parser.parse_super_chat("  ").type, CommandType.IGNORE)
+
+
+if __name__ == '__main__':
+    unittest.main()
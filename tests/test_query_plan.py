@@ -0,0 +1,119 @@
+import os
+import re
+import unittest
+from tortoise import Tortoise
+
+from src.database import Db
+from src.database.paging import LAST_PAGE, encode_cursor
+
+# 默认按 100 万条点歌记录生成数据，调试时可以通过环境变量调小
+ROWS = int(os.environ.get("QUERY_PLAN_ROWS", 1_000_000))
+NOW = 1_760_000_000
+# 不带 USING 的 SCAN 即全表扫描，songhistory_fts 是全文索引的虚拟表，不在检查范围内
+FULL_SCAN = re.compile(r"^SCAN (?:songhistory|song_daily_stats)(?: |$)(?!.*USING)")
+
+SEED_SQL = """
+    INSERT INTO songhistory (uid, uname, song_name, source, create_time)
+    WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+    SELECT n % 50000, 'user' || (n % 50000), 'song' || (n % 3000),
+           CASE n % 3 WHEN 0 THEN 'douyin' ELSE 'bilibili' END, ? - n * 30
+    FROM seq
+"""
+
+
+class QueryRecorder:
+    """
+    记录 Db 方法通过连接执行的 SQL 和参数
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.queries: list[tuple[str, list]] = []
+
+    def _wrap(self, name: str):
+        execute = getattr(self.conn, name)
+
+        async def wrapper(query, values=None):
+            self.queries.append((query, list(values or ())))
+            return await execute(query, values)
+
+        return wrapper
+
+    def __enter__(self):
+        self.queries.clear()
+        for name in ("execute_query", "execute_query_dict"):
+            setattr(self.conn, name, self._wrap(name))
+        return self
+
+    def __exit__(self, *exc):
+        for name in ("execute_query", "execute_query_dict"):
+            delattr(self.conn, name)
+
+
+class TestSongHistoryQueryPlan(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["src.database.model"]})
+        await Tortoise.generate_schemas()
+        Db._conn = Tortoise.get_connection("default")
+        Db._cooldown.clear()
+        Db._counts.clear()
+        await Db._conn.execute_query(SEED_SQL, [ROWS, NOW])
+        await Db._search.setup(Db._conn)
+        await Db._rollup.setup(Db._conn)
+        await Db._conn.execute_script("ANALYZE")
+
+    async def asyncTearDown(self):
+        Db._cooldown.clear()
+        Db._counts.clear()
+        Db._search.clear()
+        await Tortoise.close_connections()
+
+    async def explain(self, query: str, values: list) -> list[str]:
+        _, rows = await Db._conn.execute_query(f"EXPLAIN QUERY PLAN {query}", values)
+        return [row["detail"] for row in rows]
+
+    async def test_song_history_queries_use_indexes(self):
+        """
+        测试所有 songhistory 查询的执行计划都走索引，出现全表扫描即失败
+        """
+        # 种子数据第 n 行的 id 为 n，create_time 为 NOW - n * 30
+        middle = ROWS // 2
+        # uname/song_name 的子串搜索走全文索引，不足 3 个字符的关键字回落到 LIKE，不在这里覆盖
+        cases = {
+            "get_song_history": lambda: Db.get_song_history(uid=123, source="bilibili"),
+            "get_last_request": lambda: Db.get_last_request(uid=123, source="douyin"),
+            "cooldown_warm": lambda: Db._cooldown.warm(Db._conn),
+            "history_page": lambda: Db.get_song_history_page(page=3),
+            "history_page_source": lambda: Db.get_song_history_page(source="douyin"),
+            "history_page_time": lambda: Db.get_song_history_page(start_time=NOW - 86400 * 7, end_time=NOW),
+            "history_page_source_time": lambda: Db.get_song_history_page(
+                source="bilibili", start_time=NOW - 86400 * 7, end_time=NOW),
+            "history_page_uname_source": lambda: Db.get_song_history_page(uname="user1", source="douyin"),
+            "history_page_uname": lambda: Db.get_song_history_page(uname="user123"),
+            "history_page_song_time": lambda: Db.get_song_history_page(
+                song_name="song29", start_time=NOW - 86400 * 7, end_time=NOW),
+            "history_cursor_next": lambda: Db.get_song_history_cursor(cursor=encode_cursor(NOW - middle * 30, middle)),
+            "history_cursor_prev": lambda: Db.get_song_history_cursor(
+                cursor=encode_cursor(NOW - middle * 30, middle, backward=True)),
+            "history_cursor_source": lambda: Db.get_song_history_cursor(
+                source="douyin", cursor=encode_cursor(NOW - middle * 30, middle)),
+            "history_cursor_last": lambda: Db.get_song_history_cursor(source="bilibili", cursor=LAST_PAGE),
+            "statistic_song": lambda: Db.get_statisitic("song", 30, None),
+            "statistic_user_source": lambda: Db.get_statisitic("user", 7, "douyin"),
+            "statistic_top_songs": lambda: Db.get_statisitic("song", 15, "bilibili", top=10),
+        }
+        for name, call in cases.items():
+            with self.subTest(name):
+                with QueryRecorder(Db._conn) as recorder:
+                    await call()
+                queries = [(query, values) for query, values in recorder.queries if "songhistory" in query]
+                self.assertTrue(queries)
+                for query, values in queries:
+                    plan = await self.explain(query, values)
+                    scans = [detail for detail in plan if FULL_SCAN.match(detail)]
+                    self.assertFalse(scans, f"{name} falls back to a full table scan: {query} -> {plan}")
+
+
+if __name__ == "__main__":
+    unittest.main()
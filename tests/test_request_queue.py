@@ -0,0 +1,53 @@
+import unittest
+
+from src.utils import DanmuInfo, RequestQueue
+
+
+def make_item(msg_id, uid=1, send_time=0, source="bilibili"):
+    return DanmuInfo(uid, f"user{uid}", msg_id=msg_id, msg=f"song{msg_id}", send_time=send_time, source=source)
+
+
+class TestRequestQueue(unittest.TestCase):
+
+    def test_order_and_indexes(self):
+        """
+        测试按 send_time 排序、按 msg_id 删除和按 uid 查询。
+        """
+        queue = RequestQueue()
+        queue.append(make_item(1, uid=1, send_time=10))
+        queue.append(make_item(2, uid=2, send_time=20))
+        queue.append(make_item(3, uid=1, send_time=30))
+        queue.append(make_item(4, uid=3, send_time=5))
+        queue.append(make_item(5, uid=3, send_time=15))
+        self.assertEqual([item.msg_id for item in queue], [4, 1, 5, 2, 3])
+        self.assertEqual(queue.latest_by_uid(1, "bilibili").msg_id, 3)
+
+        self.assertEqual(queue.remove(3).msg_id, 3)
+        self.assertIsNone(queue.remove(3))
+        self.assertEqual(queue.latest_by_uid(1, "bilibili").msg_id, 1)
+        self.assertEqual([item.msg_id for item in queue.snapshot(newest_first=True)], [2, 5, 1, 4])
+
+        version = queue.version
+        queue.clear()
+        self.assertEqual(len(queue), 0)
+        self.assertGreater(queue.version, version)
+
+    def test_capacity_eviction(self):
+        """
+        测试容量上限的淘汰和拒绝策略。
+        """
+        evicted = []
+        queue = RequestQueue(capacity=2, on_evict=evicted.append)
+        for i in range(3):
+            self.assertTrue(queue.append(make_item(i, uid=i, send_time=i)))
+        self.assertEqual([item.msg_id for item in evicted], [0])
+        self.assertIsNone(queue.latest_by_uid(0, "bilibili"))
+
+        queue = RequestQueue(capacity=1, eviction="reject")
+        self.assertTrue(queue.append(make_item(1)))
+        self.assertFalse(queue.append(make_item(2)))
+        self.assertEqual(len(queue), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.douyin import DouyinLiveWebFetcher
+from src.douyin.resolve_cache import ResolveCache
+from src.utils import async_worker
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestResolveCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "resolve.json")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ttl_and_max_age(self):
+        """
+        测试 ttl 内为新鲜记录，ttl 到 max_age 之间需要后台刷新，超过 max_age 视为无记录
+        """
+        cache = ResolveCache(self.path, ttl=10, max_age=100, clock=self.clock)
+        cache.put("123", "tw", "7000")
+        self.assertFalse(cache.get("123")[1])
+        self.clock.now += 50
+        entry, stale = cache.get("123")
+        self.assertEqual((entry.room_id, stale), ("7000", True))
+        self.clock.now += 50
+        self.assertEqual(cache.get("123"), (None, False))
+
+    def test_persisted_across_instances(self):
+        """
+        测试解析结果写入文件后，新的缓存实例可以读取，invalidate 会同时删除文件中的记录
+        """
+        ResolveCache(self.path, clock=self.clock).put("123", "tw", "7000")
+        cache = ResolveCache(self.path, clock=self.clock)
+        self.assertEqual(cache.get("123")[0].ttwid, "tw")
+        cache.invalidate("123")
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {})
+
+    def test_corrupt_file_is_ignored(self):
+        """
+        测试缓存文件损坏时按无记录处理
+        """
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        self.assertEqual(ResolveCache(self.path).get("123"), (None, False))
+
+
+class TestFetcherResolution(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.room_id = "7000000000000000001"
+        self.hits = {"ttwid": 0, "room": 0}
+
+        async def home(request):
+            self.hits["ttwid"] += 1
+            response = web.Response(text="ok")
+            response.set_cookie("ttwid", f"tw{self.hits['ttwid']}")
+            return response
+
+        async def room(request):
+            self.hits["room"] += 1
+            return web.Response(text=f'<script>{{\\"roomId\\":\\"{self.room_id}\\"}}</script>')
+
+        async def broken(request):
+            return web.Response(status=500, text="error")
+
+        app = web.Application()
+        app.router.add_get("/", home)
+        app.router.add_get("/broken/{live_id}", broken)
+        app.router.add_get("/{live_id}", room)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await async_worker.http.close()
+        await self.server.close()
+        self.tmp.cleanup()
+
+    def new_fetcher(self, cache):
+        fetcher = DouyinLiveWebFetcher(live_id=123, resolve_cache=cache)
+        fetcher.live_url = str(self.server.make_url("/"))
+        return fetcher
+
+    def new_cache(self):
+        return ResolveCache(os.path.join(self.tmp.name, "resolve.json"), ttl=10, max_age=100, clock=self.clock)
+
+    async def test_restart_skips_http_when_cached(self):
+        """
+        测试第一次解析请求本地替身服务，新实例（相当于 restart）直接使用持久化的结果
+        """
+        first = self.new_fetcher(self.new_cache())
+        self.assertEqual(await first.room_id(), self.room_id)
+        self.assertEqual(await first.ttwid(), "tw1")
+        self.assertEqual(self.hits, {"ttwid": 1, "room": 1})
+
+        second = self.new_fetcher(self.new_cache())
+        self.assertEqual(await second.room_id(), self.room_id)
+        self.assertEqual(await second.ttwid(), "tw1")
+        self.assertEqual(self.hits, {"ttwid": 1, "room": 1})
+
+    async def test_stale_entry_is_revalidated_in_background(self):
+        """
+        测试超过 ttl 的记录先返回旧值，后台重新解析后更新缓存和实例
+        """
+        cache = self.new_cache()
+        await self.new_fetcher(cache).room_id()
+        self.clock.now += 20
+        self.room_id = "7000000000000000002"
+
+        fetcher = self.new_fetcher(cache)
+        self.assertEqual(await fetcher.room_id(), "7000000000000000001")
+        await asyncio.wait_for(fetcher._revalidate_task, timeout=5)
+        self.assertEqual(self.hits, {"ttwid": 2, "room": 2})
+        self.assertEqual(await fetcher.room_id(), "7000000000000000002")
+        self.assertFalse(cache.get("123")[1])
+        self.assertEqual(cache.get("123")[0].room_id, "7000000000000000002")
+
+    async def test_forget_resolution_refetches(self):
+        """
+        测试丢弃解析结果后重新请求
+        """
+        cache = self.new_cache()
+        fetcher = self.new_fetcher(cache)
+        await fetcher.room_id()
+        fetcher._forget_resolution()
+        self.assertEqual(cache.get("123"), (None, False))
+        await fetcher.room_id()
+        self.assertEqual(self.hits, {"ttwid": 2, "room": 2})
+
+    async def test_responses_released_to_pool(self):
+        """
+        测试请求成功或失败后连接都归还共享连接池，重复重连不会占满 limit_per_host
+        """
+        fetcher = self.new_fetcher(self.new_cache())
+        connector = fetcher.http_session.connector
+        for _ in range(connector.limit_per_host + 5):
+            self.assertTrue(await asyncio.wait_for(fetcher._fetch_ttwid(), timeout=5))
+            self.assertEqual(await asyncio.wait_for(fetcher._fetch_room_id("tw"), timeout=5), self.room_id)
+        fetcher.live_url = str(self.server.make_url("/broken/"))
+        for _ in range(connector.limit_per_host + 5):
+            self.assertIsNone(await asyncio.wait_for(fetcher._fetch_room_id("tw"), timeout=5))
+        self.assertFalse(connector._acquired)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from src.douyin.signature import SignatureEngine, engine, generateSignature
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+
+@mock.patch.dict(os.environ, {"FLET_ASSETS_DIR": ASSETS_DIR})
+class TestSignatureEngine(unittest.TestCase):
+
+    def test_compile_once(self):
+        """
+        测试多线程并发调用时脚本只编译一次。
+        """
+        signature_engine = SignatureEngine()
+        params = [f"{n:032x}" for n in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda p: signature_engine.call("sign_v1.js", "get_sign", p), params))
+        self.assertEqual(signature_engine.compile_count, 1)
+        self.assertTrue(all(len(result) == 16 for result in results))
+
+    def test_memoized_signature(self):
+        """
+        测试相同的 wss 地址在 sign_ttl 内命中签名缓存，过期后重新计算。
+        """
+        wss = "wss://example.com/push?live_id=1&aid=6383&room_id=7000000000000000000&identity=audience"
+        engine.clear()
+        hits = engine.sign_hits
+        first = generateSignature(wss)
+        self.assertTrue(first)
+        self.assertEqual(generateSignature(wss), first)
+        self.assertEqual(engine.sign_hits, hits + 1)
+
+        with mock.patch("src.douyin.signature.time.monotonic", return_value=10**9):
+            generateSignature(wss)
+        self.assertEqual(engine.sign_hits, hits + 1)
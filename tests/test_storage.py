@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from tortoise import Tortoise
+
+from src.database.storage import PROFILE_ENV, PROFILES, connection_config, get_profile, maintain
+
+
+class TestStorageProfile(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    async def asyncTearDown(self):
+        await Tortoise.close_connections()
+        self.tmp_dir.cleanup()
+
+    def test_get_profile(self):
+        """
+        测试按名称、环境变量选择配置档，未知名称回落到默认配置档
+        """
+        self.assertEqual(get_profile("safe").synchronous, "FULL")
+        with mock.patch.dict(os.environ, {PROFILE_ENV: "fast"}):
+            self.assertEqual(get_profile().name, "fast")
+        with mock.patch.dict(os.environ, {PROFILE_ENV: ""}):
+            self.assertEqual(get_profile().name, "balanced")
+        self.assertEqual(get_profile("unknown").name, "balanced")
+
+    async def test_pragmas_applied_and_maintain(self):
+        """
+        测试连接建立时执行配置档的 PRAGMA，维护任务执行 checkpoint
+        """
+        profile = PROFILES["balanced"]
+        path = os.path.join(self.tmp_dir.name, "storage.sqlite3")
+        await Tortoise.init(config={
+            "connections": {"default": connection_config(path, profile)},
+            "apps": {"models": {"models": ["src.database.model"], "default_connection": "default"}},
+        })
+        await Tortoise.generate_schemas()
+        conn = Tortoise.get_connection("default")
+        values = {}
+        for pragma in ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "busy_timeout"):
+            _, rows = await conn.execute_query(f"PRAGMA {pragma}")
+            values[pragma] = rows[0][0]
+        self.assertEqual(values, {"journal_mode": "wal", "synchronous": 1, "cache_size": profile.cache_size,
+                                  "mmap_size": profile.mmap_size, "temp_store": 2, "busy_timeout": 5000})
+
+        result = await maintain(conn)
+        self.assertEqual(result["busy"], 0)
+        self.assertEqual(result["log"], result["checkpointed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import asyncio
+import unittest
+from aiohttp import web, WSCloseCode
+from aiohttp.test_utils import TestServer
+
+from src.utils import WebSocketClient, ReconnectPolicy, async_worker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestReconnectPolicy(unittest.TestCase):
+    def test_immediate_first_then_capped_backoff(self):
+        """
+        测试第一次重连立即进行，之后按指数退避增长并受上限限制，实际等待为随机比例
+        """
+        policy = ReconnectPolicy(base_delay=1, max_delay=10, rand=lambda: 1.0)
+        delays = []
+        for _ in range(7):
+            policy.on_disconnected()
+            delays.append(policy.next_delay())
+        self.assertEqual(delays, [0, 1, 2, 4, 8, 10, 10])
+
+        half = ReconnectPolicy(base_delay=1, max_delay=10, rand=lambda: 0.5)
+        half.next_delay()
+        self.assertEqual(half.next_delay(), 0.5)
+
+    def test_reset_only_after_stable_connection(self):
+        """
+        测试连接后很快断开不重置重连次数，保持 stable_after 以上再断开才重置
+        """
+        clock = FakeClock()
+        policy = ReconnectPolicy(stable_after=30, clock=clock, rand=lambda: 1.0)
+        policy.on_disconnected()
+        policy.next_delay()
+        policy.next_delay()
+        clock.now += 1
+        policy.on_connected()
+        clock.now += 5
+        policy.on_disconnected()
+        self.assertEqual(policy.attempt, 2)
+
+        policy.next_delay()
+        policy.on_connected()
+        clock.now += 30
+        policy.on_disconnected()
+        self.assertEqual(policy.attempt, 0)
+
+    def test_metrics(self):
+        """
+        测试记录每次重连的等待时间、耗时、结果，以及断线到恢复的时间
+        """
+        clock = FakeClock()
+        policy = ReconnectPolicy(base_delay=2, clock=clock, rand=lambda: 1.0)
+        policy.on_disconnected()
+        policy.next_delay()
+        clock.now += 0.5
+        policy.on_disconnected()
+        policy.next_delay()
+        clock.now += 2.5
+        policy.on_connected()
+
+        self.assertEqual([(a.attempt, a.delay, a.duration, a.success) for a in policy.history],
+                         [(1, 0, 0.5, False), (2, 2, 2.5, True)])
+        stats = policy.stats()
+        self.assertEqual((stats.attempts, stats.failures, stats.recoveries), (2, 1, 1))
+        self.assertEqual(stats.last_recovery, 3.0)
+
+
+class EchoClient(WebSocketClient):
+    def __init__(self, url, policy):
+        super().__init__()
+        self.url = url
+        self.max_retries = 20
+        self.reconnect_policy = policy
+        self.messages = []
+
+    async def on_message(self, message):
+        self.messages.append(message)
+
+
+class TestReconnectAgainstServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.sockets = set()
+        self.connections = 0
+        self.connected = asyncio.Condition()
+        # 为 True 时握手后立即断开，模拟连接抖动
+        self.flapping = False
+
+        async def handler(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            async with self.connected:
+                self.connections += 1
+                self.connected.notify_all()
+            if self.flapping:
+                await ws.close(code=WSCloseCode.GOING_AWAY)
+                return ws
+            self.sockets.add(ws)
+            try:
+                async for _ in ws:
+                    pass
+            finally:
+                self.sockets.discard(ws)
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.url = str(self.server.make_url("/ws"))
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        await async_worker.http.close()
+
+    async def drop(self):
+        for ws in list(self.sockets):
+            await ws.close(code=WSCloseCode.GOING_AWAY)
+
+    async def wait_connections(self, count, timeout=5):
+        async with self.connected:
+            await asyncio.wait_for(self.connected.wait_for(lambda: self.connections >= count), timeout)
+
+    async def wait_status(self, client, status, timeout=5):
+        async def poll():
+            while client.status_code != status or not client.is_connected:
+                await asyncio.sleep(0.005)
+        await asyncio.wait_for(poll(), timeout)
+
+    async def test_first_retry_is_immediate(self):
+        """
+        测试服务端断开后第一次重连立即进行，恢复时间远小于退避基数
+        """
+        policy = ReconnectPolicy(base_delay=1, max_delay=5, stable_after=60)
+        client = EchoClient(self.url, policy)
+        await client._start()
+        await self.wait_connections(1)
+
+        await self.drop()
+        await self.wait_connections(2)
+        await self.wait_status(client, 1)
+        self.assertLess(policy.stats().last_recovery, 0.5)
+        self.assertEqual(policy.history[-1].delay, 0)
+        await client.close()
+
+    async def test_flapping_backs_off_and_recovers(self):
+        """
+        测试连接反复连上即断时持续退避，服务恢复后重新连上，并记录断线到恢复的时间；
+        每次都连上了，重连次数超过 max_retries 也不会放弃
+        """
+        policy = ReconnectPolicy(base_delay=0.02, max_delay=0.1, stable_after=60)
+        client = EchoClient(self.url, policy)
+        client.max_retries = 3
+        await client._start()
+        await self.wait_connections(1)
+
+        self.flapping = True
+        await self.drop()
+        await self.wait_connections(5)
+        self.flapping = False
+        await self.wait_connections(6)
+        await self.wait_status(client, 1)
+        await self.drop()
+        await self.wait_connections(7)
+        await self.wait_status(client, 1)
+
+        # 连上即断不重置次数，重连次数一直累加
+        self.assertGreaterEqual(policy.attempt, 6)
+        delays = [attempt.delay for attempt in policy.history]
+        self.assertEqual(delays[0], 0)
+        self.assertTrue(all(delay <= 0.1 for delay in delays))
+        stats = policy.stats()
+        self.assertGreaterEqual(stats.recoveries, 2)
+        self.assertLess(stats.max_recovery, 2)
+        await client.close()
+
+    async def test_gives_up_after_max_retries(self):
+        """
+        测试服务端不可用时达到最大重连次数后关闭客户端，状态为连接失败
+        """
+        policy = ReconnectPolicy(base_delay=0.01, max_delay=0.02)
+        client = EchoClient(self.url, policy)
+        client.max_retries = 3
+        await client._start()
+        await self.wait_connections(1)
+        # 重连指向没有服务监听的端口
+        client.url = "http://127.0.0.1:1/ws"
+        await self.drop()
+
+        async def stopped():
+            while client.status_code != 3:
+                await asyncio.sleep(0.005)
+        await asyncio.wait_for(stopped(), 5)
+        self.assertEqual(policy.attempt, 3)
+        self.assertEqual(policy.stats().failures, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()